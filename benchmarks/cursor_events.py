@@ -0,0 +1,83 @@
+"""Measures the throughput of `AssignmentCursor` bookkeeping.
+
+The cursor reads pre-structured pages from an in-memory fake client, so the measured time is spent by the cursor
+itself: filtering of already seen assignments, advancing of the cursor position and creation of events.
+
+Usage:
+    python benchmarks/cursor_events.py --events 200000 --same-time 3
+"""
+
+import argparse
+import asyncio
+import bisect
+import datetime
+import time
+
+from toloka.client import Assignment
+from toloka.client.search_results import AssignmentSearchResult
+from toloka.streaming.cursor import AssignmentCursor
+from toloka.streaming.event import AssignmentEvent
+
+
+class FakeClient:
+    """Returns assignments sorted by submission time like `find_assignments` does."""
+
+    def __init__(self, assignments):
+        self.assignments = assignments
+        self.times = [assignment.submitted for assignment in assignments]
+
+    def find_assignments(self, request, sort=None, limit=None):
+        start = bisect.bisect_left(self.times, request.submitted_gte) if request.submitted_gte else 0
+        stop = bisect.bisect_right(self.times, request.submitted_lte) if request.submitted_lte else len(self.times)
+        items = self.assignments[start:min(start + limit, stop)]
+        return AssignmentSearchResult(items=items, has_more=start + limit < stop)
+
+
+class AsyncFakeClient(FakeClient):
+
+    async def find_assignments(self, request, sort=None, limit=None):
+        return super().find_assignments(request, sort=sort, limit=limit)
+
+
+def make_assignments(count: int, same_time: int):
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        Assignment(
+            id=f'{i:024x}', pool_id='1', user_id=f'user-{i % 97}', status=Assignment.SUBMITTED,
+            submitted=start + datetime.timedelta(seconds=i // same_time),
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=200000)
+    parser.add_argument('--same-time', type=int, default=3, help='Assignments submitted at the same second')
+    args = parser.parse_args()
+
+    assignments = make_assignments(args.events, args.same_time)
+
+    def sync_events():
+        cursor = AssignmentCursor(toloka_client=FakeClient(assignments), event_type=AssignmentEvent.Type.SUBMITTED)
+        return sum(1 for _ in cursor)
+
+    async def async_events():
+        cursor = AssignmentCursor(
+            toloka_client=AsyncFakeClient(assignments), event_type=AssignmentEvent.Type.SUBMITTED,
+        )
+        count = 0
+        async for _ in cursor:
+            count += 1
+        return count
+
+    for name, function in [('sync', sync_events), ('async', lambda: asyncio.run(async_events()))]:
+        start = time.perf_counter()
+        count = function()
+        elapsed = time.perf_counter() - start
+        assert count == args.events, count
+        print(f'{name:>5}: {count / elapsed:9.0f} events/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Compares per-item and per-page iteration over search results.
+
+Both clients read pages from an in-process mocked API, so the measured time is the client overhead: decoding,
+structuring and passing items through generators. The async client passes every item of `get_*` through several
+async generators, while `get_*_pages` passes a whole page at once.
+
+Usage:
+    python benchmarks/page_iteration.py --items 20000 --batch-size 1000
+
+Requires `respx`.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Tuple
+
+import respx
+import simplejson
+from toloka.async_client import AsyncTolokaClient
+from toloka.client import TolokaClient
+
+URL = 'https://toloka.dev'
+
+
+def make_pages(items_count: int, batch_size: int) -> dict:
+    items = [
+        {'id': f'{i:012}', 'pool_id': '1', 'user_id': 'user', 'status': 'ACCEPTED', 'created': '2023-03-01T12:00:00'}
+        for i in range(items_count)
+    ]
+    pages = {}
+    for start in range(0, items_count, batch_size):
+        page_items = items[start:start + batch_size]
+        id_gt = items[start - 1]['id'] if start else None
+        pages[id_gt] = simplejson.dumps({'items': page_items, 'has_more': start + batch_size < items_count}).encode()
+    return pages
+
+
+def measure(function) -> Tuple[int, float]:
+    start = time.perf_counter()
+    count = function()
+    elapsed = time.perf_counter() - start
+    return count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    pages = make_pages(args.items, args.batch_size)
+    sync_client = TolokaClient('fake-token', url=URL)
+    async_client = AsyncTolokaClient('fake-token', url=URL)
+
+    def sync_items():
+        return sum(1 for _ in sync_client.get_assignments(batch_size=args.batch_size))
+
+    def sync_pages():
+        return sum(len(page.items) for page in sync_client.get_assignments_pages(batch_size=args.batch_size))
+
+    async def async_items():
+        count = 0
+        async for _ in async_client.get_assignments(batch_size=args.batch_size):
+            count += 1
+        return count
+
+    async def async_pages():
+        count = 0
+        async for page in async_client.get_assignments_pages(batch_size=args.batch_size):
+            count += len(page.items)
+        return count
+
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(f'{URL}/api/v1/assignments').mock(
+            side_effect=lambda request: respx.MockResponse(200, content=pages[request.url.params.get('id_gt')]),
+        )
+        for name, function in [
+            ('sync get_assignments', sync_items),
+            ('sync get_assignments_pages', sync_pages),
+            ('async get_assignments', lambda: asyncio.run(async_items())),
+            ('async get_assignments_pages', lambda: asyncio.run(async_pages())),
+        ]:
+            count, elapsed = measure(function)
+            assert count == args.items
+            print(f'{name:>28}: {elapsed:6.3f} s, {elapsed / count * 1e6:6.1f} us per item')
+
+
+if __name__ == '__main__':
+    main()
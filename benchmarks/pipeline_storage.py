@@ -0,0 +1,69 @@
+"""Measures how long a pipeline spends saving and loading observers' states in `JSONLocalStorage`.
+
+Every observer is an `AssignmentsObserver` with a callback, like in a pipeline watching many pools. States are saved
+in the JSON and the binary formats. A pipeline saves only observers that got new events, so saving a part of
+observers shows the cost of a typical iteration.
+
+Usage:
+    python benchmarks/pipeline_storage.py --observers 1000 --dirty 0.05
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from toloka.client import TolokaClient
+from toloka.streaming import AssignmentsObserver
+from toloka.streaming.storage import JSONLocalStorage
+
+
+def handle_submitted(events):
+    pass
+
+
+def make_observers(count: int) -> dict:
+    toloka_client = TolokaClient('fake-token', url='https://toloka.dev')
+    observers = {}
+    for i in range(count):
+        observer = AssignmentsObserver(toloka_client, pool_id=str(100000 + i))
+        observer.on_submitted(handle_submitted)
+        observers[str(observer.get_unique_key())] = observer
+    return observers
+
+
+def measure(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--observers', type=int, default=1000)
+    parser.add_argument('--dirty', type=float, default=0.05, help='Share of observers that got new events')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    observers = make_observers(args.observers)
+    dirty = dict(list(observers.items())[:max(1, int(len(observers) * args.dirty))])
+    keys = list(observers)
+
+    for binary in [False, True]:
+        with tempfile.TemporaryDirectory() as dirname:
+            storage = JSONLocalStorage(dirname=dirname, binary=binary)
+            save_all = measure(lambda: storage.save('pipeline', observers), args.repeat)
+            save_dirty = measure(lambda: storage.save('pipeline', dirty), args.repeat)
+            load = measure(lambda: storage.load('pipeline', keys), args.repeat)
+            size = sum(
+                os.path.getsize(os.path.join(directory, name))
+                for directory, _, names in os.walk(dirname) for name in names
+            )
+        print(f'{"binary" if binary else "json":>6}: save all {save_all * 1000:7.1f} ms, '
+              f'save {len(dirty)} dirty {save_dirty * 1000:6.1f} ms, load {load * 1000:7.1f} ms, '
+              f'{size / 2 ** 20:5.2f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Measures how decoding of search pages scales with the number of worker processes.
+
+Several threads decode 1000-item assignment pages at the same time, like a multi-threaded exporter does. Pages are
+decoded either in the calling threads or in a process pool used by the `decode_processes` client parameter.
+
+Usage:
+    python benchmarks/search_page_decoding.py --threads 8 --pages 64 --processes 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import simplejson
+from toloka.client._search_streaming import decode_search_page, get_decode_executor
+from toloka.client.search_results import AssignmentSearchResult
+
+
+def make_page(items_count: int) -> bytes:
+    items = [
+        {
+            'id': f'00001a2b3c--{i:024x}',
+            'task_suite_id': f'00001a2b3c--{i:024x}',
+            'pool_id': '1080020',
+            'user_id': f'user-{i % 97}',
+            'status': 'ACCEPTED',
+            'reward': 0.02,
+            'tasks': [
+                {'pool_id': '1080020', 'input_values': {'image': f'https://example.com/{i}-{j}.png'}}
+                for j in range(5)
+            ],
+            'automerged': False,
+            'created': '2023-03-01T12:00:00',
+            'submitted': '2023-03-01T12:01:00',
+            'accepted': '2023-03-01T12:02:00',
+            'solutions': [{'output_values': {'label': 'cat', 'confidence': 0.95}} for _ in range(5)],
+            'mixed': False,
+        }
+        for i in range(items_count)
+    ]
+    return simplejson.dumps({'items': items, 'has_more': True}).encode()
+
+
+def run(content: bytes, pages: int, threads: int, processes: int) -> float:
+    if processes:
+        executor = get_decode_executor(processes)
+        # start worker processes before measuring
+        list(executor.map(decode_search_page, [content] * processes, [AssignmentSearchResult] * processes,
+                          ['items'] * processes))
+
+        def decode(_):
+            return executor.submit(decode_search_page, content, AssignmentSearchResult, 'items').result()
+    else:
+        def decode(_):
+            return decode_search_page(content, AssignmentSearchResult, 'items')
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as thread_pool:
+        for items, _ in thread_pool.map(decode, range(pages)):
+            assert len(items)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=1000, help='Items per page')
+    parser.add_argument('--pages', type=int, default=64, help='Pages decoded in each run')
+    parser.add_argument('--threads', type=int, default=8, help='Threads decoding pages concurrently')
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()],
+                        help='Numbers of decoding processes to compare with decoding in threads')
+    args = parser.parse_args()
+
+    content = make_page(args.items)
+    print(f'Page size: {len(content) / 2 ** 20:.1f} MiB, {args.items} items, {args.threads} threads, '
+          f'{os.cpu_count()} CPUs')
+    baseline = run(content, args.pages, args.threads, processes=0)
+    print(f'{"in threads":>14}: {args.pages / baseline:7.1f} pages/s')
+    for processes in sorted(set(args.processes)):
+        elapsed = run(content, args.pages, args.threads, processes)
+        print(f'{processes:>4} processes: {args.pages / elapsed:7.1f} pages/s  x{baseline / elapsed:.2f}')
+
+
+if __name__ == '__main__':
+    main()
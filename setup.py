@@ -44,6 +44,7 @@ EXTRAS_REQUIRE = {
     ],
     'pandas': ['pandas'],
     'autoquality': ['crowd-kit >= 1.0.0'],
+    'parquet': ['pyarrow'],
     's3': ['boto3 >= 1.4.7'],
     'zookeeper': ['kazoo >= 2.6.1'],
     'jupyter-metrics': ['plotly', 'ipyplot', 'jupyter-dash', get_ipython_with_version()],
@@ -1,14 +1,18 @@
 __all__ = [
     'async_client',
     'client',
+    'export',
     'metrics',
+    'mirror',
     'streaming',
     'util',
 ]
 
 from . import async_client
 from . import client
+from . import export
 from . import metrics
+from . import mirror
 from . import streaming
 from . import util
 
@@ -1,7 +1,9 @@
 __all__ = [
     'async_client',
     'client',
+    'export',
     'metrics',
+    'mirror',
     'streaming',
     'util',
     'autoquality',
@@ -10,7 +12,9 @@ from toloka import (
     async_client,
     autoquality,
     client,
+    export,
     metrics,
+    mirror,
     streaming,
     util,
 )
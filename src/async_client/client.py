@@ -2,18 +2,29 @@ __all__ = [
     'AsyncTolokaClient',
 ]
 import asyncio
+import collections
 import datetime
 import functools
+import itertools
 import logging
 import threading
+import time
 from decimal import Decimal
-from typing import Dict, Optional, Callable, List
+from typing import AsyncIterable, Dict, Iterable, Optional, Callable, List, Union
 
 import attr
 import httpx
-from toloka.client.batch_create_results import FieldValidationError
+from toloka.client.batch_create_results import FieldValidationError, IdsBatchCreateResult
 
 from ..client import TolokaClient, structure, unstructure
+from ..client import _chunked_creation
+from ..client._search_streaming import (
+    StreamedSearchPage,
+    decode_search_page,
+    get_decode_executor,
+    streamed_search_page_var,
+    structure_items,
+)
 from ..client.exceptions import (
     raise_on_api_error,
     ValidationApiError,
@@ -21,7 +32,11 @@ from ..client.exceptions import (
 from ..client.operations import Operation
 from ..client.primitives.parameter import IdempotentOperationParameters
 from ..client.primitives.retry import AsyncRetryingOverURLLibRetry
-from ..util._managing_headers import add_headers
+from ..client.search_batch_size import AdaptiveBatchSize
+from ..client.search_results import SearchResultPage
+from ..client.upload_journal import UploadJournal
+from ..util._json_stream import JSONArrayStreamParser
+from ..util._managing_headers import add_headers, set_variable
 from ..util.async_utils import generate_async_methods_from
 
 logger = logging.getLogger(__name__)
@@ -82,10 +97,17 @@ class AsyncTolokaClient:
         event_loop_id = id(asyncio.get_event_loop())
         return self._session_for_thread_for_event_loop(threading.current_thread().ident, event_loop_id)
 
-    async def _do_request_with_retries(self, method, path, **kwargs):
+    async def _do_request_with_retries(self, method, path, stream: bool = False, **kwargs):
         @self.retrying.wraps
         async def wrapped(method, url, **kwargs):
-            response = await self._session.request(method, url, **kwargs)
+            if stream:
+                response = await self._session.send(self._session.build_request(method, url, **kwargs), stream=True)
+                if not response.is_success:
+                    # Error responses are small, read them to parse the error and to make them available for retries
+                    await response.aread()
+                    await response.aclose()
+            else:
+                response = await self._session.request(method, url, **kwargs)
             raise_on_api_error(response)
             return response
 
@@ -94,19 +116,140 @@ class AsyncTolokaClient:
     async def _request(self, method, path, **kwargs):
         return (await self._raw_request(method, path, **kwargs)).json(parse_float=Decimal)
 
-    async def _find_all(self, find_function, request, sort_field: str = 'id',
-                        items_field: str = 'items', batch_size: Optional[int] = None):
-        result = await find_function(request, sort=[sort_field], limit=batch_size)
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
-            for item in items:
+    async def _stream_json_array(self, method, path, **kwargs):
+        async def parse(response):
+            parser = JSONArrayStreamParser(parse_float=Decimal)
+            async for text in response.aiter_text():
+                for item in parser.feed(text):
+                    yield item
+            for item in parser.close():
                 yield item
-            result = await find_function(request, sort=[sort_field])
-            items = getattr(result, items_field)
 
-        for item in items:
-            yield item
+        yielded_count = 0
+        retry = None
+        while True:
+            response = await self._raw_request(method, path, stream=True, **kwargs)
+            try:
+                idx = 0
+                async for item in parse(response):
+                    if idx >= yielded_count:
+                        yielded_count += 1
+                        yield item
+                    idx += 1
+                return
+            except httpx.TransportError as exc:
+                retry = self.retrying.increment_on_body_error(retry, method, f'/api{path}', exc)
+                if retry is None:
+                    raise
+                logger.warning('Failed to read the response of %s %s, retrying: %r', method.upper(), path, exc)
+                await asyncio.sleep(retry.get_backoff_time())
+            finally:
+                await response.aclose()
+
+    async def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items',
+                        batch_size: Union[int, AdaptiveBatchSize, None] = None, max_limit: int = 100_000):
+        adaptive = batch_size if isinstance(batch_size, AdaptiveBatchSize) else None
+        limit = batch_size if adaptive is None else min(adaptive.get_initial_size(), max_limit)
+        retry = None
+        while True:
+            page = StreamedSearchPage(items_field=items_field)
+            started = time.perf_counter()
+            with set_variable(streamed_search_page_var, page):
+                result = await find_function(request, sort=[sort_field], limit=limit)
+            items_count = 0
+            consumer_seconds = 0.0
+            try:
+                async for item in self._stream_search_page(page, result):
+                    items_count += 1
+                    yielded = time.perf_counter()
+                    yield item
+                    consumer_seconds += time.perf_counter() - yielded
+            except httpx.TransportError as exc:
+                retry = await self._increment_search_page_retry(retry, page, exc)
+                await asyncio.sleep(retry.get_backoff_time())
+                # The page is requested again starting after the last yielded item
+                if page.last_item is not None:
+                    request = attr.evolve(request, **{f'{sort_field}_gt': getattr(page.last_item, sort_field)})
+                continue
+            retry = None
+            if adaptive is not None:
+                seconds = time.perf_counter() - started - consumer_seconds
+                limit = min(adaptive.get_next_size(limit, items_count, seconds, page.bytes_count), max_limit)
+            if not page.has_more:
+                return
+            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(page.last_item, sort_field)})
+
+    async def _find_all_pages(self, find_function, request, sort_field: str = 'id', items_field: str = 'items',
+                              batch_size: Union[int, AdaptiveBatchSize, None] = None, max_limit: int = 100_000):
+        adaptive = batch_size if isinstance(batch_size, AdaptiveBatchSize) else None
+        limit = batch_size if adaptive is None else min(adaptive.get_initial_size(), max_limit)
+        retry = None
+        while True:
+            page = StreamedSearchPage(items_field=items_field)
+            started = time.perf_counter()
+            with set_variable(streamed_search_page_var, page):
+                result = await find_function(request, sort=[sort_field], limit=limit)
+            try:
+                items = [item async for item in self._stream_search_page(page, result)]
+            except httpx.TransportError as exc:
+                retry = await self._increment_search_page_retry(retry, page, exc)
+                await asyncio.sleep(retry.get_backoff_time())
+                continue
+            retry = None
+            if adaptive is not None:
+                seconds = time.perf_counter() - started
+                limit = min(adaptive.get_next_size(limit, len(items), seconds, page.bytes_count), max_limit)
+            next_request = None
+            if page.has_more:
+                next_request = attr.evolve(request, **{f'{sort_field}_gt': getattr(page.last_item, sort_field)})
+            yield SearchResultPage(items=items, has_more=page.has_more, next_request=next_request)
+            if next_request is None:
+                return
+            request = next_request
+
+    async def _stream_search_page(self, page: StreamedSearchPage, result):
+        if page.response is None:
+            items = getattr(result, page.items_field)
+            page.has_more = result.has_more
+            page.last_item = items[-1] if items else None
+            for item in items:
+                yield item
+            return
+
+        result_type = type(result)
+        if self.decode_processes:
+            try:
+                content = await page.response.aread()
+            finally:
+                await page.response.aclose()
+            items, page.has_more = await asyncio.get_running_loop().run_in_executor(
+                get_decode_executor(self.decode_processes), decode_search_page, content, result_type, page.items_field,
+            )
+            page.bytes_count = len(content)
+            page.last_item = items[-1] if items else None
+            for item in items:
+                yield item
+            return
+
+        try:
+            parser = JSONArrayStreamParser(parse_float=Decimal, items_field=page.items_field)
+            async for chunk in page.response.aiter_bytes():
+                items = structure_items(
+                    result_type, page.items_field, parser.feed(page.decode(chunk)), self.lazy_structuring,
+                )
+                if items:
+                    page.last_item = items[-1]
+                for item in items:
+                    yield item
+            raw_items = parser.feed(page.decode(b'', final=True)) + parser.close()
+            items = structure_items(result_type, page.items_field, raw_items, self.lazy_structuring)
+            if items:
+                page.last_item = items[-1]
+            for item in items:
+                yield item
+        finally:
+            await page.response.aclose()
+        page.has_more = structure(parser.fields, result_type).has_more
 
     @add_headers('async_client')
     async def wait_operation(
@@ -136,6 +279,42 @@ class AsyncTolokaClient:
             if datetime.datetime.now(datetime.timezone.utc) > wait_until_time:
                 raise TimeoutError
 
+    async def _map_concurrently(
+        self, func: Callable, items: Union[Iterable, AsyncIterable], concurrency: int,
+    ) -> List:
+        if concurrency <= 0:
+            raise ValueError(f'concurrency must be positive, got {concurrency}')
+
+        results = {}
+        pending = {}
+
+        async def collect_completed():
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results[pending.pop(task)] = task.result()
+
+        async def iterate_items():
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    yield item
+            else:
+                for item in items:
+                    yield item
+
+        try:
+            idx = 0
+            async for item in iterate_items():
+                if len(pending) == concurrency:
+                    await collect_completed()
+                pending[asyncio.ensure_future(func(item))] = idx
+                idx += 1
+            while pending:
+                await collect_completed()
+        finally:
+            for task in pending:
+                task.cancel()
+        return [results[idx] for idx in range(len(results))]
+
     async def _sync_via_async_pool_related(
             self,
             objects,
@@ -145,25 +324,32 @@ class AsyncTolokaClient:
             operation_type: Operation,
             output_id_field: str,
             get_method: Callable,
+            ids_only: bool = False,
+            max_batch_size: int = 100_000,
+            journaled_result: Optional[IdsBatchCreateResult] = None,
     ):
+        if journaled_result is not None:
+            return await self._restore_journaled_result(
+                objects, journaled_result, result_type, get_method, max_batch_size, pool_related=True,
+            )
         if not parameters.async_mode:
             response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return self._ids_batch_create_result(response) if ids_only else structure(response, result_type)
         is_single = not isinstance(objects, list)
         insert_operation = await self._start_sync_via_async(objects, parameters, url, operation_type)
 
         pools = {}
         validation_errors = {}
-        for log_item in await self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
+        async for log_item in self._stream_json_array('get', f'/v1/operations/{insert_operation.id}/log'):
+            if '__item_idx' in log_item['input']:
+                index = log_item['input']['__item_idx']
             else:
                 continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
+            if log_item['success']:
+                numerated_ids = pools.setdefault(log_item['input']['pool_id'], {})
+                numerated_ids[log_item['output'][output_id_field]] = index
             else:
-                validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
+                validation_errors[index] = structure(log_item['output'], Dict[str, FieldValidationError])
 
         # Like in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -178,23 +364,93 @@ class AsyncTolokaClient:
             pool_id = list(pools.keys())[0]
             item_id = list(pools[pool_id].keys())[0]
             return await get_method(item_id)
+        elif ids_only:
+            numerated_ids = {item_id: index for ids in pools.values() for item_id, index in ids.items()}
+            return self._ids_batch_create_result_from_log(numerated_ids, validation_errors or {})
         else:
-            items = await self._collect_from_pools(get_method, pools)
+            items = await self._collect_from_pools(get_method, pools, max_batch_size)
             return result_type(items=items, validation_errors=validation_errors or {})
 
-    async def _collect_from_pools(self, get_method, pools):
+    async def _collect_from_pools(self, get_method, pools, max_batch_size):
+        semaphore = asyncio.Semaphore(self._COLLECT_MAX_WORKERS)
+
+        async def collect(pool_id, numerated_ids):
+            async with semaphore:
+                return await self._collect_by_ids(
+                    functools.partial(get_method, pool_id=pool_id), numerated_ids, max_batch_size,
+                )
+
         items = {}
-        for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            async for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
+        for pool_items in await asyncio.gather(*(
+            collect(pool_id, numerated_ids) for pool_id, numerated_ids in pools.items()
+        )):
+            items.update(pool_items)
+        return items
+
+    async def _collect_by_ids(self, get_method, numerated_ids, max_batch_size):
+        items = {}
+        obj_it = get_method(
+            id_gte=min(numerated_ids.keys()),
+            id_lte=max(numerated_ids.keys()),
+            batch_size=min(len(numerated_ids), max_batch_size),
+        )
+        async for obj in obj_it:
+            if obj.id in numerated_ids:
+                items[numerated_ids[obj.id]] = obj
+                # Objects created by other writers may lie in the same id range, so stop as soon as all ours are found
+                if len(items) == len(numerated_ids):
+                    break
         return items
 
+    async def _create_in_chunks(
+        self,
+        objects: Iterable,
+        parameters: IdempotentOperationParameters,
+        chunk_size: Optional[int],
+        max_concurrent_chunks: int,
+        ids_only: bool,
+        journal: Optional[UploadJournal],
+        create_chunk: Callable,
+    ):
+        chunks = _chunked_creation.iterate_chunks(objects, _chunked_creation.get_chunk_size(parameters, chunk_size))
+        first_chunk = next(chunks)
+        second_chunk = next(chunks, None)
+        if second_chunk is None and journal is None:
+            return await create_chunk(objects=first_chunk, parameters=parameters)
+
+        # At most max_concurrent_chunks chunks are kept in memory: the next chunk is read from the input only after
+        # the oldest submitted one is merged into the result
+        merger = _chunked_creation.ChunkedBatchCreateResultMerger(parameters, ids_only, journal)
+        pending = collections.deque()
+
+        async def merge_oldest_chunk():
+            task, chunk = pending.popleft()
+            try:
+                merger.add_result(chunk, await task)
+            except ValidationApiError as exc:
+                merger.add_validation_error(chunk, exc)
+
+        try:
+            start = 0
+            read_chunks = [first_chunk] if second_chunk is None else [first_chunk, second_chunk]
+            for chunk_idx, chunk_objects in enumerate(itertools.chain(read_chunks, chunks)):
+                chunk = merger.start_chunk(chunk_idx, start, start + len(chunk_objects))
+                start += len(chunk_objects)
+                if chunk is None:
+                    continue
+                if len(pending) == max_concurrent_chunks:
+                    await merge_oldest_chunk()
+                task = asyncio.ensure_future(create_chunk(
+                    objects=chunk_objects, parameters=chunk.parameters, journaled_result=chunk.journaled_result,
+                ))
+                pending.append((task, chunk))
+            while pending:
+                await merge_oldest_chunk()
+        finally:
+            for task, _ in pending:
+                task.cancel()
+        return merger.get_result()
+
     async def _sync_via_async(
             self,
             objects: List,
@@ -204,24 +460,31 @@ class AsyncTolokaClient:
             operation_type: Operation,
             output_id_field: str,
             get_method: Callable,
+            ids_only: bool = False,
+            max_batch_size: int = 100_000,
+            journaled_result: Optional[IdsBatchCreateResult] = None,
     ):
+        if journaled_result is not None:
+            return await self._restore_journaled_result(
+                objects, journaled_result, result_type, get_method, max_batch_size, pool_related=False,
+            )
         if not parameters.async_mode:
             response = await self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return self._ids_batch_create_result(response) if ids_only else structure(response, result_type)
         is_single = not isinstance(objects, list)
         insert_operation = await self._start_sync_via_async(objects, parameters, url, operation_type)
 
         item_id_to_idx = {}
         validation_errors = {}
-        for log_item in await self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
+        async for log_item in self._stream_json_array('get', f'/v1/operations/{insert_operation.id}/log'):
+            if '__item_idx' in log_item['input']:
+                index = log_item['input']['__item_idx']
             else:
                 continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                item_id_to_idx[log_item.output[output_id_field]] = index
+            if log_item['success']:
+                item_id_to_idx[log_item['output'][output_id_field]] = index
             else:
-                validation_errors[index] = log_item.output
+                validation_errors[index] = log_item['output']
 
         # Like as in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -235,13 +498,10 @@ class AsyncTolokaClient:
         if is_single:
             item_id = list(item_id_to_idx.keys())[0]
             return await get_method(item_id)
-        else:
-            items = {}
-            obj_it = get_method(
-                id_gte=min(item_id_to_idx.keys()),
-                id_lte=max(item_id_to_idx.keys()),
+        elif ids_only:
+            return self._ids_batch_create_result_from_log(
+                item_id_to_idx, structure(validation_errors, Dict[str, Dict[str, FieldValidationError]]),
             )
-            async for obj in obj_it:
-                if obj.id in item_id_to_idx:
-                    items[item_id_to_idx[obj.id]] = obj
+        else:
+            items = await self._collect_by_ids(get_method, item_id_to_idx, max_batch_size)
             return result_type(items=items, validation_errors=validation_errors or {})
@@ -421,7 +421,7 @@ class AutoQuality:
                 if other_pool.id != pool.id:
                     pool.filter &= (Skill(self.autoquality_pool_skills[other_pool.id]) != 1)
 
-            self.toloka_client.update_pool(pool.id, pool)
+            self.toloka_client.save_pool(pool)
 
     def _open_pools(self):
         self.toloka_client.open_pool(self.training_pool_id)
@@ -454,15 +454,20 @@ class AutoQuality:
                                                    field=[GetAssignmentsTsvParameters.Field.WORKER_ID],
                                                    exclude_banned=True)
         workers = df['ASSIGNMENT:worker_id'].unique()
+        desired_values = {}
         for worker_id in workers:
             if worker_id not in self.worker_autoquality_pool_skills:
                 skill = next(pool_skills_cycle)
-                self.toloka_client.set_user_skill(
-                    skill_id=skill.id,
-                    user_id=worker_id,
-                    value=Decimal(1),
-                )
-                self.worker_autoquality_pool_skills[worker_id] = skill.id
+                desired_values.setdefault(skill.id, {})[worker_id] = Decimal(1)
+
+        for skill_id, skill_desired_values in desired_values.items():
+            report = self.toloka_client.reconcile_user_skills(skill_id, skill_desired_values)
+            for result in report.applied:
+                self.worker_autoquality_pool_skills[result.change.user_id] = skill_id
+            for user_id in report.unchanged_user_ids:
+                self.worker_autoquality_pool_skills[user_id] = skill_id
+            if report.failed:
+                raise report.failed[0].error
 
     def _wait_pool_for_all_pools_to_close(self, minutes_to_wait=0.3):
         sleep_time = 60 * minutes_to_wait
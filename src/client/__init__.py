@@ -17,7 +17,10 @@ __all__ = [
     'operations',
     'owner',
     'quality_control',
+    'reconciliation',
     'requester',
+    'review_results',
+    'search_batch_size',
     'search_requests',
     'search_results',
     'skill',
@@ -26,6 +29,7 @@ __all__ = [
     'task_distribution_function',
     'task_suite',
     'training',
+    'upload_journal',
     'user_bonus',
     'user_restriction',
     'user_skill',
@@ -35,10 +39,14 @@ __all__ = [
     'unstructure',
 
     'TolokaClient',
+    'AdaptiveBatchSize',
     'AggregatedSolution',
     'AnalyticsRequest',
     'Assignment',
     'AssignmentPatch',
+    'AssignmentReviewDecision',
+    'AssignmentReviewReport',
+    'CloneFailure',
     'CloneResults',
     'GetAssignmentsTsvParameters',
     'Attachment',
@@ -54,6 +62,7 @@ __all__ = [
     'TaskSuite',
     'Task',
     'Training',
+    'UploadJournal',
     'UserBonus',
     'UserRestriction',
     'UserSkill',
@@ -61,6 +70,7 @@ __all__ = [
     'Pool',
     'PoolPatchRequest',
     'Project',
+    'ProjectCloneError',
     'AppProject',
     'App',
     'AppItem',
@@ -69,9 +79,12 @@ __all__ = [
     'AppBatchCreateRequest',
 ]
 
+import collections
+import contextvars
 import datetime
 import functools
 import io
+import itertools
 import logging
 import threading
 import time
@@ -89,11 +102,12 @@ try:
 except ImportError:
     PANDAS_INSTALLED = False
 
+from concurrent import futures
 from decimal import Decimal
 from enum import Enum, unique
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
-from typing import BinaryIO, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Union
+from typing import BinaryIO, Callable, ClassVar, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union
 from urllib3.util.retry import Retry
 
 from . import actions
@@ -114,7 +128,10 @@ from . import operation_log
 from . import operations
 from . import owner
 from . import quality_control
+from . import reconciliation
 from . import requester
+from . import review_results
+from . import search_batch_size
 from . import search_requests
 from . import search_results
 from . import skill
@@ -123,12 +140,21 @@ from . import task
 from . import task_distribution_function
 from . import task_suite
 from . import training
+from . import upload_journal
 from . import user_bonus
 from . import user_restriction
 from . import user_skill
 from . import webhook_subscription
 
 from ..__version__ import __version__
+from . import _chunked_creation
+from ._search_streaming import (
+    StreamedSearchPage,
+    decode_search_page,
+    get_decode_executor,
+    streamed_search_page_var,
+    structure_items,
+)
 from ._converter import structure, unstructure
 from .aggregation import AggregatedSolution
 from .analytics_request import AnalyticsRequest
@@ -141,12 +167,12 @@ from .app import (
     AppBatchCreateRequest,
     AppItemsCreateRequest,
 )
-from .assignment import Assignment, AssignmentPatch, GetAssignmentsTsvParameters
+from .assignment import Assignment, AssignmentPatch, AssignmentReviewDecision, GetAssignmentsTsvParameters
 from .attachment import Attachment
-from .clone_results import CloneResults
+from .clone_results import CloneFailure, CloneResults, ProjectCloneError
 from .exceptions import (
-    IncorrectActionsApiError, raise_on_api_error, ValidationApiError, InternalApiError, TooManyRequestsApiError,
-    RemoteServiceUnavailableApiError,
+    ApiError, ConflictStateApiError, IncorrectActionsApiError, raise_on_api_error, ValidationApiError,
+    InternalApiError, TooManyRequestsApiError, RemoteServiceUnavailableApiError,
 )
 from .message_thread import (
     Folder, MessageThread, MessageThreadReply, MessageThreadFolders, MessageThreadCompose
@@ -158,17 +184,25 @@ from .primitives.base import autocast_to_enum
 from .primitives.parameter import IdempotentOperationParameters
 from .project import Project, ProjectCheckResponse, ProjectUpdateDifferenceLevel
 from .training import Training
+from .reconciliation import (
+    UserStateChange, UserStateChangeAction, UserStateChangeResult, UserStateReconciliationReport, _diff_user_restrictions,
+    _diff_user_skills,
+)
 from .requester import Requester
+from .review_results import AssignmentReviewOutcome, AssignmentReviewReport, AssignmentReviewResult
+from .search_batch_size import AdaptiveBatchSize
 from .skill import Skill
 from .task import Task
 from .task_suite import TaskSuite
 from .user_bonus import UserBonus
 from .user_restriction import UserRestriction
+from .upload_journal import UploadJournal
 from .user_skill import SetUserSkillRequest, UserSkill
 from .user import User
 from ..util import identity
-from ..util._managing_headers import add_headers, form_additional_headers, top_level_method_var
+from ..util._managing_headers import add_headers, form_additional_headers, set_variable, top_level_method_var
 from ..util._codegen import expand
+from ..util._json_stream import JSONArrayStreamParser
 from .webhook_subscription import WebhookSubscription
 
 logger = logging.getLogger(__name__)
@@ -232,6 +266,15 @@ class TolokaClient:
             verify the identity of requested hosts. Either `True` (default CA bundle),
             a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
             (which will disable verification).
+        decode_processes: The number of worker processes used to decode and structure pages of search results
+            in `get_*` methods. Decoding large pages is CPU-bound, so it limits the throughput of clients
+            used from several threads. If set, pages are downloaded entirely and decoded in a process pool shared
+            by clients with the same `decode_processes`. Default value: `None` — pages are decoded in the calling
+            thread while they are downloaded.
+        lazy_structuring: If `True`, objects yielded by `get_*` methods keep received data and convert each field
+            on first access. It speeds up iteration if only a few fields of big objects like assignments are used.
+            Such objects have the same classes and are equal to eagerly structured ones. Pages decoded in worker
+            processes are structured eagerly. Default value: `False`.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -263,12 +306,16 @@ class TolokaClient:
     EXCEPTIONS_TO_RETRY: ClassVar[Tuple[Exception]] = (
         InternalApiError, TooManyRequestsApiError, RemoteServiceUnavailableApiError, HTTPStatusError,
     )
+    # Maximum number of pools which created objects are downloaded from concurrently
+    _COLLECT_MAX_WORKERS: ClassVar[int] = 8
 
     token: str
     default_timeout: Union[float, Tuple[float, float]]
     _platform_url: Optional[str]
     url: Optional[str]
     retryer_factory: Optional[Callable[[], Retry]]
+    decode_processes: Optional[int]
+    lazy_structuring: bool
 
     def __init__(
         self,
@@ -281,6 +328,8 @@ class TolokaClient:
         retryer_factory: Optional[Callable[[], Retry]] = None,
         act_under_account_id: Optional[str] = None,
         verify: VerifyTypes = True,
+        decode_processes: Optional[int] = None,
+        lazy_structuring: bool = False,
     ):
         if url is None and environment is None:
             raise ValueError('You must pass at least one parameter: url or environment.')
@@ -312,6 +361,10 @@ class TolokaClient:
 
         self.act_under_account_id = act_under_account_id
         self.verify = verify
+        if decode_processes is not None and decode_processes <= 0:
+            raise ValueError(f'decode_processes must be positive, got {decode_processes}')
+        self.decode_processes = decode_processes
+        self.lazy_structuring = lazy_structuring
 
         self.retrying = SyncRetryingOverURLLibRetry(
             base_url=str(self._session.base_url), retry=self.retryer_factory(), reraise=True,
@@ -348,10 +401,17 @@ class TolokaClient:
             headers['X-Act-Under-Account-ID'] = self.act_under_account_id
         return headers
 
-    def _do_request_with_retries(self, method, path, **kwargs):
+    def _do_request_with_retries(self, method, path, stream: bool = False, **kwargs):
         @self.retrying.wraps
         def wrapped(method, url, **kwargs):
-            response = self._session.request(method, url, **kwargs)
+            if stream:
+                response = self._session.send(self._session.build_request(method, url, **kwargs), stream=True)
+                if not response.is_success:
+                    # Error responses are small, read them to parse the error and to make them available for retries
+                    response.read()
+                    response.close()
+            else:
+                response = self._session.request(method, url, **kwargs)
             raise_on_api_error(response)
             return response
 
@@ -387,32 +447,181 @@ class TolokaClient:
             headers['Content-Type'] = 'application/json'
         return prepared_kwargs
 
-    def _raw_request(self, method, path, **kwargs):
+    def _raw_request(self, method, path, stream: bool = False, **kwargs):
         kwargs = self._prepare_request(kwargs)
-        response = self._do_request_with_retries(method, f'/api{path}', **kwargs)
+        response = self._do_request_with_retries(method, f'/api{path}', stream=stream, **kwargs)
         return response
 
     def _request(self, method, path, **kwargs):
         return self._raw_request(method, path, **kwargs).json(parse_float=Decimal)
 
+    def _stream_json_array(self, method, path, **kwargs):
+        """Yields items of a JSON array response body while it is being downloaded.
+
+        If reading the body fails, the request is sent again and the items that were already yielded are skipped.
+        """
+
+        def parse(response):
+            parser = JSONArrayStreamParser(parse_float=Decimal)
+            for text in response.iter_text():
+                yield from parser.feed(text)
+            yield from parser.close()
+
+        yielded_count = 0
+        retry = None
+        while True:
+            response = self._raw_request(method, path, stream=True, **kwargs)
+            try:
+                for idx, item in enumerate(parse(response)):
+                    if idx >= yielded_count:
+                        yielded_count += 1
+                        yield item
+                return
+            except httpx.TransportError as exc:
+                retry = self.retrying.increment_on_body_error(retry, method, f'/api{path}', exc)
+                if retry is None:
+                    raise
+                logger.warning('Failed to read the response of %s %s, retrying: %r', method.upper(), path, exc)
+                time.sleep(retry.get_backoff_time())
+            finally:
+                response.close()
+
     def _search_request(self, method, path, request, sort, limit):
         params = unstructure(request) or {}
         if sort is not None:
             params['sort'] = unstructure(sort)
         if limit:
             params['limit'] = limit
+        streamed_page = streamed_search_page_var.get()
+        if streamed_page is not None:
+            # The body is parsed by _find_all, the find_* method structures an empty page
+            streamed_page.response = self._raw_request(method, path, stream=True, params=params)
+            return {}
         return self._request(method, path, params=params)
 
-    def _find_all(self, find_function, request, sort_field: str = 'id', items_field: str = 'items', batch_size: Optional[int] = None):
-        result = find_function(request, sort=[sort_field], limit=batch_size)
-        items = getattr(result, items_field)
-        while result.has_more:
-            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(items[-1], sort_field)})
+    def _find_all(
+        self, find_function, request, sort_field: str = 'id', items_field: str = 'items',
+        batch_size: Union[int, AdaptiveBatchSize, None] = None, max_limit: int = 100_000,
+    ):
+        # Adaptive limits are capped by the maximum limit of the find_function endpoint
+        adaptive = batch_size if isinstance(batch_size, AdaptiveBatchSize) else None
+        limit = batch_size if adaptive is None else min(adaptive.get_initial_size(), max_limit)
+        retry = None
+        while True:
+            page = StreamedSearchPage(items_field=items_field)
+            started = time.perf_counter()
+            with set_variable(streamed_search_page_var, page):
+                result = find_function(request, sort=[sort_field], limit=limit)
+            try:
+                if adaptive is None:
+                    generator = self._stream_search_page(page, result)
+                    yield from generator
+                else:
+                    items_count = 0
+                    consumer_seconds = 0.0
+                    for item in self._stream_search_page(page, result):
+                        items_count += 1
+                        yielded = time.perf_counter()
+                        yield item
+                        consumer_seconds += time.perf_counter() - yielded
+                    seconds = time.perf_counter() - started - consumer_seconds
+                    limit = min(adaptive.get_next_size(limit, items_count, seconds, page.bytes_count), max_limit)
+            except httpx.TransportError as exc:
+                retry = self._increment_search_page_retry(retry, page, exc)
+                time.sleep(retry.get_backoff_time())
+                # The page is requested again starting after the last yielded item
+                if page.last_item is not None:
+                    request = attr.evolve(request, **{f'{sort_field}_gt': getattr(page.last_item, sort_field)})
+                continue
+            retry = None
+            if not page.has_more:
+                return
+            request = attr.evolve(request, **{f'{sort_field}_gt': getattr(page.last_item, sort_field)})
+
+    def _find_all_pages(
+        self, find_function, request, sort_field: str = 'id', items_field: str = 'items',
+        batch_size: Union[int, AdaptiveBatchSize, None] = None, max_limit: int = 100_000,
+    ):
+        # Adaptive limits are capped by the maximum limit of the find_function endpoint
+        adaptive = batch_size if isinstance(batch_size, AdaptiveBatchSize) else None
+        limit = batch_size if adaptive is None else min(adaptive.get_initial_size(), max_limit)
+        retry = None
+        while True:
+            page = StreamedSearchPage(items_field=items_field)
+            started = time.perf_counter()
+            with set_variable(streamed_search_page_var, page):
+                result = find_function(request, sort=[sort_field], limit=limit)
+            try:
+                items = list(self._stream_search_page(page, result))
+            except httpx.TransportError as exc:
+                retry = self._increment_search_page_retry(retry, page, exc)
+                time.sleep(retry.get_backoff_time())
+                continue
+            retry = None
+            if adaptive is not None:
+                seconds = time.perf_counter() - started
+                limit = min(adaptive.get_next_size(limit, len(items), seconds, page.bytes_count), max_limit)
+            next_request = None
+            if page.has_more:
+                next_request = attr.evolve(request, **{f'{sort_field}_gt': getattr(page.last_item, sort_field)})
+            yield search_results.SearchResultPage(items=items, has_more=page.has_more, next_request=next_request)
+            if next_request is None:
+                return
+            request = next_request
+
+    def _increment_search_page_retry(self, retry, page: StreamedSearchPage, exc: httpx.TransportError):
+        """Counts an error raised while a search page is being read. Reraises the error if it can't be retried."""
+
+        request = page.response.request
+        retry = self.retrying.increment_on_body_error(retry, request.method, request.url.path, exc)
+        if retry is None:
+            raise exc
+        logger.warning('Failed to read the search page %s, retrying: %r', request.url, exc)
+        return retry
+
+    def _stream_search_page(self, page: StreamedSearchPage, result):
+        """Yields items of a search page while the response body is being downloaded."""
+
+        if page.response is None:
+            # The find function doesn't use _search_request, the page is already structured
+            items = getattr(result, page.items_field)
+            page.has_more = result.has_more
+            page.last_item = items[-1] if items else None
             yield from items
-            result = find_function(request, sort=[sort_field], limit=batch_size)
-            items = getattr(result, items_field)
+            return
 
-        yield from items
+        result_type = type(result)
+        if self.decode_processes:
+            try:
+                content = page.response.read()
+            finally:
+                page.response.close()
+            future = get_decode_executor(self.decode_processes).submit(
+                decode_search_page, content, result_type, page.items_field,
+            )
+            items, page.has_more = future.result()
+            page.bytes_count = len(content)
+            page.last_item = items[-1] if items else None
+            yield from items
+            return
+
+        try:
+            parser = JSONArrayStreamParser(parse_float=Decimal, items_field=page.items_field)
+            for chunk in page.response.iter_bytes():
+                items = structure_items(
+                    result_type, page.items_field, parser.feed(page.decode(chunk)), self.lazy_structuring,
+                )
+                if items:
+                    page.last_item = items[-1]
+                yield from items
+            raw_items = parser.feed(page.decode(b'', final=True)) + parser.close()
+            items = structure_items(result_type, page.items_field, raw_items, self.lazy_structuring)
+            if items:
+                page.last_item = items[-1]
+            yield from items
+        finally:
+            page.response.close()
+        page.has_more = structure(parser.fields, result_type).has_more
 
     def _async_create_objects_idempotent(
         self,
@@ -464,25 +673,32 @@ class TolokaClient:
             operation_type: operations.Operation,
             output_id_field: str,
             get_method: Callable,
+            ids_only: bool = False,
+            max_batch_size: int = 100_000,
+            journaled_result: Optional[batch_create_results.IdsBatchCreateResult] = None,
     ):
+        if journaled_result is not None:
+            return self._restore_journaled_result(
+                objects, journaled_result, result_type, get_method, max_batch_size, pool_related=True,
+            )
         if not parameters.async_mode:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return self._ids_batch_create_result(response) if ids_only else structure(response, result_type)
         is_single = not isinstance(objects, list)
         insert_operation = self._start_sync_via_async(objects, parameters, url, operation_type)
 
         pools = {}
         validation_errors = {}
-        for log_item in self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
+        for log_item in self._stream_json_array('get', f'/v1/operations/{insert_operation.id}/log'):
+            if '__item_idx' in log_item['input']:
+                index = log_item['input']['__item_idx']
             else:
                 continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                numerated_ids = pools.setdefault(log_item.input['pool_id'], {})
-                numerated_ids[log_item.output[output_id_field]] = index
+            if log_item['success']:
+                numerated_ids = pools.setdefault(log_item['input']['pool_id'], {})
+                numerated_ids[log_item['output'][output_id_field]] = index
             else:
-                validation_errors[index] = structure(log_item.output, Dict[str, FieldValidationError])
+                validation_errors[index] = structure(log_item['output'], Dict[str, FieldValidationError])
 
         # Like in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -497,23 +713,171 @@ class TolokaClient:
             pool_id = list(pools.keys())[0]
             item_id = list(pools[pool_id].keys())[0]
             return get_method(item_id)
+        elif ids_only:
+            numerated_ids = {item_id: index for ids in pools.values() for item_id, index in ids.items()}
+            return self._ids_batch_create_result_from_log(numerated_ids, validation_errors)
         else:
-            items = self._collect_from_pools(get_method, pools)
+            items = self._collect_from_pools(get_method, pools, max_batch_size)
             return result_type(items=items, validation_errors=validation_errors)
 
-    def _collect_from_pools(self, get_method, pools):
+    def _collect_from_pools(self, get_method, pools, max_batch_size):
+        if len(pools) == 1:
+            pool_id, numerated_ids = next(iter(pools.items()))
+            return self._collect_by_ids(functools.partial(get_method, pool_id=pool_id), numerated_ids, max_batch_size)
+
+        # Pools are independent id ranges, so they are scanned concurrently
         items = {}
-        for pool_id, numerated_ids in pools.items():
-            obj_it = get_method(
-                pool_id=pool_id,
-                id_gte=min(numerated_ids.keys()),
-                id_lte=max(numerated_ids.keys()),
-            )
-            for obj in obj_it:
-                if obj.id in numerated_ids:
-                    items[numerated_ids[obj.id]] = obj
+        with futures.ThreadPoolExecutor(max_workers=min(len(pools), self._COLLECT_MAX_WORKERS)) as executor:
+            pool_futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._collect_by_ids, functools.partial(get_method, pool_id=pool_id), numerated_ids, max_batch_size,
+                )
+                for pool_id, numerated_ids in pools.items()
+            ]
+            for future in pool_futures:
+                items.update(future.result())
+        return items
+
+    def _collect_by_ids(self, get_method, numerated_ids, max_batch_size):
+        items = {}
+        obj_it = get_method(
+            id_gte=min(numerated_ids.keys()),
+            id_lte=max(numerated_ids.keys()),
+            batch_size=min(len(numerated_ids), max_batch_size),
+        )
+        for obj in obj_it:
+            if obj.id in numerated_ids:
+                items[numerated_ids[obj.id]] = obj
+                # Objects created by other writers may lie in the same id range, so stop as soon as all ours are found
+                if len(items) == len(numerated_ids):
+                    break
         return items
 
+    def _restore_journaled_result(
+        self, objects, journaled_result, result_type, get_method: Callable, max_batch_size: int, pool_related: bool,
+    ):
+        """Downloads objects of a chunk created during a previous run using IDs saved in the upload journal."""
+
+        validation_errors = journaled_result.validation_errors or {}
+        if not journaled_result.items:
+            return result_type(items={}, validation_errors=validation_errors)
+        if pool_related:
+            pools = {}
+            for index, item_id in journaled_result.items.items():
+                pools.setdefault(objects[int(index)].pool_id, {})[item_id] = index
+            items = self._collect_from_pools(get_method, pools, max_batch_size)
+        else:
+            numerated_ids = {item_id: index for index, item_id in journaled_result.items.items()}
+            items = self._collect_by_ids(get_method, numerated_ids, max_batch_size)
+        return result_type(items=items, validation_errors=validation_errors)
+
+    def _create_in_chunks(
+        self,
+        objects: Iterable,
+        parameters: IdempotentOperationParameters,
+        chunk_size: Optional[int],
+        max_concurrent_chunks: int,
+        ids_only: bool,
+        journal: Optional[UploadJournal],
+        create_chunk: Callable,
+    ):
+        chunks = _chunked_creation.iterate_chunks(objects, _chunked_creation.get_chunk_size(parameters, chunk_size))
+        first_chunk = next(chunks)
+        second_chunk = next(chunks, None)
+        if second_chunk is None and journal is None:
+            return create_chunk(objects=first_chunk, parameters=parameters)
+
+        # At most max_concurrent_chunks chunks are kept in memory: the next chunk is read from the input only after
+        # the oldest submitted one is merged into the result
+        merger = _chunked_creation.ChunkedBatchCreateResultMerger(parameters, ids_only, journal)
+        pending = collections.deque()
+
+        def merge_oldest_chunk():
+            future, chunk = pending.popleft()
+            try:
+                merger.add_result(chunk, future.result())
+            except ValidationApiError as exc:
+                merger.add_validation_error(chunk, exc)
+
+        with futures.ThreadPoolExecutor(max_workers=max_concurrent_chunks) as executor:
+            start = 0
+            read_chunks = [first_chunk] if second_chunk is None else [first_chunk, second_chunk]
+            for chunk_idx, chunk_objects in enumerate(itertools.chain(read_chunks, chunks)):
+                chunk = merger.start_chunk(chunk_idx, start, start + len(chunk_objects))
+                start += len(chunk_objects)
+                if chunk is None:
+                    continue
+                if len(pending) == max_concurrent_chunks:
+                    merge_oldest_chunk()
+                future = executor.submit(
+                    contextvars.copy_context().run, create_chunk,
+                    objects=chunk_objects, parameters=chunk.parameters, journaled_result=chunk.journaled_result,
+                )
+                pending.append((future, chunk))
+            while pending:
+                merge_oldest_chunk()
+        return merger.get_result()
+
+    def _map_concurrently(self, func: Callable, items: Iterable, concurrency: int) -> List:
+        """Calls the function for every item with at most `concurrency` calls at the same time.
+
+        Items are read lazily. Results are returned in the order of items.
+        """
+
+        if concurrency <= 0:
+            raise ValueError(f'concurrency must be positive, got {concurrency}')
+
+        results = {}
+        pending = {}
+
+        def collect_completed():
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for idx, item in enumerate(items):
+                if len(pending) == concurrency:
+                    collect_completed()
+                pending[executor.submit(contextvars.copy_context().run, func, item)] = idx
+            while pending:
+                collect_completed()
+        return [results[idx] for idx in range(len(results))]
+
+    def _apply_user_state_change(self, change: UserStateChange) -> UserStateChangeResult:
+        try:
+            if change.action == UserStateChangeAction.DELETE:
+                if isinstance(change.current, UserSkill):
+                    self.delete_user_skill(change.current.id)
+                else:
+                    self.delete_user_restriction(change.current.id)
+            elif isinstance(change.desired, SetUserSkillRequest):
+                self.set_user_skill(change.desired)
+            else:
+                self.set_user_restriction(change.desired)
+        except (ApiError, httpx.HTTPError) as exc:
+            logger.warning('Failed to %s the state of Toloker %s: %r', change.action.value.lower(), change.user_id, exc)
+            return UserStateChangeResult(change=change, error=exc)
+        return UserStateChangeResult(change=change)
+
+    @staticmethod
+    def _ids_batch_create_result(response):
+        return structure(
+            {
+                'items': {index: item['id'] for index, item in response['items'].items()},
+                'validation_errors': response.get('validation_errors'),
+            },
+            batch_create_results.IdsBatchCreateResult,
+        )
+
+    @staticmethod
+    def _ids_batch_create_result_from_log(numerated_ids, validation_errors):
+        return batch_create_results.IdsBatchCreateResult(
+            items={index: item_id for item_id, index in sorted(numerated_ids.items(), key=lambda item: int(item[1]))},
+            validation_errors=validation_errors,
+        )
+
     def _sync_via_async(
             self,
             objects: List,
@@ -523,24 +887,31 @@ class TolokaClient:
             operation_type: operations.Operation,
             output_id_field: str,
             get_method: Callable,
+            ids_only: bool = False,
+            max_batch_size: int = 100_000,
+            journaled_result: Optional[batch_create_results.IdsBatchCreateResult] = None,
     ):
+        if journaled_result is not None:
+            return self._restore_journaled_result(
+                objects, journaled_result, result_type, get_method, max_batch_size, pool_related=False,
+            )
         if not parameters.async_mode:
             response = self._request('post', url, json=unstructure(objects), params=unstructure(parameters))
-            return structure(response, result_type)
+            return self._ids_batch_create_result(response) if ids_only else structure(response, result_type)
         is_single = not isinstance(objects, list)
         insert_operation = self._start_sync_via_async(objects, parameters, url, operation_type)
 
         item_id_to_idx = {}
         validation_errors = {}
-        for log_item in self.get_operation_log(insert_operation.id):
-            if '__item_idx' in log_item.input:
-                index = log_item.input['__item_idx']
+        for log_item in self._stream_json_array('get', f'/v1/operations/{insert_operation.id}/log'):
+            if '__item_idx' in log_item['input']:
+                index = log_item['input']['__item_idx']
             else:
                 continue  # operation could be not just creating objects (e.g. open_pool while creating_object)
-            if log_item.success:
-                item_id_to_idx[log_item.output[output_id_field]] = index
+            if log_item['success']:
+                item_id_to_idx[log_item['output'][output_id_field]] = index
             else:
-                validation_errors[index] = log_item.output
+                validation_errors[index] = log_item['output']
 
         # Like as in sync methods Exception will raise
         # even if the skip_invalid_items=True but no objects are created
@@ -554,15 +925,12 @@ class TolokaClient:
         if is_single:
             item_id = list(item_id_to_idx.keys())[0]
             return get_method(item_id)
-        else:
-            items = {}
-            obj_it = get_method(
-                id_gte=min(item_id_to_idx.keys()),
-                id_lte=max(item_id_to_idx.keys()),
+        elif ids_only:
+            return self._ids_batch_create_result_from_log(
+                item_id_to_idx, structure(validation_errors, Dict[str, Dict[str, FieldValidationError]]),
             )
-            for obj in obj_it:
-                if obj.id in item_id_to_idx:
-                    items[item_id_to_idx[obj.id]] = obj
+        else:
+            items = self._collect_by_ids(get_method, item_id_to_idx, max_batch_size)
             return result_type(items=items, validation_errors=validation_errors)
 
     # Aggregation section
@@ -687,7 +1055,7 @@ class TolokaClient:
     def get_aggregated_solutions(
         self,
         operation_id: str, request: search_requests.AggregatedSolutionSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[AggregatedSolution, None, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -708,6 +1076,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -729,6 +1098,36 @@ class TolokaClient:
         generator = self._find_all(find_function, request, sort_field='task_id', batch_size=batch_size)
         yield from generator
 
+    @expand('request')
+    @add_headers('client')
+    def get_aggregated_solutions_pages(
+        self,
+        operation_id: str, request: search_requests.AggregatedSolutionSearchRequest,
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
+    ) -> Generator[search_results.SearchResultPage, None, None]:
+        """Finds all aggregated responses that match certain criteria and yields them page by page.
+
+        `get_aggregated_solutions_pages` works like [get_aggregated_solutions](toloka.client.TolokaClient.get_aggregated_solutions.md)
+        but yields whole pages of search results. Use it to process aggregated responses in batches.
+
+        Args:
+            operation_id: The ID of the aggregation operation.
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with aggregated responses and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_aggregated_solutions_pages(aggregation_operation.id, batch_size=10000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        find_function = functools.partial(self.find_aggregated_solutions, operation_id)
+        generator = self._find_all_pages(find_function, request, sort_field='task_id', batch_size=batch_size)
+        yield from generator
+
     # Assignments section
 
     @add_headers('client')
@@ -809,7 +1208,7 @@ class TolokaClient:
     def get_assignments(
         self,
         request: search_requests.AssignmentSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -821,6 +1220,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Assignment: The next matching assignment.
@@ -836,6 +1236,33 @@ class TolokaClient:
         generator = self._find_all(self.find_assignments, request, batch_size=batch_size)
         yield from generator
 
+    @expand('request')
+    @add_headers('client')
+    def get_assignments_pages(
+        self,
+        request: search_requests.AssignmentSearchRequest,
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
+    ) -> Generator[search_results.SearchResultPage, None, None]:
+        """Finds all assignments that match certain criteria and yields them page by page.
+
+        `get_assignments_pages` works like [get_assignments](toloka.client.TolokaClient.get_assignments.md) but yields whole pages of search results. Use it to process assignments in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with assignments and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_assignments_pages(pool_id='1080020', status='ACCEPTED', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        generator = self._find_all_pages(self.find_assignments, request, batch_size=batch_size)
+        yield from generator
+
     @expand('patch')
     @add_headers('client')
     def patch_assignment(self, assignment_id: str, patch: AssignmentPatch) -> Assignment:
@@ -880,6 +1307,59 @@ class TolokaClient:
         """
         return self.patch_assignment(assignment_id, public_comment=public_comment, status=Assignment.REJECTED)
 
+    @add_headers('client')
+    def review_assignments(
+        self,
+        decisions: Iterable[AssignmentReviewDecision],
+        concurrency: int = 10,
+    ) -> AssignmentReviewReport:
+        """Accepts and rejects assignments in parallel.
+
+        Decisions are read from the iterable lazily, so it may be a generator over a large file or over
+        [AssignmentCursor](toloka.streaming.cursor.AssignmentCursor.md) events. At most `concurrency` requests are sent
+        at the same time. Requests that fail because of the rate limit are retried like all other requests of the client.
+
+        Assignments that were reviewed before are reported with the `ALREADY_REVIEWED` outcome and are considered
+        successful, so the method may be safely called again for the same decisions. Other errors don't stop the review:
+        they are reported with the `FAILED` outcome.
+
+        Args:
+            decisions: Decisions to accept or reject assignments.
+            concurrency: The maximum number of simultaneous requests. Default value: 10.
+
+        In `AsyncTolokaClient` decisions may be read from an async iterable as well.
+
+        Returns:
+            AssignmentReviewReport: Results of the review in the order of decisions.
+
+        Example:
+            Accepting all submitted assignments in a pool.
+
+            >>> from toloka.client import AssignmentReviewDecision
+            >>> from toloka.streaming import AssignmentCursor
+            >>> cursor = AssignmentCursor(pool_id='1080020', event_type='SUBMITTED', toloka_client=toloka_client)
+            >>> report = toloka_client.review_assignments(
+            >>>     AssignmentReviewDecision(assignment_id=event.assignment.id, status='ACCEPTED')
+            >>>     for event in cursor
+            >>> )
+            >>> print(len(report.failed))
+            ...
+        """
+        results = self._map_concurrently(self._review_assignment, decisions, concurrency)
+        return AssignmentReviewReport(results=results)
+
+    def _review_assignment(self, decision: AssignmentReviewDecision) -> AssignmentReviewResult:
+        try:
+            assignment = self.patch_assignment(
+                decision.assignment_id, public_comment=decision.public_comment, status=decision.status,
+            )
+        except ConflictStateApiError as exc:
+            return AssignmentReviewResult(decision=decision, outcome=AssignmentReviewOutcome.ALREADY_REVIEWED, error=exc)
+        except (ApiError, httpx.HTTPError) as exc:
+            logger.warning('Failed to review assignment %s: %r', decision.assignment_id, exc)
+            return AssignmentReviewResult(decision=decision, outcome=AssignmentReviewOutcome.FAILED, error=exc)
+        return AssignmentReviewResult(decision=decision, outcome=AssignmentReviewOutcome.REVIEWED, assignment=assignment)
+
     # Attachment section
 
     @expand('request')
@@ -938,7 +1418,7 @@ class TolokaClient:
     def get_attachments(
         self,
         request: search_requests.AttachmentSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -950,6 +1430,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Attachment: The next matching attachment.
@@ -960,7 +1441,7 @@ class TolokaClient:
             >>> attachments = list(toloka_client.get_attachments(pool_id='1080020'))
             ...
         """
-        generator = self._find_all(self.find_attachments, request, batch_size=batch_size)
+        generator = self._find_all(self.find_attachments, request, batch_size=batch_size, max_limit=100)
         yield from generator
 
     @add_headers('client')
@@ -1100,7 +1581,7 @@ class TolokaClient:
     def get_message_threads(
         self,
         request: search_requests.MessageThreadSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[MessageThread, None, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1112,6 +1593,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1122,7 +1604,7 @@ class TolokaClient:
             >>> message_threads = toloka_client.get_message_threads(folder=['INBOX', 'UNREAD'])
             ...
         """
-        generator = self._find_all(self.find_message_threads, request, batch_size=batch_size)
+        generator = self._find_all(self.find_message_threads, request, batch_size=batch_size, max_limit=300)
         yield from generator
 
     @autocast_to_enum
@@ -1228,6 +1710,7 @@ class TolokaClient:
         """
         response = self._request('post', '/v1/projects', json=unstructure(project))
         result = structure(response, Project)
+        result._take_snapshot()
         logger.info(f'A new project with ID "{result.id}" has been created. Link to open in web interface: {self._platform_url}/requester/project/{result.id}')
         return result
 
@@ -1279,14 +1762,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/projects/{project_id}')
-        return structure(response, Project)
+        result = structure(response, Project)
+        result._take_snapshot()
+        return result
 
     @expand('request')
     @add_headers('client')
     def get_projects(
         self,
         request: search_requests.ProjectSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Project, None, None]:
         """Finds all projects that match certain criteria.
 
@@ -1298,6 +1783,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Project: The next matching project.
@@ -1312,7 +1798,7 @@ class TolokaClient:
             >>> my_projects = toloka_client.get_projects()
             ...
         """
-        generator = self._find_all(self.find_projects, request, batch_size=batch_size)
+        generator = self._find_all(self.find_projects, request, batch_size=batch_size, max_limit=300)
         yield from generator
 
     @add_headers('client')
@@ -1333,7 +1819,33 @@ class TolokaClient:
             ...
         """
         response = self._request('put', f'/v1/projects/{project_id}', json=unstructure(project))
-        return structure(response, Project)
+        result = structure(response, Project)
+        result._take_snapshot()
+        return result
+
+    @add_headers('client')
+    def save_project(self, project: Project) -> Project:
+        """Saves changes of a project to Toloka.
+
+        Unlike [update_project](toloka.client.TolokaClient.update_project.md), `save_project` doesn't send a request
+        if the project wasn't changed since it was received from Toloka.
+
+        Args:
+            project: The project received from Toloka and then changed.
+
+        Returns:
+            Project: The project with updated parameters, or the same project if it wasn't changed.
+
+        Example:
+            >>> project = toloka_client.get_project(project_id='92694')
+            >>> project.private_comment = 'example project'
+            >>> project = toloka_client.save_project(project)
+            ...
+        """
+        if project.get_changed_fields() == set():
+            logger.debug('Project %s is not changed, skipping update', project.id)
+            return project
+        return self.update_project(project.id, project)
 
     @add_headers('client')
     def check_update_project_for_major_version_change(
@@ -1361,10 +1873,12 @@ class TolokaClient:
         return ProjectCheckResponse.structure(response).difference_level
 
     @add_headers('client')
-    def clone_project(self, project_id: str, reuse_controllers: bool = True) -> CloneResults:
+    def clone_project(self, project_id: str, reuse_controllers: bool = True, concurrency: int = 10) -> CloneResults:
         """Clones a project and all pools and trainings inside it.
 
-        `clone_project` emulates cloning behavior via Toloka interface. Note that it calls several API methods. If some method fails then the project may be partially cloned.
+        `clone_project` emulates cloning behavior via Toloka interface. Note that it calls several API methods.
+        Trainings are created in parallel first, then pools are created in parallel. If some pools or trainings are not cloned,
+        the others are cloned anyway and the [ProjectCloneError](toloka.client.clone_results.ProjectCloneError.md) is raised.
 
         Important notes:
         * No tasks are cloned.
@@ -1380,10 +1894,14 @@ class TolokaClient:
                 * `False` — Use separate quality controllers.
 
                 Default value: `True`.
+            concurrency: The maximum number of pools or trainings created at the same time. Default value: 10.
 
         Returns:
             Tuple[Project, List[Pool], List[Training]]: Created project, pools and trainings.
 
+        Raises:
+            ProjectCloneError: Some pools or trainings were not cloned. The error contains created objects and failures.
+
         Example:
 
             >>> project, pools, trainings = toloka_client.clone_project(
@@ -1414,30 +1932,69 @@ class TolokaClient:
         project_for_clone.quality_control = None
         new_project = self.create_project(project_for_clone)
 
+        def get_training_error(quality_control):
+            training_requirement = getattr(quality_control, 'training_requirement', None)
+            return failed_training_errors.get(getattr(training_requirement, 'training_pool_id', None))
+
         # create trainings
-        new_trainings = []
-        old_to_new_train_ids = {}
+        trainings = []
         for training in self.get_trainings(project_id=project_id):  # noqa
-            old_id = training.id
             training.project_id = new_project.id
-            new_training = self.create_training(training)
-            new_trainings.append(new_training)
-            old_to_new_train_ids[old_id] = new_training.id
+            trainings.append(training)
+        training_results = self._map_concurrently(self._create_clone, trainings, concurrency)
+
+        new_trainings = []
+        old_to_new_train_ids = {}
+        failures = []
+        failed_training_errors = {}
+        for training, (new_training, error) in zip(trainings, training_results):
+            if error is None:
+                new_trainings.append(new_training)
+                old_to_new_train_ids[training.id] = new_training.id
+            else:
+                failures.append(CloneFailure(source=training, error=error))
+                failed_training_errors[training.id] = error
 
         # save quality control on project
-        reset_quality_control(project_quality_control, old_to_new_train_ids)
-        if project_quality_control is not None:
+        if project_quality_control is not None and get_training_error(project_quality_control) is not None:
+            project_for_clone.quality_control = project_quality_control
+            failures.append(CloneFailure(source=project_for_clone, error=get_training_error(project_quality_control)))
+        elif project_quality_control is not None:
+            reset_quality_control(project_quality_control, old_to_new_train_ids)
             new_project.quality_control = project_quality_control
             new_project = self.update_project(new_project.id, new_project)
 
         # create new pools
-        new_pools = []
+        pools = []
         for pool in self.get_pools(project_id=project_id):
+            if get_training_error(pool.quality_control) is not None:
+                failures.append(CloneFailure(source=pool, error=get_training_error(pool.quality_control)))
+                continue
             pool.project_id = new_project.id
             reset_quality_control(pool.quality_control, old_to_new_train_ids)
-            new_pools.append(self.create_pool(pool))
+            pools.append(pool)
+        pool_results = self._map_concurrently(self._create_clone, pools, concurrency)
+
+        new_pools = []
+        for pool, (new_pool, error) in zip(pools, pool_results):
+            if error is None:
+                new_pools.append(new_pool)
+            else:
+                failures.append(CloneFailure(source=pool, error=error))
 
-        return CloneResults(project=new_project, pools=new_pools, trainings=new_trainings)
+        results = CloneResults(project=new_project, pools=new_pools, trainings=new_trainings)
+        if failures:
+            raise ProjectCloneError(results=results, failures=failures)
+        return results
+
+    def _create_clone(self, source: Union[Pool, Training]) -> Tuple[Union[Pool, Training, None], Optional[Exception]]:
+        try:
+            if isinstance(source, Training):
+                return self.create_training(source), None
+            return self.create_pool(source), None
+        except (ApiError, httpx.HTTPError) as exc:
+            logger.warning('Failed to clone %s %s: %r', type(source).__name__.lower(), source.id, exc)
+            return None, exc
 
     # Pool section
 
@@ -1675,6 +2232,7 @@ class TolokaClient:
             params['storage_key'] = tier
         response = self._request('post', '/v1/pools', json=unstructure(pool), params=params)
         result = structure(response, Pool)
+        result._take_snapshot()
         logger.info(
             f'A new pool with ID "{result.id}" has been created. Link to open in web interface: '
             f'{self._platform_url}/requester/project/{result.project_id}/pool/{result.id}'
@@ -1742,14 +2300,16 @@ class TolokaClient:
             ...
         """
         response = self._request('get', f'/v1/pools/{pool_id}')
-        return structure(response, Pool)
+        result = structure(response, Pool)
+        result._take_snapshot()
+        return result
 
     @expand('request')
     @add_headers('client')
     def get_pools(
         self,
         request: search_requests.PoolSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Pool, None, None]:
         """Finds all pools that match certain criteria.
 
@@ -1761,6 +2321,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Pool: The next matching pool.
@@ -1772,7 +2333,7 @@ class TolokaClient:
             ...
 
         """
-        generator = self._find_all(self.find_pools, request, batch_size=batch_size)
+        generator = self._find_all(self.find_pools, request, batch_size=batch_size, max_limit=300)
         yield from generator
 
     @add_headers('client')
@@ -1846,7 +2407,9 @@ class TolokaClient:
             ...
         """
         response = self._request('patch', f'/v1/pools/{pool_id}', json=unstructure(request))
-        return structure(response, Pool)
+        result = structure(response, Pool)
+        result._take_snapshot()
+        return result
 
     @add_headers('client')
     def update_pool(self, pool_id: str, pool: Pool) -> Pool:
@@ -1868,7 +2431,43 @@ class TolokaClient:
         if pool.type == Pool.Type.TRAINING:
             raise ValueError('Training pools are not supported')
         response = self._request('put', f'/v1/pools/{pool_id}', json=unstructure(pool))
-        return structure(response, Pool)
+        result = structure(response, Pool)
+        result._take_snapshot()
+        return result
+
+    @add_headers('client')
+    def save_pool(self, pool: Pool) -> Pool:
+        """Saves changes of a pool to Toloka sending as little data as possible.
+
+        The pool is compared with its state when it was received from Toloka:
+        * If nothing is changed, no request is sent.
+        * If only parameters supported by [PoolPatchRequest](toloka.client.pool.PoolPatchRequest.md) are changed,
+            they are sent with the [patch_pool](toloka.client.TolokaClient.patch_pool.md) method.
+        * Otherwise, or if changes of the pool aren't tracked, for example, if the pool was created locally or found
+            with [find_pools](toloka.client.TolokaClient.find_pools.md), all parameters are sent with
+            the [update_pool](toloka.client.TolokaClient.update_pool.md) method.
+
+        Args:
+            pool: The pool with new parameters.
+
+        Returns:
+            Pool: The pool with updated parameters, or the same pool if it wasn't changed.
+
+        Example:
+            >>> pool = toloka_client.get_pool(pool_id='1080020')
+            >>> pool.priority = 100
+            >>> pool = toloka_client.save_pool(pool)  # sends only the priority
+            ...
+        """
+        changed_fields = pool.get_changed_fields()
+        if changed_fields == set():
+            logger.debug('Pool %s is not changed, skipping update', pool.id)
+            return pool
+        patchable_fields = {field.name for field in attr.fields(PoolPatchRequest) if field.name != '_unexpected'}
+        if changed_fields is not None and changed_fields <= patchable_fields:
+            patch = PoolPatchRequest(**{field: getattr(pool, field) for field in changed_fields})
+            return self.patch_pool(pool.id, patch)
+        return self.update_pool(pool.id, pool)
 
     # Training section
 
@@ -2122,7 +2721,7 @@ class TolokaClient:
     def get_trainings(
         self,
         request: search_requests.TrainingSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Training, None, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2134,6 +2733,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Training: The next matching training.
@@ -2144,7 +2744,7 @@ class TolokaClient:
             >>> trainings = toloka_client.get_trainings(project_id='92694')
             ...
         """
-        generator = self._find_all(self.find_trainings, request, batch_size=batch_size)
+        generator = self._find_all(self.find_trainings, request, batch_size=batch_size, max_limit=300)
         yield from generator
 
     @add_headers('client')
@@ -2306,7 +2906,7 @@ class TolokaClient:
     def get_skills(
         self,
         request: search_requests.SkillSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Skill, None, None]:
         """Finds all skills that match certain criteria.
 
@@ -2318,6 +2918,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Skill: The next matching skill.
@@ -2332,7 +2933,7 @@ class TolokaClient:
             >>>     print('Create new segmentation skill here')
             ...
         """
-        generator = self._find_all(self.find_skills, request, batch_size=batch_size)
+        generator = self._find_all(self.find_skills, request, batch_size=batch_size, max_limit=100)
         yield from generator
 
     @add_headers('client')
@@ -2443,8 +3044,12 @@ class TolokaClient:
     @add_headers('client')
     def create_tasks(
         self,
-        tasks: List[Task], parameters: Optional[task.CreateTasksParameters] = None
-    ) -> batch_create_results.TaskBatchCreateResult:
+        tasks: Iterable[Task], parameters: Optional[task.CreateTasksParameters] = None,
+        *, ids_only: bool = False,
+        chunk_size: Optional[int] = None,
+        max_concurrent_chunks: int = _chunked_creation.DEFAULT_MAX_CONCURRENT_CHUNKS,
+        journal: Optional[UploadJournal] = None,
+    ) -> Union[batch_create_results.TaskBatchCreateResult, batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can create general and control tasks together. Tasks can be added to different pools.
@@ -2458,12 +3063,25 @@ class TolokaClient:
 
         You can send no more than 100,000 requests per minute and no more than 2,000,000 requests per day.
 
+        If there are more tasks than `chunk_size`, they are split into chunks which are created by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily,
+        so `tasks` may be a generator producing millions of tasks. Each chunk gets a deterministic `operation_id` derived
+        from the `operation_id` parameter, so repeated calls with the same `operation_id` do not create duplicates.
+
         Args:
-            tasks: A list of tasks to be created.
+            tasks: Tasks to be created. A list or any other iterable.
             parameters: Additional parameters of the request.
+            ids_only: If `True`, created tasks are not downloaded from Toloka and only their IDs are returned.
+                It halves the traffic when you don't need the created objects. Default value: `False`.
+            chunk_size: The maximum number of tasks created by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[batch_create_results.TaskBatchCreateResult, batch_create_results.IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2502,14 +3120,22 @@ class TolokaClient:
             >>> print(len(result.items))
             ...
         """
-        return self._sync_via_async_pool_related(
+        return self._create_in_chunks(
             objects=tasks,
             parameters=parameters,
-            url='/v1/tasks',
-            result_type=batch_create_results.TaskBatchCreateResult,
-            operation_type=operations.TasksCreateOperation,
-            output_id_field='task_id',
-            get_method=self.get_tasks,
+            chunk_size=chunk_size,
+            max_concurrent_chunks=max_concurrent_chunks,
+            ids_only=ids_only,
+            journal=journal,
+            create_chunk=functools.partial(
+                self._sync_via_async_pool_related,
+                url='/v1/tasks',
+                result_type=batch_create_results.TaskBatchCreateResult,
+                operation_type=operations.TasksCreateOperation,
+                output_id_field='task_id',
+                get_method=self.get_tasks,
+                ids_only=ids_only,
+            ),
         )
 
     @expand('parameters')
@@ -2597,7 +3223,7 @@ class TolokaClient:
     def get_tasks(
         self,
         request: search_requests.TaskSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -2609,6 +3235,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Task: The next matching task.
@@ -2622,6 +3249,33 @@ class TolokaClient:
         generator = self._find_all(self.find_tasks, request, batch_size=batch_size)
         yield from generator
 
+    @expand('request')
+    @add_headers('client')
+    def get_tasks_pages(
+        self,
+        request: search_requests.TaskSearchRequest,
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
+    ) -> Generator[search_results.SearchResultPage, None, None]:
+        """Finds all tasks that match certain criteria and yields them page by page.
+
+        `get_tasks_pages` works like [get_tasks](toloka.client.TolokaClient.get_tasks.md) but yields whole pages of search results. Use it to process tasks in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with tasks and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_tasks_pages(pool_id='1086170', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        generator = self._find_all_pages(self.find_tasks, request, batch_size=batch_size)
+        yield from generator
+
     @expand('patch')
     @add_headers('client')
     def patch_task(self, task_id: str, patch: task.TaskPatch) -> Task:
@@ -2711,8 +3365,12 @@ class TolokaClient:
     @add_headers('client')
     def create_task_suites(
         self,
-        task_suites: List[TaskSuite], parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None
-    ) -> batch_create_results.TaskSuiteBatchCreateResult:
+        task_suites: Iterable[TaskSuite], parameters: Optional[task_suite.TaskSuitesCreateRequestParameters] = None,
+        *, ids_only: bool = False,
+        chunk_size: Optional[int] = None,
+        max_concurrent_chunks: int = _chunked_creation.DEFAULT_MAX_CONCURRENT_CHUNKS,
+        journal: Optional[UploadJournal] = None,
+    ) -> Union[batch_create_results.TaskSuiteBatchCreateResult, batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create task suites manually, because Toloka can group tasks into suites automatically.
@@ -2728,12 +3386,24 @@ class TolokaClient:
         You can send a maximum of 100,000 requests of this kind per minute and 2,000,000 requests per day.
         It is recommended that you create no more than 10,000 task suites in a single request if the `async_mode` parameter is `True`.
 
+        If there are more task suites than `chunk_size`, they are split into chunks which are created by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily.
+        Each chunk gets a deterministic `operation_id` derived from the `operation_id` parameter.
+
         Args:
-            task_suites: A list of task suites to be created.
+            task_suites: Task suites to be created. A list or any other iterable.
             parameters: Additional parameters of the request. Default: `None`
+            ids_only: If `True`, created task suites are not downloaded from Toloka and only their IDs are returned.
+                Default value: `False`.
+            chunk_size: The maximum number of task suites created by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2755,14 +3425,22 @@ class TolokaClient:
             >>> task_suites = toloka_client.create_task_suites(task_suites)
             ...
         """
-        return self._sync_via_async_pool_related(
+        return self._create_in_chunks(
             objects=task_suites,
             parameters=parameters,
-            url='/v1/task-suites',
-            result_type=batch_create_results.TaskSuiteBatchCreateResult,
-            operation_type=operations.TaskSuiteCreateBatchOperation,
-            output_id_field='task_suite_id',
-            get_method=self.get_task_suites,
+            chunk_size=chunk_size,
+            max_concurrent_chunks=max_concurrent_chunks,
+            ids_only=ids_only,
+            journal=journal,
+            create_chunk=functools.partial(
+                self._sync_via_async_pool_related,
+                url='/v1/task-suites',
+                result_type=batch_create_results.TaskSuiteBatchCreateResult,
+                operation_type=operations.TaskSuiteCreateBatchOperation,
+                output_id_field='task_suite_id',
+                get_method=self.get_task_suites,
+                ids_only=ids_only,
+            ),
         )
 
     @expand('parameters')
@@ -2863,7 +3541,7 @@ class TolokaClient:
     def get_task_suites(
         self,
         request: search_requests.TaskSuiteSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -2875,6 +3553,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -2886,6 +3565,33 @@ class TolokaClient:
         generator = self._find_all(self.find_task_suites, request, batch_size=batch_size)
         yield from generator
 
+    @expand('request')
+    @add_headers('client')
+    def get_task_suites_pages(
+        self,
+        request: search_requests.TaskSuiteSearchRequest,
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
+    ) -> Generator[search_results.SearchResultPage, None, None]:
+        """Finds all task suites that match certain criteria and yields them page by page.
+
+        `get_task_suites_pages` works like [get_task_suites](toloka.client.TolokaClient.get_task_suites.md) but yields whole pages of search results. Use it to process task suites in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with task suites and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_task_suites_pages(pool_id='1086170', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        generator = self._find_all_pages(self.find_task_suites, request, batch_size=batch_size)
+        yield from generator
+
     @expand('patch')
     @add_headers('client')
     def patch_task_suite(self, task_suite_id: str, patch: task_suite.TaskSuitePatch) -> TaskSuite:
@@ -3061,7 +3767,7 @@ class TolokaClient:
     def get_operations(
         self,
         request: search_requests.OperationSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[operations.Operation, None, None]:
         """Finds all operations that match certain criteria.
 
@@ -3073,6 +3779,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Operation: The next matching operation.
@@ -3081,7 +3788,7 @@ class TolokaClient:
             >>> some_operations = list(toloka_client.get_operations(submitted_lt='2023-06-01T00:00:00'))
             ...
         """
-        generator = self._find_all(self.find_operations, request, batch_size=batch_size)
+        generator = self._find_all(self.find_operations, request, batch_size=batch_size, max_limit=500)
         yield from generator
 
     @add_headers('client')
@@ -3107,6 +3814,30 @@ class TolokaClient:
         response = self._request('get', f'/v1/operations/{operation_id}/log')
         return structure(response, List[OperationLogItem])
 
+    @add_headers('client')
+    def get_operation_log_items(self, operation_id: str) -> Generator[OperationLogItem, None, None]:
+        """Iterates over an operation log.
+
+        Unlike [get_operation_log](toloka.client.TolokaClient.get_operation_log.md), the log is parsed incrementally while
+        it is being downloaded, so logs of operations with hundreds of thousands of items are processed in bounded memory.
+
+        Args:
+            operation_id: The ID of the operation.
+
+        Yields:
+            OperationLogItem: The next log item.
+
+        Example:
+            >>> created_task_ids = [
+            >>>     log_item.output['task_id']
+            >>>     for log_item in toloka_client.get_operation_log_items(operation_id='6d84114f-fcfc-473d-8249-1a4f3ea550eb')
+            >>>     if log_item.success
+            >>> ]
+            ...
+        """
+        for log_item in self._stream_json_array('get', f'/v1/operations/{operation_id}/log'):
+            yield structure(log_item, OperationLogItem)
+
     # User bonus
 
     @expand('parameters')
@@ -3161,18 +3892,34 @@ class TolokaClient:
     @add_headers('client')
     def create_user_bonuses(
         self,
-        user_bonuses: List[UserBonus], parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None
-    ) -> batch_create_results.UserBonusBatchCreateResult:
+        user_bonuses: Iterable[UserBonus], parameters: Optional[user_bonus.UserBonusesCreateRequestParameters] = None,
+        *, ids_only: bool = False,
+        chunk_size: Optional[int] = None,
+        max_concurrent_chunks: int = _chunked_creation.DEFAULT_MAX_CONCURRENT_CHUNKS,
+        journal: Optional[UploadJournal] = None,
+    ) -> Union[batch_create_results.UserBonusBatchCreateResult, batch_create_results.IdsBatchCreateResult]:
         """Issues several bonus payments to Tolokers.
 
         You can send a maximum of 10,000 requests of this kind per day.
 
+        If there are more bonuses than `chunk_size`, they are split into chunks which are issued by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily.
+        Each chunk gets a deterministic `operation_id` derived from the `operation_id` parameter.
+
         Args:
-            user_bonuses: A list of bonuses.
+            user_bonuses: Bonuses to be issued. A list or any other iterable.
             parameters: Parameters of the request.
+            ids_only: If `True`, issued bonuses are not downloaded from Toloka and only their IDs are returned.
+                Default value: `False`.
+            chunk_size: The maximum number of bonuses issued by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            UserBonusBatchCreateResult: The result of the operation.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Example:
             >>> from decimal import Decimal
@@ -3195,14 +3942,23 @@ class TolokaClient:
             >>> result = toloka_client.create_user_bonuses(new_bonuses)
             ...
         """
-        return self._sync_via_async(
+        return self._create_in_chunks(
             objects=user_bonuses,
             parameters=parameters,
-            url='/v1/user-bonuses',
-            result_type=batch_create_results.UserBonusBatchCreateResult,
-            operation_type=operations.UserBonusCreateBatchOperation,
-            output_id_field='user_bonus_id',
-            get_method=self.get_user_bonuses,
+            chunk_size=chunk_size,
+            max_concurrent_chunks=max_concurrent_chunks,
+            ids_only=ids_only,
+            journal=journal,
+            create_chunk=functools.partial(
+                self._sync_via_async,
+                url='/v1/user-bonuses',
+                result_type=batch_create_results.UserBonusBatchCreateResult,
+                operation_type=operations.UserBonusCreateBatchOperation,
+                output_id_field='user_bonus_id',
+                get_method=self.get_user_bonuses,
+                ids_only=ids_only,
+                max_batch_size=300,
+            ),
         )
 
     @expand('parameters')
@@ -3304,7 +4060,7 @@ class TolokaClient:
     def get_user_bonuses(
         self,
         request: search_requests.UserBonusSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[UserBonus, None, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -3316,6 +4072,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -3324,7 +4081,34 @@ class TolokaClient:
             >>> bonuses = list(toloka_client.get_user_bonuses(created_lt='2023-06-01T00:00:00'))
             ...
         """
-        generator = self._find_all(self.find_user_bonuses, request, batch_size=batch_size)
+        generator = self._find_all(self.find_user_bonuses, request, batch_size=batch_size, max_limit=300)
+        yield from generator
+
+    @expand('request')
+    @add_headers('client')
+    def get_user_bonuses_pages(
+        self,
+        request: search_requests.UserBonusSearchRequest,
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
+    ) -> Generator[search_results.SearchResultPage, None, None]:
+        """Finds all bonuses that match certain criteria and yields them page by page.
+
+        `get_user_bonuses_pages` works like [get_user_bonuses](toloka.client.TolokaClient.get_user_bonuses.md) but yields whole pages of search results. Use it to process bonuses in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with bonuses and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_user_bonuses_pages(created_lt='2023-06-01T00:00:00', batch_size=300):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        generator = self._find_all_pages(self.find_user_bonuses, request, batch_size=batch_size, max_limit=300)
         yield from generator
 
     # User restrictions
@@ -3383,7 +4167,7 @@ class TolokaClient:
     def get_user_restrictions(
         self,
         request: search_requests.UserRestrictionSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[UserRestriction, None, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -3395,6 +4179,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -3403,7 +4188,7 @@ class TolokaClient:
             >>> restrictions = list(toloka_client.get_user_restrictions(scope='ALL_PROJECTS'))
             ...
         """
-        generator = self._find_all(self.find_user_restrictions, request, batch_size=batch_size)
+        generator = self._find_all(self.find_user_restrictions, request, batch_size=batch_size, max_limit=500)
         yield from generator
 
     @add_headers('client')
@@ -3444,6 +4229,59 @@ class TolokaClient:
         """
         self._raw_request('delete', f'/v1/user-restrictions/{user_restriction_id}')
 
+    @add_headers('client')
+    def reconcile_user_restrictions(
+        self,
+        desired_restrictions: Dict[str, Optional[UserRestriction]],
+        scope: Union[UserRestriction.Scope, str],
+        project_id: Optional[str] = None,
+        pool_id: Optional[str] = None,
+        remove_missing: bool = False,
+        concurrency: int = 10,
+    ) -> UserStateReconciliationReport:
+        """Brings Tolokers' restrictions to the desired state changing only those that differ.
+
+        Current restrictions with the specified scope are fetched in bulk. Then restrictions are set only for Tolokers
+        who have no restriction or have a restriction with other parameters, and restrictions mapped to `None` are
+        removed. If a Toloker has several restrictions with the same scope, project and pool, all of them except
+        the desired one are removed. Changes are applied in parallel.
+
+        Args:
+            desired_restrictions: A mapping from Toloker IDs to desired restrictions.
+                `None` means that the Toloker must not be restricted. If `user_id` of a restriction is not set,
+                the mapping key is used.
+            scope: The scope of restrictions.
+            project_id: The ID of the project. Used with the `PROJECT` scope.
+            pool_id: The ID of the pool. Used with the `POOL` scope.
+            remove_missing: Remove restrictions of Tolokers who are not in `desired_restrictions`. Default value: `False`.
+            concurrency: The maximum number of simultaneous requests. Default value: 10.
+
+        Returns:
+            UserStateReconciliationReport: Applied changes and Tolokers who already had the desired restrictions.
+
+        Example:
+            Synchronizing a ban list with a project.
+
+            >>> from toloka.client.user_restriction import ProjectUserRestriction
+            >>> report = toloka_client.reconcile_user_restrictions(
+            >>>     {
+            >>>         user_id: ProjectUserRestriction(project_id='92694', private_comment='Spammer')
+            >>>         for user_id in banned_user_ids
+            >>>     },
+            >>>     scope='PROJECT',
+            >>>     project_id='92694',
+            >>>     remove_missing=True,
+            >>> )
+            >>> print(len(report.applied), len(report.unchanged_user_ids))
+            ...
+        """
+        current = collections.defaultdict(list)
+        for restriction in self.get_user_restrictions(scope=scope, project_id=project_id, pool_id=pool_id, batch_size=500):
+            current[restriction.user_id].append(restriction)
+        changes, unchanged_user_ids = _diff_user_restrictions(current, desired_restrictions, remove_missing)
+        results = self._map_concurrently(self._apply_user_state_change, changes, concurrency)
+        return UserStateReconciliationReport(results=results, unchanged_user_ids=unchanged_user_ids)
+
     # Requester
 
     @add_headers('client')
@@ -3527,7 +4365,7 @@ class TolokaClient:
     def get_user_skills(
         self,
         request: search_requests.UserSkillSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[UserSkill, None, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -3539,6 +4377,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -3547,7 +4386,7 @@ class TolokaClient:
             >>> user_skills = list(toloka_client.get_user_skills(skill_id='11294'))
             ...
         """
-        generator = self._find_all(self.find_user_skills, request, batch_size=batch_size)
+        generator = self._find_all(self.find_user_skills, request, batch_size=batch_size, max_limit=1000)
         yield from generator
 
     @add_headers('client')
@@ -3605,6 +4444,46 @@ class TolokaClient:
         """
         self._raw_request('delete', f'/v1/user-skills/{user_skill_id}')
 
+    @add_headers('client')
+    def reconcile_user_skills(
+        self,
+        skill_id: str,
+        desired_values: Dict[str, Optional[Decimal]],
+        remove_missing: bool = False,
+        concurrency: int = 10,
+    ) -> UserStateReconciliationReport:
+        """Brings Tolokers' skill values to the desired state changing only those that differ.
+
+        Current values of the skill are fetched in bulk. Then the skill is set only for Tolokers whose value differs
+        from the desired one, and skill values mapped to `None` are removed. Changes are applied in parallel.
+
+        Args:
+            skill_id: The ID of the skill.
+            desired_values: A mapping from Toloker IDs to desired skill values. `None` means that the Toloker must not
+                have the skill.
+            remove_missing: Remove the skill from Tolokers who are not in `desired_values`. Default value: `False`.
+            concurrency: The maximum number of simultaneous requests. Default value: 10.
+
+        Returns:
+            UserStateReconciliationReport: Applied changes and Tolokers who already had the desired skill values.
+
+        Example:
+            >>> from decimal import Decimal
+            >>> report = toloka_client.reconcile_user_skills(
+            >>>     skill_id='11294',
+            >>>     desired_values={'fac97860c7929add8048ed2ef63b66fd': Decimal(100), 'a1b0b42923c429daa2c764d7ccfc364d': None},
+            >>> )
+            >>> for result in report.failed:
+            >>>     print(result.change.user_id, result.error)
+            ...
+        """
+        current = {}
+        for skill_value in self.get_user_skills(skill_id=skill_id, batch_size=1000):
+            current[skill_value.user_id] = skill_value
+        changes, unchanged_user_ids = _diff_user_skills(skill_id, current, desired_values, remove_missing)
+        results = self._map_concurrently(self._apply_user_state_change, changes, concurrency)
+        return UserStateReconciliationReport(results=results, unchanged_user_ids=unchanged_user_ids)
+
     @add_headers('client')
     def upsert_webhook_subscriptions(
         self,
@@ -3696,7 +4575,7 @@ class TolokaClient:
     def get_webhook_subscriptions(
         self,
         request: search_requests.WebhookSubscriptionSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[WebhookSubscription, None, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -3708,6 +4587,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -3717,7 +4597,7 @@ class TolokaClient:
             >>>     print(subscription.id, subscription.event_type)
             ...
         """
-        generator = self._find_all(self.find_webhook_subscriptions, request, sort_field='created', batch_size=batch_size)
+        generator = self._find_all(self.find_webhook_subscriptions, request, sort_field='created', batch_size=batch_size, max_limit=300)
         yield from generator
 
     @add_headers('client')
@@ -3830,7 +4710,7 @@ class TolokaClient:
     def get_app_projects(
         self,
         request: search_requests.AppProjectSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[AppProject, None, None]:
         """Finds all App projects that match certain criteria.
 
@@ -3848,11 +4728,12 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppProject: The next matching App project.
         """
-        generator = self._find_all(self.find_app_projects, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(self.find_app_projects, request, items_field='content', batch_size=batch_size, max_limit=5000)
         yield from generator
 
     @add_headers('client')
@@ -4003,7 +4884,7 @@ class TolokaClient:
     def get_apps(
         self,
         request: search_requests.AppSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[App, None, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -4021,11 +4902,12 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             App: The next matching solution.
         """
-        generator = self._find_all(self.find_apps, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(self.find_apps, request, items_field='content', batch_size=batch_size, max_limit=1000)
         yield from generator
 
     @add_headers('client')
@@ -4093,7 +4975,7 @@ class TolokaClient:
     def get_app_items(
         self,
         app_project_id: str, request: search_requests.AppItemSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[AppItem, None, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -4112,12 +4994,13 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppItem: The next matching item.
         """
         find_function = functools.partial(self.find_app_items, app_project_id)
-        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size, max_limit=1000)
         yield from generator
 
     @expand('app_item')
@@ -4243,7 +5126,7 @@ class TolokaClient:
         self,
         app_project_id: str,
         request: search_requests.AppBatchSearchRequest,
-        batch_size: Optional[int] = None
+        batch_size: Union[int, AdaptiveBatchSize, None] = None
     ) -> Generator[AppBatch, None, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -4264,12 +5147,13 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppBatch: The next matching batch.
         """
         find_function = functools.partial(self.find_app_batches, app_project_id)
-        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size)
+        generator = self._find_all(find_function, request, items_field='content', batch_size=batch_size, max_limit=1000)
         yield from generator
 
     @expand('request')
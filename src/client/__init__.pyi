@@ -17,7 +17,10 @@ __all__ = [
     'operations',
     'owner',
     'quality_control',
+    'reconciliation',
     'requester',
+    'review_results',
+    'search_batch_size',
     'search_requests',
     'search_results',
     'skill',
@@ -26,6 +29,7 @@ __all__ = [
     'task_distribution_function',
     'task_suite',
     'training',
+    'upload_journal',
     'user_bonus',
     'user_restriction',
     'user_skill',
@@ -33,10 +37,14 @@ __all__ = [
     'structure',
     'unstructure',
     'TolokaClient',
+    'AdaptiveBatchSize',
     'AggregatedSolution',
     'AnalyticsRequest',
     'Assignment',
     'AssignmentPatch',
+    'AssignmentReviewDecision',
+    'AssignmentReviewReport',
+    'CloneFailure',
     'CloneResults',
     'GetAssignmentsTsvParameters',
     'Attachment',
@@ -52,6 +60,7 @@ __all__ = [
     'TaskSuite',
     'Task',
     'Training',
+    'UploadJournal',
     'UserBonus',
     'UserRestriction',
     'UserSkill',
@@ -59,6 +68,7 @@ __all__ = [
     'Pool',
     'PoolPatchRequest',
     'Project',
+    'ProjectCloneError',
     'AppProject',
     'App',
     'AppItem',
@@ -85,13 +95,17 @@ import toloka.client.operations
 import toloka.client.owner
 import toloka.client.pool
 import toloka.client.project
+import toloka.client.reconciliation
 import toloka.client.requester
+import toloka.client.review_results
+import toloka.client.search_batch_size
 import toloka.client.search_requests
 import toloka.client.search_results
 import toloka.client.skill
 import toloka.client.task
 import toloka.client.task_suite
 import toloka.client.training
+import toloka.client.upload_journal
 import toloka.client.user
 import toloka.client.user_bonus
 import toloka.client.user_restriction
@@ -120,7 +134,10 @@ from toloka.client import (
     operations,
     owner,
     quality_control,
+    reconciliation,
     requester,
+    review_results,
+    search_batch_size,
     search_requests,
     search_results,
     skill,
@@ -129,6 +146,7 @@ from toloka.client import (
     task_distribution_function,
     task_suite,
     training,
+    upload_journal,
     user_bonus,
     user_restriction,
     user_skill,
@@ -147,10 +165,15 @@ from toloka.client.app import (
 from toloka.client.assignment import (
     Assignment,
     AssignmentPatch,
+    AssignmentReviewDecision,
     GetAssignmentsTsvParameters,
 )
 from toloka.client.attachment import Attachment
-from toloka.client.clone_results import CloneResults
+from toloka.client.clone_results import (
+    CloneFailure,
+    CloneResults,
+    ProjectCloneError,
+)
 from toloka.client.message_thread import (
     Folder,
     MessageThread,
@@ -165,10 +188,13 @@ from toloka.client.pool import (
 )
 from toloka.client.project import Project
 from toloka.client.requester import Requester
+from toloka.client.review_results import AssignmentReviewReport
+from toloka.client.search_batch_size import AdaptiveBatchSize
 from toloka.client.skill import Skill
 from toloka.client.task import Task
 from toloka.client.task_suite import TaskSuite
 from toloka.client.training import Training
+from toloka.client.upload_journal import UploadJournal
 from toloka.client.user import User
 from toloka.client.user_bonus import UserBonus
 from toloka.client.user_restriction import UserRestriction
@@ -236,6 +262,15 @@ class TolokaClient:
             verify the identity of requested hosts. Either `True` (default CA bundle),
             a path to an SSL certificate file, an `ssl.SSLContext`, or `False`
             (which will disable verification).
+        decode_processes: The number of worker processes used to decode and structure pages of search results
+            in `get_*` methods. Decoding large pages is CPU-bound, so it limits the throughput of clients
+            used from several threads. If set, pages are downloaded entirely and decoded in a process pool shared
+            by clients with the same `decode_processes`. Default value: `None` — pages are decoded in the calling
+            thread while they are downloaded.
+        lazy_structuring: If `True`, objects yielded by `get_*` methods keep received data and convert each field
+            on first access. It speeds up iteration if only a few fields of big objects like assignments are used.
+            Such objects have the same classes and are equal to eagerly structured ones. Pages decoded in worker
+            processes are structured eagerly. Default value: `False`.
 
     Example:
         How to create `TolokaClient` instance and make your first request to Toloka.
@@ -269,7 +304,9 @@ class TolokaClient:
         retry_quotas: typing.Union[typing.List[str], str, None] = 'MIN',
         retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]] = None,
         act_under_account_id: typing.Optional[str] = None,
-        verify: typing.Union[str, bool, ssl.SSLContext] = True
+        verify: typing.Union[str, bool, ssl.SSLContext] = True,
+        decode_processes: typing.Optional[int] = None,
+        lazy_structuring: bool = False
     ): ...
 
     @typing.overload
@@ -510,7 +547,7 @@ class TolokaClient:
         self,
         operation_id: str,
         request: toloka.client.search_requests.AggregatedSolutionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.aggregation.AggregatedSolution, None, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -531,6 +568,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -558,7 +596,7 @@ class TolokaClient:
         task_id_lte: typing.Optional[str] = None,
         task_id_gt: typing.Optional[str] = None,
         task_id_gte: typing.Optional[str] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.aggregation.AggregatedSolution, None, None]:
         """Finds all aggregated responses that match certain criteria.
 
@@ -579,6 +617,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AggregatedSolution: The next matching aggregated response.
@@ -598,6 +637,65 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_aggregated_solutions_pages(
+        self,
+        operation_id: str,
+        request: toloka.client.search_requests.AggregatedSolutionSearchRequest,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all aggregated responses that match certain criteria and yields them page by page.
+
+        `get_aggregated_solutions_pages` works like [get_aggregated_solutions](toloka.client.TolokaClient.get_aggregated_solutions.md)
+        but yields whole pages of search results. Use it to process aggregated responses in batches.
+
+        Args:
+            operation_id: The ID of the aggregation operation.
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with aggregated responses and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_aggregated_solutions_pages(aggregation_operation.id, batch_size=10000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_aggregated_solutions_pages(
+        self,
+        operation_id: str,
+        task_id_lt: typing.Optional[str] = None,
+        task_id_lte: typing.Optional[str] = None,
+        task_id_gt: typing.Optional[str] = None,
+        task_id_gte: typing.Optional[str] = None,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all aggregated responses that match certain criteria and yields them page by page.
+
+        `get_aggregated_solutions_pages` works like [get_aggregated_solutions](toloka.client.TolokaClient.get_aggregated_solutions.md)
+        but yields whole pages of search results. Use it to process aggregated responses in batches.
+
+        Args:
+            operation_id: The ID of the aggregation operation.
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with aggregated responses and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_aggregated_solutions_pages(aggregation_operation.id, batch_size=10000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
     def accept_assignment(
         self,
         assignment_id: str,
@@ -742,7 +840,7 @@ class TolokaClient:
     def get_assignments(
         self,
         request: toloka.client.search_requests.AssignmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -754,6 +852,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Assignment: The next matching assignment.
@@ -804,7 +903,7 @@ class TolokaClient:
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.assignment.Assignment, None, None]:
         """Finds all assignments that match certain criteria.
 
@@ -816,6 +915,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Assignment: The next matching assignment.
@@ -830,6 +930,88 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_assignments_pages(
+        self,
+        request: toloka.client.search_requests.AssignmentSearchRequest,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all assignments that match certain criteria and yields them page by page.
+
+        `get_assignments_pages` works like [get_assignments](toloka.client.TolokaClient.get_assignments.md) but yields whole pages of search results. Use it to process assignments in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with assignments and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_assignments_pages(pool_id='1080020', status='ACCEPTED', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_assignments_pages(
+        self,
+        status: typing.Union[str, toloka.client.assignment.Assignment.Status, typing.List[typing.Union[str, toloka.client.assignment.Assignment.Status]]] = None,
+        task_id: typing.Optional[str] = None,
+        task_suite_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        submitted_lt: typing.Optional[datetime.datetime] = None,
+        submitted_lte: typing.Optional[datetime.datetime] = None,
+        submitted_gt: typing.Optional[datetime.datetime] = None,
+        submitted_gte: typing.Optional[datetime.datetime] = None,
+        accepted_lt: typing.Optional[datetime.datetime] = None,
+        accepted_lte: typing.Optional[datetime.datetime] = None,
+        accepted_gt: typing.Optional[datetime.datetime] = None,
+        accepted_gte: typing.Optional[datetime.datetime] = None,
+        rejected_lt: typing.Optional[datetime.datetime] = None,
+        rejected_lte: typing.Optional[datetime.datetime] = None,
+        rejected_gt: typing.Optional[datetime.datetime] = None,
+        rejected_gte: typing.Optional[datetime.datetime] = None,
+        skipped_lt: typing.Optional[datetime.datetime] = None,
+        skipped_lte: typing.Optional[datetime.datetime] = None,
+        skipped_gt: typing.Optional[datetime.datetime] = None,
+        skipped_gte: typing.Optional[datetime.datetime] = None,
+        expired_lt: typing.Optional[datetime.datetime] = None,
+        expired_lte: typing.Optional[datetime.datetime] = None,
+        expired_gt: typing.Optional[datetime.datetime] = None,
+        expired_gte: typing.Optional[datetime.datetime] = None,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all assignments that match certain criteria and yields them page by page.
+
+        `get_assignments_pages` works like [get_assignments](toloka.client.TolokaClient.get_assignments.md) but yields whole pages of search results. Use it to process assignments in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with assignments and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_assignments_pages(pool_id='1080020', status='ACCEPTED', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_assignment(
         self,
@@ -907,6 +1089,45 @@ class TolokaClient:
         """
         ...
 
+    def review_assignments(
+        self,
+        decisions: typing.Iterable[toloka.client.assignment.AssignmentReviewDecision],
+        concurrency: int = 10
+    ) -> toloka.client.review_results.AssignmentReviewReport:
+        """Accepts and rejects assignments in parallel.
+
+        Decisions are read from the iterable lazily, so it may be a generator over a large file or over
+        [AssignmentCursor](toloka.streaming.cursor.AssignmentCursor.md) events. At most `concurrency` requests are sent
+        at the same time. Requests that fail because of the rate limit are retried like all other requests of the client.
+
+        Assignments that were reviewed before are reported with the `ALREADY_REVIEWED` outcome and are considered
+        successful, so the method may be safely called again for the same decisions. Other errors don't stop the review:
+        they are reported with the `FAILED` outcome.
+
+        Args:
+            decisions: Decisions to accept or reject assignments.
+            concurrency: The maximum number of simultaneous requests. Default value: 10.
+
+        In `AsyncTolokaClient` decisions may be read from an async iterable as well.
+
+        Returns:
+            AssignmentReviewReport: Results of the review in the order of decisions.
+
+        Example:
+            Accepting all submitted assignments in a pool.
+
+            >>> from toloka.client import AssignmentReviewDecision
+            >>> from toloka.streaming import AssignmentCursor
+            >>> cursor = AssignmentCursor(pool_id='1080020', event_type='SUBMITTED', toloka_client=toloka_client)
+            >>> report = toloka_client.review_assignments(
+            >>>     AssignmentReviewDecision(assignment_id=event.assignment.id, status='ACCEPTED')
+            >>>     for event in cursor
+            >>> )
+            >>> print(len(report.failed))
+            ...
+        """
+        ...
+
     @typing.overload
     def find_attachments(
         self,
@@ -1006,7 +1227,7 @@ class TolokaClient:
     def get_attachments(
         self,
         request: toloka.client.search_requests.AttachmentSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -1018,6 +1239,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Attachment: The next matching attachment.
@@ -1048,7 +1270,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.attachment.Attachment, None, None]:
         """Finds all attachments that match certain criteria and returns their metadata.
 
@@ -1060,6 +1282,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Attachment: The next matching attachment.
@@ -1279,7 +1502,7 @@ class TolokaClient:
     def get_message_threads(
         self,
         request: toloka.client.search_requests.MessageThreadSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1291,6 +1514,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1316,7 +1540,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.message_thread.MessageThread, None, None]:
         """Finds all message threads that match certain criteria.
 
@@ -1328,6 +1552,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             MessageThread: The next matching message thread.
@@ -1526,7 +1751,7 @@ class TolokaClient:
     def get_projects(
         self,
         request: toloka.client.search_requests.ProjectSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.project.Project, None, None]:
         """Finds all projects that match certain criteria.
 
@@ -1538,6 +1763,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Project: The next matching project.
@@ -1566,7 +1792,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.project.Project, None, None]:
         """Finds all projects that match certain criteria.
 
@@ -1578,6 +1804,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Project: The next matching project.
@@ -1616,6 +1843,26 @@ class TolokaClient:
         """
         ...
 
+    def save_project(self, project: toloka.client.project.Project) -> toloka.client.project.Project:
+        """Saves changes of a project to Toloka.
+
+        Unlike [update_project](toloka.client.TolokaClient.update_project.md), `save_project` doesn't send a request
+        if the project wasn't changed since it was received from Toloka.
+
+        Args:
+            project: The project received from Toloka and then changed.
+
+        Returns:
+            Project: The project with updated parameters, or the same project if it wasn't changed.
+
+        Example:
+            >>> project = toloka_client.get_project(project_id='92694')
+            >>> project.private_comment = 'example project'
+            >>> project = toloka_client.save_project(project)
+            ...
+        """
+        ...
+
     def check_update_project_for_major_version_change(
         self,
         project_id: str,
@@ -1641,11 +1888,14 @@ class TolokaClient:
     def clone_project(
         self,
         project_id: str,
-        reuse_controllers: bool = True
+        reuse_controllers: bool = True,
+        concurrency: int = 10
     ) -> toloka.client.clone_results.CloneResults:
         """Clones a project and all pools and trainings inside it.
 
-        `clone_project` emulates cloning behavior via Toloka interface. Note that it calls several API methods. If some method fails then the project may be partially cloned.
+        `clone_project` emulates cloning behavior via Toloka interface. Note that it calls several API methods.
+        Trainings are created in parallel first, then pools are created in parallel. If some pools or trainings are not cloned,
+        the others are cloned anyway and the [ProjectCloneError](toloka.client.clone_results.ProjectCloneError.md) is raised.
 
         Important notes:
         * No tasks are cloned.
@@ -1661,10 +1911,14 @@ class TolokaClient:
                 * `False` — Use separate quality controllers.
 
                 Default value: `True`.
+            concurrency: The maximum number of pools or trainings created at the same time. Default value: 10.
 
         Returns:
             Tuple[Project, List[Pool], List[Training]]: Created project, pools and trainings.
 
+        Raises:
+            ProjectCloneError: Some pools or trainings were not cloned. The error contains created objects and failures.
+
         Example:
 
             >>> project, pools, trainings = toloka_client.clone_project(
@@ -1990,7 +2244,7 @@ class TolokaClient:
     def get_pools(
         self,
         request: toloka.client.search_requests.PoolSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.pool.Pool, None, None]:
         """Finds all pools that match certain criteria.
 
@@ -2002,6 +2256,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Pool: The next matching pool.
@@ -2031,7 +2286,7 @@ class TolokaClient:
         last_started_lte: typing.Optional[datetime.datetime] = None,
         last_started_gt: typing.Optional[datetime.datetime] = None,
         last_started_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.pool.Pool, None, None]:
         """Finds all pools that match certain criteria.
 
@@ -2043,6 +2298,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300. The default value: 20.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Pool: The next matching pool.
@@ -2166,6 +2422,31 @@ class TolokaClient:
         """
         ...
 
+    def save_pool(self, pool: toloka.client.pool.Pool) -> toloka.client.pool.Pool:
+        """Saves changes of a pool to Toloka sending as little data as possible.
+
+        The pool is compared with its state when it was received from Toloka:
+        * If nothing is changed, no request is sent.
+        * If only parameters supported by [PoolPatchRequest](toloka.client.pool.PoolPatchRequest.md) are changed,
+            they are sent with the [patch_pool](toloka.client.TolokaClient.patch_pool.md) method.
+        * Otherwise, or if changes of the pool aren't tracked, for example, if the pool was created locally or found
+            with [find_pools](toloka.client.TolokaClient.find_pools.md), all parameters are sent with
+            the [update_pool](toloka.client.TolokaClient.update_pool.md) method.
+
+        Args:
+            pool: The pool with new parameters.
+
+        Returns:
+            Pool: The pool with updated parameters, or the same pool if it wasn't changed.
+
+        Example:
+            >>> pool = toloka_client.get_pool(pool_id='1080020')
+            >>> pool.priority = 100
+            >>> pool = toloka_client.save_pool(pool)  # sends only the priority
+            ...
+        """
+        ...
+
     def archive_training(self, training_id: str) -> toloka.client.training.Training:
         """Archives a training.
 
@@ -2434,7 +2715,7 @@ class TolokaClient:
     def get_trainings(
         self,
         request: toloka.client.search_requests.TrainingSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.training.Training, None, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2446,6 +2727,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Training: The next matching training.
@@ -2475,7 +2757,7 @@ class TolokaClient:
         last_started_lte: typing.Optional[datetime.datetime] = None,
         last_started_gt: typing.Optional[datetime.datetime] = None,
         last_started_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.training.Training, None, None]:
         """Finds all trainings that match certain criteria.
 
@@ -2487,6 +2769,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Training: The next matching training.
@@ -2713,7 +2996,7 @@ class TolokaClient:
     def get_skills(
         self,
         request: toloka.client.search_requests.SkillSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.skill.Skill, None, None]:
         """Finds all skills that match certain criteria.
 
@@ -2725,6 +3008,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Skill: The next matching skill.
@@ -2753,7 +3037,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.skill.Skill, None, None]:
         """Finds all skills that match certain criteria.
 
@@ -2765,6 +3049,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Skill: The next matching skill.
@@ -2915,9 +3200,14 @@ class TolokaClient:
     @typing.overload
     def create_tasks(
         self,
-        tasks: typing.List[toloka.client.task.Task],
-        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None
-    ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
+        tasks: typing.Iterable[toloka.client.task.Task],
+        parameters: typing.Optional[toloka.client.task.CreateTasksParameters] = None,
+        *,
+        ids_only: bool = False,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_chunks: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None
+    ) -> typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can create general and control tasks together. Tasks can be added to different pools.
@@ -2931,12 +3221,25 @@ class TolokaClient:
 
         You can send no more than 100,000 requests per minute and no more than 2,000,000 requests per day.
 
+        If there are more tasks than `chunk_size`, they are split into chunks which are created by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily,
+        so `tasks` may be a generator producing millions of tasks. Each chunk gets a deterministic `operation_id` derived
+        from the `operation_id` parameter, so repeated calls with the same `operation_id` do not create duplicates.
+
         Args:
-            tasks: A list of tasks to be created.
+            tasks: Tasks to be created. A list or any other iterable.
             parameters: Additional parameters of the request.
+            ids_only: If `True`, created tasks are not downloaded from Toloka and only their IDs are returned.
+                It halves the traffic when you don't need the created objects. Default value: `False`.
+            chunk_size: The maximum number of tasks created by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[batch_create_results.TaskBatchCreateResult, batch_create_results.IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -2980,14 +3283,18 @@ class TolokaClient:
     @typing.overload
     def create_tasks(
         self,
-        tasks: typing.List[toloka.client.task.Task],
+        tasks: typing.Iterable[toloka.client.task.Task],
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.TaskBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        ids_only: bool = False,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_chunks: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None
+    ) -> typing.Union[toloka.client.batch_create_results.TaskBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several tasks in Toloka.
 
         You can create general and control tasks together. Tasks can be added to different pools.
@@ -3001,12 +3308,25 @@ class TolokaClient:
 
         You can send no more than 100,000 requests per minute and no more than 2,000,000 requests per day.
 
+        If there are more tasks than `chunk_size`, they are split into chunks which are created by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily,
+        so `tasks` may be a generator producing millions of tasks. Each chunk gets a deterministic `operation_id` derived
+        from the `operation_id` parameter, so repeated calls with the same `operation_id` do not create duplicates.
+
         Args:
-            tasks: A list of tasks to be created.
+            tasks: Tasks to be created. A list or any other iterable.
             parameters: Additional parameters of the request.
+            ids_only: If `True`, created tasks are not downloaded from Toloka and only their IDs are returned.
+                It halves the traffic when you don't need the created objects. Default value: `False`.
+            chunk_size: The maximum number of tasks created by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            batch_create_results.TaskBatchCreateResult: The result of the operation.
+            Union[batch_create_results.TaskBatchCreateResult, batch_create_results.IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3207,7 +3527,7 @@ class TolokaClient:
     def get_tasks(
         self,
         request: toloka.client.search_requests.TaskSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3219,6 +3539,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Task: The next matching task.
@@ -3248,7 +3569,7 @@ class TolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.task.Task, None, None]:
         """Finds all tasks that match certain criteria.
 
@@ -3260,6 +3581,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Task: The next matching task.
@@ -3272,6 +3594,69 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_tasks_pages(
+        self,
+        request: toloka.client.search_requests.TaskSearchRequest,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all tasks that match certain criteria and yields them page by page.
+
+        `get_tasks_pages` works like [get_tasks](toloka.client.TolokaClient.get_tasks.md) but yields whole pages of search results. Use it to process tasks in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with tasks and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_tasks_pages(pool_id='1086170', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_tasks_pages(
+        self,
+        pool_id: typing.Optional[str] = None,
+        overlap: typing.Optional[int] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        overlap_lt: typing.Optional[int] = None,
+        overlap_lte: typing.Optional[int] = None,
+        overlap_gt: typing.Optional[int] = None,
+        overlap_gte: typing.Optional[int] = None,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all tasks that match certain criteria and yields them page by page.
+
+        `get_tasks_pages` works like [get_tasks](toloka.client.TolokaClient.get_tasks.md) but yields whole pages of search results. Use it to process tasks in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with tasks and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_tasks_pages(pool_id='1086170', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_task(
         self,
@@ -3444,9 +3829,14 @@ class TolokaClient:
     @typing.overload
     def create_task_suites(
         self,
-        task_suites: typing.List[toloka.client.task_suite.TaskSuite],
-        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None
-    ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
+        parameters: typing.Optional[toloka.client.task_suite.TaskSuitesCreateRequestParameters] = None,
+        *,
+        ids_only: bool = False,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_chunks: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None
+    ) -> typing.Union[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create task suites manually, because Toloka can group tasks into suites automatically.
@@ -3462,12 +3852,24 @@ class TolokaClient:
         You can send a maximum of 100,000 requests of this kind per minute and 2,000,000 requests per day.
         It is recommended that you create no more than 10,000 task suites in a single request if the `async_mode` parameter is `True`.
 
+        If there are more task suites than `chunk_size`, they are split into chunks which are created by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily.
+        Each chunk gets a deterministic `operation_id` derived from the `operation_id` parameter.
+
         Args:
-            task_suites: A list of task suites to be created.
+            task_suites: Task suites to be created. A list or any other iterable.
             parameters: Additional parameters of the request. Default: `None`
+            ids_only: If `True`, created task suites are not downloaded from Toloka and only their IDs are returned.
+                Default value: `False`.
+            chunk_size: The maximum number of task suites created by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3494,14 +3896,18 @@ class TolokaClient:
     @typing.overload
     def create_task_suites(
         self,
-        task_suites: typing.List[toloka.client.task_suite.TaskSuite],
+        task_suites: typing.Iterable[toloka.client.task_suite.TaskSuite],
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
         allow_defaults: typing.Optional[bool] = None,
         open_pool: typing.Optional[bool] = None,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.TaskSuiteBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        ids_only: bool = False,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_chunks: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None
+    ) -> typing.Union[toloka.client.batch_create_results.TaskSuiteBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Creates several task suites in Toloka.
 
         Usually, you don't need to create task suites manually, because Toloka can group tasks into suites automatically.
@@ -3517,12 +3923,24 @@ class TolokaClient:
         You can send a maximum of 100,000 requests of this kind per minute and 2,000,000 requests per day.
         It is recommended that you create no more than 10,000 task suites in a single request if the `async_mode` parameter is `True`.
 
+        If there are more task suites than `chunk_size`, they are split into chunks which are created by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily.
+        Each chunk gets a deterministic `operation_id` derived from the `operation_id` parameter.
+
         Args:
-            task_suites: A list of task suites to be created.
+            task_suites: Task suites to be created. A list or any other iterable.
             parameters: Additional parameters of the request. Default: `None`
+            ids_only: If `True`, created task suites are not downloaded from Toloka and only their IDs are returned.
+                Default value: `False`.
+            chunk_size: The maximum number of task suites created by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            TaskSuiteBatchCreateResult: The result of the operation.
+            Union[TaskSuiteBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Raises:
             ValidationApiError:
@@ -3723,7 +4141,7 @@ class TolokaClient:
     def get_task_suites(
         self,
         request: toloka.client.search_requests.TaskSuiteSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3735,6 +4153,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3763,7 +4182,7 @@ class TolokaClient:
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
         overlap_gte: typing.Optional[int] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.task_suite.TaskSuite, None, None]:
         """Finds all task suites that match certain criteria.
 
@@ -3775,6 +4194,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 100,000. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             TaskSuite: The next matching task suite.
@@ -3785,6 +4205,70 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_task_suites_pages(
+        self,
+        request: toloka.client.search_requests.TaskSuiteSearchRequest,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all task suites that match certain criteria and yields them page by page.
+
+        `get_task_suites_pages` works like [get_task_suites](toloka.client.TolokaClient.get_task_suites.md) but yields whole pages of search results. Use it to process task suites in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with task suites and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_task_suites_pages(pool_id='1086170', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_task_suites_pages(
+        self,
+        task_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        overlap: typing.Optional[int] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        overlap_lt: typing.Optional[int] = None,
+        overlap_lte: typing.Optional[int] = None,
+        overlap_gt: typing.Optional[int] = None,
+        overlap_gte: typing.Optional[int] = None,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all task suites that match certain criteria and yields them page by page.
+
+        `get_task_suites_pages` works like [get_task_suites](toloka.client.TolokaClient.get_task_suites.md) but yields whole pages of search results. Use it to process task suites in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with task suites and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_task_suites_pages(pool_id='1086170', batch_size=1000):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
     @typing.overload
     def patch_task_suite(
         self,
@@ -4028,7 +4512,7 @@ class TolokaClient:
     def get_operations(
         self,
         request: toloka.client.search_requests.OperationSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.operations.Operation, None, None]:
         """Finds all operations that match certain criteria.
 
@@ -4040,6 +4524,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Operation: The next matching operation.
@@ -4067,7 +4552,7 @@ class TolokaClient:
         finished_lte: typing.Optional[datetime.datetime] = None,
         finished_gt: typing.Optional[datetime.datetime] = None,
         finished_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.operations.Operation, None, None]:
         """Finds all operations that match certain criteria.
 
@@ -4079,6 +4564,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500. The default value: 50.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             Operation: The next matching operation.
@@ -4110,6 +4596,28 @@ class TolokaClient:
         """
         ...
 
+    def get_operation_log_items(self, operation_id: str) -> typing.Generator[toloka.client.operation_log.OperationLogItem, None, None]:
+        """Iterates over an operation log.
+
+        Unlike [get_operation_log](toloka.client.TolokaClient.get_operation_log.md), the log is parsed incrementally while
+        it is being downloaded, so logs of operations with hundreds of thousands of items are processed in bounded memory.
+
+        Args:
+            operation_id: The ID of the operation.
+
+        Yields:
+            OperationLogItem: The next log item.
+
+        Example:
+            >>> created_task_ids = [
+            >>>     log_item.output['task_id']
+            >>>     for log_item in toloka_client.get_operation_log_items(operation_id='6d84114f-fcfc-473d-8249-1a4f3ea550eb')
+            >>>     if log_item.success
+            >>> ]
+            ...
+        """
+        ...
+
     @typing.overload
     def create_user_bonus(
         self,
@@ -4195,19 +4703,36 @@ class TolokaClient:
     @typing.overload
     def create_user_bonuses(
         self,
-        user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
-        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None
-    ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
+        parameters: typing.Optional[toloka.client.user_bonus.UserBonusesCreateRequestParameters] = None,
+        *,
+        ids_only: bool = False,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_chunks: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None
+    ) -> typing.Union[toloka.client.batch_create_results.UserBonusBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Issues several bonus payments to Tolokers.
 
         You can send a maximum of 10,000 requests of this kind per day.
 
+        If there are more bonuses than `chunk_size`, they are split into chunks which are issued by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily.
+        Each chunk gets a deterministic `operation_id` derived from the `operation_id` parameter.
+
         Args:
-            user_bonuses: A list of bonuses.
+            user_bonuses: Bonuses to be issued. A list or any other iterable.
             parameters: Parameters of the request.
+            ids_only: If `True`, issued bonuses are not downloaded from Toloka and only their IDs are returned.
+                Default value: `False`.
+            chunk_size: The maximum number of bonuses issued by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            UserBonusBatchCreateResult: The result of the operation.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Example:
             >>> from decimal import Decimal
@@ -4235,22 +4760,38 @@ class TolokaClient:
     @typing.overload
     def create_user_bonuses(
         self,
-        user_bonuses: typing.List[toloka.client.user_bonus.UserBonus],
+        user_bonuses: typing.Iterable[toloka.client.user_bonus.UserBonus],
         *,
         operation_id: typing.Optional[uuid.UUID] = ...,
         async_mode: typing.Optional[bool] = True,
-        skip_invalid_items: typing.Optional[bool] = None
-    ) -> toloka.client.batch_create_results.UserBonusBatchCreateResult:
+        skip_invalid_items: typing.Optional[bool] = None,
+        ids_only: bool = False,
+        chunk_size: typing.Optional[int] = None,
+        max_concurrent_chunks: int = 4,
+        journal: typing.Optional[toloka.client.upload_journal.UploadJournal] = None
+    ) -> typing.Union[toloka.client.batch_create_results.UserBonusBatchCreateResult, toloka.client.batch_create_results.IdsBatchCreateResult]:
         """Issues several bonus payments to Tolokers.
 
         You can send a maximum of 10,000 requests of this kind per day.
 
+        If there are more bonuses than `chunk_size`, they are split into chunks which are issued by separate requests.
+        Up to `max_concurrent_chunks` chunks are uploaded at the same time, and the input is read lazily.
+        Each chunk gets a deterministic `operation_id` derived from the `operation_id` parameter.
+
         Args:
-            user_bonuses: A list of bonuses.
+            user_bonuses: Bonuses to be issued. A list or any other iterable.
             parameters: Parameters of the request.
+            ids_only: If `True`, issued bonuses are not downloaded from Toloka and only their IDs are returned.
+                Default value: `False`.
+            chunk_size: The maximum number of bonuses issued by a single request.
+                Default value: 10,000 if `async_mode` is `True` and 5000 otherwise.
+            max_concurrent_chunks: The maximum number of chunks uploaded concurrently. Default value: 4.
+            journal: An [UploadJournal](toloka.client.upload_journal.UploadJournal.md) that records uploaded chunks.
+                If the upload is interrupted, call the method again with the same `operation_id` and journal to resume it.
+                Default value: `None`.
 
         Returns:
-            UserBonusBatchCreateResult: The result of the operation.
+            Union[UserBonusBatchCreateResult, IdsBatchCreateResult]: The result of the operation.
 
         Example:
             >>> from decimal import Decimal
@@ -4452,7 +4993,7 @@ class TolokaClient:
     def get_user_bonuses(
         self,
         request: toloka.client.search_requests.UserBonusSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -4464,6 +5005,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -4488,7 +5030,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.user_bonus.UserBonus, None, None]:
         """Finds all Tolokers' bonuses that match certain rules and returns them in an iterable object
 
@@ -4500,6 +5042,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserBonus: The next matching Toloker's bonus.
@@ -4510,6 +5053,66 @@ class TolokaClient:
         """
         ...
 
+    @typing.overload
+    def get_user_bonuses_pages(
+        self,
+        request: toloka.client.search_requests.UserBonusSearchRequest,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all bonuses that match certain criteria and yields them page by page.
+
+        `get_user_bonuses_pages` works like [get_user_bonuses](toloka.client.TolokaClient.get_user_bonuses.md) but yields whole pages of search results. Use it to process bonuses in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with bonuses and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_user_bonuses_pages(created_lt='2023-06-01T00:00:00', batch_size=300):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
+    @typing.overload
+    def get_user_bonuses_pages(
+        self,
+        user_id: typing.Optional[str] = None,
+        assignment_id: typing.Optional[str] = None,
+        private_comment: typing.Optional[str] = None,
+        id_lt: typing.Optional[str] = None,
+        id_lte: typing.Optional[str] = None,
+        id_gt: typing.Optional[str] = None,
+        id_gte: typing.Optional[str] = None,
+        created_lt: typing.Optional[datetime.datetime] = None,
+        created_lte: typing.Optional[datetime.datetime] = None,
+        created_gt: typing.Optional[datetime.datetime] = None,
+        created_gte: typing.Optional[datetime.datetime] = None,
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
+    ) -> typing.Generator[toloka.client.search_results.SearchResultPage, None, None]:
+        """Finds all bonuses that match certain criteria and yields them page by page.
+
+        `get_user_bonuses_pages` works like [get_user_bonuses](toloka.client.TolokaClient.get_user_bonuses.md) but yields whole pages of search results. Use it to process bonuses in batches.
+
+        Args:
+            request: Search criteria.
+            batch_size: A limit of items returned by each request to Toloka.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
+
+        Yields:
+            SearchResultPage: The next page with bonuses and the request for the next page.
+
+        Example:
+            >>> for page in toloka_client.get_user_bonuses_pages(created_lt='2023-06-01T00:00:00', batch_size=300):
+            >>>     save_to_database(page.items)
+            ...
+        """
+        ...
+
     @typing.overload
     def find_user_restrictions(
         self,
@@ -4603,7 +5206,7 @@ class TolokaClient:
     def get_user_restrictions(
         self,
         request: toloka.client.search_requests.UserRestrictionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -4615,6 +5218,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -4640,7 +5244,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.user_restriction.UserRestriction, None, None]:
         """Finds all Toloker restrictions that match certain criteria.
 
@@ -4652,6 +5256,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 500.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserRestriction: The next matching Toloker restriction.
@@ -4697,6 +5302,53 @@ class TolokaClient:
         """
         ...
 
+    def reconcile_user_restrictions(
+        self,
+        desired_restrictions: typing.Dict[str, typing.Optional[toloka.client.user_restriction.UserRestriction]],
+        scope: typing.Union[toloka.client.user_restriction.UserRestriction.Scope, str],
+        project_id: typing.Optional[str] = None,
+        pool_id: typing.Optional[str] = None,
+        remove_missing: bool = False,
+        concurrency: int = 10
+    ) -> toloka.client.reconciliation.UserStateReconciliationReport:
+        """Brings Tolokers' restrictions to the desired state changing only those that differ.
+
+        Current restrictions with the specified scope are fetched in bulk. Then restrictions are set only for Tolokers
+        who have no restriction or have a restriction with other parameters, and restrictions mapped to `None` are
+        removed. If a Toloker has several restrictions with the same scope, project and pool, all of them except
+        the desired one are removed. Changes are applied in parallel.
+
+        Args:
+            desired_restrictions: A mapping from Toloker IDs to desired restrictions.
+                `None` means that the Toloker must not be restricted. If `user_id` of a restriction is not set,
+                the mapping key is used.
+            scope: The scope of restrictions.
+            project_id: The ID of the project. Used with the `PROJECT` scope.
+            pool_id: The ID of the pool. Used with the `POOL` scope.
+            remove_missing: Remove restrictions of Tolokers who are not in `desired_restrictions`. Default value: `False`.
+            concurrency: The maximum number of simultaneous requests. Default value: 10.
+
+        Returns:
+            UserStateReconciliationReport: Applied changes and Tolokers who already had the desired restrictions.
+
+        Example:
+            Synchronizing a ban list with a project.
+
+            >>> from toloka.client.user_restriction import ProjectUserRestriction
+            >>> report = toloka_client.reconcile_user_restrictions(
+            >>>     {
+            >>>         user_id: ProjectUserRestriction(project_id='92694', private_comment='Spammer')
+            >>>         for user_id in banned_user_ids
+            >>>     },
+            >>>     scope='PROJECT',
+            >>>     project_id='92694',
+            >>>     remove_missing=True,
+            >>> )
+            >>> print(len(report.applied), len(report.unchanged_user_ids))
+            ...
+        """
+        ...
+
     def get_requester(self) -> toloka.client.requester.Requester:
         """Gets information about the requester and the account balance.
 
@@ -4823,7 +5475,7 @@ class TolokaClient:
     def get_user_skills(
         self,
         request: toloka.client.search_requests.UserSkillSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -4835,6 +5487,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -4862,7 +5515,7 @@ class TolokaClient:
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
         modified_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.user_skill.UserSkill, None, None]:
         """Finds all Toloker's skills that match certain criteria.
 
@@ -4874,6 +5527,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             UserSkill: The next matching Toloker's skill.
@@ -4958,6 +5612,40 @@ class TolokaClient:
         """
         ...
 
+    def reconcile_user_skills(
+        self,
+        skill_id: str,
+        desired_values: typing.Dict[str, typing.Optional[decimal.Decimal]],
+        remove_missing: bool = False,
+        concurrency: int = 10
+    ) -> toloka.client.reconciliation.UserStateReconciliationReport:
+        """Brings Tolokers' skill values to the desired state changing only those that differ.
+
+        Current values of the skill are fetched in bulk. Then the skill is set only for Tolokers whose value differs
+        from the desired one, and skill values mapped to `None` are removed. Changes are applied in parallel.
+
+        Args:
+            skill_id: The ID of the skill.
+            desired_values: A mapping from Toloker IDs to desired skill values. `None` means that the Toloker must not
+                have the skill.
+            remove_missing: Remove the skill from Tolokers who are not in `desired_values`. Default value: `False`.
+            concurrency: The maximum number of simultaneous requests. Default value: 10.
+
+        Returns:
+            UserStateReconciliationReport: Applied changes and Tolokers who already had the desired skill values.
+
+        Example:
+            >>> from decimal import Decimal
+            >>> report = toloka_client.reconcile_user_skills(
+            >>>     skill_id='11294',
+            >>>     desired_values={'fac97860c7929add8048ed2ef63b66fd': Decimal(100), 'a1b0b42923c429daa2c764d7ccfc364d': None},
+            >>> )
+            >>> for result in report.failed:
+            >>>     print(result.change.user_id, result.error)
+            ...
+        """
+        ...
+
     def upsert_webhook_subscriptions(self, subscriptions: typing.List[toloka.client.webhook_subscription.WebhookSubscription]) -> toloka.client.batch_create_results.WebhookSubscriptionBatchCreateResult:
         """Creates subscriptions.
 
@@ -5079,7 +5767,7 @@ class TolokaClient:
     def get_webhook_subscriptions(
         self,
         request: toloka.client.search_requests.WebhookSubscriptionSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.webhook_subscription.WebhookSubscription, None, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -5091,6 +5779,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -5115,7 +5804,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.webhook_subscription.WebhookSubscription, None, None]:
         """Finds all webhook subscriptions that match certain criteria.
 
@@ -5127,6 +5816,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 300.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             WebhookSubscription: The next matching webhook subscription.
@@ -5344,7 +6034,7 @@ class TolokaClient:
     def get_app_projects(
         self,
         request: toloka.client.search_requests.AppProjectSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.AppProject, None, None]:
         """Finds all App projects that match certain criteria.
 
@@ -5362,6 +6052,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppProject: The next matching App project.
@@ -5389,7 +6080,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.AppProject, None, None]:
         """Finds all App projects that match certain criteria.
 
@@ -5407,6 +6098,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 5000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppProject: The next matching App project.
@@ -5588,7 +6280,7 @@ class TolokaClient:
     def get_apps(
         self,
         request: toloka.client.search_requests.AppSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.App, None, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -5606,6 +6298,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             App: The next matching solution.
@@ -5621,7 +6314,7 @@ class TolokaClient:
         id_lte: typing.Optional[str] = None,
         id_gt: typing.Optional[str] = None,
         id_gte: typing.Optional[str] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.App, None, None]:
         """Finds all App solutions that match certain criteria.
 
@@ -5639,6 +6332,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             App: The next matching solution.
@@ -5764,7 +6458,7 @@ class TolokaClient:
         self,
         app_project_id: str,
         request: toloka.client.search_requests.AppItemSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.AppItem, None, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -5783,6 +6477,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppItem: The next matching item.
@@ -5808,7 +6503,7 @@ class TolokaClient:
         finished_lte: typing.Optional[datetime.datetime] = None,
         finished_gt: typing.Optional[datetime.datetime] = None,
         finished_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.AppItem, None, None]:
         """Finds all App task items that match certain criteria in an App project.
 
@@ -5827,6 +6522,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppItem: The next matching item.
@@ -6076,7 +6772,7 @@ class TolokaClient:
         self,
         app_project_id: str,
         request: toloka.client.search_requests.AppBatchSearchRequest,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.AppBatch, None, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -6097,6 +6793,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppBatch: The next matching batch.
@@ -6121,7 +6818,7 @@ class TolokaClient:
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
         created_gte: typing.Optional[datetime.datetime] = None,
-        batch_size: typing.Optional[int] = None
+        batch_size: typing.Union[int, toloka.client.search_batch_size.AdaptiveBatchSize, None] = None
     ) -> typing.Generator[toloka.client.app.AppBatch, None, None]:
         """Finds all batches that match certain criteria in an App project.
 
@@ -6142,6 +6839,7 @@ class TolokaClient:
             request: Search criteria.
             batch_size: A limit of items returned by each request to Toloka.
                 The maximum allowed value: 1000.
+                Pass [AdaptiveBatchSize](toloka.client.search_batch_size.AdaptiveBatchSize.md) to adjust the limit while iterating.
 
         Yields:
             AppBatch: The next matching batch.
@@ -6360,8 +7058,11 @@ class TolokaClient:
         ...
 
     EXCEPTIONS_TO_RETRY: typing.ClassVar[typing.Tuple[Exception]]
+    _COLLECT_MAX_WORKERS: typing.ClassVar[int]
     token: str
     default_timeout: typing.Union[float, typing.Tuple[float, float]]
     _platform_url: typing.Optional[str]
     url: typing.Optional[str]
     retryer_factory: typing.Optional[typing.Callable[[], urllib3.util.retry.Retry]]
+    decode_processes: typing.Optional[int]
+    lazy_structuring: bool
@@ -0,0 +1,192 @@
+__all__: list = []
+
+import itertools
+import uuid
+from copy import copy
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+import attr
+
+from ._converter import structure, unstructure
+from .batch_create_results import FieldValidationError, IdsBatchCreateResult
+from .exceptions import ValidationApiError
+from .primitives.parameter import IdempotentOperationParameters
+from .upload_journal import UploadChunk, UploadChunkStatus, UploadJournal
+
+# Toloka recommends no more than 10,000 objects per request in async mode and accepts no more than 5000 objects
+# per request in sync mode
+DEFAULT_ASYNC_MODE_CHUNK_SIZE = 10_000
+DEFAULT_SYNC_MODE_CHUNK_SIZE = 5_000
+DEFAULT_MAX_CONCURRENT_CHUNKS = 4
+
+
+def get_chunk_size(parameters: IdempotentOperationParameters, chunk_size: Optional[int]) -> int:
+    if chunk_size is None:
+        return DEFAULT_ASYNC_MODE_CHUNK_SIZE if parameters.async_mode else DEFAULT_SYNC_MODE_CHUNK_SIZE
+    if chunk_size <= 0:
+        raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+    return chunk_size
+
+
+def iterate_chunks(objects: Iterable, chunk_size: int) -> Iterator[List]:
+    """Splits objects into lists of at most `chunk_size` items reading the input lazily.
+
+    At least one (possibly empty) chunk is always yielded.
+    """
+
+    iterator = iter(objects)
+    chunk = list(itertools.islice(iterator, chunk_size))
+    yield chunk
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_chunk_operation_id(operation_id: uuid.UUID, chunk_idx: int) -> uuid.UUID:
+    """Returns a deterministic operation ID for a chunk, so a retried upload reuses operations already submitted.
+
+    The first chunk uses the operation ID itself, so uploads that fit into a single chunk behave as before.
+    """
+
+    if chunk_idx == 0:
+        return operation_id
+    return uuid.uuid5(operation_id, str(chunk_idx))
+
+
+def get_chunk_parameters(parameters: IdempotentOperationParameters, chunk_idx: int) -> IdempotentOperationParameters:
+    chunk_parameters = copy(parameters)
+    chunk_parameters.operation_id = get_chunk_operation_id(parameters.operation_id, chunk_idx)
+    return chunk_parameters
+
+
+def is_chunk_validation_error(exc: ValidationApiError, parameters: IdempotentOperationParameters) -> bool:
+    """Checks whether the chunk failed only because none of its items passed validation."""
+
+    return (
+        getattr(parameters, 'skip_invalid_items', False)
+        and isinstance(exc.payload, dict)
+        and all(isinstance(key, str) and key.isdigit() for key in exc.payload)
+    )
+
+
+@attr.attrs(auto_attribs=True, frozen=True)
+class Chunk:
+    idx: int
+    start: int
+    stop: int
+    parameters: IdempotentOperationParameters
+    # IDs of objects created during a previous run. Such a chunk is not submitted again, its objects are downloaded
+    journaled_result: Optional[IdsBatchCreateResult] = None
+
+
+class ChunkedBatchCreateResultMerger:
+    """Merges results of chunks into a single batch create result keyed by indexes in the whole input.
+
+    If the upload journal is passed, chunks are recorded in it, and results of chunks completed during the previous
+    runs are restored from it instead of being submitted again.
+
+    Submitted chunks are resubmitted on resume. It is safe only in the async mode: Toloka ignores `operation_id`
+    otherwise and would create the objects twice.
+    """
+
+    def __init__(self, parameters: IdempotentOperationParameters, ids_only: bool, journal: Optional[UploadJournal]):
+        if journal is not None and not parameters.async_mode:
+            raise ValueError('The upload journal can be used only with async_mode=True')
+        self.parameters = parameters
+        self.ids_only = ids_only
+        self.journal = journal
+        self.upload_id = str(parameters.operation_id)
+        self.result_type: Optional[Type] = None
+        self.items: Dict[str, Any] = {}
+        self.validation_errors: Dict[str, Dict[str, FieldValidationError]] = {}
+
+    def start_chunk(self, chunk_idx: int, start: int, stop: int) -> Optional[Chunk]:
+        """Returns the chunk to submit or `None` if the chunk result is restored from the journal."""
+
+        chunk = Chunk(
+            idx=chunk_idx, start=start, stop=stop, parameters=get_chunk_parameters(self.parameters, chunk_idx),
+        )
+        if self.journal is None:
+            return chunk
+
+        record = self.journal.get_chunk(self.upload_id, chunk_idx)
+        if record is None:
+            self._save_chunk(chunk, UploadChunkStatus.SUBMITTED)
+            return chunk
+        if (record.start, record.stop) != (start, stop):
+            raise ValueError(
+                f'Chunk {chunk_idx} of the upload {self.upload_id} was journaled with objects [{record.start}, '
+                f'{record.stop}), but now it contains objects [{start}, {stop}). '
+                f'Pass the same objects and chunk_size to resume the upload.'
+            )
+        if record.status == UploadChunkStatus.COMPLETED:
+            if not self.ids_only:
+                return attr.evolve(chunk, journaled_result=record.result)
+            self.result_type = IdsBatchCreateResult
+            self._add_items(record.result, chunk.start)
+            return None
+        # Submitted chunks are submitted again: the same operation_id makes Toloka return the existing operation
+        return chunk
+
+    def add_result(self, chunk: Chunk, result) -> None:
+        self.result_type = type(result)
+        self._add_items(result, chunk.start)
+        if self.journal is not None and chunk.journaled_result is None:
+            if not isinstance(result, IdsBatchCreateResult):
+                result = IdsBatchCreateResult(
+                    items={idx: item.id for idx, item in result.items.items()},
+                    validation_errors=result.validation_errors,
+                )
+            self._save_chunk(chunk, UploadChunkStatus.COMPLETED, result)
+
+    def add_validation_error(self, chunk: Chunk, exc: ValidationApiError) -> None:
+        """Stores validation errors of a chunk where no objects were created or reraises the exception otherwise."""
+
+        if not is_chunk_validation_error(exc, chunk.parameters):
+            raise exc
+        # The payload may contain both raw and structured errors, they are structured like in results of chunks
+        # where some objects were created
+        validation_errors = structure(unstructure(exc.payload), Dict[str, Dict[str, FieldValidationError]])
+        self._add_validation_errors(validation_errors, chunk.start)
+        if self.journal is not None:
+            result = IdsBatchCreateResult(items={}, validation_errors=validation_errors)
+            self._save_chunk(chunk, UploadChunkStatus.COMPLETED, result)
+
+    def get_result(self):
+        # Like in sync methods Exception will raise
+        # even if the skip_invalid_items=True but no objects are created
+        if not self.items:
+            raise ValidationApiError(
+                code='VALIDATION_ERROR',
+                message='Validation failed',
+                payload=self.validation_errors,
+            )
+        return self.result_type(items=self.items, validation_errors=self.validation_errors)
+
+    def _add_items(self, result, offset: int) -> None:
+        for idx, item in sorted(result.items.items(), key=lambda idx_and_item: int(idx_and_item[0])):
+            self.items[str(int(idx) + offset)] = item
+        self._add_validation_errors(result.validation_errors or {}, offset)
+
+    def _add_validation_errors(
+        self, validation_errors: Dict[str, Dict[str, FieldValidationError]], offset: int,
+    ) -> None:
+        for idx, errors in sorted(validation_errors.items(), key=lambda idx_and_errors: int(idx_and_errors[0])):
+            self.validation_errors[str(int(idx) + offset)] = errors
+
+    def _save_chunk(
+        self, chunk: Chunk, status: Union[UploadChunkStatus, str], result: Optional[IdsBatchCreateResult] = None,
+    ) -> None:
+        self.journal.save_chunk(
+            UploadChunk(
+                upload_id=self.upload_id,
+                chunk_idx=chunk.idx,
+                start=chunk.start,
+                stop=chunk.stop,
+                operation_id=str(chunk.parameters.operation_id),
+                status=status,
+                result=result,
+            )
+        )
@@ -0,0 +1,106 @@
+__all__: list = []
+
+import atexit
+import codecs
+import functools
+import multiprocessing
+import threading
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import attr
+import httpx
+import simplejson
+
+from ._converter import structure
+
+# Set by _find_all while calling a find_* method. If it is set, _search_request sends the request in streaming mode
+# and stores the response in the page instead of reading it, so _find_all may parse and yield items while the body
+# is still being downloaded.
+streamed_search_page_var: ContextVar[Optional['StreamedSearchPage']] = ContextVar('streamed_search_page', default=None)
+
+
+@attr.attrs(auto_attribs=True)
+class StreamedSearchPage:
+    items_field: str
+    response: Optional[httpx.Response] = None
+    has_more: Optional[bool] = None
+    last_item: Any = None
+    # The size of the decoded response body, set after the page is parsed
+    bytes_count: Optional[int] = None
+    _decoder: Optional[codecs.IncrementalDecoder] = attr.ib(default=None, init=False, repr=False)
+
+    def decode(self, chunk: bytes, final: bool = False) -> str:
+        """Decodes a part of the response body and counts its bytes.
+
+        Decompressed bytes are counted, so the count reflects the memory used by the page rather than the traffic.
+        """
+
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder(self.response.encoding or 'utf-8')()
+            self.bytes_count = 0
+        self.bytes_count += len(chunk)
+        return self._decoder.decode(chunk, final=final)
+
+
+def structure_items(result_type: Type, items_field: str, raw_items: List[Dict[str, Any]], lazy: bool = False) -> List:
+    """Structures a part of the search page items the same way as the whole page is structured.
+
+    If `lazy` is `True`, items that support it are structured on first access to their fields.
+    """
+
+    if not raw_items:
+        return []
+    if lazy:
+        item_type = get_item_type(result_type, items_field)
+        if item_type is not None:
+            return [item_type.structure_lazy(raw_item) for raw_item in raw_items]
+    return getattr(structure({items_field: raw_items}, result_type), items_field)
+
+
+@functools.lru_cache(maxsize=None)
+def get_item_type(result_type: Type, items_field: str) -> Optional[Type]:
+    """Returns the class of search result items if they may be structured lazily."""
+
+    field_type = attr.fields_dict(result_type)[items_field].type
+    # Optional[List[ItemType]]
+    list_type = next((arg for arg in typing.get_args(field_type) if arg is not type(None)), field_type)  # noqa: E721
+    item_type = next(iter(typing.get_args(list_type)), None)
+    if isinstance(item_type, type) and hasattr(item_type, 'structure_lazy'):
+        return item_type
+    return None
+
+
+# Process pools are shared by all clients with the same number of decoding processes. They are not stored in clients,
+# so clients stay pickle-friendly.
+_decode_executors: Dict[int, ProcessPoolExecutor] = {}
+_decode_executors_lock = threading.Lock()
+
+
+def get_decode_executor(max_workers: int) -> ProcessPoolExecutor:
+    with _decode_executors_lock:
+        executor = _decode_executors.get(max_workers)
+        if executor is None or executor._broken:
+            # Clients are used from threads and event loops, and forking a multi-threaded process may deadlock
+            # in the child, so worker processes are spawned
+            executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+            _decode_executors[max_workers] = executor
+        return executor
+
+
+@atexit.register
+def shutdown_decode_executors() -> None:
+    with _decode_executors_lock:
+        for executor in _decode_executors.values():
+            executor.shutdown()
+        _decode_executors.clear()
+
+
+def decode_search_page(content: bytes, result_type: Type, items_field: str) -> Tuple[List, bool]:
+    """Decodes and structures a whole search page. Runs in a worker process."""
+
+    result = structure(simplejson.loads(content, parse_float=Decimal), result_type)
+    return getattr(result, items_field), result.has_more
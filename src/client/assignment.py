@@ -1,6 +1,7 @@
 __all__ = [
     'Assignment',
     'AssignmentPatch',
+    'AssignmentReviewDecision',
     'GetAssignmentsTsvParameters'
 ]
 from attr.validators import optional, instance_of
@@ -130,6 +131,32 @@ class AssignmentPatch(BaseTolokaObject):
     status: Assignment.Status
 
 
+class AssignmentReviewDecision(BaseTolokaObject):
+    """A decision to accept or reject an assignment.
+
+    Decisions are passed to the [review_assignments](toloka.client.TolokaClient.review_assignments.md) method.
+
+    Attributes:
+        assignment_id: The ID of the assignment.
+        status: The new status of the assignment:
+            * `ACCEPTED` — Accept the assignment.
+            * `REJECTED` — Reject the assignment.
+        public_comment: The public comment. It is required when the assignment is rejected.
+
+    Example:
+        >>> decision = toloka.client.AssignmentReviewDecision(
+        >>>     assignment_id='00001092da--61ef030400c684132d0da0de',
+        >>>     status='REJECTED',
+        >>>     public_comment='Some questions skipped',
+        >>> )
+        ...
+    """
+
+    assignment_id: str = attribute(required=True)
+    status: Assignment.Status = attribute(required=True, autocast=True)
+    public_comment: str
+
+
 class GetAssignmentsTsvParameters(Parameters):
     """Parameters for downloading assignments.
 
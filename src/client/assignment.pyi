@@ -1,6 +1,7 @@
 __all__ = [
     'Assignment',
     'AssignmentPatch',
+    'AssignmentReviewDecision',
     'GetAssignmentsTsvParameters',
 ]
 import datetime
@@ -157,6 +158,44 @@ class AssignmentPatch(toloka.client.primitives.base.BaseTolokaObject):
     status: typing.Optional[Assignment.Status]
 
 
+class AssignmentReviewDecision(toloka.client.primitives.base.BaseTolokaObject):
+    """A decision to accept or reject an assignment.
+
+    Decisions are passed to the [review_assignments](toloka.client.TolokaClient.review_assignments.md) method.
+
+    Attributes:
+        assignment_id: The ID of the assignment.
+        status: The new status of the assignment:
+            * `ACCEPTED` — Accept the assignment.
+            * `REJECTED` — Reject the assignment.
+        public_comment: The public comment. It is required when the assignment is rejected.
+
+    Example:
+        >>> decision = toloka.client.AssignmentReviewDecision(
+        >>>     assignment_id='00001092da--61ef030400c684132d0da0de',
+        >>>     status='REJECTED',
+        >>>     public_comment='Some questions skipped',
+        >>> )
+        ...
+    """
+
+    def __init__(
+        self,
+        *,
+        assignment_id: str,
+        status: typing.Union[Assignment.Status, str],
+        public_comment: typing.Optional[str] = None
+    ) -> None:
+        """Method generated by attrs for class AssignmentReviewDecision.
+        """
+        ...
+
+    _unexpected: typing.Optional[typing.Dict[str, typing.Any]]
+    assignment_id: str
+    status: Assignment.Status
+    public_comment: typing.Optional[str]
+
+
 class GetAssignmentsTsvParameters(toloka.client.primitives.parameter.Parameters):
     """Parameters for downloading assignments.
 
@@ -1,5 +1,6 @@
 __all__ = [
     'FieldValidationError',
+    'IdsBatchCreateResult',
     'TaskBatchCreateResult',
     'TaskSuiteBatchCreateResult',
     'UserBonusBatchCreateResult',
@@ -28,6 +29,28 @@ class FieldValidationError(BaseTolokaObject):
     params: List[Any]
 
 
+class IdsBatchCreateResult(BaseTolokaObject):
+    """The result of a batch creation that contains only IDs of created objects.
+
+    `IdsBatchCreateResult` is returned by the [create_tasks](toloka.client.TolokaClient.create_tasks.md),
+    [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) and
+    [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) methods called with `ids_only=True`.
+    Created objects are not downloaded from Toloka in this case.
+
+    Attributes:
+        items: A dictionary with IDs of created objects. The indexes of an input list are used as keys in the dictionary.
+        validation_errors: A dictionary with validation errors. It is filled if the request parameter `skip_invalid_items` is `True`.
+
+    Example:
+        >>> result = toloka_client.create_tasks(tasks, allow_defaults=True, skip_invalid_items=True, ids_only=True)
+        >>> created_task_ids = list(result.items.values())
+        ...
+    """
+
+    items: Dict[str, str]
+    validation_errors: Dict[str, Dict[str, FieldValidationError]]
+
+
 def _create_batch_create_result_class_for(type_: Type, docstring: Optional[str] = None):
     cls = BaseTolokaObjectMetaclass(
         f'{type_.__name__}BatchCreateResult',
@@ -1,5 +1,6 @@
 __all__ = [
     'FieldValidationError',
+    'IdsBatchCreateResult',
     'TaskBatchCreateResult',
     'TaskSuiteBatchCreateResult',
     'UserBonusBatchCreateResult',
@@ -39,6 +40,39 @@ class FieldValidationError(toloka.client.primitives.base.BaseTolokaObject):
     params: typing.Optional[typing.List[typing.Any]]
 
 
+class IdsBatchCreateResult(toloka.client.primitives.base.BaseTolokaObject):
+    """The result of a batch creation that contains only IDs of created objects.
+
+    `IdsBatchCreateResult` is returned by the [create_tasks](toloka.client.TolokaClient.create_tasks.md),
+    [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) and
+    [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) methods called with `ids_only=True`.
+    Created objects are not downloaded from Toloka in this case.
+
+    Attributes:
+        items: A dictionary with IDs of created objects. The indexes of an input list are used as keys in the dictionary.
+        validation_errors: A dictionary with validation errors. It is filled if the request parameter `skip_invalid_items` is `True`.
+
+    Example:
+        >>> result = toloka_client.create_tasks(tasks, allow_defaults=True, skip_invalid_items=True, ids_only=True)
+        >>> created_task_ids = list(result.items.values())
+        ...
+    """
+
+    def __init__(
+        self,
+        *,
+        items: typing.Optional[typing.Dict[str, str]] = None,
+        validation_errors: typing.Optional[typing.Dict[str, typing.Dict[str, FieldValidationError]]] = None
+    ) -> None:
+        """Method generated by attrs for class IdsBatchCreateResult.
+        """
+        ...
+
+    _unexpected: typing.Optional[typing.Dict[str, typing.Any]]
+    items: typing.Optional[typing.Dict[str, str]]
+    validation_errors: typing.Optional[typing.Dict[str, typing.Dict[str, FieldValidationError]]]
+
+
 class TaskBatchCreateResult(toloka.client.primitives.base.BaseTolokaObject):
     """The result of a task creation.
 
@@ -1,5 +1,11 @@
-__all__=['CloneResults']
-from typing import NamedTuple, List
+__all__ = [
+    'CloneResults',
+    'CloneFailure',
+    'ProjectCloneError',
+]
+from typing import NamedTuple, List, Union
+
+import attr
 
 from .pool import Pool
 from .project import Project
@@ -27,3 +33,41 @@ class CloneResults(NamedTuple):
     project: Project
     pools: List[Pool]
     trainings: List[Training]
+
+
+class CloneFailure(NamedTuple):
+    """An object that wasn't cloned by the [clone_project](toloka.client.TolokaClient.clone_project.md) method.
+
+    Attributes:
+        source: The original pool or training. If the project quality control settings weren't saved, the original
+            project.
+        error: The exception raised while cloning. If the object depends on a training that wasn't cloned,
+            the error of that training.
+    """
+
+    source: Union[Project, Pool, Training]
+    error: Exception
+
+
+@attr.attrs(auto_attribs=True, str=True, kw_only=True)
+class ProjectCloneError(Exception):
+    """An exception that is raised when the project is cloned partially.
+
+    Pools and trainings are cloned independently, so a failed request doesn't stop cloning of other objects.
+
+    Attributes:
+        results: The created project, pools and trainings.
+        failures: Objects that weren't cloned.
+
+    Example:
+        >>> try:
+        >>>     result = toloka_client.clone_project(project_id='92694')
+        >>> except toloka.client.ProjectCloneError as error:
+        >>>     result = error.results
+        >>>     for failure in error.failures:
+        >>>         print(type(failure.source).__name__, failure.source.id, failure.error)
+        ...
+    """
+
+    results: CloneResults
+    failures: List[CloneFailure]
@@ -1,5 +1,7 @@
 __all__ = [
     'CloneResults',
+    'CloneFailure',
+    'ProjectCloneError',
 ]
 import toloka.client.pool
 import toloka.client.project
@@ -39,3 +41,50 @@ class CloneResults(tuple):
     project: toloka.client.project.Project
     pools: typing.List[toloka.client.pool.Pool]
     trainings: typing.List[toloka.client.training.Training]
+
+
+class CloneFailure(tuple):
+    """An object that wasn't cloned by the [clone_project](toloka.client.TolokaClient.clone_project.md) method.
+
+    Attributes:
+        source: The original pool or training. If the project quality control settings weren't saved, the original
+            project.
+        error: The exception raised while cloning. If the object depends on a training that wasn't cloned,
+            the error of that training.
+    """
+
+    source: typing.Union[toloka.client.project.Project, toloka.client.pool.Pool, toloka.client.training.Training]
+    error: Exception
+
+
+class ProjectCloneError(Exception):
+    """An exception that is raised when the project is cloned partially.
+
+    Pools and trainings are cloned independently, so a failed request doesn't stop cloning of other objects.
+
+    Attributes:
+        results: The created project, pools and trainings.
+        failures: Objects that weren't cloned.
+
+    Example:
+        >>> try:
+        >>>     result = toloka_client.clone_project(project_id='92694')
+        >>> except toloka.client.ProjectCloneError as error:
+        >>>     result = error.results
+        >>>     for failure in error.failures:
+        >>>         print(type(failure.source).__name__, failure.source.id, failure.error)
+        ...
+    """
+
+    def __init__(
+        self,
+        *,
+        results: CloneResults,
+        failures: typing.List[CloneFailure]
+    ) -> None:
+        """Method generated by attrs for class ProjectCloneError.
+        """
+        ...
+
+    results: CloneResults
+    failures: typing.List[CloneFailure]
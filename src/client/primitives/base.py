@@ -7,13 +7,14 @@ __all__ = [
     'BaseParameters',
 ]
 
+import functools
 import inspect
 import logging
 import typing
 from copy import copy
 from enum import Enum
 from functools import update_wrapper, partial
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Set, Type, TypeVar, Union, Tuple
 
 import attr
 import simplejson as json
@@ -226,6 +227,12 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     # Unexpected fields access
 
     def __getattr__(self, item):
+        # Fields of lazily structured objects are absent in __dict__ until they are accessed
+        lazy_data = super().__getattribute__('__dict__').get('_lazy_data')
+        if lazy_data is not None:
+            field = _get_fields_by_name(type(self)).get(item)
+            if field is not None:
+                return self._structure_lazy_field(field, lazy_data)
         try:
             # get _unexpected pickle-friendly
             _unexpected = super().__getattribute__('_unexpected')
@@ -326,6 +333,68 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
         obj._unexpected = data
         return obj
 
+    @classmethod
+    def structure_lazy(cls, data: Dict[str, Any]):
+        """Creates an object that structures its fields on first access.
+
+        The object keeps the unstructured data and converts a field only when it is read, so reading a few fields of
+        a big object is cheap. The object has the same class as the one returned by `structure`, and it is equal to
+        it. Validation of fields is skipped. Variant types, generic types and classes with `__attrs_post_init__` are
+        structured eagerly. If a required field is missing, the same error as in `structure` is raised.
+        """
+
+        if (
+            cls.is_variant_incomplete() or hasattr(cls, '__attrs_post_init__')
+            or generate_type_var_mapping(cls)[1] or not _get_required_keys(cls) <= data.keys()
+        ):
+            return cls.structure(data)
+
+        keys = _get_fields_by_key(cls)
+        obj = cls.__new__(cls)
+        obj.__dict__['_unexpected'] = {key: value for key, value in data.items() if key not in keys}
+        obj.__dict__['_lazy_data'] = data
+        return obj
+
+    def _structure_lazy_field(self, field: attr.Attribute, lazy_data: Dict[str, Any]) -> Any:
+        key = field.metadata.get(ORIGIN_KEY, field.name)
+        if key in lazy_data:
+            value = lazy_data[key]
+            if field.type is not None:
+                value = converter.structure(value, field.type)
+        elif isinstance(field.default, attr.Factory):
+            value = field.default.factory(self) if field.default.takes_self else field.default.factory()
+        else:
+            value = field.default
+        if field.converter is not None:
+            value = field.converter(value)
+        self.__dict__[field.name] = value
+        if _get_fields_by_name(type(self)).keys() <= self.__dict__.keys():
+            del self.__dict__['_lazy_data']
+        return value
+
+    # Change tracking
+
+    def _take_snapshot(self) -> None:
+        # The client saves the state of objects that it returns from get, create and update methods, so changes
+        # made after that may be found by get_changed_fields
+        self.__dict__['_snapshot'] = self.unstructure() or {}
+
+    def get_changed_fields(self) -> Optional[Set[str]]:
+        """Returns names of top-level fields changed since the object was received from Toloka.
+
+        Returns:
+            Optional[Set[str]]: Names of changed fields in the API format. `None` if changes of the object aren't
+                tracked. Changes are tracked only for pools and projects returned by the `get_*`, `create_*` and
+                `update_*` methods of the client. Objects created locally, found by `find_*` methods or copied with
+                `attr.evolve` aren't tracked.
+        """
+
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot is None:
+            return None
+        current = self.unstructure() or {}
+        return {key for key in snapshot.keys() | current.keys() if snapshot.get(key) != current.get(key)}
+
     def to_json(self, pretty: bool = False) -> str:
         basic_config = {
             'use_decimal': True,
@@ -341,6 +410,24 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
         return cls.structure(json.loads(json_str, use_decimal=True))
 
 
+@functools.lru_cache(maxsize=None)
+def _get_fields_by_name(cls: type) -> Dict[str, attr.Attribute]:
+    return {field.name: field for field in attr.fields(cls) if field.name != '_unexpected'}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fields_by_key(cls: type) -> Set[str]:
+    return {field.metadata.get(ORIGIN_KEY, field.name) for field in _get_fields_by_name(cls).values()}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_required_keys(cls: type) -> Set[str]:
+    return {
+        field.metadata.get(ORIGIN_KEY, field.name)
+        for field in _get_fields_by_name(cls).values() if field.default is attr.NOTHING
+    }
+
+
 def _get_mapped_type(t, mapping):
     if isinstance(t, typing.TypeVar):
         return mapping.get(t.__name__, t)
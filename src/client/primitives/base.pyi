@@ -100,6 +100,28 @@ class BaseTolokaObject(metaclass=BaseTolokaObjectMetaclass):
     @classmethod
     def structure(cls, data: typing.Any): ...
 
+    @classmethod
+    def structure_lazy(cls, data: typing.Dict[str, typing.Any]):
+        """Creates an object that structures its fields on first access.
+
+        The object keeps the unstructured data and converts a field only when it is read, so reading a few fields of
+        a big object is cheap. The object has the same class as the one returned by `structure`, and it is equal to
+        it. Validation of fields is skipped. Variant types, generic types and classes with `__attrs_post_init__` are
+        structured eagerly. If a required field is missing, the same error as in `structure` is raised.
+        """
+        ...
+
+    def get_changed_fields(self) -> typing.Optional[typing.Set[str]]:
+        """Returns names of top-level fields changed since the object was received from Toloka.
+
+        Returns:
+            Optional[Set[str]]: Names of changed fields in the API format. `None` if changes of the object aren't
+                tracked. Changes are tracked only for pools and projects returned by the `get_*`, `create_*` and
+                `update_*` methods of the client. Objects created locally, found by `find_*` methods or copied with
+                `attr.evolve` aren't tracked.
+        """
+        ...
+
     def to_json(self, pretty: bool = False) -> str: ...
 
     @classmethod
@@ -175,6 +175,34 @@ class RetryingOverURLLibRetry(BaseRetrying):
             base_url=state['base_url'], retry=state['urllib3_retry'], exception_to_retry=state['exception_to_retry']
         )
 
+    def increment_on_body_error(
+        self, retry: Optional[Retry], method: str, url: str, exception: Exception,
+    ) -> Optional[Retry]:
+        """Counts an error raised while a streamed response body is being read.
+
+        Wrapped functions return streamed responses as soon as headers are received, so such errors happen outside
+        of the retrying. The caller may send the request again if the returned `Retry` is not `None`. `None` means
+        that the error is not retried or retries are exhausted.
+
+        Args:
+            retry: The `Retry` returned by the previous call or `None` for the first error.
+            method: The method of the request.
+            url: The URL of the request relative to the base URL.
+            exception: The raised exception.
+        """
+
+        if not isinstance(exception, self.exception_to_retry):
+            return None
+        try:
+            urllib3_exception = map_urllib3_exception_for_retrying(httpx_exception_to_urllib3_exception(exception))
+        except RuntimeError:
+            return None
+        retry = retry or self.urllib3_retry
+        try:
+            return retry.increment(method=method, url=f'{self.base_url}{url}', error=urllib3_exception)
+        except urllib3.exceptions.MaxRetryError:
+            return None
+
     def _patch_with_urllib3_retry(self, func: Callable):
         """Ensures that retry_state contains current urllib3 Retry instance before function call."""
 
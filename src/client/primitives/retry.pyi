@@ -91,6 +91,27 @@ class RetryingOverURLLibRetry(tenacity.BaseRetrying, metaclass=abc.ABCMeta):
 
     def __setstate__(self, state): ...
 
+    def increment_on_body_error(
+        self,
+        retry: typing.Optional[urllib3.util.retry.Retry],
+        method: str,
+        url: str,
+        exception: Exception
+    ) -> typing.Optional[urllib3.util.retry.Retry]:
+        """Counts an error raised while a streamed response body is being read.
+
+        Wrapped functions return streamed responses as soon as headers are received, so such errors happen outside
+        of the retrying. The caller may send the request again if the returned `Retry` is not `None`. `None` means
+        that the error is not retried or retries are exhausted.
+
+        Args:
+            retry: The `Retry` returned by the previous call or `None` for the first error.
+            method: The method of the request.
+            url: The URL of the request relative to the base URL.
+            exception: The raised exception.
+        """
+        ...
+
 
 class SyncRetryingOverURLLibRetry(RetryingOverURLLibRetry, tenacity.Retrying):
     ...
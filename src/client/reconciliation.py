@@ -0,0 +1,176 @@
+__all__ = [
+    'UserStateChangeAction',
+    'UserStateChange',
+    'UserStateChangeResult',
+    'UserStateReconciliationReport',
+]
+import datetime
+from decimal import Decimal
+from enum import unique
+from typing import Dict, List, NamedTuple, Optional, Union
+
+import attr
+
+from ._converter import unstructure
+from .user_restriction import UserRestriction
+from .user_skill import SetUserSkillRequest, UserSkill
+from ..util._extendable_enum import ExtendableStrEnum
+
+
+@unique
+class UserStateChangeAction(ExtendableStrEnum):
+    """An action required to bring a Toloker's skill or restriction to the desired state.
+
+    Attributes:
+        SET: Set the skill value or the restriction.
+        DELETE: Remove the skill value or the restriction.
+    """
+
+    SET = 'SET'
+    DELETE = 'DELETE'
+
+
+class UserStateChange(NamedTuple):
+    """A change of a Toloker's skill value or restriction.
+
+    Attributes:
+        user_id: The ID of the Toloker.
+        action: The action to apply.
+        desired: The skill value or the restriction to set. It is set for the `SET` action.
+        current: The current skill value or restriction. It is set for the `DELETE` action and for the `SET` action
+            if the Toloker has a different skill value or restriction.
+    """
+
+    user_id: str
+    action: UserStateChangeAction
+    desired: Union[SetUserSkillRequest, UserRestriction, None] = None
+    current: Union[UserSkill, UserRestriction, None] = None
+
+
+class UserStateChangeResult(NamedTuple):
+    """The result of applying a change.
+
+    Attributes:
+        change: The applied change.
+        error: The exception raised when the change was applied. `None` if the change was applied successfully.
+    """
+
+    change: UserStateChange
+    error: Optional[Exception] = None
+
+
+class UserStateReconciliationReport(NamedTuple):
+    """The result of reconciling Tolokers' skills or restrictions with the desired state.
+
+    The report is returned by the [reconcile_user_skills](toloka.client.TolokaClient.reconcile_user_skills.md) and
+    [reconcile_user_restrictions](toloka.client.TolokaClient.reconcile_user_restrictions.md) methods.
+
+    Attributes:
+        results: Results of applied changes.
+        unchanged_user_ids: IDs of Tolokers who already were in the desired state.
+    """
+
+    results: List[UserStateChangeResult]
+    unchanged_user_ids: List[str]
+
+    @property
+    def applied(self) -> List[UserStateChangeResult]:
+        """Results of changes that were applied successfully."""
+        return [result for result in self.results if result.error is None]
+
+    @property
+    def failed(self) -> List[UserStateChangeResult]:
+        """Results of changes that failed."""
+        return [result for result in self.results if result.error is not None]
+
+
+def _to_decimal(value: Union[Decimal, int, float, str]) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _diff_user_skills(
+    skill_id: str,
+    current: Dict[str, UserSkill],
+    desired_values: Dict[str, Optional[Decimal]],
+    remove_missing: bool,
+):
+    changes, unchanged_user_ids = [], []
+    for user_id, value in desired_values.items():
+        user_skill = current.get(user_id)
+        if value is None:
+            if user_skill is None:
+                unchanged_user_ids.append(user_id)
+            else:
+                changes.append(UserStateChange(user_id, UserStateChangeAction.DELETE, current=user_skill))
+        elif user_skill is not None and user_skill.exact_value == _to_decimal(value):
+            unchanged_user_ids.append(user_id)
+        else:
+            desired = SetUserSkillRequest(skill_id=skill_id, user_id=user_id, value=_to_decimal(value))
+            changes.append(UserStateChange(user_id, UserStateChangeAction.SET, desired=desired, current=user_skill))
+    if remove_missing:
+        for user_id, user_skill in current.items():
+            if user_id not in desired_values:
+                changes.append(UserStateChange(user_id, UserStateChangeAction.DELETE, current=user_skill))
+    return changes, unchanged_user_ids
+
+
+def _get_restriction_state(restriction: UserRestriction) -> dict:
+    state = unstructure(restriction)
+    state.pop('id', None)
+    state.pop('created', None)
+    will_expire = restriction.will_expire
+    if will_expire is not None:
+        # Toloka returns will_expire in UTC while the desired value may use any timezone
+        if will_expire.tzinfo is None:
+            will_expire = will_expire.replace(tzinfo=datetime.timezone.utc)
+        state['will_expire'] = will_expire.astimezone(datetime.timezone.utc)
+    return state
+
+
+def _get_restriction_target(restriction: UserRestriction) -> tuple:
+    return restriction.scope, getattr(restriction, 'project_id', None), getattr(restriction, 'pool_id', None)
+
+
+def _diff_user_restrictions(
+    current: Dict[str, List[UserRestriction]],
+    desired_restrictions: Dict[str, Optional[UserRestriction]],
+    remove_missing: bool,
+):
+    changes, unchanged_user_ids = [], []
+    for user_id, desired in desired_restrictions.items():
+        restrictions = current.get(user_id, [])
+        if desired is None:
+            if not restrictions:
+                unchanged_user_ids.append(user_id)
+            for restriction in restrictions:
+                changes.append(UserStateChange(user_id, UserStateChangeAction.DELETE, current=restriction))
+            continue
+        if desired.user_id is None:
+            desired = attr.evolve(desired, user_id=user_id)
+        elif desired.user_id != user_id:
+            raise ValueError(f'The restriction for the Toloker {user_id} has another user_id: {desired.user_id}')
+        superseded = [
+            restriction for restriction in restrictions
+            if _get_restriction_target(restriction) == _get_restriction_target(desired)
+        ]
+        desired_state = _get_restriction_state(desired)
+        kept = next(
+            (restriction for restriction in superseded if _get_restriction_state(restriction) == desired_state), None,
+        )
+        if kept is None:
+            current_restriction = superseded[0] if superseded else None
+            changes.append(
+                UserStateChange(user_id, UserStateChangeAction.SET, desired=desired, current=current_restriction)
+            )
+        elif len(superseded) == 1:
+            unchanged_user_ids.append(user_id)
+        # A Toloker may have several restrictions with the same target, all of them except the kept one are removed
+        for restriction in superseded:
+            if restriction is not kept:
+                changes.append(UserStateChange(user_id, UserStateChangeAction.DELETE, current=restriction))
+    if remove_missing:
+        for user_id, restrictions in current.items():
+            if user_id not in desired_restrictions:
+                for restriction in restrictions:
+                    changes.append(UserStateChange(user_id, UserStateChangeAction.DELETE, current=restriction))
+    return changes, unchanged_user_ids
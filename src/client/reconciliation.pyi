@@ -0,0 +1,66 @@
+__all__ = [
+    'UserStateChangeAction',
+    'UserStateChange',
+    'UserStateChangeResult',
+    'UserStateReconciliationReport',
+]
+import toloka.client.user_restriction
+import toloka.client.user_skill
+import toloka.util._extendable_enum
+import typing
+
+
+class UserStateChangeAction(toloka.util._extendable_enum.ExtendableStrEnum):
+    """An action required to bring a Toloker's skill or restriction to the desired state.
+
+    Attributes:
+        SET: Set the skill value or the restriction.
+        DELETE: Remove the skill value or the restriction.
+    """
+
+    SET = 'SET'
+    DELETE = 'DELETE'
+
+
+class UserStateChange(tuple):
+    """A change of a Toloker's skill value or restriction.
+
+    Attributes:
+        user_id: The ID of the Toloker.
+        action: The action to apply.
+        desired: The skill value or the restriction to set. It is set for the `SET` action.
+        current: The current skill value or restriction. It is set for the `DELETE` action and for the `SET` action
+            if the Toloker has a different skill value or restriction.
+    """
+
+    user_id: str
+    action: UserStateChangeAction
+    desired: typing.Union[toloka.client.user_skill.SetUserSkillRequest, toloka.client.user_restriction.UserRestriction, None]
+    current: typing.Union[toloka.client.user_skill.UserSkill, toloka.client.user_restriction.UserRestriction, None]
+
+
+class UserStateChangeResult(tuple):
+    """The result of applying a change.
+
+    Attributes:
+        change: The applied change.
+        error: The exception raised when the change was applied. `None` if the change was applied successfully.
+    """
+
+    change: UserStateChange
+    error: typing.Optional[Exception]
+
+
+class UserStateReconciliationReport(tuple):
+    """The result of reconciling Tolokers' skills or restrictions with the desired state.
+
+    The report is returned by the [reconcile_user_skills](toloka.client.TolokaClient.reconcile_user_skills.md) and
+    [reconcile_user_restrictions](toloka.client.TolokaClient.reconcile_user_restrictions.md) methods.
+
+    Attributes:
+        results: Results of applied changes.
+        unchanged_user_ids: IDs of Tolokers who already were in the desired state.
+    """
+
+    results: typing.List[UserStateChangeResult]
+    unchanged_user_ids: typing.List[str]
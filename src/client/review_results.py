@@ -0,0 +1,77 @@
+__all__ = [
+    'AssignmentReviewOutcome',
+    'AssignmentReviewResult',
+    'AssignmentReviewReport',
+]
+from enum import unique
+from typing import List, NamedTuple, Optional
+
+from .assignment import Assignment, AssignmentReviewDecision
+from ..util._extendable_enum import ExtendableStrEnum
+
+
+@unique
+class AssignmentReviewOutcome(ExtendableStrEnum):
+    """The outcome of reviewing an assignment.
+
+    Attributes:
+        REVIEWED: The assignment was accepted or rejected.
+        ALREADY_REVIEWED: The assignment had been reviewed before, so Toloka responded with the `CONFLICT_STATE` error.
+            It is considered successful because reviews are often retried.
+        FAILED: The assignment status wasn't changed because of an error.
+    """
+
+    REVIEWED = 'REVIEWED'
+    ALREADY_REVIEWED = 'ALREADY_REVIEWED'
+    FAILED = 'FAILED'
+
+
+class AssignmentReviewResult(NamedTuple):
+    """The result of reviewing a single assignment.
+
+    Attributes:
+        decision: The review decision.
+        outcome: The outcome of the review.
+        assignment: The assignment with the updated status. It is set only if the outcome is `REVIEWED`.
+        error: The exception raised when reviewing the assignment. It is set if the outcome is
+            `ALREADY_REVIEWED` or `FAILED`.
+    """
+
+    decision: AssignmentReviewDecision
+    outcome: AssignmentReviewOutcome
+    assignment: Optional[Assignment] = None
+    error: Optional[Exception] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.outcome != AssignmentReviewOutcome.FAILED
+
+
+class AssignmentReviewReport(NamedTuple):
+    """The result of bulk review of assignments.
+
+    `AssignmentReviewReport` is returned by the [review_assignments](toloka.client.TolokaClient.review_assignments.md)
+    method.
+
+    Attributes:
+        results: Results of reviewing assignments in the order of decisions.
+
+    Example:
+        >>> report = toloka_client.review_assignments(decisions)
+        >>> print('Reviewed:', len(report.reviewed), 'Failed:', len(report.failed))
+        >>> for result in report.failed:
+        >>>     print(result.decision.assignment_id, result.error)
+        ...
+    """
+
+    results: List[AssignmentReviewResult]
+
+    @property
+    def reviewed(self) -> List[AssignmentReviewResult]:
+        """Results of assignments that were reviewed or had been reviewed before."""
+        return [result for result in self.results if result.is_success]
+
+    @property
+    def failed(self) -> List[AssignmentReviewResult]:
+        """Results of assignments that weren't reviewed because of errors."""
+        return [result for result in self.results if not result.is_success]
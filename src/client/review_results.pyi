@@ -0,0 +1,60 @@
+__all__ = [
+    'AssignmentReviewOutcome',
+    'AssignmentReviewResult',
+    'AssignmentReviewReport',
+]
+import toloka.client.assignment
+import toloka.util._extendable_enum
+import typing
+
+
+class AssignmentReviewOutcome(toloka.util._extendable_enum.ExtendableStrEnum):
+    """The outcome of reviewing an assignment.
+
+    Attributes:
+        REVIEWED: The assignment was accepted or rejected.
+        ALREADY_REVIEWED: The assignment had been reviewed before, so Toloka responded with the `CONFLICT_STATE` error.
+            It is considered successful because reviews are often retried.
+        FAILED: The assignment status wasn't changed because of an error.
+    """
+
+    REVIEWED = 'REVIEWED'
+    ALREADY_REVIEWED = 'ALREADY_REVIEWED'
+    FAILED = 'FAILED'
+
+
+class AssignmentReviewResult(tuple):
+    """The result of reviewing a single assignment.
+
+    Attributes:
+        decision: The review decision.
+        outcome: The outcome of the review.
+        assignment: The assignment with the updated status. It is set only if the outcome is `REVIEWED`.
+        error: The exception raised when reviewing the assignment. It is set if the outcome is
+            `ALREADY_REVIEWED` or `FAILED`.
+    """
+
+    decision: toloka.client.assignment.AssignmentReviewDecision
+    outcome: AssignmentReviewOutcome
+    assignment: typing.Optional[toloka.client.assignment.Assignment]
+    error: typing.Optional[Exception]
+
+
+class AssignmentReviewReport(tuple):
+    """The result of bulk review of assignments.
+
+    `AssignmentReviewReport` is returned by the [review_assignments](toloka.client.TolokaClient.review_assignments.md)
+    method.
+
+    Attributes:
+        results: Results of reviewing assignments in the order of decisions.
+
+    Example:
+        >>> report = toloka_client.review_assignments(decisions)
+        >>> print('Reviewed:', len(report.reviewed), 'Failed:', len(report.failed))
+        >>> for result in report.failed:
+        >>>     print(result.decision.assignment_id, result.error)
+        ...
+    """
+
+    results: typing.List[AssignmentReviewResult]
@@ -0,0 +1,88 @@
+__all__ = [
+    'AdaptiveBatchSize',
+]
+from typing import Optional
+
+import attr
+
+
+@attr.attrs(auto_attribs=True, kw_only=True, frozen=True)
+class AdaptiveBatchSize:
+    """A page size that is adjusted while iterating over search results.
+
+    Pass `AdaptiveBatchSize` as the `batch_size` parameter of `get_*` methods, for example,
+    [get_assignments](toloka.client.TolokaClient.get_assignments.md). After each page the limit of items in the next
+    request is recalculated, so that a page takes about `target_seconds` to download and parse, and its response body
+    is about `target_bytes` long. Time spent by your code while processing yielded items is not counted.
+
+    Small pages lead to many requests, while big pages may lead to timeouts and memory spikes. The suitable size
+    depends on the size of items and on the network, so it is found while iterating.
+
+    Attributes:
+        min_size: The minimum limit of items in a request.
+        max_size: The maximum limit of items in a request. The maximum allowed value: 100,000. The limit is also capped
+            by the maximum allowed by the `get_*` method, for example, 300 for `get_pools`.
+        initial_size: The limit of items in the first request. Default value: `min_size`.
+        target_seconds: Desired time to get and parse a page. If `None`, time is not taken into account.
+        target_bytes: Desired size of a response body. If `None`, the size is not taken into account.
+        max_growth: The maximum ratio between limits of consecutive requests. It prevents a sudden growth of the
+            page size after a fast response. The limit is reduced without restrictions.
+
+    Example:
+        Iterating over assignments with pages taking about 2 seconds and not exceeding 10 MiB.
+
+        >>> from toloka.client import AdaptiveBatchSize
+        >>> batch_size = AdaptiveBatchSize(min_size=100, max_size=20000, target_seconds=2, target_bytes=10 * 2 ** 20)
+        >>> for assignment in toloka_client.get_assignments(pool_id='1080020', batch_size=batch_size):
+        >>>     print(assignment.id)
+        ...
+    """
+
+    min_size: int = 50
+    max_size: int = 10_000
+    initial_size: Optional[int] = None
+    target_seconds: Optional[float] = 1.0
+    target_bytes: Optional[int] = None
+    max_growth: float = 4.0
+
+    def __attrs_post_init__(self):
+        if not 0 < self.min_size <= self.max_size:
+            raise ValueError(f'Expected 0 < min_size <= max_size, got {self.min_size} and {self.max_size}')
+        if self.initial_size is not None and not self.min_size <= self.initial_size <= self.max_size:
+            raise ValueError(f'initial_size must be between min_size and max_size, got {self.initial_size}')
+        if self.target_seconds is None and self.target_bytes is None:
+            raise ValueError('At least one of target_seconds and target_bytes must be set')
+        if self.target_seconds is not None and self.target_seconds <= 0:
+            raise ValueError(f'target_seconds must be positive, got {self.target_seconds}')
+        if self.target_bytes is not None and self.target_bytes <= 0:
+            raise ValueError(f'target_bytes must be positive, got {self.target_bytes}')
+        if self.max_growth <= 1:
+            raise ValueError(f'max_growth must be greater than 1, got {self.max_growth}')
+
+    def get_initial_size(self) -> int:
+        return self.min_size if self.initial_size is None else self.initial_size
+
+    def get_next_size(self, size: int, items_count: int, seconds: float, bytes_count: Optional[int]) -> int:
+        """Calculates the limit of the next request.
+
+        Args:
+            size: The limit of the previous request.
+            items_count: The number of items in the previous page.
+            seconds: Time spent to get and parse the previous page.
+            bytes_count: The size of the previous response body. `None` if it is unknown.
+
+        Returns:
+            int: The limit of the next request.
+        """
+
+        if not items_count:
+            return size
+        sizes = []
+        if self.target_seconds is not None and seconds > 0:
+            sizes.append(self.target_seconds * items_count / seconds)
+        if self.target_bytes is not None and bytes_count:
+            sizes.append(self.target_bytes * items_count / bytes_count)
+        if not sizes:
+            return size
+        next_size = min(min(sizes), size * self.max_growth)
+        return max(self.min_size, min(self.max_size, int(next_size)))
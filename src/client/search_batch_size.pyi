@@ -0,0 +1,79 @@
+__all__ = [
+    'AdaptiveBatchSize',
+]
+import typing
+
+
+class AdaptiveBatchSize:
+    """A page size that is adjusted while iterating over search results.
+
+    Pass `AdaptiveBatchSize` as the `batch_size` parameter of `get_*` methods, for example,
+    [get_assignments](toloka.client.TolokaClient.get_assignments.md). After each page the limit of items in the next
+    request is recalculated, so that a page takes about `target_seconds` to download and parse, and its response body
+    is about `target_bytes` long. Time spent by your code while processing yielded items is not counted.
+
+    Small pages lead to many requests, while big pages may lead to timeouts and memory spikes. The suitable size
+    depends on the size of items and on the network, so it is found while iterating.
+
+    Attributes:
+        min_size: The minimum limit of items in a request.
+        max_size: The maximum limit of items in a request. The maximum allowed value: 100,000. The limit is also capped
+            by the maximum allowed by the `get_*` method, for example, 300 for `get_pools`.
+        initial_size: The limit of items in the first request. Default value: `min_size`.
+        target_seconds: Desired time to get and parse a page. If `None`, time is not taken into account.
+        target_bytes: Desired size of a response body. If `None`, the size is not taken into account.
+        max_growth: The maximum ratio between limits of consecutive requests. It prevents a sudden growth of the
+            page size after a fast response. The limit is reduced without restrictions.
+
+    Example:
+        Iterating over assignments with pages taking about 2 seconds and not exceeding 10 MiB.
+
+        >>> from toloka.client import AdaptiveBatchSize
+        >>> batch_size = AdaptiveBatchSize(min_size=100, max_size=20000, target_seconds=2, target_bytes=10 * 2 ** 20)
+        >>> for assignment in toloka_client.get_assignments(pool_id='1080020', batch_size=batch_size):
+        >>>     print(assignment.id)
+        ...
+    """
+
+    def get_initial_size(self) -> int: ...
+
+    def get_next_size(
+        self,
+        size: int,
+        items_count: int,
+        seconds: float,
+        bytes_count: typing.Optional[int]
+    ) -> int:
+        """Calculates the limit of the next request.
+
+        Args:
+            size: The limit of the previous request.
+            items_count: The number of items in the previous page.
+            seconds: Time spent to get and parse the previous page.
+            bytes_count: The size of the previous response body. `None` if it is unknown.
+
+        Returns:
+            int: The limit of the next request.
+        """
+        ...
+
+    def __init__(
+        self,
+        *,
+        min_size: int = 50,
+        max_size: int = 10000,
+        initial_size: typing.Optional[int] = None,
+        target_seconds: typing.Optional[float] = 1.0,
+        target_bytes: typing.Optional[int] = None,
+        max_growth: float = 4.0
+    ) -> None:
+        """Method generated by attrs for class AdaptiveBatchSize.
+        """
+        ...
+
+    min_size: int
+    max_size: int
+    initial_size: typing.Optional[int]
+    target_seconds: typing.Optional[float]
+    target_bytes: typing.Optional[int]
+    max_growth: float
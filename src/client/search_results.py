@@ -17,9 +17,10 @@ __all__ = [
     'AppProjectSearchResult',
     'AppSearchResult',
     'AppItemSearchResult',
-    'AppBatchSearchResult'
+    'AppBatchSearchResult',
+    'SearchResultPage',
 ]
-from typing import Type, List, Optional
+from typing import Any, NamedTuple, Type, List, Optional
 from .aggregation import AggregatedSolution
 from .app import App, AppItem, AppProject, AppBatch
 from .assignment import Assignment
@@ -28,6 +29,7 @@ from .message_thread import MessageThread
 from .operations import Operation
 from .pool import Pool
 from .primitives.base import BaseTolokaObject, BaseTolokaObjectMetaclass
+from .search_requests import BaseSearchRequest
 from .project import Project
 from .skill import Skill
 from .task import Task
@@ -155,3 +157,20 @@ AppBatchSearchResult = _create_search_result_class_for(
     items_field='content',
     docstring=_create_search_result_docstring('batches', 'batches in an App project', items_field='content')
 )
+
+
+class SearchResultPage(NamedTuple):
+    """A page of search results yielded by `get_*_pages` methods.
+
+    Pages are useful if found objects are processed in batches, for example, inserted into a database.
+
+    Attributes:
+        items: Objects found by a single request to Toloka.
+        has_more: A flag showing whether there are more matching objects.
+        next_request: The search request that returns the next page. It may be saved to continue the iteration later.
+            `None` if there are no more pages.
+    """
+
+    items: List[Any]
+    has_more: bool
+    next_request: Optional[BaseSearchRequest] = None
@@ -18,6 +18,7 @@ __all__ = [
     'AppSearchResult',
     'AppItemSearchResult',
     'AppBatchSearchResult',
+    'SearchResultPage',
 ]
 import toloka.client.aggregation
 import toloka.client.app
@@ -28,6 +29,7 @@ import toloka.client.operations
 import toloka.client.pool
 import toloka.client.primitives.base
 import toloka.client.project
+import toloka.client.search_requests
 import toloka.client.skill
 import toloka.client.task
 import toloka.client.task_suite
@@ -515,3 +517,20 @@ class AppBatchSearchResult(toloka.client.primitives.base.BaseTolokaObject):
     _unexpected: typing.Optional[typing.Dict[str, typing.Any]]
     content: typing.Optional[typing.List[toloka.client.app.AppBatch]]
     has_more: typing.Optional[bool]
+
+
+class SearchResultPage(tuple):
+    """A page of search results yielded by `get_*_pages` methods.
+
+    Pages are useful if found objects are processed in batches, for example, inserted into a database.
+
+    Attributes:
+        items: Objects found by a single request to Toloka.
+        has_more: A flag showing whether there are more matching objects.
+        next_request: The search request that returns the next page. It may be saved to continue the iteration later.
+            `None` if there are no more pages.
+    """
+
+    items: typing.List[typing.Any]
+    has_more: bool
+    next_request: typing.Optional[toloka.client.search_requests.BaseSearchRequest]
@@ -0,0 +1,142 @@
+__all__ = [
+    'UploadChunkStatus',
+    'UploadChunk',
+    'UploadJournal',
+]
+import sqlite3
+import threading
+from enum import unique
+from typing import Optional
+
+import simplejson
+
+from .batch_create_results import IdsBatchCreateResult
+from .primitives.base import BaseTolokaObject
+from ..util._codegen import attribute
+from ..util._extendable_enum import ExtendableStrEnum
+
+
+@unique
+class UploadChunkStatus(ExtendableStrEnum):
+    """The status of a chunk of a bulk upload.
+
+    Attributes:
+        SUBMITTED: The chunk was sent to Toloka but its result is unknown yet.
+        COMPLETED: The chunk was processed by Toloka. IDs of created objects and validation errors are saved in the journal.
+    """
+
+    SUBMITTED = 'SUBMITTED'
+    COMPLETED = 'COMPLETED'
+
+
+class UploadChunk(BaseTolokaObject):
+    """A journal record about a chunk of a bulk upload.
+
+    Attributes:
+        upload_id: The `operation_id` of the whole upload.
+        chunk_idx: The index of the chunk in the upload.
+        start: The index of the first object of the chunk in the upload input.
+        stop: The index following the last object of the chunk in the upload input.
+        operation_id: The ID of the operation that creates objects of the chunk.
+        status: The chunk status.
+        result: IDs of created objects and validation errors. Indexes are relative to the chunk start.
+            It is filled when the status is `COMPLETED`.
+    """
+
+    upload_id: str = attribute(required=True)
+    chunk_idx: int = attribute(required=True)
+    start: int = attribute(required=True)
+    stop: int = attribute(required=True)
+    operation_id: str = attribute(required=True)
+    status: UploadChunkStatus = attribute(required=True, autocast=True)
+    result: IdsBatchCreateResult
+
+
+class UploadJournal:
+    """A local SQLite journal that makes chunked bulk uploads resumable after a crash.
+
+    Pass the journal to the [create_tasks](toloka.client.TolokaClient.create_tasks.md),
+    [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) or
+    [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) methods. The journal records the
+    range of input objects, the operation ID and the status of every chunk. When the upload is restarted with the same
+    `operation_id`, chunks completed earlier are not sent to Toloka again: their results are read from the journal, and
+    created objects are downloaded by their IDs unless `ids_only` is `True`. Chunks that were submitted but not
+    completed are resubmitted with the same operation IDs, so Toloka does not create duplicates. Toloka takes
+    operation IDs into account only in the async mode, so the journal can't be used with `async_mode=False`.
+
+    The input must produce the same objects in the same order, and the same `chunk_size` must be used on restart.
+
+    Args:
+        path: A path to the SQLite database file. The file is created if it doesn't exist.
+
+    Example:
+        >>> journal = toloka.client.UploadJournal('tasks_upload.sqlite')
+        >>> result = toloka_client.create_tasks(
+        >>>     read_tasks_from_file('tasks.jsonl'),
+        >>>     operation_id='6d84114f-fcfc-473d-8249-1a4f3ea550eb',  # a fixed ID to resume the upload
+        >>>     allow_defaults=True,
+        >>>     ids_only=True,
+        >>>     journal=journal,
+        >>> )
+        ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS upload_chunks ('
+            'upload_id TEXT NOT NULL, '
+            'chunk_idx INTEGER NOT NULL, '
+            'start INTEGER NOT NULL, '
+            'stop INTEGER NOT NULL, '
+            'operation_id TEXT NOT NULL, '
+            'status TEXT NOT NULL, '
+            'result TEXT, '
+            'PRIMARY KEY (upload_id, chunk_idx))'
+        )
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def get_chunk(self, upload_id: str, chunk_idx: int) -> Optional[UploadChunk]:
+        """Returns the record about the chunk or `None` if the chunk was never submitted."""
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT start, stop, operation_id, status, result FROM upload_chunks '
+                'WHERE upload_id = ? AND chunk_idx = ?',
+                (upload_id, chunk_idx),
+            ).fetchone()
+        if row is None:
+            return None
+        start, stop, operation_id, status, result = row
+        return UploadChunk(
+            upload_id=upload_id,
+            chunk_idx=chunk_idx,
+            start=start,
+            stop=stop,
+            operation_id=operation_id,
+            status=status,
+            result=None if result is None else IdsBatchCreateResult.structure(simplejson.loads(result)),
+        )
+
+    def save_chunk(self, chunk: UploadChunk) -> None:
+        """Saves the chunk record. The write is committed before the method returns."""
+
+        result = None if chunk.result is None else simplejson.dumps(chunk.result.unstructure())
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO upload_chunks '
+                '(upload_id, chunk_idx, start, stop, operation_id, status, result) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (chunk.upload_id, chunk.chunk_idx, chunk.start, chunk.stop, chunk.operation_id, chunk.status.value,
+                 result),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
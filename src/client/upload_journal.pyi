@@ -0,0 +1,108 @@
+__all__ = [
+    'UploadChunkStatus',
+    'UploadChunk',
+    'UploadJournal',
+]
+import toloka.client.batch_create_results
+import toloka.client.primitives.base
+import toloka.util._extendable_enum
+import typing
+
+
+class UploadChunkStatus(toloka.util._extendable_enum.ExtendableStrEnum):
+    """The status of a chunk of a bulk upload.
+
+    Attributes:
+        SUBMITTED: The chunk was sent to Toloka but its result is unknown yet.
+        COMPLETED: The chunk was processed by Toloka. IDs of created objects and validation errors are saved in the journal.
+    """
+
+    SUBMITTED = 'SUBMITTED'
+    COMPLETED = 'COMPLETED'
+
+
+class UploadChunk(toloka.client.primitives.base.BaseTolokaObject):
+    """A journal record about a chunk of a bulk upload.
+
+    Attributes:
+        upload_id: The `operation_id` of the whole upload.
+        chunk_idx: The index of the chunk in the upload.
+        start: The index of the first object of the chunk in the upload input.
+        stop: The index following the last object of the chunk in the upload input.
+        operation_id: The ID of the operation that creates objects of the chunk.
+        status: The chunk status.
+        result: IDs of created objects and validation errors. Indexes are relative to the chunk start.
+            It is filled when the status is `COMPLETED`.
+    """
+
+    def __init__(
+        self,
+        *,
+        upload_id: str,
+        chunk_idx: int,
+        start: int,
+        stop: int,
+        operation_id: str,
+        status: typing.Union[UploadChunkStatus, str],
+        result: typing.Optional[toloka.client.batch_create_results.IdsBatchCreateResult] = None
+    ) -> None:
+        """Method generated by attrs for class UploadChunk.
+        """
+        ...
+
+    _unexpected: typing.Optional[typing.Dict[str, typing.Any]]
+    upload_id: str
+    chunk_idx: int
+    start: int
+    stop: int
+    operation_id: str
+    status: UploadChunkStatus
+    result: typing.Optional[toloka.client.batch_create_results.IdsBatchCreateResult]
+
+
+class UploadJournal:
+    """A local SQLite journal that makes chunked bulk uploads resumable after a crash.
+
+    Pass the journal to the [create_tasks](toloka.client.TolokaClient.create_tasks.md),
+    [create_task_suites](toloka.client.TolokaClient.create_task_suites.md) or
+    [create_user_bonuses](toloka.client.TolokaClient.create_user_bonuses.md) methods. The journal records the
+    range of input objects, the operation ID and the status of every chunk. When the upload is restarted with the same
+    `operation_id`, chunks completed earlier are not sent to Toloka again: their results are read from the journal, and
+    created objects are downloaded by their IDs unless `ids_only` is `True`. Chunks that were submitted but not
+    completed are resubmitted with the same operation IDs, so Toloka does not create duplicates. Toloka takes
+    operation IDs into account only in the async mode, so the journal can't be used with `async_mode=False`.
+
+    The input must produce the same objects in the same order, and the same `chunk_size` must be used on restart.
+
+    Args:
+        path: A path to the SQLite database file. The file is created if it doesn't exist.
+
+    Example:
+        >>> journal = toloka.client.UploadJournal('tasks_upload.sqlite')
+        >>> result = toloka_client.create_tasks(
+        >>>     read_tasks_from_file('tasks.jsonl'),
+        >>>     operation_id='6d84114f-fcfc-473d-8249-1a4f3ea550eb',  # a fixed ID to resume the upload
+        >>>     allow_defaults=True,
+        >>>     ids_only=True,
+        >>>     journal=journal,
+        >>> )
+        ...
+    """
+
+    def __init__(self, path: str): ...
+
+    def get_chunk(
+        self,
+        upload_id: str,
+        chunk_idx: int
+    ) -> typing.Optional[UploadChunk]:
+        """Returns the record about the chunk or `None` if the chunk was never submitted.
+        """
+        ...
+
+    def save_chunk(self, chunk: UploadChunk) -> None:
+        """Saves the chunk record. The write is committed before the method returns.
+        """
+        ...
+
+    def close(self) -> None: ...
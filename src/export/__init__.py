@@ -0,0 +1,8 @@
+__all__ = [
+    'ExportFormat',
+    'ExportedPartition',
+    'PartitionBy',
+    'ProjectExporter',
+]
+
+from .project_exporter import ExportFormat, ExportedPartition, PartitionBy, ProjectExporter
@@ -0,0 +1,12 @@
+__all__ = [
+    'ExportFormat',
+    'ExportedPartition',
+    'PartitionBy',
+    'ProjectExporter',
+]
+from toloka.export.project_exporter import (
+    ExportFormat,
+    ExportedPartition,
+    PartitionBy,
+    ProjectExporter,
+)
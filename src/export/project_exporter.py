@@ -0,0 +1,417 @@
+__all__ = [
+    'ExportFormat',
+    'PartitionBy',
+    'ExportedPartition',
+    'ProjectExporter',
+]
+
+import datetime
+import gzip
+import logging
+import os
+import threading
+import typing
+from concurrent import futures
+from decimal import Decimal
+from enum import unique
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Type
+
+import attr
+import simplejson
+
+from ..client import AggregatedSolution, Assignment, Pool, Task, TolokaClient, unstructure
+from ..util._codegen import ORIGIN_KEY
+from ..util._extendable_enum import ExtendableStrEnum
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PYARROW_INSTALLED = True
+except ImportError:
+    PYARROW_INSTALLED = False
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINTS_FILE = '_checkpoints.jsonl'
+
+
+@unique
+class ExportFormat(ExtendableStrEnum):
+    """The format of exported files.
+
+    Attributes:
+        JSONL: Gzip-compressed JSON Lines. Every line contains an object in the same form as the Toloka API returns it.
+        PARQUET: Parquet files. Every top-level field of an object is stored in a separate column. Strings, numbers,
+            booleans and dates are stored in columns of the corresponding types, decimal numbers are stored as
+            doubles, and nested values are stored as JSON strings. Requires the `pyarrow` package.
+    """
+
+    JSONL = 'jsonl'
+    PARQUET = 'parquet'
+
+
+@unique
+class PartitionBy(ExtendableStrEnum):
+    """How exported tasks and assignments are split into partitions.
+
+    Attributes:
+        POOL: A partition per pool: `tasks/pool_id=<pool_id>/`.
+        DATE: A partition per pool and creation date in UTC: `tasks/date=<YYYY-MM-DD>/pool_id=<pool_id>/`.
+            Partitions are created only for dates with objects.
+    """
+
+    POOL = 'pool'
+    DATE = 'date'
+
+
+class ExportedPartition(NamedTuple):
+    """An exported partition.
+
+    Attributes:
+        entity: The exported entity: `pools`, `tasks`, `assignments` or `aggregated_solutions`.
+        path: The partition path relative to the output directory.
+        rows_count: The number of exported objects. Files are not created for empty partitions.
+        resumed: `True` if the partition was exported by a previous interrupted run and was skipped.
+    """
+
+    entity: str
+    path: str
+    rows_count: int
+    resumed: bool = False
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class _Partition:
+    entity: str
+    object_class: Type
+    fetch: Callable[[], Iterable]
+    pool_id: Optional[str] = None
+    date: Optional[datetime.date] = None
+    # New objects may appear in an open partition, so it is exported again by the next run
+    is_open: bool = False
+
+    @property
+    def path(self) -> str:
+        parts = [self.entity]
+        if self.date is not None:
+            parts.append(f'date={self.date.isoformat()}')
+        if self.pool_id is not None:
+            parts.append(f'pool_id={self.pool_id}')
+        return '/'.join(parts)
+
+
+class _BaseWriter:
+
+    extension: str
+
+    def __init__(self, path: str, object_class: Type, batch_size: int):
+        pass
+
+    def write(self, row: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class _JSONLinesWriter(_BaseWriter):
+
+    extension = 'jsonl.gz'
+
+    def __init__(self, path: str, object_class: Type, batch_size: int):
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._file.write(simplejson.dumps(row, use_decimal=True, ensure_ascii=False))
+        self._file.write('\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _get_column_types(object_class: Type) -> Dict[str, Optional[type]]:
+    """Returns the types of values of top-level fields by their names in the API format."""
+
+    column_types = {}
+    for field in attr.fields(object_class):
+        if field.name == '_unexpected':
+            continue
+        field_type = field.type
+        # Optional[X]
+        args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]  # noqa: E721
+        if typing.get_origin(field_type) is typing.Union and len(args) == 1:
+            field_type = args[0]
+        column_types[field.metadata.get(ORIGIN_KEY, field.name)] = field_type if isinstance(field_type, type) else None
+    return column_types
+
+
+def _get_arrow_type(column_type: Optional[type]) -> 'pyarrow.DataType':
+    # bool is a subclass of int and enums are subclasses of str, so the order of checks matters
+    if column_type is bool:
+        return pyarrow.bool_()
+    if column_type is None or issubclass(column_type, str):
+        return pyarrow.string()
+    if issubclass(column_type, int):
+        return pyarrow.int64()
+    if issubclass(column_type, (float, Decimal)):
+        return pyarrow.float64()
+    if issubclass(column_type, datetime.datetime):
+        # Toloka returns time in UTC without a timezone
+        return pyarrow.timestamp('us')
+    return pyarrow.string()
+
+
+def _to_parquet_value(value: Any, arrow_type: 'pyarrow.DataType') -> Any:
+    if value is None:
+        return None
+    if pyarrow.types.is_string(arrow_type):
+        return value if isinstance(value, str) else simplejson.dumps(value, use_decimal=True, ensure_ascii=False)
+    if pyarrow.types.is_floating(arrow_type):
+        return float(value)
+    if pyarrow.types.is_timestamp(arrow_type) and isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    return value
+
+
+class _ParquetWriter(_BaseWriter):
+
+    extension = 'parquet'
+
+    def __init__(self, path: str, object_class: Type, batch_size: int):
+        self._schema = pyarrow.schema([
+            (column, _get_arrow_type(column_type)) for column, column_type in _get_column_types(object_class).items()
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._batch_size = batch_size
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._rows.append({field.name: _to_parquet_value(row.get(field.name), field.type) for field in self._schema})
+        if len(self._rows) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._rows:
+            self._writer.write_table(pyarrow.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+_WRITERS: Dict[ExportFormat, Type[_BaseWriter]] = {
+    ExportFormat.JSONL: _JSONLinesWriter,
+    ExportFormat.PARQUET: _ParquetWriter,
+}
+
+
+@attr.s
+class ProjectExporter:
+    """Exports a project with its pools, tasks, assignments and aggregated responses to partitioned files.
+
+    Partitions are exported in parallel threads. Objects are streamed from Toloka to files, so only about
+    `batch_size` objects per thread are kept in memory. Every partition is written to a temporary file that is renamed
+    when the partition is complete, and the partition is recorded in the `_checkpoints.jsonl` file in the output
+    directory. If an export is interrupted, run it again with the same output directory: complete partitions are
+    skipped. Partitions that may still change are not recorded, so they are exported again by every run: the `pools`
+    partition, partitions of pools that are not closed or archived, and partitions of the current UTC date.
+
+    Files are placed in the output directory as follows:
+    * `pools/part.<extension>`
+    * `tasks/pool_id=<pool_id>/part.<extension>` or `tasks/date=<YYYY-MM-DD>/pool_id=<pool_id>/part.<extension>`
+    * `assignments/...` — the same as tasks.
+    * `aggregated_solutions/pool_id=<pool_id>/part.<extension>`
+
+    Attributes:
+        toloka_client: A client used to fetch objects.
+        output_dir: The output directory. It is created if it doesn't exist.
+        format: The format of files. Default value: `ExportFormat.JSONL`.
+        partition_by: How tasks and assignments are split into partitions. Default value: `PartitionBy.POOL`.
+        aggregation_operation_ids: IDs of completed aggregation operations by pool IDs. Aggregated responses are
+            exported only for these pools. To aggregate responses, use the
+            [aggregate_solutions_by_pool](toloka.client.TolokaClient.aggregate_solutions_by_pool.md) method.
+        entities: Entities to export. By default, all entities are exported.
+        max_workers: The maximum number of partitions exported in parallel. Default value: 4.
+        batch_size: The number of objects requested at once and the Parquet row group size. Default value: 1000.
+
+    Example:
+        >>> exporter = toloka.export.ProjectExporter(
+        >>>     toloka_client, 'export/92694', format=toloka.export.ExportFormat.PARQUET,
+        >>>     partition_by=toloka.export.PartitionBy.DATE,
+        >>> )
+        >>> partitions = exporter.export('92694')
+        >>> print(sum(partition.rows_count for partition in partitions if partition.entity == 'assignments'))
+        ...
+    """
+
+    ENTITIES = ('pools', 'tasks', 'assignments', 'aggregated_solutions')
+
+    toloka_client: TolokaClient = attr.ib()
+    output_dir: str = attr.ib()
+    format: ExportFormat = attr.ib(default=ExportFormat.JSONL, converter=ExportFormat)
+    partition_by: PartitionBy = attr.ib(default=PartitionBy.POOL, converter=PartitionBy)
+    aggregation_operation_ids: Dict[str, str] = attr.ib(factory=dict)
+    entities: Sequence[str] = attr.ib(default=ENTITIES)
+    max_workers: int = attr.ib(default=4)
+    batch_size: int = attr.ib(default=1000)
+    _checkpoints_lock: threading.Lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+
+    @format.validator
+    def _validate_format(self, attribute, value) -> None:
+        if value == ExportFormat.PARQUET and not PYARROW_INSTALLED:
+            raise ValueError('pyarrow is required for Parquet export. Install it with `pip install toloka-kit[parquet]`')
+
+    @entities.validator
+    def _validate_entities(self, attribute, value) -> None:
+        unknown = set(value) - set(self.ENTITIES)
+        if unknown:
+            raise ValueError(f'Unknown entities: {", ".join(sorted(unknown))}')
+
+    @max_workers.validator
+    def _validate_max_workers(self, attribute, value) -> None:
+        if value <= 0:
+            raise ValueError('max_workers must be positive')
+
+    def export(self, project_id: str) -> List[ExportedPartition]:
+        """Exports the project.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            List[ExportedPartition]: All partitions including the ones exported by previous runs.
+
+        Raises:
+            Exception: The first error raised while exporting partitions. Other partitions are exported anyway,
+                so the next run exports only the failed ones.
+        """
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        completed = self._load_checkpoints()
+        pools = list(self.toloka_client.get_pools(project_id=project_id))
+
+        results, errors = [], []
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            partition_futures = []
+            for partition in self._get_partitions(project_id, pools):
+                # A partition may become open again, e.g. if the pool is reopened
+                if partition.path in completed and not partition.is_open:
+                    results.append(ExportedPartition(partition.entity, partition.path, completed[partition.path], True))
+                else:
+                    partition_futures.append(executor.submit(self._export_partition, partition))
+            for future in futures.as_completed(partition_futures):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    logger.exception('Failed to export a partition')
+                    errors.append(exc)
+        if errors:
+            raise errors[0]
+        return sorted(results, key=lambda result: result.path)
+
+    def _get_partitions(self, project_id: str, pools: List[Pool]) -> Iterator[_Partition]:
+        if 'pools' in self.entities:
+            # New pools may be created and existing ones may change
+            yield _Partition('pools', Pool, lambda: pools, is_open=True)
+        for pool in pools:
+            # Tasks may be added to a pool that is not closed, and its assignments change their statuses
+            pool_is_open = not (pool.is_closed() or pool.is_archived())
+            for entity, object_class, get_objects, find_objects in (
+                ('tasks', Task, self.toloka_client.get_tasks, self.toloka_client.find_tasks),
+                ('assignments', Assignment, self.toloka_client.get_assignments, self.toloka_client.find_assignments),
+            ):
+                if entity not in self.entities:
+                    continue
+                if self.partition_by == PartitionBy.POOL:
+                    fetch = self._bind_fetch(get_objects, pool_id=pool.id)
+                    yield _Partition(entity, object_class, fetch, pool_id=pool.id, is_open=pool_is_open)
+                    continue
+                today = datetime.datetime.now(datetime.timezone.utc).date()
+                for date in self._get_dates(pool, find_objects):
+                    start = datetime.datetime.combine(date, datetime.time(), tzinfo=datetime.timezone.utc)
+                    fetch = self._bind_fetch(
+                        get_objects, pool_id=pool.id, created_gte=start, created_lt=start + datetime.timedelta(days=1),
+                    )
+                    yield _Partition(
+                        entity, object_class, fetch, pool_id=pool.id, date=date, is_open=pool_is_open or date >= today,
+                    )
+            operation_id = self.aggregation_operation_ids.get(pool.id)
+            if 'aggregated_solutions' in self.entities and operation_id is not None:
+                fetch = self._bind_fetch(self.toloka_client.get_aggregated_solutions, operation_id)
+                yield _Partition('aggregated_solutions', AggregatedSolution, fetch, pool_id=pool.id)
+
+    def _bind_fetch(self, get_objects: Callable[..., Iterable], *args, **kwargs) -> Callable[[], Iterable]:
+        return lambda: get_objects(*args, batch_size=self.batch_size, **kwargs)
+
+    @staticmethod
+    def _get_dates(pool: Pool, find_objects: Callable) -> Iterator[datetime.date]:
+        """Yields dates when objects were created in the pool.
+
+        Every request finds the first object created after the previous date, so days without objects are skipped.
+        """
+
+        created = pool.created
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=datetime.timezone.utc)
+        date = created.astimezone(datetime.timezone.utc).date()
+        while True:
+            start = datetime.datetime.combine(date, datetime.time(), tzinfo=datetime.timezone.utc)
+            found = find_objects(pool_id=pool.id, created_gte=start, sort=['created'], limit=1)
+            if not found.items:
+                return
+            created = found.items[0].created
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=datetime.timezone.utc)
+            date = created.astimezone(datetime.timezone.utc).date()
+            yield date
+            date += datetime.timedelta(days=1)
+
+    def _export_partition(self, partition: _Partition) -> ExportedPartition:
+        writer_class = _WRITERS[self.format]
+        directory = os.path.join(self.output_dir, *partition.path.split('/'))
+        path = os.path.join(directory, f'part.{writer_class.extension}')
+        tmp_path = f'{path}.tmp'
+        os.makedirs(directory, exist_ok=True)
+
+        rows_count = 0
+        writer = None
+        try:
+            for obj in partition.fetch():
+                if writer is None:
+                    writer = writer_class(tmp_path, partition.object_class, self.batch_size)
+                writer.write(unstructure(obj))
+                rows_count += 1
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is not None:
+            os.replace(tmp_path, path)
+
+        if not partition.is_open:
+            self._save_checkpoint(partition.path, rows_count)
+        logger.info('Exported %d objects to %s', rows_count, partition.path)
+        return ExportedPartition(partition.entity, partition.path, rows_count)
+
+    def _load_checkpoints(self) -> Dict[str, int]:
+        completed: Dict[str, int] = {}
+        path = os.path.join(self.output_dir, _CHECKPOINTS_FILE)
+        if not os.path.exists(path):
+            return completed
+        with open(path, encoding='utf-8') as checkpoints_file:
+            for line in checkpoints_file:
+                try:
+                    checkpoint = simplejson.loads(line)
+                except simplejson.JSONDecodeError:
+                    # the last line may be incomplete if the previous run was killed while writing it
+                    continue
+                completed[checkpoint['partition']] = checkpoint['rows_count']
+        return completed
+
+    def _save_checkpoint(self, partition_path: str, rows_count: int) -> None:
+        line = simplejson.dumps({'partition': partition_path, 'rows_count': rows_count})
+        with self._checkpoints_lock:
+            with open(os.path.join(self.output_dir, _CHECKPOINTS_FILE), 'a', encoding='utf-8') as checkpoints_file:
+                checkpoints_file.write(f'{line}\n')
+                checkpoints_file.flush()
+                os.fsync(checkpoints_file.fileno())
@@ -0,0 +1,132 @@
+__all__ = [
+    'ExportFormat',
+    'PartitionBy',
+    'ExportedPartition',
+    'ProjectExporter',
+]
+import threading
+import toloka.client
+import toloka.util._extendable_enum
+import typing
+
+
+class ExportFormat(toloka.util._extendable_enum.ExtendableStrEnum):
+    """The format of exported files.
+
+    Attributes:
+        JSONL: Gzip-compressed JSON Lines. Every line contains an object in the same form as the Toloka API returns it.
+        PARQUET: Parquet files. Every top-level field of an object is stored in a separate column. Strings, numbers,
+            booleans and dates are stored in columns of the corresponding types, decimal numbers are stored as
+            doubles, and nested values are stored as JSON strings. Requires the `pyarrow` package.
+    """
+
+    JSONL = 'jsonl'
+    PARQUET = 'parquet'
+
+
+class PartitionBy(toloka.util._extendable_enum.ExtendableStrEnum):
+    """How exported tasks and assignments are split into partitions.
+
+    Attributes:
+        POOL: A partition per pool: `tasks/pool_id=<pool_id>/`.
+        DATE: A partition per pool and creation date in UTC: `tasks/date=<YYYY-MM-DD>/pool_id=<pool_id>/`.
+            Partitions are created only for dates with objects.
+    """
+
+    POOL = 'pool'
+    DATE = 'date'
+
+
+class ExportedPartition(tuple):
+    """An exported partition.
+
+    Attributes:
+        entity: The exported entity: `pools`, `tasks`, `assignments` or `aggregated_solutions`.
+        path: The partition path relative to the output directory.
+        rows_count: The number of exported objects. Files are not created for empty partitions.
+        resumed: `True` if the partition was exported by a previous interrupted run and was skipped.
+    """
+
+    entity: str
+    path: str
+    rows_count: int
+    resumed: bool
+
+
+class ProjectExporter:
+    """Exports a project with its pools, tasks, assignments and aggregated responses to partitioned files.
+
+    Partitions are exported in parallel threads. Objects are streamed from Toloka to files, so only about
+    `batch_size` objects per thread are kept in memory. Every partition is written to a temporary file that is renamed
+    when the partition is complete, and the partition is recorded in the `_checkpoints.jsonl` file in the output
+    directory. If an export is interrupted, run it again with the same output directory: complete partitions are
+    skipped. Partitions that may still change are not recorded, so they are exported again by every run: the `pools`
+    partition, partitions of pools that are not closed or archived, and partitions of the current UTC date.
+
+    Files are placed in the output directory as follows:
+    * `pools/part.<extension>`
+    * `tasks/pool_id=<pool_id>/part.<extension>` or `tasks/date=<YYYY-MM-DD>/pool_id=<pool_id>/part.<extension>`
+    * `assignments/...` — the same as tasks.
+    * `aggregated_solutions/pool_id=<pool_id>/part.<extension>`
+
+    Attributes:
+        toloka_client: A client used to fetch objects.
+        output_dir: The output directory. It is created if it doesn't exist.
+        format: The format of files. Default value: `ExportFormat.JSONL`.
+        partition_by: How tasks and assignments are split into partitions. Default value: `PartitionBy.POOL`.
+        aggregation_operation_ids: IDs of completed aggregation operations by pool IDs. Aggregated responses are
+            exported only for these pools. To aggregate responses, use the
+            [aggregate_solutions_by_pool](toloka.client.TolokaClient.aggregate_solutions_by_pool.md) method.
+        entities: Entities to export. By default, all entities are exported.
+        max_workers: The maximum number of partitions exported in parallel. Default value: 4.
+        batch_size: The number of objects requested at once and the Parquet row group size. Default value: 1000.
+
+    Example:
+        >>> exporter = toloka.export.ProjectExporter(
+        >>>     toloka_client, 'export/92694', format=toloka.export.ExportFormat.PARQUET,
+        >>>     partition_by=toloka.export.PartitionBy.DATE,
+        >>> )
+        >>> partitions = exporter.export('92694')
+        >>> print(sum(partition.rows_count for partition in partitions if partition.entity == 'assignments'))
+        ...
+    """
+
+    def export(self, project_id: str) -> typing.List[ExportedPartition]:
+        """Exports the project.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            List[ExportedPartition]: All partitions including the ones exported by previous runs.
+
+        Raises:
+            Exception: The first error raised while exporting partitions. Other partitions are exported anyway,
+                so the next run exports only the failed ones.
+        """
+        ...
+
+    def __init__(
+        self,
+        toloka_client: toloka.client.TolokaClient,
+        output_dir: str,
+        format=ExportFormat.JSONL,
+        partition_by=PartitionBy.POOL,
+        aggregation_operation_ids: typing.Dict[str, str] = ...,
+        entities: typing.Sequence[str] = ...,
+        max_workers: int = 4,
+        batch_size: int = 1000
+    ) -> None:
+        """Method generated by attrs for class ProjectExporter.
+        """
+        ...
+
+    toloka_client: toloka.client.TolokaClient
+    output_dir: str
+    format: ExportFormat
+    partition_by: PartitionBy
+    aggregation_operation_ids: typing.Dict[str, str]
+    entities: typing.Sequence[str]
+    max_workers: int
+    batch_size: int
+    _checkpoints_lock: threading.Lock
@@ -0,0 +1,5 @@
+__all__ = [
+    'SQLiteMirror',
+]
+
+from .sqlite_mirror import SQLiteMirror
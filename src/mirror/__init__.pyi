@@ -0,0 +1,4 @@
+__all__ = [
+    'SQLiteMirror',
+]
+from toloka.mirror.sqlite_mirror import SQLiteMirror
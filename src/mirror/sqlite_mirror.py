@@ -0,0 +1,234 @@
+__all__ = [
+    'SQLiteMirror',
+]
+
+import datetime
+import logging
+import sqlite3
+import threading
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+import simplejson
+
+from ..client import Assignment, Pool, Project, Task, TolokaClient, UserBonus, structure, unstructure
+from ..streaming.cursor import AssignmentCursor, BaseCursor, TaskCursor, UserBonusCursor
+from ..streaming.event import AssignmentEvent
+
+logger = logging.getLogger(__name__)
+
+# Table name -> (object class, columns that are stored separately from the object data and are indexed)
+_TABLES: Dict[str, Tuple[Type, Tuple[str, ...]]] = {
+    'projects': (Project, ('status', 'created')),
+    'pools': (Pool, ('project_id', 'status', 'created')),
+    'tasks': (Task, ('pool_id', 'created')),
+    'assignments': (Assignment, ('pool_id', 'task_suite_id', 'user_id', 'status', 'created', 'submitted')),
+    'user_bonuses': (UserBonus, ('user_id', 'assignment_id', 'created')),
+}
+
+# Indexes used by the query methods
+_INDEXES: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    'projects': (),
+    'pools': (('project_id',),),
+    'tasks': (('pool_id', 'created'),),
+    'assignments': (('pool_id', 'status'), ('user_id',), ('task_suite_id',)),
+    'user_bonuses': (('user_id',), ('assignment_id',)),
+}
+
+# Assignment events in the order of the assignment lifecycle. Assignments found by later cursors overwrite assignments
+# found by earlier ones, so the mirror keeps the latest known state.
+_ASSIGNMENT_EVENT_TYPES = (
+    AssignmentEvent.Type.CREATED,
+    AssignmentEvent.Type.SUBMITTED,
+    AssignmentEvent.Type.ACCEPTED,
+    AssignmentEvent.Type.REJECTED,
+    AssignmentEvent.Type.SKIPPED,
+    AssignmentEvent.Type.EXPIRED,
+)
+
+
+def _to_column_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+class SQLiteMirror:
+    """A local copy of projects, pools, tasks, assignments and bonuses stored in an SQLite database.
+
+    The mirror is synchronized incrementally: tasks, assignments and bonuses are fetched with
+    [TaskCursor](toloka.streaming.cursor.TaskCursor.md), [AssignmentCursor](toloka.streaming.cursor.AssignmentCursor.md)
+    and [UserBonusCursor](toloka.streaming.cursor.UserBonusCursor.md), and cursor checkpoints are saved in the same
+    database. So every next synchronization requests only objects that were created or changed since the previous one.
+    An interrupted synchronization continues from the last saved checkpoint.
+
+    After synchronization, objects may be read by the query methods or by SQL queries using the `connection` attribute
+    without requests to Toloka. Every table has the `id` and `data` columns. The `data` column contains the object
+    JSON. Some fields, like `pool_id` and `status`, are also stored in separate indexed columns.
+
+    Args:
+        path: A path to the SQLite database file. The file is created if it doesn't exist.
+        toloka_client: A client used for synchronization.
+        commit_every: The number of objects after which fetched objects and the cursor checkpoint are committed
+            to the database. Default value: 1000.
+
+    Example:
+        >>> mirror = toloka.mirror.SQLiteMirror('toloka.sqlite', toloka_client)
+        >>> mirror.sync_project('92694')
+        >>> submitted = list(mirror.get_assignments(pool_id='1080020', status='SUBMITTED'))
+        >>> mirror.connection.execute('SELECT user_id, COUNT(*) FROM assignments GROUP BY user_id').fetchall()
+        ...
+    """
+
+    def __init__(self, path: str, toloka_client: TolokaClient, commit_every: int = 1000):
+        self.path = path
+        self.toloka_client = toloka_client
+        self.commit_every = commit_every
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self.connection:
+            for table, (_, columns) in _TABLES.items():
+                column_definitions = ''.join(f'{column}, ' for column in columns)
+                self.connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, {column_definitions}data TEXT NOT NULL)'
+                )
+                for index_columns in _INDEXES[table]:
+                    self.connection.execute(
+                        f'CREATE INDEX IF NOT EXISTS {table}_{"_".join(index_columns)} '
+                        f'ON {table} ({", ".join(index_columns)})'
+                    )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS cursor_checkpoints (name TEXT PRIMARY KEY, state TEXT NOT NULL)'
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
+
+    # Synchronization
+
+    def sync_project(self, project_id: str) -> None:
+        """Synchronizes the project, all its pools, their tasks and assignments."""
+
+        self._upsert('projects', [self.toloka_client.get_project(project_id)])
+        for pool in self.toloka_client.get_pools(project_id=project_id):
+            self._upsert('pools', [pool])
+            self._sync_pool_objects(pool.id)
+
+    def sync_pool(self, pool_id: str) -> None:
+        """Synchronizes the pool, its project, tasks and assignments."""
+
+        pool = self.toloka_client.get_pool(pool_id)
+        self._upsert('projects', [self.toloka_client.get_project(pool.project_id)])
+        self._upsert('pools', [pool])
+        self._sync_pool_objects(pool_id)
+
+    def sync_user_bonuses(self) -> None:
+        """Synchronizes all bonuses issued by the requester."""
+
+        cursor = UserBonusCursor(toloka_client=self.toloka_client)
+        self._consume('user_bonuses', cursor, 'user_bonuses', lambda event: event.user_bonus)
+
+    def _sync_pool_objects(self, pool_id: str) -> None:
+        cursor = TaskCursor(toloka_client=self.toloka_client, pool_id=pool_id)
+        self._consume(f'tasks:{pool_id}', cursor, 'tasks', lambda event: event.task)
+        for event_type in _ASSIGNMENT_EVENT_TYPES:
+            cursor = AssignmentCursor(toloka_client=self.toloka_client, pool_id=pool_id, event_type=event_type)
+            self._consume(f'assignments:{pool_id}:{event_type.value}', cursor, 'assignments', lambda event: event.assignment)
+
+    def _consume(self, name: str, cursor: BaseCursor, table: str, get_object) -> None:
+        self._restore_checkpoint(name, cursor)
+        objects = []
+        for event in cursor:
+            objects.append(get_object(event))
+            if len(objects) >= self.commit_every:
+                self._upsert(table, objects, checkpoint=(name, cursor))
+                objects = []
+        self._upsert(table, objects, checkpoint=(name, cursor))
+
+    def _restore_checkpoint(self, name: str, cursor: BaseCursor) -> None:
+        with self._lock:
+            row = self.connection.execute('SELECT state FROM cursor_checkpoints WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            return
+        state = simplejson.loads(row[0])
+        request, _, _ = cursor._get_state()
+        cursor._set_state((structure(state['request'], type(request)), None, set(state['seen_ids'])))
+
+    def _upsert(self, table: str, objects: List, checkpoint: Optional[Tuple[str, BaseCursor]] = None) -> None:
+        """Writes objects and the cursor checkpoint in a single transaction."""
+
+        _, columns = _TABLES[table]
+        placeholders = ', '.join('?' * (len(columns) + 2))
+        rows = [
+            (
+                obj.id,
+                *(_to_column_value(getattr(obj, column)) for column in columns),
+                simplejson.dumps(unstructure(obj), use_decimal=True),
+            )
+            for obj in objects
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(
+                f'INSERT OR REPLACE INTO {table} (id, {", ".join(columns)}, data) VALUES ({placeholders})', rows,
+            )
+            if checkpoint is not None:
+                name, cursor = checkpoint
+                request, _, seen_ids = cursor._get_state()
+                state = simplejson.dumps({'request': unstructure(request), 'seen_ids': sorted(seen_ids)})
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO cursor_checkpoints (name, state) VALUES (?, ?)', (name, state),
+                )
+        logger.debug('Mirrored %d objects to %s', len(rows), table)
+
+    # Queries
+
+    def get_project(self, project_id: str) -> Optional[Project]:
+        return next(self._select('projects', id=project_id), None)
+
+    def get_pool(self, pool_id: str) -> Optional[Pool]:
+        return next(self._select('pools', id=pool_id), None)
+
+    def get_pools(
+        self,
+        project_id: Optional[str] = None,
+        status: Union[str, Pool.Status, Sequence[Union[str, Pool.Status]], None] = None,
+    ) -> Iterator[Pool]:
+        return self._select('pools', project_id=project_id, status=status)
+
+    def get_tasks(self, pool_id: Optional[str] = None) -> Iterator[Task]:
+        return self._select('tasks', pool_id=pool_id)
+
+    def get_assignments(
+        self,
+        pool_id: Optional[str] = None,
+        status: Union[str, Assignment.Status, Sequence[Union[str, Assignment.Status]], None] = None,
+        user_id: Optional[str] = None,
+        task_suite_id: Optional[str] = None,
+    ) -> Iterator[Assignment]:
+        return self._select('assignments', pool_id=pool_id, status=status, user_id=user_id, task_suite_id=task_suite_id)
+
+    def get_user_bonuses(
+        self, user_id: Optional[str] = None, assignment_id: Optional[str] = None,
+    ) -> Iterator[UserBonus]:
+        return self._select('user_bonuses', user_id=user_id, assignment_id=assignment_id)
+
+    def _select(self, table: str, **filters) -> Iterator:
+        object_class, _ = _TABLES[table]
+        conditions, parameters = [], []
+        for column, value in filters.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                conditions.append(f'{column} IN ({", ".join("?" * len(value))})')
+                parameters.extend(_to_column_value(item) for item in value)
+            else:
+                conditions.append(f'{column} = ?')
+                parameters.append(_to_column_value(value))
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        with self._lock:
+            rows = self.connection.execute(f'SELECT data FROM {table}{where} ORDER BY id', parameters).fetchall()
+        for (data,) in rows:
+            yield structure(simplejson.loads(data, use_decimal=True), object_class)
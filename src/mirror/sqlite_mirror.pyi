@@ -0,0 +1,88 @@
+__all__ = [
+    'SQLiteMirror',
+]
+import toloka.client
+import toloka.client.assignment
+import toloka.client.pool
+import toloka.client.project
+import toloka.client.task
+import toloka.client.user_bonus
+import typing
+
+
+class SQLiteMirror:
+    """A local copy of projects, pools, tasks, assignments and bonuses stored in an SQLite database.
+
+    The mirror is synchronized incrementally: tasks, assignments and bonuses are fetched with
+    [TaskCursor](toloka.streaming.cursor.TaskCursor.md), [AssignmentCursor](toloka.streaming.cursor.AssignmentCursor.md)
+    and [UserBonusCursor](toloka.streaming.cursor.UserBonusCursor.md), and cursor checkpoints are saved in the same
+    database. So every next synchronization requests only objects that were created or changed since the previous one.
+    An interrupted synchronization continues from the last saved checkpoint.
+
+    After synchronization, objects may be read by the query methods or by SQL queries using the `connection` attribute
+    without requests to Toloka. Every table has the `id` and `data` columns. The `data` column contains the object
+    JSON. Some fields, like `pool_id` and `status`, are also stored in separate indexed columns.
+
+    Args:
+        path: A path to the SQLite database file. The file is created if it doesn't exist.
+        toloka_client: A client used for synchronization.
+        commit_every: The number of objects after which fetched objects and the cursor checkpoint are committed
+            to the database. Default value: 1000.
+
+    Example:
+        >>> mirror = toloka.mirror.SQLiteMirror('toloka.sqlite', toloka_client)
+        >>> mirror.sync_project('92694')
+        >>> submitted = list(mirror.get_assignments(pool_id='1080020', status='SUBMITTED'))
+        >>> mirror.connection.execute('SELECT user_id, COUNT(*) FROM assignments GROUP BY user_id').fetchall()
+        ...
+    """
+
+    def __init__(
+        self,
+        path: str,
+        toloka_client: toloka.client.TolokaClient,
+        commit_every: int = 1000
+    ): ...
+
+    def close(self) -> None: ...
+
+    def sync_project(self, project_id: str) -> None:
+        """Synchronizes the project, all its pools, their tasks and assignments.
+        """
+        ...
+
+    def sync_pool(self, pool_id: str) -> None:
+        """Synchronizes the pool, its project, tasks and assignments.
+        """
+        ...
+
+    def sync_user_bonuses(self) -> None:
+        """Synchronizes all bonuses issued by the requester.
+        """
+        ...
+
+    def get_project(self, project_id: str) -> typing.Optional[toloka.client.project.Project]: ...
+
+    def get_pool(self, pool_id: str) -> typing.Optional[toloka.client.pool.Pool]: ...
+
+    def get_pools(
+        self,
+        project_id: typing.Optional[str] = None,
+        status: typing.Union[str, toloka.client.pool.Pool.Status, typing.Sequence[typing.Union[str, toloka.client.pool.Pool.Status]], None] = None
+    ) -> typing.Iterator[toloka.client.pool.Pool]: ...
+
+    def get_tasks(self, pool_id: typing.Optional[str] = None) -> typing.Iterator[toloka.client.task.Task]: ...
+
+    def get_assignments(
+        self,
+        pool_id: typing.Optional[str] = None,
+        status: typing.Union[str, toloka.client.assignment.Assignment.Status, typing.Sequence[typing.Union[str, toloka.client.assignment.Assignment.Status]], None] = None,
+        user_id: typing.Optional[str] = None,
+        task_suite_id: typing.Optional[str] = None
+    ) -> typing.Iterator[toloka.client.assignment.Assignment]: ...
+
+    def get_user_bonuses(
+        self,
+        user_id: typing.Optional[str] = None,
+        assignment_id: typing.Optional[str] = None
+    ) -> typing.Iterator[toloka.client.user_bonus.UserBonus]: ...
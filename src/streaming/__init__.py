@@ -1,4 +1,5 @@
 __all__ = [
+    'AdaptivePeriod',
     'AssignmentsObserver',
     'BaseStorage',
     'FileLocker',
@@ -19,7 +20,7 @@ from . import pipeline
 from . import observer
 from . import storage
 
-from .pipeline import Pipeline
+from .pipeline import AdaptivePeriod, Pipeline
 from .observer import AssignmentsObserver, PoolStatusObserver
 from .storage import BaseStorage, JSONLocalStorage, S3Storage
 from .locker import FileLocker
@@ -1,4 +1,5 @@
 __all__ = [
+    'AdaptivePeriod',
     'AssignmentsObserver',
     'BaseStorage',
     'FileLocker',
@@ -28,7 +29,10 @@ from toloka.streaming.observer import (
     AssignmentsObserver,
     PoolStatusObserver,
 )
-from toloka.streaming.pipeline import Pipeline
+from toloka.streaming.pipeline import (
+    AdaptivePeriod,
+    Pipeline,
+)
 from toloka.streaming.storage import (
     BaseStorage,
     JSONLocalStorage,
@@ -14,6 +14,7 @@ import asyncio
 import attr
 import copy
 import functools
+import itertools
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Set, Tuple, Union
 
@@ -86,56 +87,205 @@ class BaseCursor:
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
     """
 
     toloka_client: TolokaClientSyncOrAsyncType = attr.ib()
     _request: BaseSearchRequest = attr.ib()
     _time_lag: timedelta = attr.ib(default=DEFAULT_LAG)
+    prefetch_pages: int = attr.ib(default=0, kw_only=True)
     _prev_response: Optional[ResponseObjectType] = attr.ib(default=None, init=False)
     _seen_ids: Set[str] = attr.ib(factory=set, init=False)
+    # The time of the last yielded item. The request is updated with it once per page, not for each item.
+    _position_time: Optional[datetime] = attr.ib(default=None, init=False)
+    # The state before the current CursorFetchContext started fetching. It is pickled instead of the state that is
+    # being changed, so a cursor saved in the middle of fetching doesn't skip events that weren't handled yet.
+    _fetch_start_state: Optional[Tuple] = attr.ib(default=None, init=False)
+    _prefetcher: Optional['_PagePrefetcher'] = attr.ib(default=None, init=False, eq=False, repr=False)
+    # The page already received by `backfill`. It is used as the next page instead of requesting it again.
+    _received_page: Optional[ResponseObjectType] = attr.ib(default=None, init=False, eq=False, repr=False)
 
     @attr.s
     class CursorFetchContext:
         """Context manager to return from `BaseCursor.try_fetch_all method`.
         Commit cursor state only if no error occured.
+
+        If `limit` is set, at most `limit` events are fetched from the `events` iterator over the cursor.
+        If `backfill_shards` is set, events are fetched with `BaseCursor.backfill` in the async mode.
         """
         _cursor: 'BaseCursor' = attr.ib()
+        _events: Union[Iterator[BaseEvent], AsyncIterator[BaseEvent], None] = attr.ib(default=None)
+        _limit: Optional[int] = attr.ib(default=None)
+        _backfill_shards: Optional[int] = attr.ib(default=None)
         _start_state: Optional[Tuple] = attr.ib(default=None, init=False)
         _finish_state: Optional[Tuple] = attr.ib(default=None, init=False)
+        exhausted: bool = attr.ib(default=False, init=False)
+        committed: bool = attr.ib(default=False, init=False)
 
         def __enter__(self) -> List[BaseEvent]:
-            self._start_state = copy.deepcopy(self._cursor._get_state())
-            res = [item for item in self._cursor]
-            self._finish_state = self._cursor._get_state()
-            self._cursor._set_state(self._start_state)
+            if self._backfill_shards is not None:
+                raise ValueError('Backfill is supported only in the async mode')
+            self._start_state = self._cursor._copy_state()
+            self._cursor._fetch_start_state = self._start_state
+            try:
+                events = iter(self._cursor) if self._events is None else self._events
+                res = list(itertools.islice(events, self._limit))
+                self.exhausted = self._limit is None or len(res) < self._limit
+                self._finish_state = self._cursor._get_state()
+            finally:
+                # Events are handled after fetching, so the cursor isn't moved until they are handled
+                self._cursor._set_state(self._start_state)
+                self._cursor._fetch_start_state = None
             return res
 
         async def __aenter__(self) -> List[BaseEvent]:
-            self._start_state = copy.deepcopy(self._cursor._get_state())
-            res = [item async for item in self._cursor]
-            self._finish_state = self._cursor._get_state()
-            self._cursor._set_state(self._start_state)
+            self._start_state = self._cursor._copy_state()
+            self._cursor._fetch_start_state = self._start_state
+            try:
+                events = self._events
+                if events is None:
+                    events = self._cursor._aiter_events(self._backfill_shards)
+                res = []
+                if self._limit != 0:
+                    async for item in events:
+                        res.append(item)
+                        if len(res) == self._limit:
+                            break
+                self.exhausted = self._limit is None or len(res) < self._limit
+                self._finish_state = self._cursor._get_state()
+            finally:
+                self._cursor._set_state(self._start_state)
+                self._cursor._fetch_start_state = None
             return res
 
         def __exit__(self, exc_type, exc_value, traceback) -> None:
             if exc_type is None:
                 self._cursor._set_state(self._finish_state)
+                self.committed = True
 
         async def __aexit__(self, exc_type, exc_value, traceback) -> Awaitable[None]:
             if exc_type is None:
                 self._cursor._set_state(self._finish_state)
+                self.committed = True
+
+    @attr.s
+    class CursorFetchChunks:
+        """Iterable over contexts to return from `BaseCursor.try_fetch_chunks` method.
+        Each context fetches at most `chunk_size` events and commits cursor state if no error occured. Iteration
+        stops when all events are fetched or when a context isn't committed.
+        """
+        _cursor: 'BaseCursor' = attr.ib()
+        _chunk_size: int = attr.ib()
+        _backfill_shards: Optional[int] = attr.ib(default=None)
+
+        def __iter__(self) -> Iterator['BaseCursor.CursorFetchContext']:
+            if self._backfill_shards is not None:
+                raise ValueError('Backfill is supported only in the async mode')
+            events = iter(self._cursor)
+            try:
+                while True:
+                    context = BaseCursor.CursorFetchContext(self._cursor, events, self._chunk_size)
+                    yield context
+                    if context.exhausted or not context.committed:
+                        return
+            finally:
+                events.close()
+
+        async def __aiter__(self) -> AsyncIterator['BaseCursor.CursorFetchContext']:
+            events = self._cursor._aiter_events(self._backfill_shards)
+            try:
+                while True:
+                    context = BaseCursor.CursorFetchContext(self._cursor, events, self._chunk_size)
+                    yield context
+                    if context.exhausted or not context.committed:
+                        return
+            finally:
+                await events.aclose()
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state['_prefetcher'] = None
+        state['_received_page'] = None
+        if self._fetch_start_state is not None:
+            state['_request'], state['_prev_response'], state['_seen_ids'] = self._fetch_start_state
+            state['_position_time'] = None
+            state['_fetch_start_state'] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # Cursors pickled by older versions don't have these attributes
+        state.setdefault('_position_time', None)
+        state.setdefault('_fetch_start_state', None)
+        state.setdefault('prefetch_pages', 0)
+        state.setdefault('_prefetcher', None)
+        self.__dict__.update(state)
+
+    def _copy_state(self) -> Tuple:
+        request, prev_response, seen_ids = self._get_state()
+        # The request and the response are replaced but never modified during iteration
+        return request, prev_response, set(seen_ids)
 
     def _get_state(self) -> Tuple:
+        self._flush_position()
         return self._request, self._prev_response, self._seen_ids
 
     def _set_state(self, state: Tuple) -> None:
         self._request, self._prev_response, self._seen_ids = state
+        self._position_time = None
+
+    def _flush_position(self) -> None:
+        """Moves the time lower bound of the request to the time of the last yielded item."""
+
+        if self._position_time is not None:
+            self._request = attr.evolve(self._request, **{self._time_field_gte: self._position_time})
+            self._position_time = None
+
+    def _strip_seen_ids(self, items: List[Any]) -> None:
+        """Keeps ids of items that may be returned again, i.e. items not earlier than the time lower bound."""
+
+        min_time = getattr(self._request, self._time_field_gte)
+        seen_ids = set()
+        for item in reversed(items):
+            if self._get_time(item) < min_time:
+                break
+            if item.id in self._seen_ids:
+                seen_ids.add(item.id)
+        self._seen_ids = seen_ids
 
     def inject(self, injection: 'BaseCursor') -> None:
         self._set_state(injection._get_state())
 
-    def try_fetch_all(self) -> CursorFetchContext:
-        return self.CursorFetchContext(self)
+    def try_fetch_all(self, backfill_shards: Optional[int] = None) -> CursorFetchContext:
+        return self.CursorFetchContext(self, backfill_shards=backfill_shards)
+
+    def try_fetch_chunks(self, chunk_size: int, backfill_shards: Optional[int] = None) -> CursorFetchChunks:
+        """Fetches new events by chunks and commits cursor state after each successfully processed chunk.
+
+        Unlike `try_fetch_all`, a big backlog of events isn't loaded into memory at once, and progress isn't lost if
+        a later chunk fails.
+
+        Args:
+            chunk_size: The maximum number of events in a chunk.
+            backfill_shards: If set, events are fetched with `backfill` using this number of shards. It is supported
+                only in the async mode.
+
+        Examples:
+            >>> for context in cursor.try_fetch_chunks(1000):
+            >>>     with context as events:
+            >>>         handle(events)
+            ...
+        """
+
+        if chunk_size <= 0:
+            raise ValueError(f'chunk_size must be positive, got {chunk_size}')
+        return self.CursorFetchChunks(self, chunk_size, backfill_shards)
+
+    def _aiter_events(self, backfill_shards: Optional[int]) -> AsyncIterator[BaseEvent]:
+        if backfill_shards is None:
+            return self.__aiter__()
+        return self.backfill(backfill_shards)
 
     def __attrs_post_init__(self):
         if not getattr(self._request, self._time_field_gte):
@@ -164,83 +314,292 @@ class BaseCursor:
     def _time_field_lte(self) -> str:
         return f'{self._get_time_field()}_lte'  # To iterate by id for fixed time.
 
+    @property
+    def _time_field_lt(self) -> str:
+        return f'{self._get_time_field()}_lt'  # To split iteration into time intervals.
+
     @property
     def _time_field_gt(self) -> str:
         return f'{self._get_time_field()}_gt'  # To use after iteration by id.
 
     def __iter__(self) -> Iterator[BaseEvent]:
         fetcher = self._get_fetcher()
-        self._request = attr.evolve(
-            self._request, **{self._time_field_lte: datetime.now(tz=timezone.utc) - self._time_lag}
-        )
-        while True:
-            response = fetcher(self._request, sort=self._get_time_field())  # Diff between sync and async.
-            if response.items:
-                max_time = self._get_time(response.items[-1])
-                self._prev_response = response
-                for item in response.items:
-                    if item.id not in self._seen_ids:
-                        self._request = attr.evolve(self._request, **{self._time_field_gte: self._get_time(item)})
-                        self._seen_ids.add(item.id)
-                        yield self._construct_event(item)
-
-                if not response.has_more:
-                    return
-
-                # Multiple items can have the same time field value. If items with the same time field value are split
-                # between responses due to the fetcher limit they will be fetched twice and filtered by _seen_ids field
-                # afterward. But there is a corner case when all items in the response have the same time field value.
-                # As the result we will fetch the same items over and over again. To avoid this we need fallback to
-                # iteration over id field.
-                if self._get_time(response.items[0]) == max_time:
-                    fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
-                    for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
+        try:
+            self._flush_position()
+            self._request = attr.evolve(
+                self._request, **{self._time_field_lte: datetime.now(tz=timezone.utc) - self._time_lag}
+            )
+            while True:
+                response = fetcher(self._request, sort=self._get_time_field())  # Diff between sync and async.
+                if response.items:
+                    max_time = self._get_time(response.items[-1])
+                    self._prev_response = response
+                    for item in response.items:
                         if item.id not in self._seen_ids:
+                            self._position_time = self._get_time(item)
                             self._seen_ids.add(item.id)
                             yield self._construct_event(item)
-                    self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
-
-                # Strip it to the current response size.
-                self._seen_ids = {item.id for item in response.items}
-            else:
-                return
+                    self._flush_position()
+
+                    if not response.has_more:
+                        self._strip_seen_ids(response.items)
+                        return
+
+                    # Multiple items can have the same time field value. If items with the same time field value are
+                    # split between responses due to the fetcher limit they will be fetched twice and filtered by
+                    # _seen_ids field afterward. But there is a corner case when all items in the response have the
+                    # same time field value. As the result we will fetch the same items over and over again. To avoid
+                    # this we need fallback to iteration over id field.
+                    if self._get_time(response.items[0]) == max_time:
+                        fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
+                        for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
+                            if item.id not in self._seen_ids:
+                                self._seen_ids.add(item.id)
+                                yield self._construct_event(item)
+                        self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
+
+                    self._strip_seen_ids(response.items)
+                else:
+                    return
+        finally:
+            self._stop_prefetching()
 
     async def __aiter__(self) -> AsyncIterator[BaseEvent]:
         fetcher = self._get_fetcher()
-        self._request = attr.evolve(
-            self._request, **{self._time_field_lte: datetime.now(tz=timezone.utc) - self._time_lag}
-        )
-        while True:
-            response = await ensure_async(fetcher)(self._request, sort=self._get_time_field())  # Diff between sync and async.
-            if response.items:
-                max_time = self._get_time(response.items[-1])
-                self._prev_response = response
-                for item in response.items:
-                    if item.id not in self._seen_ids:
-                        self._request = attr.evolve(self._request, **{self._time_field_gte: self._get_time(item)})
-                        self._seen_ids.add(item.id)
-                        yield self._construct_event(item)
-
-                if not response.has_more:
-                    return
-
-                # Multiple items can have the same time field value. If items with the same time field value are split
-                # between responses due to the fetcher limit they will be fetched twice and filtered by _seen_ids field
-                # afterward. But there is a corner case when all items in the response have the same time field value.
-                # As the result we will fetch the same items over and over again. To avoid this we need fallback to
-                # iteration over id field.
-                if self._get_time(response.items[0]) == max_time:
-                    fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
-                    async for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
+        try:
+            self._flush_position()
+            self._request = attr.evolve(
+                self._request, **{self._time_field_lte: datetime.now(tz=timezone.utc) - self._time_lag}
+            )
+            while True:
+                response = await self._fetch_page(fetcher)  # Diff between sync and async.
+                if response.items:
+                    max_time = self._get_time(response.items[-1])
+                    self._prev_response = response
+                    for item in response.items:
                         if item.id not in self._seen_ids:
+                            self._position_time = self._get_time(item)
                             self._seen_ids.add(item.id)
                             yield self._construct_event(item)
-                    self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
+                    self._flush_position()
+
+                    if not response.has_more:
+                        self._strip_seen_ids(response.items)
+                        return
+
+                    # Multiple items can have the same time field value. If items with the same time field value are
+                    # split between responses due to the fetcher limit they will be fetched twice and filtered by
+                    # _seen_ids field afterward. But there is a corner case when all items in the response have the
+                    # same time field value. As the result we will fetch the same items over and over again. To avoid
+                    # this we need fallback to iteration over id field.
+                    if self._get_time(response.items[0]) == max_time:
+                        fixed_time_request = attr.evolve(self._request, **{self._time_field_lte: max_time})
+                        async for item in _ByIdCursor(fetcher, fixed_time_request):  # Diff between sync and async.
+                            if item.id not in self._seen_ids:
+                                self._seen_ids.add(item.id)
+                                yield self._construct_event(item)
+                        self._request = attr.evolve(self._request, **{self._time_field_gt: max_time})
+
+                    self._strip_seen_ids(response.items)
+                else:
+                    return
+        finally:
+            self._stop_prefetching()
+
+    async def _fetch_page(self, fetcher: Callable[..., ResponseObjectType]) -> ResponseObjectType:
+        """Gets the response to the current request. Uses pages requested in advance if `prefetch_pages` is set."""
+
+        if self._received_page is not None:
+            response, self._received_page = self._received_page, None
+            return response
+        if not self.prefetch_pages:
+            return await ensure_async(fetcher)(self._request, sort=self._get_time_field())
+        if self._prefetcher is not None:
+            response = await self._prefetcher.get(self._request)
+            if response is not None:
+                return response
+            # The request wasn't guessed, e.g. after iteration over id field
+            self._stop_prefetching()
+        self._prefetcher = _PagePrefetcher(self, fetcher, self._request)
+        return await self._prefetcher.get(self._request)
+
+    def _stop_prefetching(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+
+    async def backfill(self, shards: int = 8, ordered: bool = True, queue_size: int = 1000) -> AsyncIterator[BaseEvent]:
+        """Iterates over the history of events concurrently, then switches to the usual iteration.
+
+        The time range from the cursor position to the current time minus the time lag is split into `shards` equal
+        intervals. They are scanned concurrently, which speeds up catching up with a long history. When all
+        intervals are scanned, the cursor continues like `async for`. If all new events fit into a single page, the
+        history is not split, and no extra requests are made.
+
+        Args:
+            shards: The number of intervals scanned concurrently.
+            ordered: If `True`, events are yielded in the same order as by the usual iteration, and the cursor
+                position is moved after each event. Intervals are prefetched to bounded queues while earlier
+                intervals are being yielded. If `False`, events are yielded as soon as they are fetched: in order within
+                an interval, but intervals are mixed. The cursor position is moved only after all intervals are
+                scanned, so if the iteration is interrupted, events are fetched again.
+            queue_size: The maximum number of prefetched events per interval.
+
+        Yields:
+            BaseEvent: The next event.
+
+        Examples:
+            Catch up with all assignments accepted in the pool, then wait for new ones.
+
+            >>> cursor = AssignmentCursor(pool_id='123', event_type='ACCEPTED', toloka_client=async_toloka_client)
+            >>> async for event in cursor.backfill(shards=16):
+            >>>     handle(event)
+            ...
+        """
 
-                # Strip it to the current response size.
-                self._seen_ids = {item.id for item in response.items}
-            else:
-                return
+        if shards <= 0:
+            raise ValueError(f'shards must be positive, got {shards}')
+        fetcher = ensure_async(self._get_fetcher())
+        self._flush_position()
+        upper_time = datetime.now(tz=timezone.utc) - self._time_lag
+        response = await fetcher(
+            attr.evolve(self._request, **{self._time_field_lte: upper_time}), sort=self._get_time_field(),
+        )
+        if not (shards > 1 and response.items and response.has_more):
+            # The response is used as the first page of the usual iteration instead of requesting it again. The usual
+            # iteration requests items up to a later time, so items after `upper_time` are fetched by the next one
+            self._received_page = response
+        else:
+            lower_time = self._get_time(response.items[0])
+            step = (upper_time - lower_time) / shards
+            bounds = [None] + [lower_time + step * i for i in range(1, shards)] + [None]
+            shard_cursors = [self._create_shard(gte, lt) for gte, lt in zip(bounds, bounds[1:])]
+            queues = [asyncio.Queue(maxsize=queue_size) for _ in shard_cursors]
+            if not ordered:
+                queues = [asyncio.Queue(maxsize=queue_size)] * len(shard_cursors)
+            tasks = [
+                asyncio.ensure_future(_scan_shard(shard_cursor, queue))
+                for shard_cursor, queue in zip(shard_cursors, queues)
+            ]
+            try:
+                for queue in (queues if ordered else queues[:1]):
+                    finished_count = 0
+                    while finished_count < (1 if ordered else len(tasks)):
+                        item = await queue.get()
+                        if item is _SHARD_END:
+                            finished_count += 1
+                        elif isinstance(item, BaseException):
+                            raise item
+                        else:
+                            item, event = item
+                            if ordered:
+                                self._move_position(item)
+                            yield event
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            # The position is the end of the last interval with items. Later intervals may get late items
+            for shard_cursor in reversed(shard_cursors):
+                if shard_cursor._prev_response is not None:
+                    request, _, seen_ids = shard_cursor._get_state()
+                    lt = getattr(self._request, self._time_field_lt)
+                    self._set_state((attr.evolve(request, **{self._time_field_lt: lt}), None, seen_ids))
+                    break
+
+        async for event in self:
+            yield event
+
+    def _create_shard(self, gte: Optional[datetime], lt: Optional[datetime]) -> 'BaseCursor':
+        """Creates a copy of the cursor that iterates over the interval from `gte` to `lt`.
+
+        `None` bounds are not changed. The copy yields items together with events.
+        """
+
+        request, _, seen_ids = self._get_state()
+        if gte is not None:
+            request = attr.evolve(request, **{self._time_field_gte: gte})
+            seen_ids = set()
+        if lt is not None:
+            request = attr.evolve(request, **{self._time_field_lt: lt})
+        shard = copy.copy(self)
+        shard._prefetcher = None
+        shard._set_state((request, None, set(seen_ids)))
+        construct_event = shard._construct_event
+        shard._construct_event = lambda item: (item, construct_event(item))
+        return shard
+
+    def _move_position(self, item: Any) -> None:
+        """Moves the position of the cursor to the item yielded outside of the usual iteration."""
+
+        item_time = self._get_time(item)
+        position_time = self._position_time or getattr(self._request, self._time_field_gte)
+        if item_time > position_time:
+            self._seen_ids = set()
+        self._position_time = item_time
+        self._seen_ids.add(item.id)
+
+
+class _PagePrefetcher:
+    """Requests pages of the cursor in the background and keeps up to `prefetch_pages` responses in a queue.
+
+    The next request is guessed from the previous response: it is the request that the cursor makes after yielding
+    the whole page. Pages with the same time field value in all items are followed by iteration over id field, so
+    prefetching stops there. A response is used only if it was received for exactly the same request.
+    """
+
+    def __init__(self, cursor: BaseCursor, fetcher: Callable[..., ResponseObjectType], request: BaseSearchRequest):
+        self._queue = asyncio.Queue(maxsize=cursor.prefetch_pages)
+        self._task = asyncio.ensure_future(self._run(cursor, ensure_async(fetcher), request))
+
+    async def _run(self, cursor: BaseCursor, fetcher: Callable[..., Awaitable[ResponseObjectType]],
+                   request: BaseSearchRequest) -> None:
+        while True:
+            try:
+                response = await fetcher(request, sort=cursor._get_time_field())
+            except Exception as exc:
+                await self._queue.put((request, exc))
+                break
+            await self._queue.put((request, response))
+            if not response.items or not response.has_more:
+                break
+            max_time = cursor._get_time(response.items[-1])
+            if cursor._get_time(response.items[0]) == max_time:
+                break
+            request = attr.evolve(request, **{cursor._time_field_gte: max_time})
+        await self._queue.put(None)
+
+    async def get(self, request: BaseSearchRequest) -> Optional[ResponseObjectType]:
+        """Returns the next prefetched response if it was received for the request, otherwise returns `None`."""
+
+        prefetched = await self._queue.get()
+        if prefetched is None:
+            self._queue.put_nowait(None)
+            return None
+        prefetched_request, response = prefetched
+        if prefetched_request != request:
+            return None
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def stop(self) -> None:
+        self._task.cancel()
+
+
+_SHARD_END = object()
+
+
+async def _scan_shard(shard_cursor: BaseCursor, queue: asyncio.Queue) -> None:
+    """Puts items and events of the shard to the queue, then puts _SHARD_END or the raised exception."""
+
+    try:
+        async for item_and_event in shard_cursor:
+            await queue.put(item_and_event)
+    except Exception as exc:
+        await queue.put(exc)
+    else:
+        await queue.put(_SHARD_END)
 
 
 @expand('request')
@@ -43,11 +43,17 @@ class BaseCursor:
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
     """
 
     class CursorFetchContext:
         """Context manager to return from `BaseCursor.try_fetch_all method`.
         Commit cursor state only if no error occured.
+
+        If `limit` is set, at most `limit` events are fetched from the `events` iterator over the cursor.
+        If `backfill_shards` is set, events are fetched with `BaseCursor.backfill` in the async mode.
         """
 
         def __enter__(self) -> typing.List[toloka.streaming.event.BaseEvent]: ...
@@ -68,18 +74,107 @@ class BaseCursor:
             traceback
         ) -> typing.Awaitable[None]: ...
 
-        def __init__(self, cursor: 'BaseCursor') -> None:
+        def __init__(
+            self,
+            cursor: 'BaseCursor',
+            events: typing.Union[typing.Iterator[toloka.streaming.event.BaseEvent], typing.AsyncIterator[toloka.streaming.event.BaseEvent], None] = None,
+            limit: typing.Optional[int] = None,
+            backfill_shards: typing.Optional[int] = None
+        ) -> None:
             """Method generated by attrs for class BaseCursor.CursorFetchContext.
             """
             ...
 
         _cursor: 'BaseCursor'
+        _events: typing.Union[typing.Iterator[toloka.streaming.event.BaseEvent], typing.AsyncIterator[toloka.streaming.event.BaseEvent], None]
+        _limit: typing.Optional[int]
+        _backfill_shards: typing.Optional[int]
         _start_state: typing.Optional[typing.Tuple]
         _finish_state: typing.Optional[typing.Tuple]
+        exhausted: bool
+        committed: bool
+
+    class CursorFetchChunks:
+        """Iterable over contexts to return from `BaseCursor.try_fetch_chunks` method.
+        Each context fetches at most `chunk_size` events and commits cursor state if no error occured. Iteration
+        stops when all events are fetched or when a context isn't committed.
+        """
+
+        def __init__(
+            self,
+            cursor: 'BaseCursor',
+            chunk_size: int,
+            backfill_shards: typing.Optional[int] = None
+        ) -> None:
+            """Method generated by attrs for class BaseCursor.CursorFetchChunks.
+            """
+            ...
+
+        _cursor: 'BaseCursor'
+        _chunk_size: int
+        _backfill_shards: typing.Optional[int]
 
     def inject(self, injection: 'BaseCursor') -> None: ...
 
-    def try_fetch_all(self) -> CursorFetchContext: ...
+    def try_fetch_all(self, backfill_shards: typing.Optional[int] = None) -> CursorFetchContext: ...
+
+    def try_fetch_chunks(
+        self,
+        chunk_size: int,
+        backfill_shards: typing.Optional[int] = None
+    ) -> CursorFetchChunks:
+        """Fetches new events by chunks and commits cursor state after each successfully processed chunk.
+
+        Unlike `try_fetch_all`, a big backlog of events isn't loaded into memory at once, and progress isn't lost if
+        a later chunk fails.
+
+        Args:
+            chunk_size: The maximum number of events in a chunk.
+            backfill_shards: If set, events are fetched with `backfill` using this number of shards. It is supported
+                only in the async mode.
+
+        Examples:
+            >>> for context in cursor.try_fetch_chunks(1000):
+            >>>     with context as events:
+            >>>         handle(events)
+            ...
+        """
+        ...
+
+    def backfill(
+        self,
+        shards: int = 8,
+        ordered: bool = True,
+        queue_size: int = 1000
+    ) -> typing.AsyncIterator[toloka.streaming.event.BaseEvent]:
+        """Iterates over the history of events concurrently, then switches to the usual iteration.
+
+        The time range from the cursor position to the current time minus the time lag is split into `shards` equal
+        intervals. They are scanned concurrently, which speeds up catching up with a long history. When all
+        intervals are scanned, the cursor continues like `async for`. If all new events fit into a single page, the
+        history is not split, and no extra requests are made.
+
+        Args:
+            shards: The number of intervals scanned concurrently.
+            ordered: If `True`, events are yielded in the same order as by the usual iteration, and the cursor
+                position is moved after each event. Intervals are prefetched to bounded queues while earlier
+                intervals are being yielded. If `False`, events are yielded as soon as they are fetched: in order within
+                an interval, but intervals are mixed. The cursor position is moved only after all intervals are
+                scanned, so if the iteration is interrupted, events are fetched again.
+            queue_size: The maximum number of prefetched events per interval.
+
+        Yields:
+            BaseEvent: The next event.
+
+        Examples:
+            Catch up with all assignments accepted in the pool, then wait for new ones.
+
+            >>> cursor = AssignmentCursor(pool_id='123', event_type='ACCEPTED', toloka_client=async_toloka_client)
+            >>> async for event in cursor.backfill(shards=16):
+            >>>     handle(event)
+            ...
+        """
+        ...
 
     def __attrs_post_init__(self): ...
 
@@ -91,7 +186,9 @@ class BaseCursor:
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         request: toloka.client.search_requests.BaseSearchRequest,
-        time_lag: datetime.timedelta = ...
+        time_lag: datetime.timedelta = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class BaseCursor.
         """
@@ -100,8 +197,13 @@ class BaseCursor:
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.BaseSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
 
 
 class AssignmentCursor(BaseCursor):
@@ -111,6 +213,9 @@ class AssignmentCursor(BaseCursor):
         toloka_client: TolokaClient object that is being used to search assignments.
         event_type: Assignments event's type to search.
         request: Base request to search assignments by.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
@@ -131,7 +236,9 @@ class AssignmentCursor(BaseCursor):
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         event_type: typing.Any,
         request: toloka.client.search_requests.AssignmentSearchRequest = ...,
-        time_lag: datetime.timedelta = ...
+        time_lag: datetime.timedelta = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class AssignmentCursor.
         """
@@ -175,7 +282,9 @@ class AssignmentCursor(BaseCursor):
         expired_lte: typing.Optional[datetime.datetime] = None,
         expired_gt: typing.Optional[datetime.datetime] = None,
         expired_gte: typing.Optional[datetime.datetime] = None,
-        time_lag: datetime.timedelta = ...
+        time_lag: datetime.timedelta = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class AssignmentCursor.
         """
@@ -184,8 +293,13 @@ class AssignmentCursor(BaseCursor):
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.AssignmentSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
     _event_type: toloka.streaming.event.AssignmentEvent.Type
 
 
@@ -195,6 +309,9 @@ class TaskCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search tasks.
         request: Base request to search tasks by.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
@@ -214,7 +331,9 @@ class TaskCursor(BaseCursor):
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         time_lag: datetime.timedelta = ...,
-        request: toloka.client.search_requests.TaskSearchRequest = ...
+        request: toloka.client.search_requests.TaskSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class TaskCursor.
         """
@@ -238,7 +357,9 @@ class TaskCursor(BaseCursor):
         overlap_lt: typing.Optional[int] = None,
         overlap_lte: typing.Optional[int] = None,
         overlap_gt: typing.Optional[int] = None,
-        overlap_gte: typing.Optional[int] = None
+        overlap_gte: typing.Optional[int] = None,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class TaskCursor.
         """
@@ -247,8 +368,13 @@ class TaskCursor(BaseCursor):
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.TaskSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
 
 
 class UserBonusCursor(BaseCursor):
@@ -257,6 +383,9 @@ class UserBonusCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search `UserBonus` instances.
         request: Base request to search `UserBonus` instances by.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
@@ -276,7 +405,9 @@ class UserBonusCursor(BaseCursor):
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         time_lag: datetime.timedelta = ...,
-        request: toloka.client.search_requests.UserBonusSearchRequest = ...
+        request: toloka.client.search_requests.UserBonusSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class UserBonusCursor.
         """
@@ -297,7 +428,9 @@ class UserBonusCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class UserBonusCursor.
         """
@@ -306,8 +439,13 @@ class UserBonusCursor(BaseCursor):
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.UserBonusSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
 
 
 class UserSkillCursor(BaseCursor):
@@ -317,6 +455,9 @@ class UserSkillCursor(BaseCursor):
         toloka_client: TolokaClient object that is being used to search skills.
         event_type: Skill event type to search.
         request: Base request to search skills by.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
@@ -337,7 +478,9 @@ class UserSkillCursor(BaseCursor):
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         event_type: typing.Any,
         request: toloka.client.search_requests.UserSkillSearchRequest = ...,
-        time_lag: datetime.timedelta = ...
+        time_lag: datetime.timedelta = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class UserSkillCursor.
         """
@@ -362,7 +505,9 @@ class UserSkillCursor(BaseCursor):
         modified_lte: typing.Optional[datetime.datetime] = None,
         modified_gt: typing.Optional[datetime.datetime] = None,
         modified_gte: typing.Optional[datetime.datetime] = None,
-        time_lag: datetime.timedelta = ...
+        time_lag: datetime.timedelta = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class UserSkillCursor.
         """
@@ -371,8 +516,13 @@ class UserSkillCursor(BaseCursor):
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.UserSkillSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
     _event_type: toloka.streaming.event.UserSkillEvent.Type
 
 
@@ -382,6 +532,9 @@ class UserRestrictionCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search Toloker restrictions.
         request: Base request to search Toloker restrictions.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
@@ -401,7 +554,9 @@ class UserRestrictionCursor(BaseCursor):
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         time_lag: datetime.timedelta = ...,
-        request: toloka.client.search_requests.UserRestrictionSearchRequest = ...
+        request: toloka.client.search_requests.UserRestrictionSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class UserRestrictionCursor.
         """
@@ -423,7 +578,9 @@ class UserRestrictionCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class UserRestrictionCursor.
         """
@@ -432,8 +589,13 @@ class UserRestrictionCursor(BaseCursor):
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.UserRestrictionSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
 
 
 class MessageThreadCursor(BaseCursor):
@@ -442,6 +604,9 @@ class MessageThreadCursor(BaseCursor):
     Args:
         toloka_client: TolokaClient object that is being used to search messages.
         request: Base request to search messages.
+        prefetch_pages: The number of pages requested in advance during async iteration. The next page is requested
+            as soon as the current one is received, so the network latency overlaps with handling of events. Default
+            is 0, i.e. pages are requested one by one.
         _time_lag: Time lag between cursor time field upper bound and real time. Default is 1 minute. This lag is
             required to keep cursor consistent. Lowering this value will make cursor process events faster, but raises
             probability of missing some events in case of concurrent operations.
@@ -461,7 +626,9 @@ class MessageThreadCursor(BaseCursor):
         self,
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         time_lag: datetime.timedelta = ...,
-        request: toloka.client.search_requests.MessageThreadSearchRequest = ...
+        request: toloka.client.search_requests.MessageThreadSearchRequest = ...,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class MessageThreadCursor.
         """
@@ -481,7 +648,9 @@ class MessageThreadCursor(BaseCursor):
         created_lt: typing.Optional[datetime.datetime] = None,
         created_lte: typing.Optional[datetime.datetime] = None,
         created_gt: typing.Optional[datetime.datetime] = None,
-        created_gte: typing.Optional[datetime.datetime] = None
+        created_gte: typing.Optional[datetime.datetime] = None,
+        *,
+        prefetch_pages: int = 0
     ) -> None:
         """Method generated by attrs for class MessageThreadCursor.
         """
@@ -490,5 +659,10 @@ class MessageThreadCursor(BaseCursor):
     toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]
     _request: toloka.client.search_requests.MessageThreadSearchRequest
     _time_lag: datetime.timedelta
+    prefetch_pages: int
     _prev_response: typing.Optional[ResponseObjectType]
     _seen_ids: typing.Set[str]
+    _position_time: typing.Optional[datetime.datetime]
+    _fetch_start_state: typing.Optional[typing.Tuple]
+    _prefetcher: typing.Optional[typing.Any]
+    _received_page: typing.Optional[ResponseObjectType]
@@ -6,10 +6,12 @@ __all__ = [
 
 import asyncio
 import attr
+import copy
 import datetime
 import inspect
 import logging
 
+from contextvars import ContextVar
 from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..client.primitives.base import autocast_to_enum
@@ -22,12 +24,181 @@ from .event import AssignmentEvent
 
 logger = logging.getLogger(__name__)
 
+# Set by Pipeline for a running observer. Saves the observer state to the pipeline storage, so observers may save
+# their progress before they finish.
+checkpoint_var: ContextVar[Optional[Callable[[], None]]] = ContextVar('checkpoint', default=None)
+
+
+class _RequestCache:
+    """Shares results of identical read requests made by observers during a single Pipeline iteration.
+
+    Concurrent identical requests wait for the first one, so the API is called once. Each caller gets its own copy of
+    the result, so callbacks may modify it. Failed requests are not cached. Results older than `max_age` are requested
+    again, so observers running for a long time don't get outdated data.
+    """
+
+    def __init__(self, max_age: datetime.timedelta):
+        self._max_age = max_age.total_seconds()
+        self._futures: Dict[Tuple, Tuple[float, asyncio.Future]] = {}
+
+    async def request(self, client: AsyncInterfaceWrapper, method: str, *args, **kwargs) -> Any:
+        key = (id(client.__wrapped__), method, repr(args), repr(sorted(kwargs.items())))
+        now = asyncio.get_event_loop().time()
+        start_time, future = self._futures.get(key, (None, None))
+        if future is None or (future.done() and now - start_time > self._max_age):
+            future = asyncio.ensure_future(getattr(client, method)(*args, **kwargs))
+            self._futures[key] = (now, future)
+
+            def _forget_failed(done: asyncio.Future) -> None:
+                if (done.cancelled() or done.exception() is not None) and self._futures.get(key, (None, None))[1] is done:
+                    del self._futures[key]
+
+            future.add_done_callback(_forget_failed)
+        # A cancelled caller doesn't cancel the request for others
+        return copy.deepcopy(await asyncio.shield(future))
+
+
+# Set by Pipeline for each iteration. Identical read requests of observers started in one iteration are coalesced.
+request_cache_var: ContextVar[Optional[_RequestCache]] = ContextVar('request_cache', default=None)
+
+
+async def _request(client: AsyncInterfaceWrapper, method: str, *args, **kwargs) -> Any:
+    """Calls the client method. Uses the Pipeline iteration cache if it's set."""
+
+    cache = request_cache_var.get()
+    if cache is None:
+        return await getattr(client, method)(*args, **kwargs)
+    return await cache.request(client, method, *args, **kwargs)
+
+
+@attr.s
+class _ClientPools:
+    client: AsyncInterfaceWrapper = attr.ib()
+    # Project IDs of watched pools. `None` if the project isn't known yet.
+    watched: Dict[str, Optional[str]] = attr.ib(factory=dict)
+    pools: Dict[str, Pool] = attr.ib(factory=dict)
+    refreshed_at: Optional[float] = attr.ib(default=None)
+    refreshing: Optional[asyncio.Future] = attr.ib(default=None)
+
+
+class _PoolStatuses:
+    """Keeps pools watched by observers of a Pipeline and refreshes all of them with a few `find_pools` requests.
+
+    Pools are grouped by project. A group is refreshed by paging over pools of the project with IDs between the minimal
+    and the maximal watched IDs. Paging stops when it can't save requests compared to getting the remaining pools one
+    by one, so sparse groups take at most twice as many requests as `get_pool` calls, and single pools are got by
+    `get_pool`. Pools with unknown projects are
+    paged without the project filter. Data is refreshed if it's older than `max_age`.
+    """
+
+    PAGE_SIZE = 300
+
+    def __init__(self, max_age: datetime.timedelta):
+        self._max_age = max_age.total_seconds()
+        self._client_pools: Dict[int, _ClientPools] = {}
+
+    def watch(self, observers: Iterable['BasePoolObserver']) -> None:
+        """Sets pools to refresh. Pools that aren't watched anymore are forgotten."""
+
+        watched_by_client: Dict[int, Dict[str, Optional[str]]] = {}
+        for observer in observers:
+            client_pools = self._get_client_pools(observer.toloka_client)
+            watched = watched_by_client.setdefault(id(client_pools.client.__wrapped__), {})
+            watched[observer.pool_id] = client_pools.watched.get(observer.pool_id)
+        for key, client_pools in list(self._client_pools.items()):
+            client_pools.watched = watched_by_client.get(key, {})
+            client_pools.pools = {
+                pool_id: pool for pool_id, pool in client_pools.pools.items() if pool_id in client_pools.watched
+            }
+            if not client_pools.watched:
+                del self._client_pools[key]
+
+    async def get_pool(self, client: AsyncInterfaceWrapper, pool_id: str) -> Pool:
+        client_pools = self._get_client_pools(client)
+        client_pools.watched.setdefault(pool_id, None)
+        now = asyncio.get_event_loop().time()
+        if client_pools.refreshed_at is None or now - client_pools.refreshed_at > self._max_age:
+            if client_pools.refreshing is None:
+                client_pools.refreshing = asyncio.ensure_future(self._refresh(client_pools))
+            await asyncio.shield(client_pools.refreshing)
+        if pool_id not in client_pools.pools:
+            # The pool started being watched after the last refresh
+            pool = await _request(client, 'get_pool', pool_id)
+            client_pools.pools[pool_id] = pool
+            client_pools.watched[pool_id] = pool.project_id
+        return copy.deepcopy(client_pools.pools[pool_id])
+
+    def _get_client_pools(self, client: AsyncInterfaceWrapper) -> _ClientPools:
+        key = id(client.__wrapped__)
+        if key not in self._client_pools:
+            self._client_pools[key] = _ClientPools(client)
+        return self._client_pools[key]
+
+    async def _refresh(self, client_pools: _ClientPools) -> None:
+        try:
+            start_time = asyncio.get_event_loop().time()
+            pool_ids_by_project: Dict[Optional[str], List[str]] = {}
+            for pool_id, project_id in client_pools.watched.items():
+                pool_ids_by_project.setdefault(project_id, []).append(pool_id)
+            groups = await asyncio.gather(*(
+                self._get_pools(client_pools.client, project_id, pool_ids)
+                for project_id, pool_ids in pool_ids_by_project.items()
+            ))
+            for pools in groups:
+                for pool in pools:
+                    client_pools.pools[pool.id] = pool
+                    client_pools.watched[pool.id] = pool.project_id
+            client_pools.refreshed_at = start_time
+            logger.info('Refreshed pools count: %d', sum(map(len, groups)))
+        finally:
+            client_pools.refreshing = None
+
+    async def _get_pools(self, client: AsyncInterfaceWrapper, project_id: Optional[str], pool_ids: List[str]) -> List[Pool]:
+        remaining = set(pool_ids)
+        found = []
+        request = {'id_gte': min(pool_ids, key=_pool_id_key), 'id_lte': max(pool_ids, key=_pool_id_key)}
+        if project_id is not None:
+            request['project_id'] = project_id
+        requests_count = 0
+        # A page is requested only if it may save requests compared to getting the remaining pools one by one
+        while len(remaining) > requests_count + 1:
+            response = await client.find_pools(sort='id', limit=self.PAGE_SIZE, **request)
+            requests_count += 1
+            for pool in response.items:
+                if pool.id in remaining:
+                    remaining.remove(pool.id)
+                    found.append(pool)
+            if not response.has_more or not response.items:
+                break
+            request.pop('id_gte', None)
+            request['id_gt'] = response.items[-1].id
+        found.extend(await asyncio.gather(*(_request(client, 'get_pool', pool_id) for pool_id in remaining)))
+        return found
+
+
+def _pool_id_key(pool_id: str) -> Tuple[int, str]:
+    # Numeric IDs are compared as numbers
+    return len(pool_id), pool_id
+
+
+# Set by Pipeline for its observers. Pools are requested with `_PoolStatuses` instead of separate `get_pool` calls.
+pool_statuses_var: ContextVar[Optional[_PoolStatuses]] = ContextVar('pool_statuses', default=None)
+
+
+async def _get_pool(client: AsyncInterfaceWrapper, pool_id: str) -> Pool:
+    pool_statuses = pool_statuses_var.get()
+    if pool_statuses is None:
+        return await _request(client, 'get_pool', pool_id)
+    return await pool_statuses.get_pool(client, pool_id)
+
 
 @attr.s
 class BaseObserver:
     name: Optional[str] = attr.ib(default=None, kw_only=True)
     _enabled: bool = attr.ib(default=True, init=False)
     _deleted: bool = attr.ib(default=False, init=False)
+    # The number of events got by the last call. Pipeline adjusts the period of calls by it, see AdaptivePeriod.
+    _events_count: Optional[int] = attr.ib(default=None, init=False)
 
     def get_unique_key(self) -> Tuple:
         """This method should return identifier for this observer that is unique in the current pipeline context.
@@ -136,13 +307,15 @@ class BasePoolObserver(BaseObserver):
     @add_headers('streaming')
     async def should_resume(self) -> bool:
         logger.info('Check resume by pool status: %s', self.pool_id)
-        pool = await self.toloka_client.get_pool(self.pool_id)
+        pool = await _get_pool(self.toloka_client, self.pool_id)
         logger.info('Pool status for %s: %s', self.pool_id, pool.status)
         if pool.is_open():
             return True
 
         logger.info('Check resume by pool active assignments: %s', self.pool_id)
-        response = await self.toloka_client.find_assignments(pool_id=self.pool_id, status=[Assignment.ACTIVE], limit=1)
+        response = await _request(
+            self.toloka_client, 'find_assignments', pool_id=self.pool_id, status=[Assignment.ACTIVE], limit=1,
+        )
         logger.info('Pool %s has active assignments: %s', self.pool_id, bool(response.items))
         return bool(response.items)
 
@@ -244,13 +417,15 @@ class PoolStatusObserver(BasePoolObserver):
 
     @add_headers('streaming')
     async def __call__(self) -> None:
+        self._events_count = 0
         if not self._callbacks:
             return
 
-        pool = await self.toloka_client.get_pool(self.pool_id)
+        pool = await _get_pool(self.toloka_client, self.pool_id)
         current_status = pool.status
 
         if current_status != self._previous_status:
+            self._events_count = 1
             logger.info('Pool %s status change: %s -> %s', self.pool_id, self._previous_status, current_status)
             if self._callbacks.get(current_status):
                 loop = asyncio.get_event_loop()
@@ -275,8 +450,13 @@ CallbackForAssignmentEventsType = Union[CallbackForAssignmentEventsSyncType, Cal
 class _CallbacksCursorConsumer:
     """Store cursor and related callbacks.
     Allow to run callbacks at fetched data and move the cursor in case of success.
+    If `chunk_size` is set, events are fetched and passed to callbacks by chunks, and the cursor is moved after each
+    chunk.
+    If `backfill_shards` is set, events are fetched with `BaseCursor.backfill`.
     """
     cursor: AssignmentCursor = attr.ib()
+    chunk_size: Optional[int] = attr.ib(default=None)
+    backfill_shards: Optional[int] = attr.ib(default=None)
     callbacks: List[CallbackForAssignmentEventsAsyncType] = attr.ib(factory=list, init=False)
 
     def get_unique_key(self) -> Tuple:
@@ -290,21 +470,38 @@ class _CallbacksCursorConsumer:
         self.callbacks.append(ensure_async(callback))
 
     @add_headers('streaming')
-    async def __call__(self, pool_id: str) -> None:
-        async with self.cursor.try_fetch_all() as fetched:
-            if not fetched:
-                return
+    async def __call__(self, pool_id: str) -> int:
+        """Returns the number of handled events."""
+
+        if self.chunk_size is None:
+            async with self.cursor.try_fetch_all(self.backfill_shards) as fetched:
+                await self._run_callbacks(pool_id, fetched)
+            return len(fetched)
+
+        events_count = 0
+        async for context in self.cursor.try_fetch_chunks(self.chunk_size, self.backfill_shards):
+            async with context as fetched:
+                await self._run_callbacks(pool_id, fetched)
+            events_count += len(fetched)
+            checkpoint = checkpoint_var.get()
+            if fetched and checkpoint is not None:
+                checkpoint()
+        return events_count
+
+    async def _run_callbacks(self, pool_id: str, fetched: List[AssignmentEvent]) -> None:
+        if not fetched:
+            return
 
-            logger.info('Got pool %s events count of type %s: %d', pool_id, fetched[0].event_type, len(fetched))
-            loop = asyncio.get_event_loop()
-            callback_by_task = {loop.create_task(callback(fetched)): callback
-                                for callback in self.callbacks}
-            done, _ = await asyncio.wait(callback_by_task)
-            errored = [task for task in done if task.exception() is not None]
-            if errored:
-                for task in errored:
-                    logger.error('Got error in callback: %s\n%s', callback_by_task[task], get_task_traceback(task))
-                raise ComplexException([task.exception() for task in errored])
+        logger.info('Got pool %s events count of type %s: %d', pool_id, fetched[0].event_type, len(fetched))
+        loop = asyncio.get_event_loop()
+        callback_by_task = {loop.create_task(callback(fetched)): callback
+                            for callback in self.callbacks}
+        done, _ = await asyncio.wait(callback_by_task)
+        errored = [task for task in done if task.exception() is not None]
+        if errored:
+            for task in errored:
+                logger.error('Got error in callback: %s\n%s', callback_by_task[task], get_task_traceback(task))
+            raise ComplexException([task.exception() for task in errored])
 
 
 @attr.s
@@ -327,6 +524,12 @@ class AssignmentsObserver(BasePoolObserver):
         pool_id: Pool ID.
         cursor_time_lag: Time lag for cursor. This controls time lag between assignments being added and them being
             seen by this observer. See BaseCursor.time_lag for details and reasoning behind this.
+        chunk_size: The maximum number of events passed to a callback at once. If set, a backlog of events is fetched
+            and handled by chunks: the cursor is moved and the Pipeline saves its state to the storage after each
+            successfully handled chunk. By default, all new events are passed to callbacks at once.
+        backfill_shards: If set, new events are fetched by this number of concurrent requests for time intervals.
+            It speeds up catching up with a long history of the pool. Use it with `chunk_size` to avoid loading the
+            whole history into memory.
 
     Examples:
         Send submitted assignments for verification.
@@ -341,6 +544,8 @@ class AssignmentsObserver(BasePoolObserver):
     """
 
     cursor_time_lag: datetime.timedelta = attr.ib(default=DEFAULT_LAG)
+    chunk_size: Optional[int] = attr.ib(default=None)
+    backfill_shards: Optional[int] = attr.ib(default=None)
     _callbacks: Dict[AssignmentEvent.Type, _CallbacksCursorConsumer] = attr.ib(factory=dict, init=False)
 
     def get_unique_key(self) -> Tuple:
@@ -383,7 +588,9 @@ class AssignmentsObserver(BasePoolObserver):
                 toloka_client=self.toloka_client,
                 time_lag=self.cursor_time_lag
             )
-            self._callbacks[event_type] = _CallbacksCursorConsumer(cursor)
+            self._callbacks[event_type] = _CallbacksCursorConsumer(
+                cursor, chunk_size=self.chunk_size, backfill_shards=self.backfill_shards,
+            )
         self._callbacks[event_type].add_callback(callback)
         return callback
 
@@ -414,6 +621,7 @@ class AssignmentsObserver(BasePoolObserver):
 
     @add_headers('streaming')
     async def __call__(self) -> None:
+        self._events_count = 0
         if not self._callbacks:
             return
 
@@ -430,3 +638,4 @@ class AssignmentsObserver(BasePoolObserver):
                 logger.error('Got error while handling pool %s assignment events of type: %s',
                              self.pool_id, event_type_by_task[task])
             raise ComplexException([task.exception() for task in errored])
+        self._events_count = sum(task.result() for task in done)
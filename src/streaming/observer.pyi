@@ -53,6 +53,7 @@ class BaseObserver:
     name: typing.Optional[str]
     _enabled: bool
     _deleted: bool
+    _events_count: typing.Optional[int]
 
 
 class BasePoolObserver(BaseObserver):
@@ -74,6 +75,7 @@ class BasePoolObserver(BaseObserver):
     name: typing.Optional[str]
     _enabled: bool
     _deleted: bool
+    _events_count: typing.Optional[int]
     toloka_client: toloka.util.async_utils.AsyncInterfaceWrapper[typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]]
     pool_id: str
 
@@ -156,6 +158,7 @@ class PoolStatusObserver(BasePoolObserver):
     name: typing.Optional[str]
     _enabled: bool
     _deleted: bool
+    _events_count: typing.Optional[int]
     toloka_client: toloka.util.async_utils.AsyncInterfaceWrapper[typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]]
     pool_id: str
     _callbacks: typing.Dict[toloka.client.pool.Pool.Status, typing.List[typing.Callable[[toloka.client.pool.Pool], typing.Awaitable[None]]]]
@@ -165,6 +168,9 @@ class PoolStatusObserver(BasePoolObserver):
 class _CallbacksCursorConsumer:
     """Store cursor and related callbacks.
     Allow to run callbacks at fetched data and move the cursor in case of success.
+    If `chunk_size` is set, events are fetched and passed to callbacks by chunks, and the cursor is moved after each
+    chunk.
+    If `backfill_shards` is set, events are fetched with `BaseCursor.backfill`.
     """
 
     def get_unique_key(self) -> typing.Tuple: ...
@@ -175,12 +181,19 @@ class _CallbacksCursorConsumer:
 
     async def __call__(self, pool_id: str) -> None: ...
 
-    def __init__(self, cursor: toloka.streaming.cursor.AssignmentCursor) -> None:
+    def __init__(
+        self,
+        cursor: toloka.streaming.cursor.AssignmentCursor,
+        chunk_size: typing.Optional[int] = None,
+        backfill_shards: typing.Optional[int] = None
+    ) -> None:
         """Method generated by attrs for class _CallbacksCursorConsumer.
         """
         ...
 
     cursor: toloka.streaming.cursor.AssignmentCursor
+    chunk_size: typing.Optional[int]
+    backfill_shards: typing.Optional[int]
     callbacks: typing.List[typing.Callable[[typing.List[toloka.streaming.event.AssignmentEvent]], typing.Awaitable[None]]]
 
 
@@ -203,6 +216,12 @@ class AssignmentsObserver(BasePoolObserver):
         pool_id: Pool ID.
         cursor_time_lag: Time lag for cursor. This controls time lag between assignments being added and them being
             seen by this observer. See BaseCursor.time_lag for details and reasoning behind this.
+        chunk_size: The maximum number of events passed to a callback at once. If set, a backlog of events is fetched
+            and handled by chunks: the cursor is moved and the Pipeline saves its state to the storage after each
+            successfully handled chunk. By default, all new events are passed to callbacks at once.
+        backfill_shards: If set, new events are fetched by this number of concurrent requests for time intervals.
+            It speeds up catching up with a long history of the pool. Use it with `chunk_size` to avoid loading the
+            whole history into memory.
 
     Examples:
         Send submitted assignments for verification.
@@ -256,6 +275,8 @@ class AssignmentsObserver(BasePoolObserver):
         toloka_client: typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient],
         pool_id: str,
         cursor_time_lag: datetime.timedelta = ...,
+        chunk_size: typing.Optional[int] = None,
+        backfill_shards: typing.Optional[int] = None,
         *,
         name: typing.Optional[str] = None
     ) -> None:
@@ -266,7 +287,10 @@ class AssignmentsObserver(BasePoolObserver):
     name: typing.Optional[str]
     _enabled: bool
     _deleted: bool
+    _events_count: typing.Optional[int]
     toloka_client: toloka.util.async_utils.AsyncInterfaceWrapper[typing.Union[toloka.client.TolokaClient, toloka.async_client.client.AsyncTolokaClient]]
     pool_id: str
     cursor_time_lag: datetime.timedelta
+    chunk_size: typing.Optional[int]
+    backfill_shards: typing.Optional[int]
     _callbacks: typing.Dict[toloka.streaming.event.AssignmentEvent.Type, _CallbacksCursorConsumer]
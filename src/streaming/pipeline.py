@@ -1,24 +1,36 @@
 __all__ = [
+    'AdaptivePeriod',
     'Pipeline',
 ]
 
 import asyncio
+import functools
+import heapq
 from enum import Enum
 
 import itertools
 import logging
 import signal
+import zlib
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta
 from typing import Any, AsyncGenerator, Container, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import attr.setters
 
-from .observer import BaseObserver
+from .observer import (
+    BaseObserver,
+    BasePoolObserver,
+    _PoolStatuses,
+    _RequestCache,
+    checkpoint_var,
+    pool_statuses_var,
+    request_cache_var,
+)
 from .storage import BaseStorage
 from ..util.async_utils import ComplexException
-from ..util._managing_headers import add_headers
+from ..util._managing_headers import add_headers, set_variable
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +47,25 @@ class _Worker:
         name: Unique key to be identified by.
         observer: BaseObserver object to run.
         should_resume: Current observer's should_resume state.
+        priority: Workers with higher priority are started first if the number of running workers is limited.
+        period: The effective period of the observer's calls. `None` until the observer is called for the first time.
+        events_count: The number of events got by the last observer's call. `None` if the observer doesn't report it.
     """
     name: str = attr.ib()
     observer: BaseObserver = attr.ib()
     should_resume: bool = attr.ib(default=False)
+    priority: int = attr.ib(default=0, kw_only=True)
+    period: Optional[timedelta] = attr.ib(default=None, kw_only=True)
+    events_count: Optional[int] = attr.ib(default=None, kw_only=True)
 
     @add_headers('streaming')
     async def __call__(self) -> None:
         if getattr(self.observer, '_enabled', True):
             await self.observer()
+            self.events_count = getattr(self.observer, '_events_count', None)
             self.should_resume = await self.observer.should_resume()
         else:
+            self.events_count = None
             self.should_resume = False
 
     def __hash__(self) -> int:
@@ -57,13 +77,18 @@ class _Worker:
         return self.name == other.name
 
     @classmethod
-    def _from_observer(cls, observer: BaseObserver) -> '_Worker':
-        return cls(str(observer.get_unique_key()), observer)
+    def _from_observer(cls, observer: BaseObserver, priority: int = 0) -> '_Worker':
+        return cls(str(observer.get_unique_key()), observer, priority=priority)
 
     @staticmethod
     def _no_one_should_resume(workers: Iterable['_Worker']) -> bool:
         return all(not worker.should_resume for worker in workers)
 
+    def _is_dirty(self) -> bool:
+        # An observer that got no events hasn't moved its cursors, so its saved state is still actual.
+        # Observers that don't report events are always saved.
+        return self.events_count != 0
+
     def _is_deleted(self) -> bool:
         return getattr(self.observer, '_deleted', False)
 
@@ -78,6 +103,89 @@ class IterationMode(Enum):
     FIRST_COMPLETED = asyncio.FIRST_COMPLETED
 
 
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class AdaptivePeriod:
+    """Adjusts the period of each observer's calls to the observer's activity.
+
+    The period starts from `Pipeline.period`. It's divided by `factor` after each call that got events and multiplied
+    by `factor` after each call that got nothing, within `min_period` and `max_period`. So busy pools are polled more
+    often, and idle pools are polled less often. Observers that don't report the number of got events are called with
+    `Pipeline.period`.
+
+    Attributes:
+        min_period: The minimum period of calls.
+        max_period: The maximum period of calls.
+        factor: The ratio between consecutive periods.
+
+    Example:
+        Poll busy pools every 10 seconds and idle pools up to every 10 minutes.
+
+        >>> pipeline = Pipeline(
+        >>>     period=timedelta(minutes=1),
+        >>>     adaptive_period=AdaptivePeriod(min_period=timedelta(seconds=10), max_period=timedelta(minutes=10)),
+        >>> )
+        ...
+    """
+
+    min_period: timedelta = timedelta(seconds=10)
+    max_period: timedelta = timedelta(minutes=10)
+    factor: float = 2.0
+
+    def __attrs_post_init__(self):
+        if not timedelta(0) < self.min_period <= self.max_period:
+            raise ValueError(f'Expected 0 < min_period <= max_period, got {self.min_period} and {self.max_period}')
+        if self.factor <= 1:
+            raise ValueError(f'factor must be greater than 1, got {self.factor}')
+
+    def get_next_period(self, period: timedelta, events_count: Optional[int]) -> timedelta:
+        """Calculates the period after a call that got `events_count` events."""
+
+        if events_count is None:
+            return period
+        if events_count:
+            period = period / self.factor
+        else:
+            period = period * self.factor
+        return max(self.min_period, min(self.max_period, period))
+
+
+class _WorkersLimiter:
+    """Limits the number of concurrently running workers. Waiting workers with higher priority are started first,
+    workers with the same priority are started in the order of arrival.
+    """
+
+    def __init__(self, limit: int):
+        self._free = limit
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @asynccontextmanager
+    async def acquire(self, priority: int):
+        if self._free and not self._waiters:
+            self._free -= 1
+        else:
+            future = asyncio.get_event_loop().create_future()
+            heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():  # The slot was passed to the cancelled worker.
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)  # Pass the slot to the next worker.
+                return
+        self._free += 1
+
+
 @attr.s
 class Pipeline:
     """An entry point for toloka streaming pipelines.
@@ -89,6 +197,14 @@ class Pipeline:
         storage: Optional storage object to save pipeline's state.
             Allow to recover from previous state in case of failure.
         iteration_mode: When to start new iteration. Default is `FIRST_COMPLETED`
+        max_concurrent_workers: The maximum number of observers running at the same time. Other observers due to run
+            wait for a free slot, observers with higher priority first. See `register`. By default, there is no limit.
+        jitter: A fraction of the period to spread observers' runs over. The first run of each observer is delayed by
+            an offset between 0 and `jitter * period` that depends on the observer name, and next runs keep that
+            phase. So observers registered together don't make requests at the same moments. Offsets are counted from
+            the start of the pipeline, so the phase is kept only within a run. Must be between 0 and 1. Default is 0.
+        adaptive_period: If set, each observer is called with its own period that depends on the number of events it
+            gets. See `AdaptivePeriod`. The effective periods are available as `Pipeline.RunState.periods`.
 
     Examples:
         Get assignments from segmentation pool and send them for verification to another pool.
@@ -138,9 +254,19 @@ class Pipeline:
     storage: Optional[BaseStorage] = attr.ib(default=None)
     iteration_mode: IterationMode = attr.ib(default=IterationMode.FIRST_COMPLETED)
     name: Optional[str] = attr.ib(default=None, kw_only=True)
+    max_concurrent_workers: Optional[int] = attr.ib(default=None, kw_only=True)
+    jitter: float = attr.ib(default=0.0, kw_only=True)
+    adaptive_period: Optional[AdaptivePeriod] = attr.ib(default=None, kw_only=True)
     _observers: Dict[Tuple, BaseObserver] = attr.ib(factory=dict, init=False)
+    _priorities: Dict[Tuple, int] = attr.ib(factory=dict, init=False)
     _got_sigint: bool = attr.ib(default=False, init=False)
 
+    def __attrs_post_init__(self):
+        if self.max_concurrent_workers is not None and self.max_concurrent_workers <= 0:
+            raise ValueError(f'max_concurrent_workers must be positive, got {self.max_concurrent_workers}')
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f'jitter must be between 0 and 1, got {self.jitter}')
+
     @contextmanager
     def _lock(self, key: str) -> ContextManager[Any]:
         if self.storage:
@@ -162,9 +288,9 @@ class Pipeline:
                 logger.info('No saved states found')
 
     def _storage_save(self, pipeline_key: str, workers: Iterable[_Worker]) -> None:
-        if self.storage:
+        observer_by_key = {worker.name: worker.observer for worker in workers}
+        if self.storage and observer_by_key:
             logger.info('Save state to: %s', type(self.storage).__name__)
-            observer_by_key = {worker.name: worker.observer for worker in workers}
             self.storage.save(pipeline_key, observer_by_key)
             logger.info('Saved count: %d', len(observer_by_key))
 
@@ -183,11 +309,12 @@ class Pipeline:
             for observer in self._observers.values()
         )))
 
-    def register(self, observer: BaseObserver) -> BaseObserver:
+    def register(self, observer: BaseObserver, priority: int = 0) -> BaseObserver:
         """Register given observer.
 
         Args:
             observer: Observer object.
+            priority: Observers with higher priority are started first if `max_concurrent_workers` is set.
 
         Returns:
             The same observer object. It's usable to write one-liners.
@@ -210,6 +337,7 @@ class Pipeline:
             raise ValueError(f'Failed to register observer to pipeline: observer with key {observer_key} is already '
                              f'registered')
         self._observers[observer_key] = observer
+        self._priorities[observer_key] = priority
         return observer
 
     def observers_iter(self) -> Iterator[BaseObserver]:
@@ -248,8 +376,9 @@ class Pipeline:
             if task.exception():
                 errored.append(task)
             else:
-                workers_to_dump.append(task.worker)
-                pending[task.worker] = task.start_time + self.period
+                if task.worker._is_dirty():
+                    workers_to_dump.append(task.worker)
+                pending[task.worker] = task.start_time + self._update_period(task.worker)
         self._storage_save(pipeline_key, workers_to_dump)
         if errored:
             asyncio.get_event_loop().remove_signal_handler(signal.SIGINT)
@@ -257,6 +386,15 @@ class Pipeline:
                 logger.error('Got error in: %s', task)
             raise ComplexException([task.exception() for task in errored])
 
+    def _update_period(self, worker: _Worker) -> timedelta:
+        if self.adaptive_period is None:
+            worker.period = self.period
+        else:
+            period = self.period if worker.period is None else worker.period
+            worker.period = self.adaptive_period.get_next_period(period, worker.events_count)
+            logger.debug('Period of %s: %s', worker.name, worker.period)
+        return worker.period
+
     @attr.s
     class RunState:
         """State of a single Pipeline run.
@@ -271,6 +409,16 @@ class Pipeline:
         waiting: Dict[_Worker, asyncio.Task] = attr.ib(on_setattr=attr.setters.frozen, factory=lambda: {})
         pending: Dict[_Worker, datetime] = attr.ib(on_setattr=attr.setters.frozen, factory=lambda: {})
 
+        @property
+        def periods(self) -> Dict[Tuple, timedelta]:
+            """Effective periods of observers' calls by observers' unique keys."""
+
+            return {
+                worker.observer.get_unique_key(): worker.period
+                for worker in self.workers
+                if worker.period is not None
+            }
+
         def update_observers(self, pipeline: 'Pipeline'):
             known_observers_keys = {worker.observer.get_unique_key() for worker in self.workers.keys()}
             new_observers = [
@@ -280,9 +428,12 @@ class Pipeline:
             ]
             if len(new_observers) > 0:
                 logger.info(f'New observers found in quantity: {len(new_observers)}')
-            new_workers = _OrderedSet(_Worker._from_observer(observer) for observer in new_observers)
+            new_workers = _OrderedSet(
+                _Worker._from_observer(observer, pipeline._priorities.get(observer.get_unique_key(), 0))
+                for observer in new_observers
+            )
             self.workers.update(new_workers)
-            self.pending.update({worker: datetime.min for worker in new_workers})
+            self.pending.update({worker: pipeline._get_first_start_time(worker) for worker in new_workers})
 
     def _create_state(self):
         state = Pipeline.RunState(pipeline_key=str(self._get_unique_key()))
@@ -292,11 +443,30 @@ class Pipeline:
             self._storage_load(state.pipeline_key, state.workers)
         return state
 
+    def _get_first_start_time(self, worker: _Worker) -> datetime:
+        if not self.jitter:
+            return datetime.min
+        # The offset depends on the worker name only, so workers are spread the same way in every run. It is counted
+        # from now, so the absolute phase changes after a restart
+        offset = zlib.crc32(worker.name.encode()) / 2 ** 32
+        return datetime.now() + self.period * self.jitter * offset
+
+    @staticmethod
+    async def _run_worker(worker: _Worker, limiter: Optional[_WorkersLimiter]) -> None:
+        if limiter is None:
+            await worker()
+            return
+        async with limiter.acquire(worker.priority):
+            await worker()
+
     async def run_manually(self) -> AsyncGenerator['Pipeline.RunState', None]:
         if not self._observers:
             raise ValueError('No observers registered')
 
         state = await self._initialize_run()
+        # Pools of all observers are refreshed together instead of separate requests for each observer
+        pool_statuses = _PoolStatuses(max_age=self.period)
+        limiter = _WorkersLimiter(self.max_concurrent_workers) if self.max_concurrent_workers else None
 
         # Check mode means that all workers should_run methods returned False. Setting check_mode to True has following
         # effects:
@@ -330,12 +500,22 @@ class Pipeline:
                     logger.info('Found observers to remove count: %d', len(to_remove))
                     for worker in to_remove:
                         self._observers.pop(worker.observer.get_unique_key())
+                        self._priorities.pop(worker.observer.get_unique_key(), None)
                         state.workers.pop(worker)
 
                 if not self._got_sigint:
                     logger.info('Observers to run count: %d', len(to_start))
-                    for worker in to_start:
-                        task = asyncio.get_event_loop().create_task(worker())
+                    # Observers started together often make the same requests, e.g. get the same pool
+                    request_cache = _RequestCache(max_age=self.period)
+                    pool_statuses.watch(
+                        worker.observer for worker in state.workers if isinstance(worker.observer, BasePoolObserver)
+                    )
+                    for worker in sorted(to_start, key=lambda worker: -worker.priority):
+                        # Observers handling events by chunks save their state after each chunk
+                        checkpoint = functools.partial(self._storage_save, state.pipeline_key, [worker])
+                        with set_variable(checkpoint_var, checkpoint), set_variable(request_cache_var, request_cache), \
+                                set_variable(pool_statuses_var, pool_statuses):
+                            task = asyncio.get_event_loop().create_task(self._run_worker(worker, limiter))
                         task.worker = worker
                         task.start_time = iteration_start
                         state.waiting[worker] = task
@@ -394,7 +574,9 @@ class Pipeline:
 
     async def run(self) -> None:
         async for state in self.run_manually():
-            start_soon = max(state.pending.values(), default=None)
+            # Observers scheduled at different times by jitter or adaptive periods are started on time
+            spread = self.jitter or self.adaptive_period is not None
+            start_soon = (min if spread else max)(state.pending.values(), default=None)
             sleep_time = (start_soon - datetime.now()).total_seconds()
             sleep_time = max(sleep_time, self.MIN_SLEEP_SECONDS)
             logger.info('Sleeping for %f seconds', sleep_time)
@@ -1,4 +1,5 @@
 __all__ = [
+    'AdaptivePeriod',
     'Pipeline',
 ]
 import asyncio
@@ -17,6 +18,9 @@ class _Worker:
         name: Unique key to be identified by.
         observer: BaseObserver object to run.
         should_resume: Current observer's should_resume state.
+        priority: Workers with higher priority are started first if the number of running workers is limited.
+        period: The effective period of the observer's calls. `None` until the observer is called for the first time.
+        events_count: The number of events got by the last observer's call. `None` if the observer doesn't report it.
     """
 
     async def __call__(self) -> None: ...
@@ -29,7 +33,11 @@ class _Worker:
         self,
         name: str,
         observer: toloka.streaming.observer.BaseObserver,
-        should_resume: bool = False
+        should_resume: bool = False,
+        *,
+        priority: int = 0,
+        period: typing.Optional[datetime.timedelta] = None,
+        events_count: typing.Optional[int] = None
     ) -> None:
         """Method generated by attrs for class _Worker.
         """
@@ -38,6 +46,9 @@ class _Worker:
     name: str
     observer: toloka.streaming.observer.BaseObserver
     should_resume: bool
+    priority: int
+    period: typing.Optional[datetime.timedelta]
+    events_count: typing.Optional[int]
 
 
 class IterationMode(enum.Enum):
@@ -50,6 +61,54 @@ class IterationMode(enum.Enum):
     FIRST_COMPLETED = 'FIRST_COMPLETED'
 
 
+class AdaptivePeriod:
+    """Adjusts the period of each observer's calls to the observer's activity.
+
+    The period starts from `Pipeline.period`. It's divided by `factor` after each call that got events and multiplied
+    by `factor` after each call that got nothing, within `min_period` and `max_period`. So busy pools are polled more
+    often, and idle pools are polled less often. Observers that don't report the number of got events are called with
+    `Pipeline.period`.
+
+    Attributes:
+        min_period: The minimum period of calls.
+        max_period: The maximum period of calls.
+        factor: The ratio between consecutive periods.
+
+    Example:
+        Poll busy pools every 10 seconds and idle pools up to every 10 minutes.
+
+        >>> pipeline = Pipeline(
+        >>>     period=timedelta(minutes=1),
+        >>>     adaptive_period=AdaptivePeriod(min_period=timedelta(seconds=10), max_period=timedelta(minutes=10)),
+        >>> )
+        ...
+    """
+
+    def get_next_period(
+        self,
+        period: datetime.timedelta,
+        events_count: typing.Optional[int]
+    ) -> datetime.timedelta:
+        """Calculates the period after a call that got `events_count` events.
+        """
+        ...
+
+    def __init__(
+        self,
+        *,
+        min_period: datetime.timedelta = ...,
+        max_period: datetime.timedelta = ...,
+        factor: float = 2.0
+    ) -> None:
+        """Method generated by attrs for class AdaptivePeriod.
+        """
+        ...
+
+    min_period: datetime.timedelta
+    max_period: datetime.timedelta
+    factor: float
+
+
 class Pipeline:
     """An entry point for toloka streaming pipelines.
     Allow you to register multiple observers and call them periodically
@@ -60,6 +119,14 @@ class Pipeline:
         storage: Optional storage object to save pipeline's state.
             Allow to recover from previous state in case of failure.
         iteration_mode: When to start new iteration. Default is `FIRST_COMPLETED`
+        max_concurrent_workers: The maximum number of observers running at the same time. Other observers due to run
+            wait for a free slot, observers with higher priority first. See `register`. By default, there is no limit.
+        jitter: A fraction of the period to spread observers' runs over. The first run of each observer is delayed by
+            an offset between 0 and `jitter * period` that depends on the observer name, and next runs keep that
+            phase. So observers registered together don't make requests at the same moments. Offsets are counted from
+            the start of the pipeline, so the phase is kept only within a run. Must be between 0 and 1. Default is 0.
+        adaptive_period: If set, each observer is called with its own period that depends on the number of events it
+            gets. See `AdaptivePeriod`. The effective periods are available as `Pipeline.RunState.periods`.
 
     Examples:
         Get assignments from segmentation pool and send them for verification to another pool.
@@ -103,11 +170,16 @@ class Pipeline:
         ...
     """
 
-    def register(self, observer: toloka.streaming.observer.BaseObserver) -> toloka.streaming.observer.BaseObserver:
+    def register(
+        self,
+        observer: toloka.streaming.observer.BaseObserver,
+        priority: int = 0
+    ) -> toloka.streaming.observer.BaseObserver:
         """Register given observer.
 
         Args:
             observer: Observer object.
+            priority: Observers with higher priority are started first if `max_concurrent_workers` is set.
 
         Returns:
             The same observer object. It's usable to write one-liners.
@@ -173,7 +245,10 @@ class Pipeline:
         storage: typing.Optional[toloka.streaming.storage.BaseStorage] = None,
         iteration_mode: IterationMode = IterationMode.FIRST_COMPLETED,
         *,
-        name: typing.Optional[str] = None
+        name: typing.Optional[str] = None,
+        max_concurrent_workers: typing.Optional[int] = None,
+        jitter: float = 0.0,
+        adaptive_period: typing.Optional[AdaptivePeriod] = None
     ) -> None:
         """Method generated by attrs for class Pipeline.
         """
@@ -183,5 +258,9 @@ class Pipeline:
     storage: typing.Optional[toloka.streaming.storage.BaseStorage]
     iteration_mode: IterationMode
     name: typing.Optional[str]
+    max_concurrent_workers: typing.Optional[int]
+    jitter: float
+    adaptive_period: typing.Optional[AdaptivePeriod]
     _observers: typing.Dict[typing.Tuple, toloka.streaming.observer.BaseObserver]
+    _priorities: typing.Dict[typing.Tuple, int]
     _got_sigint: bool
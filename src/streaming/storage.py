@@ -7,18 +7,31 @@ __all__ = [
 import collections
 import json
 import os
+import pickle
 import shutil
-from contextlib import contextmanager
+import tempfile
+from concurrent import futures
+from contextlib import contextmanager, suppress
 from io import BytesIO
-from typing import Any, ContextManager, Dict, Optional, Sequence, TypeVar
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Sequence, TypeVar
 from typing_extensions import Protocol
 
 import attr
 
 from .locker import BaseLocker, FileLocker
-from ..util.stored import get_base64_digest, get_stored_meta, pickle_dumps_base64, pickle_loads_base64
+from ..util.stored import (
+    PICKLE_DEFAULT_PROTOCOL,
+    get_base64_digest,
+    get_stored_meta,
+    is_stored_binary,
+    pickle_dumps_base64,
+    pickle_dumps_binary,
+    pickle_loads_base64,
+    pickle_loads_binary,
+)
 
 Pickleable = TypeVar('Pickleable')
+T = TypeVar('T')
 
 
 class BaseStorage:
@@ -63,6 +76,12 @@ class JSONLocalStorage(BaseExternalLockerStorage):
     Attributes:
         dirname: Directory to store pipeline's state files. By default, "/tmp".
         locker: Optional locker object. By default, FileLocker with the same dirname is used.
+        binary: If `True`, states are saved in a compact binary format: a short JSON header followed by the pickled
+            object, without base64 encoding and indentation. Files in both formats are loaded, but toloka-kit versions
+            before this option can't load binary files. By default, `False`.
+
+    Files are written to a temporary file first and then renamed, so an interrupted save never leaves a partially
+    written state.
 
     Example:
         Allow pipeline to dump it's state to the local storage.
@@ -83,6 +102,7 @@ class JSONLocalStorage(BaseExternalLockerStorage):
 
     dirname: str = attr.ib(default='/tmp')
     locker: Optional[BaseLocker] = attr.ib(factory=DefaultNearbyFileLocker, kw_only=True)
+    binary: bool = attr.ib(default=False, kw_only=True)
 
     def __attrs_post_init__(self) -> None:
         if isinstance(self.locker, self.DefaultNearbyFileLocker):
@@ -104,13 +124,28 @@ class JSONLocalStorage(BaseExternalLockerStorage):
             if not os.path.isdir(base_path):
                 raise
 
+        meta = get_stored_meta()
         for key, value in data.items():
-            with open(self._join_minor_path(base_path, key), 'w') as file:
-                data = {'base_key': base_key,
-                        'key': key,
-                        'value': pickle_dumps_base64(value).decode(),
-                        'meta': get_stored_meta()}
-                json.dump(data, file, indent=4)
+            if self.binary:
+                content = pickle_dumps_binary(value, {'base_key': base_key, 'key': key, 'meta': meta})
+            else:
+                content = json.dumps({'base_key': base_key,
+                                      'key': key,
+                                      'value': pickle_dumps_base64(value).decode(),
+                                      'meta': meta}, indent=4).encode()
+            self._write_atomically(self._join_minor_path(base_path, key), content)
+
+    @staticmethod
+    def _write_atomically(path: str, content: bytes) -> None:
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
 
     def load(self, base_key: str, keys: Sequence[str]) -> Optional[Dict[str, Pickleable]]:
         base_path = self._get_base_path(base_key)
@@ -120,9 +155,11 @@ class JSONLocalStorage(BaseExternalLockerStorage):
         res: Dict[str, Pickleable] = {}
         for key in keys:
             try:
-                with open(self._join_minor_path(base_path, key), 'r') as file:
+                with open(self._join_minor_path(base_path, key), 'rb') as file:
                     content = file.read()
-                    if content:
+                    if is_stored_binary(content):
+                        res[key] = pickle_loads_binary(content)
+                    elif content:
                         res[key] = pickle_loads_base64(json.loads(content)['value'])
             except FileNotFoundError:
                 pass
@@ -173,6 +210,13 @@ class S3Storage(BaseExternalLockerStorage):
     Attributes:
         bucket: Boto3 bucket object.
         locker: Optional locker object. By default, no locker is used.
+        binary: If `True`, states are saved in a compact binary format without base64 encoding. Objects in both
+            formats are loaded, but toloka-kit versions before this option can't load binary objects. By default,
+            `False`.
+        max_workers: The maximum number of objects uploaded or downloaded in parallel threads. By default, 8.
+        manifest: If `True`, states of all pipeline's observers are saved in a single object. It takes one request to
+            save or load the pipeline, but every save uploads all states. States saved without this option are still
+            loaded. By default, `False`.
 
     Examples:
         Create new instance.
@@ -197,7 +241,18 @@ class S3Storage(BaseExternalLockerStorage):
         >>> await pipeline.run()  # Will load from storage at the start and save after each iteration.
         ...
     """
+    MANIFEST_SUFFIX = 'manifest'
+
     bucket: BucketType = attr.ib()
+    binary: bool = attr.ib(default=False, kw_only=True)
+    max_workers: int = attr.ib(default=8, kw_only=True)
+    manifest: bool = attr.ib(default=False, kw_only=True)
+    _manifests: Dict[str, Dict[str, bytes]] = attr.ib(factory=dict, init=False, repr=False, eq=False)
+
+    @max_workers.validator
+    def _validate_max_workers(self, attribute, value) -> None:
+        if value <= 0:
+            raise ValueError('max_workers must be positive')
 
     @classmethod
     def _is_not_found_error(cls, exc: Exception) -> bool:
@@ -212,37 +267,96 @@ class S3Storage(BaseExternalLockerStorage):
         """Each observer is being saved with the key prefixed by the base path."""
         return f'{base_path}_{get_base64_digest(key)}'
 
+    def _get_manifest_path(self, base_key: str) -> str:
+        return f'{self._get_base_path(base_key)}_{self.MANIFEST_SUFFIX}'
+
+    def _map(self, function: Callable[..., T], *iterables: Iterable) -> List[T]:
+        """Calls bucket methods in threads. The first error is raised after all calls are finished."""
+        args = list(zip(*iterables))
+        if self.max_workers == 1 or len(args) <= 1:
+            return [function(*arg) for arg in args]
+        with futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(args))) as executor:
+            return list(executor.map(lambda arg: function(*arg), args))
+
+    def _dumps(self, value: Any, header: Dict[str, str]) -> bytes:
+        if self.binary:
+            return pickle_dumps_binary(value, header)
+        return pickle_dumps_base64(value)
+
+    @staticmethod
+    def _loads(content: bytes) -> Any:
+        if is_stored_binary(content):
+            return pickle_loads_binary(content)
+        return pickle_loads_base64(content)
+
+    def _upload(self, path: str, content: bytes, metadata: Dict[str, str]) -> None:
+        self.bucket.upload_fileobj(BytesIO(content), path, ExtraArgs={'Metadata': metadata})
+
+    def _download(self, path: str) -> Optional[bytes]:
+        """Returns `None` if there is no such object."""
+        try:
+            with BytesIO() as file:
+                self.bucket.download_fileobj(path, file)
+                return file.getvalue()
+        except Exception as exc:
+            if self._is_not_found_error(exc):
+                return None
+            raise
+
     def save(self, base_key: str, data: Dict[str, Pickleable]) -> None:
+        meta = json.dumps(get_stored_meta(), ensure_ascii=True, indent=None, separators=(',', ':'))
+        if self.manifest:
+            self._save_manifest(base_key, data, meta)
+            return
+
         base_path = self._get_base_path(base_key)
+        paths, contents, metadatas = [], [], []
         for key, value in data.items():
-            stream = BytesIO(pickle_dumps_base64(value))
-            path = self._join_minor_path(base_path, key)
-            metadata = {'base_key': base_key,  # Metadata values should be strings.
-                        'key': key,
-                        'meta': json.dumps(get_stored_meta(), ensure_ascii=True, indent=None, separators=(',', ':'))}
-            self.bucket.upload_fileobj(stream, path, ExtraArgs={'Metadata': metadata})
-
-    def load(self, base_key: str, keys: Sequence[str]) -> Dict[str, Pickleable]:
-        base_path = self._get_base_path(base_key)
-
-        res: Dict[str, Pickleable] = {}
-        for key in keys:
-            path = self._join_minor_path(base_path, key)
-            try:
-                with BytesIO() as file:
-                    self.bucket.download_fileobj(path, file)
-                    file.seek(0)
-                    content = file.read()
-                    if content:
-                        res[key] = pickle_loads_base64(content)
-            except Exception as exc:
-                if self._is_not_found_error(exc):
-                    return None
-                raise
+            paths.append(self._join_minor_path(base_path, key))
+            contents.append(self._dumps(value, {'base_key': base_key, 'key': key}))
+            metadatas.append({'base_key': base_key,  # Metadata values should be strings.
+                              'key': key,
+                              'meta': meta})
+        self._map(self._upload, paths, contents, metadatas)
+
+    def _save_manifest(self, base_key: str, data: Dict[str, Pickleable], meta: str) -> None:
+        # Pipelines save only changed observers, so the rest of states are taken from the last saved manifest
+        states = self._manifests.get(base_key)
+        if states is None:
+            content = self._download(self._get_manifest_path(base_key))
+            states = self._loads(content) if content else {}
+        states = dict(states)
+        for key, value in data.items():
+            states[key] = pickle.dumps(value, protocol=PICKLE_DEFAULT_PROTOCOL)
+        self._upload(
+            self._get_manifest_path(base_key),
+            self._dumps(states, {'base_key': base_key}),
+            {'base_key': base_key, 'meta': meta},
+        )
+        self._manifests[base_key] = states
 
-        return res
+    def load(self, base_key: str, keys: Sequence[str]) -> Optional[Dict[str, Pickleable]]:
+        keys = list(keys)
+        if self.manifest:
+            content = self._download(self._get_manifest_path(base_key))
+            if content:
+                states = self._loads(content)
+                self._manifests[base_key] = states
+                return {key: pickle.loads(states[key]) for key in keys if key in states} or None
+
+        # States may be saved without the manifest before, so they are loaded one by one
+        base_path = self._get_base_path(base_key)
+        contents = self._map(self._download, [self._join_minor_path(base_path, key) for key in keys])
+        res = {key: self._loads(content) for key, content in zip(keys, contents) if content}
+        if self.manifest:
+            # The first manifest is saved with changed observers only, so it should include the rest of loaded states
+            self._manifests[base_key] = {
+                key: pickle.dumps(value, protocol=PICKLE_DEFAULT_PROTOCOL) for key, value in res.items()
+            }
+        return res or None
 
     def cleanup(self, base_key: str, keys: Sequence[str], lock: Any) -> None:
         self.bucket.objects.filter(Prefix=self._get_base_path(base_key)).delete()
+        self._manifests.pop(base_key, None)
         if self.locker:
             self.locker.cleanup(lock)
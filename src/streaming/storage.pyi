@@ -57,6 +57,12 @@ class JSONLocalStorage(BaseExternalLockerStorage):
     Attributes:
         dirname: Directory to store pipeline's state files. By default, "/tmp".
         locker: Optional locker object. By default, FileLocker with the same dirname is used.
+        binary: If `True`, states are saved in a compact binary format: a short JSON header followed by the pickled
+            object, without base64 encoding and indentation. Files in both formats are loaded, but toloka-kit versions
+            before this option can't load binary files. By default, `False`.
+
+    Files are written to a temporary file first and then renamed, so an interrupted save never leaves a partially
+    written state.
 
     Example:
         Allow pipeline to dump it's state to the local storage.
@@ -100,7 +106,8 @@ class JSONLocalStorage(BaseExternalLockerStorage):
         self,
         dirname: str = '/tmp',
         *,
-        locker: typing.Optional[toloka.streaming.locker.BaseLocker] = ...
+        locker: typing.Optional[toloka.streaming.locker.BaseLocker] = ...,
+        binary: bool = False
     ) -> None:
         """Method generated by attrs for class JSONLocalStorage.
         """
@@ -108,6 +115,7 @@ class JSONLocalStorage(BaseExternalLockerStorage):
 
     locker: typing.Optional[toloka.streaming.locker.BaseLocker]
     dirname: str
+    binary: bool
 
 
 class ObjectSummaryCollection(typing_extensions.Protocol):
@@ -167,6 +175,13 @@ class S3Storage(BaseExternalLockerStorage):
     Attributes:
         bucket: Boto3 bucket object.
         locker: Optional locker object. By default, no locker is used.
+        binary: If `True`, states are saved in a compact binary format without base64 encoding. Objects in both
+            formats are loaded, but toloka-kit versions before this option can't load binary objects. By default,
+            `False`.
+        max_workers: The maximum number of objects uploaded or downloaded in parallel threads. By default, 8.
+        manifest: If `True`, states of all pipeline's observers are saved in a single object. It takes one request to
+            save or load the pipeline, but every save uploads all states. States saved without this option are still
+            loaded. By default, `False`.
 
     Examples:
         Create new instance.
@@ -202,7 +217,7 @@ class S3Storage(BaseExternalLockerStorage):
         self,
         base_key: str,
         keys: typing.Sequence[str]
-    ) -> typing.Dict[str, Pickleable]: ...
+    ) -> typing.Optional[typing.Dict[str, Pickleable]]: ...
 
     def cleanup(
         self,
@@ -215,7 +230,10 @@ class S3Storage(BaseExternalLockerStorage):
         self,
         bucket: BucketType,
         *,
-        locker: typing.Optional[toloka.streaming.locker.BaseLocker] = None
+        locker: typing.Optional[toloka.streaming.locker.BaseLocker] = None,
+        binary: bool = False,
+        max_workers: int = 8,
+        manifest: bool = False
     ) -> None:
         """Method generated by attrs for class S3Storage.
         """
@@ -223,3 +241,7 @@ class S3Storage(BaseExternalLockerStorage):
 
     locker: typing.Optional[toloka.streaming.locker.BaseLocker]
     bucket: BucketType
+    binary: bool
+    max_workers: int
+    manifest: bool
+    _manifests: typing.Dict[str, typing.Dict[str, bytes]]
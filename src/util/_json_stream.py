@@ -0,0 +1,252 @@
+__all__ = [
+    'JSONArrayStreamParser',
+]
+
+import re
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import simplejson
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITERS = frozenset(' \t\n\r,]}')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURE_SPECIAL = re.compile(r'["\[\]{}]')
+
+
+def _is_delimited(buffer: str, pos: int) -> bool:
+    return pos < len(buffer) and buffer[pos] in _DELIMITERS
+
+
+class _ValueScanner:
+    """Finds the end of a JSON object, array or string that may be split across several chunks.
+
+    Brackets and string state are tracked between calls, so every character of the value is scanned only once.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def scan(self, text: str, pos: int = 0) -> Optional[int]:
+        """Scans `text` from `pos` and returns the position after the end of the value or `None` if it continues."""
+
+        while True:
+            if self._escaped:
+                if pos == len(text):
+                    return None
+                self._escaped = False
+                pos += 1
+            elif self._in_string:
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+                if match.group() == '\\':
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                    if self._depth == 0:
+                        return pos
+            else:
+                match = _STRUCTURE_SPECIAL.search(text, pos)
+                if match is None:
+                    return None
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in '[{':
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return pos
+
+
+class _State(Enum):
+    BEFORE_ROOT = 'BEFORE_ROOT'
+    BEFORE_FIRST_KEY = 'BEFORE_FIRST_KEY'
+    BEFORE_KEY = 'BEFORE_KEY'
+    AFTER_KEY = 'AFTER_KEY'
+    BEFORE_VALUE = 'BEFORE_VALUE'
+    AFTER_VALUE = 'AFTER_VALUE'
+    BEFORE_FIRST_ITEM = 'BEFORE_FIRST_ITEM'
+    BEFORE_ITEM = 'BEFORE_ITEM'
+    AFTER_ITEM = 'AFTER_ITEM'
+    DONE = 'DONE'
+
+
+class JSONArrayStreamParser:
+    """Push parser that extracts items of a JSON array from text fed in arbitrary chunks.
+
+    Only the unparsed tail of the input is kept in memory, so a large response body may be processed item by item
+    while it is still being downloaded.
+
+    Args:
+        parse_float: A function used to parse JSON floats.
+        items_field: If set, the input is expected to be an object and the array is the value of this key. Other
+            keys of the object are parsed as a whole and are available in the `fields` attribute.
+
+    Example:
+        >>> parser = JSONArrayStreamParser()
+        >>> parser.feed('[{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> parser.feed(': 2}]')
+        [{'a': 2}]
+        >>> parser.close()
+        ...
+
+        >>> parser = JSONArrayStreamParser(items_field='items')
+        >>> parser.feed('{"items": [1, 2], "has_more": false}')
+        [1, 2]
+        >>> parser.close()
+        >>> parser.fields
+        {'has_more': False}
+        ...
+    """
+
+    def __init__(self, parse_float=Decimal, items_field: Optional[str] = None):
+        self._decoder = simplejson.JSONDecoder(parse_float=parse_float)
+        self._items_field = items_field
+        self._buffer = ''
+        # Chunks of a value that is not fully received yet. They are joined only when the value ends
+        self._pending_chunks: List[str] = []
+        self._scanner: Optional[_ValueScanner] = None
+        self._state = _State.BEFORE_ROOT
+        self._key = None
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, text: str) -> List[Any]:
+        """Adds the next chunk of the input and returns items that were completed by it."""
+
+        if self._scanner is not None:
+            self._pending_chunks.append(text)
+            if self._scanner.scan(text) is None:
+                return []
+            self._join_pending_chunks()
+        else:
+            self._buffer += text
+        items = []
+        pos = self._parse(items, final=False)
+        self._buffer = self._buffer[pos:]
+        return items
+
+    def close(self) -> List[Any]:
+        """Signals the end of the input and returns the remaining items.
+
+        Raises:
+            simplejson.JSONDecodeError: The input is not a complete JSON array or object.
+        """
+
+        self._join_pending_chunks()
+        items = []
+        pos = self._parse(items, final=True)
+        self._buffer = self._buffer[pos:]
+        if self._state is not _State.DONE:
+            raise simplejson.JSONDecodeError('Unexpected end of JSON input', self._buffer, len(self._buffer))
+        if self._buffer.strip():
+            raise simplejson.JSONDecodeError('Extra data', self._buffer, 0)
+        return items
+
+    def _join_pending_chunks(self) -> None:
+        self._buffer += ''.join(self._pending_chunks)
+        self._pending_chunks = []
+        self._scanner = None
+
+    def _decode(self, buffer: str, pos: int, final: bool):
+        """Decodes a complete value starting at `pos` or returns `None` if more input is needed."""
+
+        if not final and buffer[pos] in '[{"':
+            # Decoding is tried only when the end of the value is found, otherwise a large value received
+            # in many chunks would be decoded from the start after each of them
+            scanner = _ValueScanner()
+            if scanner.scan(buffer, pos) is None:
+                self._scanner = scanner
+                return None
+            return self._decoder.raw_decode(buffer, pos)
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except simplejson.JSONDecodeError:
+            if final:
+                raise
+            return None  # the value is not fully received yet
+        # A number or a literal is complete only when it is followed by a delimiter,
+        # otherwise it may continue in the next chunk (e.g. "0." + "125")
+        if not final and not isinstance(value, (dict, list, str)) and not _is_delimited(buffer, end):
+            return None
+        return value, end
+
+    def _end_array(self) -> None:
+        self._state = _State.DONE if self._items_field is None else _State.AFTER_VALUE
+
+    def _parse(self, items: List[Any], final: bool) -> int:
+        buffer = self._buffer
+        pos = 0
+        while self._state is not _State.DONE:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            state = self._state
+
+            if state is _State.BEFORE_ROOT:
+                expected = '[' if self._items_field is None else '{'
+                if char != expected:
+                    raise simplejson.JSONDecodeError(f'Expecting "{expected}"', buffer, pos)
+                self._state = _State.BEFORE_FIRST_ITEM if self._items_field is None else _State.BEFORE_FIRST_KEY
+                pos += 1
+            elif state is _State.AFTER_ITEM:
+                if char == ',':
+                    self._state = _State.BEFORE_ITEM
+                elif char == ']':
+                    self._end_array()
+                else:
+                    raise simplejson.JSONDecodeError('Expecting "," or "]"', buffer, pos)
+                pos += 1
+            elif state is _State.BEFORE_FIRST_ITEM and char == ']':
+                self._end_array()
+                pos += 1
+            elif state is _State.BEFORE_FIRST_ITEM or state is _State.BEFORE_ITEM:
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                item, pos = decoded
+                items.append(item)
+                self._state = _State.AFTER_ITEM
+            elif state is _State.BEFORE_FIRST_KEY and char == '}':
+                self._state = _State.DONE
+                pos += 1
+            elif state is _State.BEFORE_FIRST_KEY or state is _State.BEFORE_KEY:
+                if char != '"':
+                    raise simplejson.JSONDecodeError('Expecting property name enclosed in double quotes', buffer, pos)
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                self._key, pos = decoded
+                self._state = _State.AFTER_KEY
+            elif state is _State.AFTER_KEY:
+                if char != ':':
+                    raise simplejson.JSONDecodeError('Expecting ":" delimiter', buffer, pos)
+                self._state = _State.BEFORE_VALUE
+                pos += 1
+            elif state is _State.BEFORE_VALUE and self._key == self._items_field and char == '[':
+                self._state = _State.BEFORE_FIRST_ITEM
+                pos += 1
+            elif state is _State.BEFORE_VALUE:
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break
+                self.fields[self._key], pos = decoded
+                self._state = _State.AFTER_VALUE
+            elif state is _State.AFTER_VALUE:
+                if char == ',':
+                    self._state = _State.BEFORE_KEY
+                elif char == '}':
+                    self._state = _State.DONE
+                else:
+                    raise simplejson.JSONDecodeError('Expecting "," or "}"', buffer, pos)
+                pos += 1
+        return pos
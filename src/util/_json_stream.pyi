@@ -0,0 +1,54 @@
+__all__ = [
+    'JSONArrayStreamParser',
+]
+import decimal
+import typing
+
+
+class JSONArrayStreamParser:
+    """Push parser that extracts items of a JSON array from text fed in arbitrary chunks.
+
+    Only the unparsed tail of the input is kept in memory, so a large response body may be processed item by item
+    while it is still being downloaded.
+
+    Args:
+        parse_float: A function used to parse JSON floats.
+        items_field: If set, the input is expected to be an object and the array is the value of this key. Other
+            keys of the object are parsed as a whole and are available in the `fields` attribute.
+
+    Example:
+        >>> parser = JSONArrayStreamParser()
+        >>> parser.feed('[{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> parser.feed(': 2}]')
+        [{'a': 2}]
+        >>> parser.close()
+        ...
+
+        >>> parser = JSONArrayStreamParser(items_field='items')
+        >>> parser.feed('{"items": [1, 2], "has_more": false}')
+        [1, 2]
+        >>> parser.close()
+        >>> parser.fields
+        {'has_more': False}
+        ...
+    """
+
+    def __init__(
+        self,
+        parse_float=decimal.Decimal,
+        items_field: typing.Optional[str] = None
+    ): ...
+
+    def feed(self, text: str) -> typing.List[typing.Any]:
+        """Adds the next chunk of the input and returns items that were completed by it.
+        """
+        ...
+
+    def close(self) -> typing.List[typing.Any]:
+        """Signals the end of the input and returns the remaining items.
+
+        Raises:
+            simplejson.JSONDecodeError: The input is not a complete JSON array or object.
+        """
+        ...
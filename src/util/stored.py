@@ -2,16 +2,21 @@ __all__ = [
     'PICKLE_DEFAULT_PROTOCOL',
     'get_base64_digest',
     'get_stored_meta',
+    'is_stored_binary',
     'pickle_dumps_base64',
+    'pickle_dumps_binary',
     'pickle_loads_base64',
+    'pickle_loads_binary',
 ]
 
 import base64
 import datetime
 import hashlib
+import json
 import os
 import pickle
 import socket
+import struct
 import sys
 import time
 
@@ -20,6 +25,9 @@ from ..__version__ import __version__
 
 STORAGE_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
 PICKLE_DEFAULT_PROTOCOL = 4
+# Binary stored objects are: the magic, the length of the header, the JSON header and the pickled object.
+BINARY_MAGIC = b'TKS1'
+BINARY_HEADER_LENGTH = struct.Struct('>I')
 
 
 def get_base64_digest(key: str) -> str:
@@ -46,3 +54,23 @@ def pickle_dumps_base64(obj) -> bytes:
 
 def pickle_loads_base64(dumped) -> object:
     return pickle.loads(base64.b64decode(dumped if isinstance(dumped, bytes) else dumped.encode()))
+
+
+def pickle_dumps_binary(obj, header: dict) -> bytes:
+    header_bytes = json.dumps(header, ensure_ascii=True, separators=(',', ':')).encode()
+    return b''.join((
+        BINARY_MAGIC,
+        BINARY_HEADER_LENGTH.pack(len(header_bytes)),
+        header_bytes,
+        pickle.dumps(obj, protocol=PICKLE_DEFAULT_PROTOCOL),
+    ))
+
+
+def is_stored_binary(dumped: bytes) -> bool:
+    return dumped.startswith(BINARY_MAGIC)
+
+
+def pickle_loads_binary(dumped: bytes) -> object:
+    offset = len(BINARY_MAGIC)
+    header_length, = BINARY_HEADER_LENGTH.unpack_from(dumped, offset)
+    return pickle.loads(memoryview(dumped)[offset + BINARY_HEADER_LENGTH.size + header_length:])
@@ -2,8 +2,11 @@ __all__ = [
     'PICKLE_DEFAULT_PROTOCOL',
     'get_base64_digest',
     'get_stored_meta',
+    'is_stored_binary',
     'pickle_dumps_base64',
+    'pickle_dumps_binary',
     'pickle_loads_base64',
+    'pickle_loads_binary',
 ]
 PICKLE_DEFAULT_PROTOCOL = 4
 
@@ -17,3 +20,12 @@ def pickle_dumps_base64(obj) -> bytes: ...
 
 
 def pickle_loads_base64(dumped) -> object: ...
+
+
+def pickle_dumps_binary(obj, header: dict) -> bytes: ...
+
+
+def is_stored_binary(dumped: bytes) -> bool: ...
+
+
+def pickle_loads_binary(dumped: bytes) -> object: ...
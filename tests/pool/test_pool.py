@@ -3,6 +3,7 @@ import logging
 from operator import itemgetter
 from urllib.parse import urlparse, parse_qs
 
+import attr
 import httpx
 import pytest
 import simplejson
@@ -409,6 +410,56 @@ def test_update_pool(respx_mock, toloka_client, toloka_url, pool_map_with_readon
     assert updated_pool == client.unstructure(result)
 
 
+def test_save_pool(respx_mock, toloka_client, toloka_url, pool_map_with_readonly):
+    sent_requests = []
+
+    def pools(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'save_pool',
+            'X-Low-Level-Method': 'patch_pool' if request.method == 'PATCH' else 'update_pool',
+        }
+        check_headers(request, expected_headers)
+
+        sent_requests.append((request.method, simplejson.loads(request.content)))
+        return httpx.Response(json={**pool_map_with_readonly, **simplejson.loads(request.content)}, status_code=200)
+
+    respx_mock.patch(f'{toloka_url}/pools/21').mock(side_effect=pools)
+    respx_mock.put(f'{toloka_url}/pools/21').mock(side_effect=pools)
+
+    respx_mock.get(f'{toloka_url}/pools/21').mock(
+        return_value=httpx.Response(json=pool_map_with_readonly, status_code=200),
+    )
+
+    # Only pools returned by the client are tracked
+    assert client.structure(pool_map_with_readonly, client.pool.Pool).get_changed_fields() is None
+
+    # Not changed pool is not sent
+    pool = toloka_client.get_pool('21')
+    assert pool.get_changed_fields() == set()
+    assert toloka_client.save_pool(pool) is pool
+    assert sent_requests == []
+
+    # Only the priority is changed, so the pool is patched
+    pool.priority = 42
+    pool = toloka_client.save_pool(pool)
+    assert sent_requests == [('PATCH', {'priority': 42})]
+    assert pool.priority == 42
+    assert pool.get_changed_fields() == set()
+
+    # Other fields are sent by update
+    pool.private_name = 'updated name'
+    pool.priority = 43
+    pool = toloka_client.save_pool(pool)
+    assert sent_requests[1] == ('PUT', {**pool_map_with_readonly, 'priority': 43, 'private_name': 'updated name'})
+
+    # Changes of a pool created locally are unknown
+    local_pool = attr.evolve(pool)
+    assert local_pool.get_changed_fields() is None
+    toloka_client.save_pool(local_pool)
+    assert [method for method, _ in sent_requests] == ['PATCH', 'PUT', 'PUT']
+
+
 def test_patch_pool(respx_mock, toloka_client, toloka_url, pool_map_with_readonly):
     raw_result = {**pool_map_with_readonly, 'priority': 42}
 
@@ -283,3 +283,51 @@ def test_extendable_enum_union_autocast(test_extendable_enum, non_attr_class):
     assert func(['a', 'b', 'field_2']) == [test_extendable_enum.A, test_extendable_enum.B, test_extendable_enum.field_2]
     non_attr_class_instance = non_attr_class(1)
     assert func(non_attr_class_instance) == non_attr_class_instance
+
+
+def test_structure_lazy(test_enum):  # noqa: F811
+    class Nested(BaseTolokaObject):
+        value: int
+
+    class LazyObject(BaseTolokaObject):
+        enum_field: test_enum = attribute(autocast=True)
+        nested: List[Nested]
+        renamed: str = attribute(origin='originalName')
+        with_factory: Dict[str, str] = attribute(factory=dict)
+
+    data = {'enum_field': 'a', 'nested': [{'value': 1}], 'originalName': 'name', 'unknown_field': 'unknown_value'}
+    lazy = LazyObject.structure_lazy(data)
+    assert type(lazy) is LazyObject
+    assert 'nested' not in lazy.__dict__
+    assert lazy.unknown_field == 'unknown_value'
+
+    assert lazy.nested == [Nested(value=1)]
+    assert 'nested' in lazy.__dict__
+    assert 'enum_field' not in lazy.__dict__
+    assert lazy.enum_field == test_enum.A
+    assert lazy.renamed == 'name'
+    assert '_lazy_data' in lazy.__dict__
+    assert lazy.with_factory == {}
+    assert '_lazy_data' not in lazy.__dict__
+
+    eager = structure(data, LazyObject)
+    lazy = LazyObject.structure_lazy(data)
+    assert lazy == eager
+    assert eager == lazy
+    assert unstructure(lazy) == unstructure(eager)
+
+    lazy.renamed = 'new name'
+    assert lazy != eager
+    assert unstructure(lazy)['originalName'] == 'new name'
+
+
+def test_structure_lazy_missing_required_field():
+    class LazyObject(BaseTolokaObject):
+        required_field: str = attribute(required=True)
+        optional_field: str
+
+    with pytest.raises(TypeError) as eager_exc:
+        structure({'optional_field': 'value'}, LazyObject)
+    with pytest.raises(TypeError) as lazy_exc:
+        LazyObject.structure_lazy({'optional_field': 'value'})
+    assert str(lazy_exc.value) == str(eager_exc.value)
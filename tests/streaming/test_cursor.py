@@ -272,7 +272,7 @@ def test_user_skill_cursor(respx_mock, toloka_url, toloka_client, chunk_size, ev
         (
             BaseCursor,
             {
-                'await ensure_async(fetcher)': 'fetcher',
+                'await self._fetch_page(fetcher)': 'fetcher(self._request, sort=self._get_time_field())',
                 'async for item in _ByIdCursor': 'for item in _ByIdCursor',
             },
         ),
@@ -334,6 +334,8 @@ class MockCursor(BaseCursor):
                 filtered_items = [
                     item for item in filtered_items if item.mock_time_field <= request.mock_time_field_lte
                 ]
+            if request.mock_time_field_lt:
+                filtered_items = [item for item in filtered_items if item.mock_time_field < request.mock_time_field_lt]
             if request.id_gt:
                 filtered_items = [item for item in filtered_items if int(item.id) > int(request.id_gt)]
             return MockResponse(
@@ -400,3 +402,167 @@ def test_time_cursor_handles_eventual_consistency_correctly(raw_items):
     assert sorted([event.item for event in all_fetched], key=lambda item: item.id) == sorted(
         items_source, key=lambda item: item.id
     )
+
+
+def test_time_cursor_resumes_after_partially_consumed_page():
+    start_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    items_source = [
+        MockItem(id=str(i), mock_time_field=start_time + timedelta(seconds=i // 3)) for i in range(20)
+    ]
+    cursor = MockCursor(items_source, batch_limit=7, time_lag=timedelta(0))
+
+    all_fetched = []
+    for stop_after in itertools.cycle([1, 2, 5]):
+        fetched = list(itertools.islice(cursor, stop_after))
+        if not fetched:
+            break
+        all_fetched.extend(fetched)
+        cursor = pickle.loads(pickle.dumps(cursor))
+
+    assert [event.item for event in all_fetched] == items_source
+    # Only ids of items with the latest time are kept to filter out repeated items
+    request, _, seen_ids = cursor._get_state()
+    assert request.mock_time_field_gte == items_source[-1].mock_time_field
+    assert seen_ids == {'18', '19'}
+
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_time_cursor_try_fetch_chunks(use_async):
+    start_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    items_source = [
+        MockItem(id=str(i), mock_time_field=start_time + timedelta(seconds=i // 2)) for i in range(10)
+    ]
+    cursor = MockCursor(items_source, batch_limit=3, time_lag=timedelta(0))
+
+    def fetch_chunks(fail_on_chunk=None):
+        chunks = []
+
+        async def run_async():
+            async for context in cursor.try_fetch_chunks(4):
+                async with context as events:
+                    if len(chunks) + 1 == fail_on_chunk:
+                        raise ValueError('Failed to handle events')
+                    chunks.append(events)
+
+        def run_sync():
+            for context in cursor.try_fetch_chunks(4):
+                with context as events:
+                    if len(chunks) + 1 == fail_on_chunk:
+                        raise ValueError('Failed to handle events')
+                    chunks.append(events)
+
+        try:
+            if use_async:
+                asyncio.new_event_loop().run_until_complete(run_async())
+            else:
+                run_sync()
+        except ValueError:
+            pass
+        return [[event.item.id for event in chunk] for chunk in chunks]
+
+    assert fetch_chunks(fail_on_chunk=2) == [['0', '1', '2', '3']]
+    # The failed chunk is fetched again
+    assert fetch_chunks() == [['4', '5', '6', '7'], ['8', '9']]
+    items_source.append(MockItem(id='10', mock_time_field=start_time + timedelta(seconds=5)))
+    assert fetch_chunks() == [['10']]
+    assert fetch_chunks() == [[]]
+
+    with pytest.raises(ValueError):
+        cursor.try_fetch_chunks(0)
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_time_cursor_backfill(ordered):
+    start_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    items_source = [
+        MockItem(id=str(i), mock_time_field=start_time + timedelta(seconds=i // 3)) for i in range(50)
+    ]
+    cursor = MockCursor(items_source, batch_limit=4, time_lag=timedelta(0))
+
+    def backfill(**kwargs):
+        async def run_async():
+            return [event async for event in cursor.backfill(**kwargs)]
+
+        return [event.item for event in asyncio.new_event_loop().run_until_complete(run_async())]
+
+    fetched = backfill(shards=3, ordered=ordered, queue_size=2)
+    if ordered:
+        assert fetched == items_source
+    else:
+        assert sorted(fetched, key=lambda item: int(item.id)) == items_source
+    request, _, seen_ids = cursor._get_state()
+    assert request.mock_time_field_gte == items_source[-1].mock_time_field
+    assert seen_ids == {'48', '49'}
+
+    new_item = MockItem(id='50', mock_time_field=items_source[-1].mock_time_field)
+    items_source.append(new_item)
+    assert backfill(shards=3, ordered=ordered) == [new_item]
+    assert backfill(shards=3, ordered=ordered) == []
+
+    with pytest.raises(ValueError):
+        backfill(shards=0)
+
+
+def test_time_cursor_try_fetch_chunks_with_backfill():
+    start_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    items_source = [
+        MockItem(id=str(i), mock_time_field=start_time + timedelta(seconds=i // 2)) for i in range(30)
+    ]
+    cursor = MockCursor(items_source, batch_limit=3, time_lag=timedelta(0))
+
+    async def run_async():
+        chunks = []
+        async for context in cursor.try_fetch_chunks(8, backfill_shards=4):
+            async with context as events:
+                chunks.append([event.item for event in events])
+        return chunks
+
+    chunks = asyncio.new_event_loop().run_until_complete(run_async())
+    assert [len(chunk) for chunk in chunks] == [8, 8, 8, 6]
+    assert list(itertools.chain(*chunks)) == items_source
+
+    with pytest.raises(ValueError):
+        list(cursor.try_fetch_chunks(8, backfill_shards=4))
+
+
+def test_time_cursor_prefetch_pages():
+    start_time = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    # Items 12-15 have the same time and are fetched by id after the page with the same time in all items
+    items_source = [
+        MockItem(id=str(i), mock_time_field=start_time + timedelta(seconds=min(i, 12) if i < 16 else i))
+        for i in range(20)
+    ]
+    log = []
+
+    class LoggingCursor(MockCursor):
+        def _get_fetcher(self):
+            fetcher = super()._get_fetcher()
+
+            async def _fetcher(request, **kwargs):
+                await asyncio.sleep(0)
+                response = fetcher(request, **kwargs)
+                log.append(f'fetched {[item.id for item in response.items]}')
+                return response
+
+            return _fetcher
+
+    cursor = LoggingCursor(items_source, batch_limit=4, time_lag=timedelta(0))
+    cursor.prefetch_pages = 2
+
+    async def run_async():
+        events = []
+        async for event in cursor:
+            log.append(f'handled {event.item.id}')
+            events.append(event)
+            await asyncio.sleep(0)
+        return events
+
+    events = asyncio.new_event_loop().run_until_complete(run_async())
+    assert [event.item for event in events] == items_source
+    # The next page is requested before the current page is handled
+    assert log.index("fetched ['3', '4', '5', '6']") < log.index('handled 3')
+    assert cursor._prefetcher is None
+
+    items_source.append(MockItem(id='20', mock_time_field=start_time + timedelta(seconds=20)))
+    events = asyncio.new_event_loop().run_until_complete(run_async())
+    assert [event.item.id for event in events] == ['20']
@@ -3,18 +3,18 @@ import copy
 import datetime
 import logging
 import pickle
-from typing import ClassVar, List, Set, Tuple
+from typing import ClassVar, List, Optional, Set, Tuple
 
 import attr
 import httpx
 import pytest
 from toloka.async_client import AsyncTolokaClient
-from toloka.client import unstructure
+from toloka.client import Pool, unstructure
 from toloka.streaming import Pipeline
 from toloka.streaming.locker import NewerInstanceDetectedError
 from toloka.streaming.observer import AssignmentsObserver, BaseObserver, PoolStatusObserver
-from toloka.streaming.pipeline import IterationMode
-from toloka.streaming.storage import JSONLocalStorage
+from toloka.streaming.pipeline import AdaptivePeriod, IterationMode
+from toloka.streaming.storage import BaseExternalLockerStorage, JSONLocalStorage
 from toloka.util.async_utils import AsyncMultithreadWrapper, ComplexException
 
 from ..testutils.backend_mock import BackendSearchMock
@@ -91,6 +91,127 @@ def test_pipeline_errored_callback(respx_mock, toloka_url, sync_toloka_client, e
     assert events_expected == unstructure(handler.received)
 
 
+class ChunksHandler:
+    fail_on_chunk: ClassVar[Optional[int]] = None
+
+    def __init__(self):
+        self.chunks = []
+
+    def __call__(self, events):
+        if len(self.chunks) + 1 == self.fail_on_chunk:
+            raise ValueError('Raised from callback')
+        self.chunks.append([event.assignment.id for event in events])
+
+
+def test_pipeline_chunked_observer_saves_progress(
+    respx_mock, toloka_url, sync_toloka_client, existing_backend_assignments, tmp_path,
+):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=3)
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=backend)
+    respx_mock.get(f'{toloka_url}/pools/100').respond(json={'id': '100', 'status': 'CLOSED'})
+    ids = [item['id'] for item in storage]
+
+    def run_pipeline(handler):
+        pipeline = Pipeline(datetime.timedelta(milliseconds=100), storage=JSONLocalStorage(dirname=str(tmp_path)))
+        observer = pipeline.register(AssignmentsObserver(sync_toloka_client, pool_id='100', chunk_size=3))
+        observer.on_submitted(handler)
+        asyncio.new_event_loop().run_until_complete(pipeline.run())
+
+    handler = ChunksHandler()
+    ChunksHandler.fail_on_chunk = 3
+    with pytest.raises(ComplexException):
+        run_pipeline(handler)
+    assert handler.chunks == [ids[:3], ids[3:6]]
+
+    # A new pipeline loads the state saved after the last successfully handled chunk
+    handler = ChunksHandler()
+    ChunksHandler.fail_on_chunk = None
+    run_pipeline(handler)
+    assert handler.chunks == [ids[:3], ids[3:6], ids[6:]]
+
+
+def test_assignments_observer_with_backfill_shards_requests_page_once(
+    respx_mock, toloka_url, sync_toloka_client, existing_backend_assignments, new_backend_assignments,
+):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=100)
+    assignments_route = respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=backend)
+
+    observer = AssignmentsObserver(sync_toloka_client, pool_id='100', backfill_shards=4)
+    submitted = []
+    observer.on_submitted(lambda events: submitted.extend(event.assignment.id for event in events))
+    loop = asyncio.new_event_loop()
+
+    # Each poll gets all new events in a single page, so shards are not started and the page is not requested again
+    for new_items in [[], new_backend_assignments, []]:
+        storage.extend(new_items)
+        calls_count = assignments_route.call_count
+        loop.run_until_complete(observer())
+        assert assignments_route.call_count == calls_count + 1
+    assert submitted == [item['id'] for item in storage]
+
+
+def test_pipeline_coalesces_observers_requests(respx_mock, toloka_url, sync_toloka_client, existing_backend_assignments):
+    storage = [item for item in existing_backend_assignments if item['status'] != 'ACTIVE']
+    backend = BackendSearchMock(storage, limit=3)
+    assignments_route = respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=backend)
+    pool_route = respx_mock.get(f'{toloka_url}/pools/100').respond(json={'id': '100', 'status': 'CLOSED'})
+
+    submitted = []
+    statuses = []
+    pipeline = Pipeline(datetime.timedelta(seconds=10))
+    pipeline.register(AssignmentsObserver(sync_toloka_client, pool_id='100')).on_submitted(submitted.extend)
+    pipeline.register(AssignmentsObserver(sync_toloka_client, pool_id='100', name='accepted')).on_accepted(list)
+    pipeline.register(PoolStatusObserver(sync_toloka_client, pool_id='100')).on_status_change(
+        lambda pool: statuses.append(pool.status)
+    )
+    asyncio.new_event_loop().run_until_complete(pipeline.run())
+
+    assert [event.assignment.id for event in submitted] == [item['id'] for item in storage]
+    assert statuses == [Pool.Status.CLOSED]
+    # Two iterations: the second one checks that no observer should resume. The pool is got once per period
+    assert pool_route.call_count == 1
+    active_calls = [call for call in assignments_route.calls if call.request.url.params.get('status') == 'ACTIVE']
+    assert len(active_calls) == 2
+
+
+def test_pipeline_refreshes_pools_in_batches(respx_mock, toloka_url, sync_toloka_client):
+    pools = [{'id': str(pool_id), 'project_id': '10', 'status': 'CLOSED'} for pool_id in range(100, 1100)]
+
+    def find_pools(request):
+        params = request.url.params
+        items = [pool for pool in pools if pool['project_id'] == params.get('project_id', pool['project_id'])]
+        for param, compare in [('id_gte', int.__ge__), ('id_gt', int.__gt__), ('id_lte', int.__le__)]:
+            if param in params:
+                items = [pool for pool in items if compare(int(pool['id']), int(params[param]))]
+        limit = int(params['limit'])
+        return httpx.Response(json={'items': items[:limit], 'has_more': len(items) > limit}, status_code=200)
+
+    find_pools_route = respx_mock.get(f'{toloka_url}/pools').mock(side_effect=find_pools)
+    get_pool_route = respx_mock.get(url__regex=rf'{toloka_url}/pools/\d+').mock(
+        side_effect=lambda request: httpx.Response(200, json=pools[int(request.url.path.split('/')[-1]) - 100])
+    )
+    respx_mock.get(f'{toloka_url}/assignments').respond(json={'items': [], 'has_more': False})
+
+    statuses = []
+    pipeline = Pipeline(datetime.timedelta(seconds=10))
+    # The pool 1099 is far from others, so it's requested separately
+    for pool_id in ['100', '101', '102', '1099']:
+        pipeline.register(PoolStatusObserver(sync_toloka_client, pool_id=pool_id)).on_status_change(
+            lambda pool: statuses.append(pool.id)
+        )
+        pipeline.register(AssignmentsObserver(sync_toloka_client, pool_id=pool_id)).on_accepted(list)
+    asyncio.new_event_loop().run_until_complete(pipeline.run())
+
+    assert sorted(statuses) == ['100', '101', '102', '1099']
+    # Pools of both iterations are got by a single page of the 100-1099 range and a separate request
+    assert find_pools_route.call_count == 1
+    assert get_pool_route.call_count == 1
+    assert find_pools_route.calls[0].request.url.params['id_gte'] == '100'
+    assert find_pools_route.calls[0].request.url.params['id_lte'] == '1099'
+
+
 # do not test async client using wrapper to prevent nested asyncio loops
 @pytest.mark.parametrize('use_async', [False, True])
 def test_pipeline(respx_mock, toloka_url, sync_toloka_client, use_async, existing_backend_assignments, new_backend_assignments):
@@ -462,6 +583,148 @@ def test_async_observers():
     ] == CountingObserver.history
 
 
+def test_pipeline_limits_concurrent_workers():
+
+    @attr.s
+    class LimitedObserver:
+        running = []
+        started = []
+        max_running = 0
+
+        name: str = attr.ib()
+
+        def get_unique_key(self):
+            return self.name
+
+        async def __call__(self):
+            self.running.append(self.name)
+            self.started.append(self.name)
+            LimitedObserver.max_running = max(LimitedObserver.max_running, len(self.running))
+            await asyncio.sleep(0.05)
+            self.running.remove(self.name)
+
+        async def should_resume(self):
+            return False
+
+    pipeline = Pipeline(period=datetime.timedelta(milliseconds=100), max_concurrent_workers=2)
+    for name in ['low_1', 'low_2', 'low_3']:
+        pipeline.register(LimitedObserver(name))
+    pipeline.register(LimitedObserver('high'), priority=1)
+
+    asyncio.new_event_loop().run_until_complete(pipeline.run())
+
+    assert LimitedObserver.max_running == 2
+    assert LimitedObserver.started[:4] == ['high', 'low_1', 'low_2', 'low_3']
+    # The second iteration checks that no one should resume
+    assert LimitedObserver.started[4] == 'high'
+    assert sorted(LimitedObserver.started[4:]) == ['high', 'low_1', 'low_2', 'low_3']
+
+
+def test_pipeline_jitter():
+    pipeline = Pipeline(period=datetime.timedelta(seconds=60), jitter=0.5)
+    start_times = []
+    for name in ['first', 'second', 'third']:
+        pipeline.register(BaseObserver(name=name))
+    for _ in range(2):
+        state = Pipeline.RunState(pipeline_key='key')
+        before = datetime.datetime.now()
+        state.update_observers(pipeline)
+        start_times.append([(time - before).total_seconds() for time in state.pending.values()])
+
+    # Offsets from the start of a run are different for observers but the same in every run
+    assert all(0 <= offset <= 30.1 for offset in start_times[0])
+    assert len({round(offset) for offset in start_times[0]}) == 3
+    assert [round(offset) for offset in start_times[0]] == [round(offset) for offset in start_times[1]]
+
+    with pytest.raises(ValueError):
+        Pipeline(jitter=2)
+    with pytest.raises(ValueError):
+        Pipeline(max_concurrent_workers=0)
+
+
+def test_adaptive_period():
+    adaptive_period = AdaptivePeriod(
+        min_period=datetime.timedelta(seconds=10), max_period=datetime.timedelta(seconds=60), factor=2,
+    )
+    period = datetime.timedelta(seconds=30)
+    assert adaptive_period.get_next_period(period, 5) == datetime.timedelta(seconds=15)
+    assert adaptive_period.get_next_period(datetime.timedelta(seconds=15), 5) == datetime.timedelta(seconds=10)
+    assert adaptive_period.get_next_period(period, 0) == datetime.timedelta(seconds=60)
+    assert adaptive_period.get_next_period(datetime.timedelta(seconds=60), 0) == datetime.timedelta(seconds=60)
+    assert adaptive_period.get_next_period(period, None) == period
+
+    with pytest.raises(ValueError):
+        AdaptivePeriod(min_period=datetime.timedelta(seconds=10), max_period=datetime.timedelta(seconds=5))
+    with pytest.raises(ValueError):
+        AdaptivePeriod(factor=1)
+
+
+def test_pipeline_adaptive_period():
+
+    @attr.s
+    class EventsObserver(BaseObserver):
+        events_counts: List[int] = attr.ib(factory=list)
+
+        async def __call__(self):
+            self._events_count = self.events_counts.pop(0) if self.events_counts else 0
+
+        async def should_resume(self):
+            return bool(self.events_counts)
+
+    pipeline = Pipeline(
+        period=datetime.timedelta(milliseconds=40),
+        adaptive_period=AdaptivePeriod(
+            min_period=datetime.timedelta(milliseconds=10), max_period=datetime.timedelta(milliseconds=80), factor=2,
+        ),
+    )
+    busy = pipeline.register(EventsObserver(name='busy', events_counts=[3, 2, 0, 0, 0, 0]))
+
+    async def run():
+        periods = []
+        async for state in pipeline.run_manually():
+            periods.append(state.periods[busy.get_unique_key()])
+            await asyncio.sleep((min(state.pending.values()) - datetime.datetime.now()).total_seconds())
+        return periods
+
+    periods = asyncio.new_event_loop().run_until_complete(run())
+    assert [period.total_seconds() for period in periods] == [0.02, 0.01, 0.02, 0.04, 0.08]
+
+
+def test_pipeline_saves_only_dirty_observers():
+
+    @attr.s
+    class EventsObserver(BaseObserver):
+        events_counts: List[Optional[int]] = attr.ib(factory=list)
+
+        async def __call__(self):
+            self._events_count = self.events_counts.pop(0) if self.events_counts else 0
+
+        async def should_resume(self):
+            return bool(self.events_counts)
+
+    @attr.s
+    class StorageMock(BaseExternalLockerStorage):
+        saved: List[Set[str]] = attr.ib(factory=list)
+
+        def save(self, base_key, data):
+            self.saved.append(set(data))
+
+        def load(self, base_key, keys):
+            return None
+
+    storage = StorageMock()
+    pipeline = Pipeline(period=datetime.timedelta(milliseconds=10), storage=storage)
+    busy = pipeline.register(EventsObserver(name='busy', events_counts=[1, 2, 0]))
+    idle = pipeline.register(EventsObserver(name='idle', events_counts=[0, 0, 0]))
+    unknown = pipeline.register(EventsObserver(name='unknown', events_counts=[None, None, None]))
+    asyncio.new_event_loop().run_until_complete(pipeline.run())
+
+    busy_key, idle_key, unknown_key = (str(observer.get_unique_key()) for observer in (busy, idle, unknown))
+    assert all(idle_key not in keys for keys in storage.saved)
+    assert sum(busy_key in keys for keys in storage.saved) == 2
+    assert sum(unknown_key in keys for keys in storage.saved) == 3
+
+
 def test_two_pipeline_instances_run(
     respx_mock,
     toloka_url,
@@ -1,5 +1,6 @@
 import attr
 import json
+import threading
 import time
 import os
 import pytest
@@ -244,3 +245,154 @@ def test_id_locks(tmp_path, start_after_iteration, overlap):
         [{'locker._id': 0}] * start_after_iteration
         + ['NewerInstanceDetectedError'] * (iterations - start_after_iteration)
     ) == results['first'], results['first']
+
+
+def test_json_storage_binary(tmp_path, obj_to_store, base_encoded, key_encoded):
+    dirname = tmp_path / 'storage'
+    dirname.mkdir()
+
+    JSONLocalStorage(dirname=dirname).save('some_pipeline_key', {'old_key': obj_to_store})
+    storage = JSONLocalStorage(dirname=dirname, binary=True)
+    storage.save('some_pipeline_key', {'some_key': obj_to_store})
+
+    with open(dirname / f'JSONLocalStorage_{base_encoded}' / key_encoded, 'rb') as file:
+        assert file.read().startswith(b'TKS1')
+
+    expected = {'some_key': obj_to_store, 'old_key': obj_to_store}
+    assert expected == storage.load('some_pipeline_key', ['some_key', 'old_key', 'unknown_key'])
+    assert expected == JSONLocalStorage(dirname=dirname).load('some_pipeline_key', ['some_key', 'old_key'])
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_json_storage_writes_atomically(tmp_path, monkeypatch, obj_to_store, base_encoded, key_encoded, binary):
+    dirname = tmp_path / 'storage'
+    dirname.mkdir()
+    storage = JSONLocalStorage(dirname=dirname, binary=binary)
+    storage.save('some_pipeline_key', {'some_key': obj_to_store})
+
+    class Unpickleable:
+        def __reduce__(self):
+            raise RuntimeError('unpickleable')
+
+    with pytest.raises(RuntimeError):
+        storage.save('some_pipeline_key', {'some_key': Unpickleable()})
+
+    def replace_interrupted(src, dst):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, 'replace', replace_interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            storage.save('some_pipeline_key', {'some_key': {}})
+
+    assert [key_encoded] == os.listdir(dirname / f'JSONLocalStorage_{base_encoded}')
+    assert {'some_key': obj_to_store} == storage.load('some_pipeline_key', ['some_key'])
+
+
+@attr.s
+class InMemoryObjects:
+    bucket: 'InMemoryBucket' = attr.ib()
+    prefix: str = attr.ib(default='')
+
+    def filter(self, Prefix: str) -> 'InMemoryObjects':
+        return InMemoryObjects(self.bucket, Prefix)
+
+    def delete(self) -> None:
+        for key in list(self.bucket.contents):
+            if key.startswith(self.prefix):
+                del self.bucket.contents[key]
+
+
+@attr.s
+class NotFoundError(Exception):
+    response = attr.ib(factory=lambda: {'Error': {'Code': '404', 'Message': 'Not Found'}})
+
+
+@attr.s
+class InMemoryBucket:
+    """Implements BucketType and counts simultaneous requests."""
+
+    delay: float = attr.ib(default=0)
+    contents: Dict[str, bytes] = attr.ib(factory=dict)
+    requests_count: int = attr.ib(default=0)
+    max_simultaneous: int = attr.ib(default=0)
+    _simultaneous: int = attr.ib(default=0)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)
+
+    @property
+    def objects(self) -> InMemoryObjects:
+        return InMemoryObjects(self)
+
+    def _request(self):
+        with self._lock:
+            self.requests_count += 1
+            self._simultaneous += 1
+            self.max_simultaneous = max(self.max_simultaneous, self._simultaneous)
+        time.sleep(self.delay)
+        with self._lock:
+            self._simultaneous -= 1
+
+    def upload_fileobj(self, Fileobj: BytesIO, Key: str, *, ExtraArgs: Dict) -> None:
+        assert json.loads(ExtraArgs['Metadata']['meta'])
+        self._request()
+        self.contents[Key] = Fileobj.read()
+
+    def download_fileobj(self, Key: str, Fileobj: BytesIO) -> None:
+        self._request()
+        if Key not in self.contents:
+            raise NotFoundError()
+        Fileobj.write(self.contents[Key])
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_s3_storage_concurrent(binary):
+    bucket = InMemoryBucket(delay=0.05)
+    storage = S3Storage(bucket, binary=binary, max_workers=4)
+    data = {f'key-{i}': {'value': i} for i in range(12)}
+
+    storage.save('some_pipeline_key', data)
+    assert 12 == len(bucket.contents)
+    assert 4 == bucket.max_simultaneous
+
+    assert data == storage.load('some_pipeline_key', list(data) + ['unknown_key'])
+    assert storage.load('some_pipeline_key', ['unknown_key']) is None
+    assert storage.load('other_pipeline_key', list(data)) is None
+
+    storage.cleanup('some_pipeline_key', list(data), None)
+    assert not bucket.contents
+
+    with pytest.raises(ValueError):
+        S3Storage(bucket, max_workers=0)
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_s3_storage_manifest(binary):
+    bucket = InMemoryBucket()
+    S3Storage(bucket, binary=binary).save('some_pipeline_key', {'old_key': 'old'})
+
+    storage = S3Storage(bucket, binary=binary, manifest=True)
+    assert {'old_key': 'old'} == storage.load('some_pipeline_key', ['old_key', 'first_key'])
+
+    # Only changed states are saved, the old state is moved to the manifest anyway
+    storage.save('some_pipeline_key', {'first_key': 1, 'second_key': 2})
+    storage.save('some_pipeline_key', {'first_key': 3})
+    assert 2 == len(bucket.contents)
+
+    # A new instance gets saved states from the manifest only
+    bucket.requests_count = 0
+    keys = ['old_key', 'first_key', 'second_key']
+    storage = S3Storage(bucket, binary=binary, manifest=True)
+    assert {'old_key': 'old', 'first_key': 3, 'second_key': 2} == storage.load('some_pipeline_key', keys)
+    assert 1 == bucket.requests_count
+
+    storage.save('some_pipeline_key', {'second_key': 4})
+    assert 2 == bucket.requests_count
+    storage = S3Storage(bucket, binary=binary, manifest=True)
+    storage.save('some_pipeline_key', {'third_key': 5})
+    assert {'old_key': 'old', 'first_key': 3, 'second_key': 4, 'third_key': 5} == storage.load(
+        'some_pipeline_key', keys + ['third_key'],
+    )
+
+    storage.cleanup('some_pipeline_key', keys + ['third_key'], None)
+    assert not bucket.contents
+    assert storage.load('some_pipeline_key', ['first_key']) is None
@@ -7,9 +7,10 @@ import simplejson
 import toloka.client as client
 from httpx import QueryParams
 from toloka.client import Task
-from toloka.client.batch_create_results import TaskBatchCreateResult
+from toloka.client.batch_create_results import FieldValidationError, IdsBatchCreateResult, TaskBatchCreateResult
 from toloka.client.exceptions import FailedOperation, IncorrectActionsApiError
 from toloka.client.operations import Operation, TasksCreateOperation
+from toloka.client.upload_journal import UploadChunkStatus, UploadJournal
 
 from ..testutils.util_functions import (
     assert_async_object_creation_is_successful, assert_retried_async_object_creation_returns_existing_operation,
@@ -429,6 +430,300 @@ def test_create_tasks_sync_through_async_retry_failed_operation(
     )
 
 
+def test_create_tasks_sync_through_async_ids_only(
+    respx_mock, toloka_client, toloka_url, tasks_map, operation_success_map, create_tasks_log,
+):
+    respx_mock.post(f'{toloka_url}/tasks').mock(httpx.Response(json=operation_success_map, status_code=201))
+    respx_mock.get(url__regex=rf'{toloka_url}/operations/.*(?<!log)$').mock(
+        httpx.Response(json=operation_success_map, status_code=200)
+    )
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(
+        httpx.Response(json=create_tasks_log, status_code=200)
+    )
+    get_tasks_route = respx_mock.get(f'{toloka_url}/tasks')
+
+    result = toloka_client.create_tasks(
+        [client.structure(task, client.task.Task) for task in tasks_map],
+        skip_invalid_items=True,
+        ids_only=True,
+    )
+
+    assert not get_tasks_route.called
+    assert result == IdsBatchCreateResult.structure({
+        'items': {
+            '0': '00014495f0--60213f7c25a8b84e2ffb7a2c',
+            '1': '00014495f0--60213f7c25a8b84e2ffb7a3b',
+        },
+        'validation_errors': {
+            '2': {
+                'input_values.image': {
+                    'code': 'VALUE_REQUIRED',
+                    'message': 'Value must be present and not equal to null'
+                },
+                'input_values.imagis': {
+                    'code': 'VALUE_NOT_ALLOWED',
+                    'message': 'Unknown field name'
+                },
+            },
+        },
+    })
+    assert list(result.items) == ['0', '1']
+
+
+def test_create_tasks_sync_through_async_fetches_only_created_tasks(
+    respx_mock, toloka_client, toloka_url, tasks_map, operation_success_map, create_tasks_log,
+    created_tasks_21_map, created_tasks_22_map,
+):
+    foreign_task_map = {**created_tasks_22_map, 'id': '00014495f0--60213f7c25a8b84e2ffb7a30'}
+
+    def return_tasks_by_pool(request):
+        params = request.url.params
+        assert params['limit'] == '1'
+        assert 'id_gt' not in params, 'All created tasks were already found on the first page'
+        if params['pool_id'] == '21':
+            return httpx.Response(json={'items': [created_tasks_21_map], 'has_more': False}, status_code=200)
+        return httpx.Response(json={'items': [foreign_task_map, created_tasks_22_map], 'has_more': True}, status_code=200)
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(httpx.Response(json=operation_success_map, status_code=201))
+    respx_mock.get(url__regex=rf'{toloka_url}/operations/.*(?<!log)$').mock(
+        httpx.Response(json=operation_success_map, status_code=200)
+    )
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(
+        httpx.Response(json=create_tasks_log, status_code=200)
+    )
+    respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=return_tasks_by_pool)
+
+    result = toloka_client.create_tasks(
+        [client.structure(task, client.task.Task) for task in tasks_map],
+        skip_invalid_items=True,
+    )
+    assert result.items == {
+        '0': Task.structure(created_tasks_21_map),
+        '1': Task.structure(created_tasks_22_map),
+    }
+
+
+def test_create_tasks_from_generator_in_chunks(respx_mock, toloka_client, toloka_url, operation_success_map):
+    operation_id = UUID('281073ea-ab34-416e-a028-47421ff1b166')
+    submitted_chunks = {}
+
+    def create_tasks(request):
+        submitted_operation_id = request.url.params['operation_id']
+        submitted_chunks[submitted_operation_id] = simplejson.loads(request.content)
+        return httpx.Response(json={**operation_success_map, 'id': submitted_operation_id}, status_code=201)
+
+    def get_operation_log(request):
+        submitted_operation_id = request.url.path.split('/')[-2]
+        return httpx.Response(
+            json=[
+                {
+                    'input': task,
+                    # the last task of each chunk is invalid
+                    'output': {'task_id': f'task-{task["input_values"]["idx"]}'} if task['input_values']['idx'] % 2 == 0
+                    else {'input_values.idx': {'code': 'VALUE_NOT_ALLOWED', 'message': 'Odd index'}},
+                    'success': task['input_values']['idx'] % 2 == 0,
+                    'type': 'TASK_CREATE',
+                }
+                for task in submitted_chunks[submitted_operation_id]
+            ],
+            status_code=200,
+        )
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(side_effect=get_operation_log)
+
+    result = toloka_client.create_tasks(
+        (Task(pool_id='21', input_values={'idx': idx}) for idx in range(6)),
+        operation_id=operation_id,
+        skip_invalid_items=True,
+        ids_only=True,
+        chunk_size=2,
+        max_concurrent_chunks=2,
+    )
+
+    assert len(submitted_chunks) == 3
+    assert str(operation_id) in submitted_chunks
+    assert sorted(
+        task['input_values']['idx'] for chunk in submitted_chunks.values() for task in chunk
+    ) == list(range(6))
+    assert result.items == {'0': 'task-0', '2': 'task-2', '4': 'task-4'}
+    assert list(result.validation_errors) == ['1', '3', '5']
+
+    # Chunk operation ids are deterministic, so the same upload is not duplicated on retry
+    submitted_operation_ids = set(submitted_chunks)
+    submitted_chunks.clear()
+    toloka_client.create_tasks(
+        (Task(pool_id='21', input_values={'idx': idx}) for idx in range(6)),
+        operation_id=operation_id,
+        skip_invalid_items=True,
+        ids_only=True,
+        chunk_size=2,
+    )
+    assert set(submitted_chunks) == submitted_operation_ids
+
+
+def test_create_tasks_in_chunks_structures_validation_errors(
+    respx_mock, toloka_client, toloka_url, operation_success_map,
+):
+    submitted_chunks = {}
+
+    def create_tasks(request):
+        submitted_operation_id = request.url.params['operation_id']
+        submitted_chunks[submitted_operation_id] = simplejson.loads(request.content)
+        return httpx.Response(json={**operation_success_map, 'id': submitted_operation_id}, status_code=201)
+
+    def get_operation_log(request):
+        submitted_operation_id = request.url.path.split('/')[-2]
+        return httpx.Response(
+            json=[
+                {
+                    'input': task,
+                    'output': {'task_id': f'task-{task["input_values"]["idx"]}'} if task['input_values']['idx'] % 2 == 0
+                    else {'input_values.idx': {'code': 'VALUE_NOT_ALLOWED', 'message': 'Odd index'}},
+                    'success': task['input_values']['idx'] % 2 == 0,
+                    'type': 'TASK_CREATE',
+                }
+                for task in submitted_chunks[submitted_operation_id]
+            ],
+            status_code=200,
+        )
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(side_effect=get_operation_log)
+
+    # Every odd chunk fails as a whole, every even chunk is created
+    result = toloka_client.create_tasks(
+        (Task(pool_id='21', input_values={'idx': idx}) for idx in range(4)),
+        skip_invalid_items=True,
+        ids_only=True,
+        chunk_size=1,
+    )
+    assert result.items == {'0': 'task-0', '2': 'task-2'}
+    assert result.validation_errors == {
+        idx: {'input_values.idx': FieldValidationError(code='VALUE_NOT_ALLOWED', message='Odd index')}
+        for idx in ['1', '3']
+    }
+
+
+def test_create_tasks_resumes_upload_from_journal(
+    respx_mock, toloka_client, toloka_url, operation_success_map, tmp_path,
+):
+    operation_id = UUID('281073ea-ab34-416e-a028-47421ff1b166')
+    submitted_chunks = {}
+
+    def create_tasks(request):
+        submitted_operation_id = request.url.params['operation_id']
+        submitted_chunks[submitted_operation_id] = simplejson.loads(request.content)
+        return httpx.Response(json={**operation_success_map, 'id': submitted_operation_id}, status_code=201)
+
+    def get_operation_log(request):
+        submitted_operation_id = request.url.path.split('/')[-2]
+        return httpx.Response(
+            json=[
+                {
+                    'input': task,
+                    'output': {'task_id': f'task-{task["input_values"]["idx"]}'},
+                    'success': True,
+                    'type': 'TASK_CREATE',
+                }
+                for task in submitted_chunks[submitted_operation_id]
+            ],
+            status_code=200,
+        )
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(side_effect=get_operation_log)
+
+    def generate_tasks(crash_at=None):
+        for idx in range(6):
+            if idx == crash_at:
+                raise RuntimeError('Process crashed')
+            yield Task(pool_id='21', input_values={'idx': idx})
+
+    journal = UploadJournal(str(tmp_path / 'journal.sqlite'))
+    create_kwargs = dict(operation_id=operation_id, ids_only=True, chunk_size=2, max_concurrent_chunks=1, journal=journal)
+
+    with pytest.raises(RuntimeError, match='Process crashed'):
+        toloka_client.create_tasks(generate_tasks(crash_at=4), **create_kwargs)
+    first_chunk_operation_id = str(operation_id)
+    assert journal.get_chunk(str(operation_id), 0).status == UploadChunkStatus.COMPLETED
+    assert journal.get_chunk(str(operation_id), 1).status == UploadChunkStatus.SUBMITTED
+    assert journal.get_chunk(str(operation_id), 2) is None
+
+    submitted_chunks.clear()
+    result = toloka_client.create_tasks(generate_tasks(), **create_kwargs)
+
+    assert first_chunk_operation_id not in submitted_chunks
+    assert sorted(task['input_values']['idx'] for chunk in submitted_chunks.values() for task in chunk) == [2, 3, 4, 5]
+    assert result.items == {str(idx): f'task-{idx}' for idx in range(6)}
+    assert all(
+        journal.get_chunk(str(operation_id), chunk_idx).status == UploadChunkStatus.COMPLETED
+        for chunk_idx in range(3)
+    )
+
+    with pytest.raises(ValueError, match='Pass the same objects and chunk_size'):
+        toloka_client.create_tasks(generate_tasks(), **{**create_kwargs, 'chunk_size': 3})
+
+
+def test_create_tasks_resume_downloads_completed_chunks(
+    respx_mock, toloka_client, toloka_url, operation_success_map, tmp_path,
+):
+    operation_id = UUID('281073ea-ab34-416e-a028-47421ff1b166')
+    submitted_chunks = {}
+
+    def create_tasks(request):
+        submitted_operation_id = request.url.params['operation_id']
+        submitted_chunks[submitted_operation_id] = simplejson.loads(request.content)
+        return httpx.Response(json={**operation_success_map, 'id': submitted_operation_id}, status_code=201)
+
+    def get_operation_log(request):
+        submitted_operation_id = request.url.path.split('/')[-2]
+        return httpx.Response(
+            json=[
+                {
+                    'input': task,
+                    'output': {'task_id': f'task-{task["input_values"]["idx"]}'},
+                    'success': True,
+                    'type': 'TASK_CREATE',
+                }
+                for task in submitted_chunks[submitted_operation_id]
+            ],
+            status_code=200,
+        )
+
+    def get_tasks(request):
+        params = request.url.params
+        assert params['pool_id'] == '21'
+        items = [
+            {'id': f'task-{idx}', 'pool_id': '21', 'input_values': {'idx': idx}}
+            for idx in range(6)
+            if params['id_gte'] <= f'task-{idx}' <= params['id_lte']
+        ]
+        return httpx.Response(json={'items': items, 'has_more': False}, status_code=200)
+
+    respx_mock.post(f'{toloka_url}/tasks').mock(side_effect=create_tasks)
+    respx_mock.get(re.compile(rf'{toloka_url}/operations/.*/log')).mock(side_effect=get_operation_log)
+    respx_mock.get(f'{toloka_url}/tasks').mock(side_effect=get_tasks)
+
+    def generate_tasks():
+        return (Task(pool_id='21', input_values={'idx': idx}) for idx in range(6))
+
+    journal = UploadJournal(str(tmp_path / 'journal.sqlite'))
+    create_kwargs = dict(operation_id=operation_id, chunk_size=2, max_concurrent_chunks=1, journal=journal)
+    first_result = toloka_client.create_tasks(generate_tasks(), **create_kwargs)
+    assert len(submitted_chunks) == 3
+
+    # All chunks are completed, so nothing is submitted again and tasks are downloaded by the journaled IDs
+    submitted_chunks.clear()
+    result = toloka_client.create_tasks(generate_tasks(), **create_kwargs)
+    assert not submitted_chunks
+    assert result == first_result
+    assert [task.id for _, task in sorted(result.items.items())] == [f'task-{idx}' for idx in range(6)]
+
+    with pytest.raises(ValueError, match='async_mode'):
+        toloka_client.create_tasks(generate_tasks(), **create_kwargs, async_mode=False)
+
+
 @pytest.fixture
 def create_tasks_operation_map():
     return {
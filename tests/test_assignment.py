@@ -1,13 +1,17 @@
+import gzip
+import pickle
 from datetime import datetime, timezone
 from operator import itemgetter
 from urllib.parse import urlparse, parse_qs
 from decimal import Decimal
+from typing import Optional
 
 import httpx
 import pytest
 import simplejson
 import toloka.client as client
 from httpx import QueryParams
+from toloka.client._search_streaming import get_decode_executor
 
 from .testutils.util_functions import check_headers
 
@@ -158,6 +162,233 @@ def test_get_assignments(respx_mock, toloka_client, toloka_url, assignment_map):
     assert assignments == client.unstructure(list(result))
 
 
+class ChunkedByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, content: bytes, chunk_size: int, fail_after: Optional[int] = None):
+        self.chunks = [content[start:start + chunk_size] for start in range(0, len(content), chunk_size)]
+        self.sent_chunks = 0
+        self.fail_after = fail_after
+
+    def _next_chunk(self, chunk):
+        if self.sent_chunks == self.fail_after:
+            raise httpx.ReadError('Connection reset by peer')
+        self.sent_chunks += 1
+        return chunk
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield self._next_chunk(chunk)
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield self._next_chunk(chunk)
+
+
+def test_get_assignments_parses_search_pages_incrementally(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(20)]
+    streams = []
+
+    def get_assignments(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_assignments',
+            'X-Low-Level-Method': 'find_assignments',
+        }
+        check_headers(request, expected_headers)
+
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:10]
+        content = simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}).encode()
+        streams.append(ChunkedByteStream(content, chunk_size=100))
+        return httpx.Response(stream=streams[-1], status_code=200)
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    result = toloka_client.get_assignments(pool_id='21')
+    first_assignment = next(iter(result))
+    assert assignments[0] == client.unstructure(first_assignment)
+    if isinstance(toloka_client, client.TolokaClient):
+        # The first assignment is yielded before the page is fully downloaded
+        assert streams[0].sent_chunks < len(streams[0].chunks)
+
+    assert assignments == client.unstructure(list(toloka_client.get_assignments(pool_id='21')))
+
+
+@pytest.mark.parametrize('pages', [False, True])
+def test_get_assignments_retries_interrupted_page(respx_mock, toloka_client, toloka_url, assignment_map, pages):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(20)]
+    requested_id_gt = []
+
+    def get_assignments(request):
+        id_gt = request.url.params.get('id_gt', None)
+        requested_id_gt.append(id_gt)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:10]
+        content = simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}).encode()
+        # The connection of the first request drops in the middle of the page
+        fail_after = len(content) // 200 if len(requested_id_gt) == 1 else None
+        return httpx.Response(200, stream=ChunkedByteStream(content, chunk_size=100, fail_after=fail_after))
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    if pages:
+        result = [item for page in toloka_client.get_assignments_pages(pool_id='21', batch_size=10) for item in page.items]
+    else:
+        result = list(toloka_client.get_assignments(pool_id='21', batch_size=10))
+    assert assignments == client.unstructure(result)
+    assert requested_id_gt[0] is None
+    if pages:
+        # Items of a failed page are not yielded, so the page is requested again
+        assert requested_id_gt[1] is None
+    else:
+        # The page is requested again starting after the last yielded item
+        assert requested_id_gt[1] is not None and requested_id_gt[1] < assignments[9]['id']
+
+
+def test_get_assignments_pages(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(25)]
+
+    def get_assignments(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_assignments_pages',
+            'X-Low-Level-Method': 'find_assignments',
+        }
+        check_headers(request, expected_headers)
+        assert request.url.params['limit'] == '10'
+
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:10]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200,
+        )
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    pages = list(toloka_client.get_assignments_pages(pool_id='21', batch_size=10))
+    assert [len(page.items) for page in pages] == [10, 10, 5]
+    assert [page.has_more for page in pages] == [True, True, False]
+    assert assignments == client.unstructure([assignment for page in pages for assignment in page.items])
+    assert pages[0].next_request == client.search_requests.AssignmentSearchRequest(
+        pool_id='21', id_gt=assignments[9]['id'],
+    )
+    assert pages[-1].next_request is None
+
+    # The iteration may be continued from a saved request
+    pages = list(toloka_client.get_assignments_pages(pages[1].next_request, batch_size=10))
+    assert assignments[20:] == client.unstructure(pages[0].items)
+
+
+@pytest.mark.parametrize('gzipped', [False, True])
+def test_get_assignments_adaptive_batch_size(respx_mock, toloka_client, toloka_url, assignment_map, gzipped):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(60)]
+    item_bytes = len(simplejson.dumps(assignments[0], use_decimal=True)) + 2
+    limits = []
+
+    def get_assignments(request):
+        limits.append(int(request.url.params['limit']))
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt]
+        items = items[:limits[-1]]
+        content = simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}).encode()
+        if gzipped:
+            # Decompressed bytes are compared with target_bytes
+            return httpx.Response(200, content=gzip.compress(content), headers={'Content-Encoding': 'gzip'})
+        return httpx.Response(200, content=content)
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    # A fixed limit is sent with every request
+    result = list(toloka_client.get_assignments(pool_id='21', batch_size=20))
+    assert assignments == client.unstructure(result)
+    assert limits == [20, 20, 20]
+
+    limits.clear()
+    batch_size = client.AdaptiveBatchSize(
+        min_size=2, max_size=20, initial_size=2, target_seconds=None, target_bytes=10 * item_bytes, max_growth=2,
+    )
+    result = list(toloka_client.get_assignments(pool_id='21', batch_size=batch_size))
+    assert assignments == client.unstructure(result)
+    # The limit grows no more than twice per request and stays below the target size of the response
+    assert limits[:4] == [2, 4, 8, 9]
+    assert set(limits[4:-1]) == {9}
+
+    limits.clear()
+    pages = list(toloka_client.get_assignments_pages(pool_id='21', batch_size=batch_size))
+    assert [len(page.items) for page in pages][:-1] == limits[:-1]
+    assert limits[:4] == [2, 4, 8, 9]
+
+
+def test_adaptive_batch_size():
+    batch_size = client.AdaptiveBatchSize(min_size=10, max_size=1000, target_seconds=1.0)
+    assert batch_size.get_initial_size() == 10
+    assert batch_size.get_next_size(10, items_count=10, seconds=0.01, bytes_count=None) == 40
+    assert batch_size.get_next_size(400, items_count=400, seconds=2.0, bytes_count=None) == 200
+    assert batch_size.get_next_size(400, items_count=400, seconds=100.0, bytes_count=None) == 10
+    assert batch_size.get_next_size(800, items_count=800, seconds=0.1, bytes_count=None) == 1000
+    assert batch_size.get_next_size(100, items_count=0, seconds=0.1, bytes_count=None) == 100
+
+    both = client.AdaptiveBatchSize(min_size=10, max_size=1000, target_seconds=1.0, target_bytes=1000)
+    # The most restrictive target wins
+    assert both.get_next_size(100, items_count=100, seconds=0.5, bytes_count=1000) == 100
+
+    with pytest.raises(ValueError):
+        client.AdaptiveBatchSize(min_size=100, max_size=10)
+    with pytest.raises(ValueError):
+        client.AdaptiveBatchSize(target_seconds=None)
+    with pytest.raises(ValueError):
+        client.AdaptiveBatchSize(min_size=10, initial_size=5)
+
+
+def test_get_assignments_with_decode_processes(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(20)]
+
+    def get_assignments(request):
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:10]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200,
+        )
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    toloka_client.decode_processes = 2
+    result = list(toloka_client.get_assignments(pool_id='21'))
+    assert all(isinstance(assignment, client.Assignment) for assignment in result)
+    assert assignments == client.unstructure(result)
+    # Forking a multi-threaded process may deadlock, so decoding processes are spawned
+    assert get_decode_executor(2)._mp_context.get_start_method() == 'spawn'
+
+    with pytest.raises(ValueError):
+        client.TolokaClient('fake-token', 'SANDBOX', decode_processes=0)
+
+
+def test_get_assignments_lazy_structuring(respx_mock, toloka_client, toloka_url, assignment_map):
+    assignments = [dict(assignment_map, id=f'assignment-i{i:02}d') for i in range(20)]
+
+    def get_assignments(request):
+        id_gt = request.url.params.get('id_gt', None)
+        items = [assignment for assignment in assignments if id_gt is None or assignment['id'] > id_gt][:10]
+        return httpx.Response(
+            text=simplejson.dumps({'items': items, 'has_more': items[-1]['id'] != assignments[-1]['id']}),
+            status_code=200,
+        )
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=get_assignments)
+
+    toloka_client.lazy_structuring = True
+    result = list(toloka_client.get_assignments(pool_id='21'))
+    assert all(type(assignment) is client.Assignment for assignment in result)
+    assert 'tasks' not in result[0].__dict__
+    assert result[0].status == client.Assignment.ACCEPTED
+    assert result[0].tasks[0].input_values == {'image': 'http://images.com/1.png'}
+
+    expected = [client.structure(assignment, client.Assignment) for assignment in assignments]
+    assert result == expected
+    assert assignments == client.unstructure(result)
+    assert pickle.loads(pickle.dumps(result)) == expected
+
+
 def test_assignment_from_json(assignment_map):
     assignment = client.structure(assignment_map, client.assignment.Assignment)
     assignment_json = simplejson.dumps(assignment_map, use_decimal=True, ensure_ascii=True)
@@ -219,6 +450,50 @@ def test_patch_assignment(respx_mock, toloka_client, toloka_url, assignment_map)
     assert raw_result == client.unstructure(result)
 
 
+def test_review_assignments(respx_mock, toloka_client, toloka_url, assignment_map):
+    def patch_assignment(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'review_assignments',
+            'X-Low-Level-Method': 'patch_assignment',
+        }
+        check_headers(request, expected_headers)
+
+        assignment_id = request.url.path.split('/')[-1]
+        if assignment_id == 'assignment-reviewed':
+            return httpx.Response(
+                json={'code': 'CONFLICT_STATE', 'message': 'Assignment is already accepted'}, status_code=409,
+            )
+        if assignment_id == 'assignment-missing':
+            return httpx.Response(json={'code': 'DOES_NOT_EXIST', 'message': 'Assignment not found'}, status_code=404)
+        raw_result = dict(assignment_map, id=assignment_id, **simplejson.loads(request.content))
+        return httpx.Response(text=simplejson.dumps(raw_result), status_code=200)
+
+    respx_mock.patch(url__regex=rf'{toloka_url}/assignments/.*').mock(side_effect=patch_assignment)
+
+    assignment_ids = [f'assignment-{i}' for i in range(20)] + ['assignment-reviewed', 'assignment-missing']
+    decisions = (
+        client.AssignmentReviewDecision(assignment_id=assignment_id, status='REJECTED', public_comment='Bad')
+        for assignment_id in assignment_ids
+    )
+    report = toloka_client.review_assignments(decisions, concurrency=4)
+
+    Outcome = client.review_results.AssignmentReviewOutcome
+    assert [result.decision.assignment_id for result in report.results] == assignment_ids
+    assert [result.outcome for result in report.results] == \
+        [Outcome.REVIEWED] * 20 + [Outcome.ALREADY_REVIEWED, Outcome.FAILED]
+    assert all(result.assignment.status == client.Assignment.REJECTED for result in report.results[:20])
+    assert all(result.assignment.public_comment == 'Bad' for result in report.results[:20])
+    assert isinstance(report.results[-1].error, client.exceptions.DoesNotExistApiError)
+    assert [result.decision.assignment_id for result in report.failed] == ['assignment-missing']
+    assert len(report.reviewed) == 21
+
+
+def test_review_assignments_invalid_concurrency(toloka_client):
+    with pytest.raises(ValueError):
+        toloka_client.review_assignments([], concurrency=0)
+
+
 @pytest.mark.parametrize(
     'value_to_check',
     [
@@ -139,6 +139,29 @@ def test_get_attachments(respx_mock, toloka_client, toloka_url, assignment_attac
     assert attachments == client.unstructure(list(result))
 
 
+def test_get_attachments_adaptive_batch_size_is_capped(respx_mock, toloka_client, toloka_url, assignment_attachment_map):
+    attachments = [dict(assignment_attachment_map, id=f'assignment-attachment-{i:04}') for i in range(500)]
+    limits = []
+
+    def get_attachments(request):
+        limits.append(int(request.url.params['limit']))
+        id_gt = request.url.params.get('id_gt', None)
+        items = [attachment for attachment in attachments if id_gt is None or attachment['id'] > id_gt][:limits[-1]]
+        return httpx.Response(
+            json={'items': items, 'has_more': items[-1]['id'] != attachments[-1]['id']}, status_code=200
+        )
+
+    respx_mock.get(f'{toloka_url}/attachments').mock(side_effect=get_attachments)
+
+    # Fast pages make the limit grow, but the attachments endpoint accepts no more than 100 items per request
+    batch_size = client.AdaptiveBatchSize(
+        min_size=50, max_size=10_000, initial_size=60, target_seconds=None, target_bytes=2 ** 30, max_growth=100,
+    )
+    result = list(toloka_client.get_attachments(batch_size=batch_size))
+    assert len(result) == 500
+    assert limits == [60, 100, 100, 100, 100, 100]
+
+
 def test_get_attachment(respx_mock, toloka_client, toloka_url, assignment_attachment_map):
 
     def get_attachment(request):
@@ -1,4 +1,5 @@
 import copy
+import json
 
 import httpx
 import pytest
@@ -390,7 +391,7 @@ def test_clone_project(
 
     respx_mock.get(f'{toloka_url}/pools').mock(side_effect=original_pool)
 
-    created_pools = [clone_pool_without_train_map, clone_pool_with_train_map]
+    created_pools = {pool['private_name']: pool for pool in [clone_pool_without_train_map, clone_pool_with_train_map]}
 
     def create_pool(request):
         expected_headers = {
@@ -400,7 +401,8 @@ def test_clone_project(
         }
         check_headers(request, expected_headers)
 
-        return httpx.Response(json=created_pools.pop(0), status_code=201)
+        # pools are created concurrently, so the response is chosen by the request
+        return httpx.Response(json=created_pools[json.loads(request.content)['private_name']], status_code=201)
 
     respx_mock.post(f'{toloka_url}/pools').mock(side_effect=create_pool)
 
@@ -410,3 +412,38 @@ def test_clone_project(
     assert clone_pool_without_train_map == client.unstructure(new_pools[0])
     assert clone_pool_with_train_map == client.unstructure(new_pools[1])
     assert clone_train_map == client.unstructure(new_trainings[0])
+
+
+def test_clone_project_partially(
+    respx_mock, toloka_client, toloka_url, original_project_with_quality_map, clone_project_map, original_train_map,
+    original_pool_without_train_map, clone_pool_without_train_map, original_pool_with_train_map,
+):
+    respx_mock.get(f'{toloka_url}/projects/404040').respond(json=original_project_with_quality_map)
+    respx_mock.post(f'{toloka_url}/projects').respond(json=clone_project_map, status_code=201)
+    update_project = respx_mock.put(f'{toloka_url}/projects/505050')
+    respx_mock.get(f'{toloka_url}/trainings').respond(json={'items': [original_train_map], 'has_more': False})
+    respx_mock.post(f'{toloka_url}/trainings').respond(
+        json={'code': 'VALIDATION_ERROR', 'message': 'Validation failed', 'request_id': 'id'}, status_code=400,
+    )
+    respx_mock.get(f'{toloka_url}/pools').respond(
+        json={'items': [original_pool_without_train_map, original_pool_with_train_map], 'has_more': False},
+    )
+    create_pool = respx_mock.post(f'{toloka_url}/pools').respond(json=clone_pool_without_train_map, status_code=201)
+
+    with pytest.raises(client.ProjectCloneError) as exc_info:
+        toloka_client.clone_project('404040')
+
+    results = exc_info.value.results
+    assert results.project.id == '505050'
+    assert results.trainings == []
+    assert [client.unstructure(pool) for pool in results.pools] == [clone_pool_without_train_map]
+    failures = exc_info.value.failures
+    assert [(type(failure.source), failure.source.id) for failure in failures] == [
+        (client.Training, original_train_map['id']),
+        (client.Project, '404040'),
+        (client.Pool, original_pool_with_train_map['id']),
+    ]
+    assert all(isinstance(failure.error, client.exceptions.ValidationApiError) for failure in failures)
+    # The pool and the project depending on the failed training are not sent
+    assert create_pool.call_count == 1
+    assert not update_project.called
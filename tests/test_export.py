@@ -0,0 +1,187 @@
+import datetime
+import gzip
+import os
+
+import pytest
+import simplejson
+from toloka.export import ExportFormat, ExportedPartition, PartitionBy, ProjectExporter
+from toloka.export.project_exporter import PYARROW_INSTALLED
+
+from .testutils.backend_mock import BackendSearchMock
+
+
+@pytest.fixture
+def yesterday():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) - datetime.timedelta(days=1)
+
+
+@pytest.fixture
+def backend(respx_mock, toloka_url, yesterday):
+    today = yesterday + datetime.timedelta(days=1)
+    backends = {
+        'pools': BackendSearchMock([
+            {'id': '100', 'project_id': '10', 'status': 'OPEN', 'created': yesterday.isoformat()},
+            {'id': '200', 'project_id': '10', 'status': 'CLOSED', 'created': today.isoformat()},
+        ], limit=50),
+        'tasks': BackendSearchMock([
+            {'pool_id': '100', 'id': 'task-1', 'input_values': {'url': 'a'}, 'created': yesterday.isoformat()},
+            {'pool_id': '100', 'id': 'task-2', 'input_values': {'url': 'b'}, 'created': today.isoformat()},
+            {'pool_id': '200', 'id': 'task-3', 'input_values': {'url': 'c'}, 'created': today.isoformat()},
+        ], limit=2),
+        'assignments': BackendSearchMock([
+            {
+                'pool_id': '100', 'id': 'assignment-1', 'status': 'ACCEPTED', 'reward': '0.01',
+                'created': today.isoformat(),
+            },
+        ], limit=2),
+        'aggregated-solutions/operation-100': BackendSearchMock([
+            {'pool_id': '100', 'task_id': 'task-1', 'confidence': 0.9, 'output_values': {'label': 'cat'}},
+        ], limit=2),
+    }
+    for path, backend_mock in backends.items():
+        respx_mock.get(f'{toloka_url}/{path}').mock(side_effect=backend_mock)
+    return backends
+
+
+def read_jsonl(output_dir, path):
+    with gzip.open(os.path.join(output_dir, path, 'part.jsonl.gz'), 'rt', encoding='utf-8') as file:
+        return [simplejson.loads(line) for line in file]
+
+
+def test_export_by_pool(sync_toloka_client, backend, tmp_path):
+    exporter = ProjectExporter(
+        sync_toloka_client, str(tmp_path), aggregation_operation_ids={'100': 'operation-100'}, max_workers=3, batch_size=2,
+    )
+    partitions = exporter.export('10')
+
+    assert partitions == [
+        ExportedPartition('aggregated_solutions', 'aggregated_solutions/pool_id=100', 1),
+        ExportedPartition('assignments', 'assignments/pool_id=100', 1),
+        ExportedPartition('assignments', 'assignments/pool_id=200', 0),
+        ExportedPartition('pools', 'pools', 2),
+        ExportedPartition('tasks', 'tasks/pool_id=100', 2),
+        ExportedPartition('tasks', 'tasks/pool_id=200', 1),
+    ]
+    assert [task['id'] for task in read_jsonl(tmp_path, 'tasks/pool_id=100')] == ['task-1', 'task-2']
+    assert read_jsonl(tmp_path, 'tasks/pool_id=200')[0]['input_values'] == {'url': 'c'}
+    assert read_jsonl(tmp_path, 'assignments/pool_id=100')[0]['reward'] == 0.01
+    assert read_jsonl(tmp_path, 'aggregated_solutions/pool_id=100')[0]['output_values'] == {'label': 'cat'}
+    # Files are not created for empty partitions
+    assert not os.path.exists(tmp_path / 'assignments' / 'pool_id=200' / 'part.jsonl.gz')
+
+
+def test_export_resumes_from_checkpoints(sync_toloka_client, backend, respx_mock, toloka_url, tmp_path):
+    respx_mock.get(f'{toloka_url}/assignments').respond(
+        404, json={'code': 'DOES_NOT_EXIST', 'message': 'Assignments are not available', 'request_id': 'id'},
+    )
+    exporter = ProjectExporter(sync_toloka_client, str(tmp_path), entities=['tasks', 'assignments'])
+    with pytest.raises(Exception):
+        exporter.export('10')
+
+    respx_mock.get(f'{toloka_url}/assignments').mock(side_effect=backend['assignments'])
+    partitions = exporter.export('10')
+
+    # Partitions of the open pool are exported again, partitions of the closed pool are complete
+    assert partitions == [
+        ExportedPartition('assignments', 'assignments/pool_id=100', 1),
+        ExportedPartition('assignments', 'assignments/pool_id=200', 0),
+        ExportedPartition('tasks', 'tasks/pool_id=100', 2),
+        ExportedPartition('tasks', 'tasks/pool_id=200', 1, resumed=True),
+    ]
+
+
+def test_export_again_after_data_changes(sync_toloka_client, backend, tmp_path, yesterday):
+    exporter = ProjectExporter(sync_toloka_client, str(tmp_path), entities=['pools', 'tasks', 'assignments'])
+    exporter.export('10')
+
+    backend['pools'].storage.append(
+        {'id': '300', 'project_id': '10', 'status': 'OPEN', 'created': yesterday.isoformat()},
+    )
+    backend['tasks'].storage.append(
+        {'pool_id': '100', 'id': 'task-4', 'input_values': {'url': 'd'}, 'created': yesterday.isoformat()},
+    )
+    backend['assignments'].storage[0]['status'] = 'REJECTED'
+    partitions = exporter.export('10')
+
+    assert [(partition.path, partition.rows_count, partition.resumed) for partition in partitions] == [
+        ('assignments/pool_id=100', 1, False),
+        ('assignments/pool_id=200', 0, True),
+        ('assignments/pool_id=300', 0, False),
+        ('pools', 3, False),
+        ('tasks/pool_id=100', 3, False),
+        ('tasks/pool_id=200', 1, True),
+        ('tasks/pool_id=300', 0, False),
+    ]
+    assert [pool['id'] for pool in read_jsonl(tmp_path, 'pools')] == ['100', '200', '300']
+    assert read_jsonl(tmp_path, 'assignments/pool_id=100')[0]['status'] == 'REJECTED'
+
+
+def test_export_by_date(sync_toloka_client, backend, tmp_path, yesterday):
+    # Partitions of open pools are never complete
+    backend['pools'].storage[0]['status'] = 'CLOSED'
+    exporter = ProjectExporter(sync_toloka_client, str(tmp_path), partition_by=PartitionBy.DATE, entities=['tasks'])
+    partitions = exporter.export('10')
+
+    yesterday_date = yesterday.date().isoformat()
+    today_date = (yesterday + datetime.timedelta(days=1)).date().isoformat()
+    assert [(partition.path, partition.rows_count) for partition in partitions] == [
+        (f'tasks/date={yesterday_date}/pool_id=100', 1),
+        (f'tasks/date={today_date}/pool_id=100', 1),
+        (f'tasks/date={today_date}/pool_id=200', 1),
+    ]
+    assert [task['id'] for task in read_jsonl(tmp_path, f'tasks/date={yesterday_date}/pool_id=100')] == ['task-1']
+
+    # Today's partitions are not complete yet, so they are exported again with new tasks
+    today_task = backend['tasks'].storage[1]
+    backend['tasks'].storage.append({**today_task, 'id': 'task-4', 'input_values': {'url': 'd'}})
+    partitions = exporter.export('10')
+    assert [(partition.path, partition.rows_count, partition.resumed) for partition in partitions] == [
+        (f'tasks/date={yesterday_date}/pool_id=100', 1, True),
+        (f'tasks/date={today_date}/pool_id=100', 2, False),
+        (f'tasks/date={today_date}/pool_id=200', 1, False),
+    ]
+
+
+def test_export_by_date_skips_days_without_objects(sync_toloka_client, backend, tmp_path, yesterday):
+    pool = backend['pools'].storage[0]
+    pool['created'] = (yesterday - datetime.timedelta(days=1000)).isoformat()
+    backend['tasks'].storage[0]['created'] = (yesterday - datetime.timedelta(days=500)).isoformat()
+    exporter = ProjectExporter(sync_toloka_client, str(tmp_path), partition_by=PartitionBy.DATE, entities=['tasks'])
+    partitions = exporter.export('10')
+
+    assert [partition.rows_count for partition in partitions] == [1, 1, 1]
+    # A request to find the next date and a request to export every partition
+    assert len(backend['tasks'].responses) == 2 * len(partitions) + 2
+
+
+def test_export_invalid_parameters(sync_toloka_client, tmp_path):
+    with pytest.raises(ValueError):
+        ProjectExporter(sync_toloka_client, str(tmp_path), entities=['users'])
+    with pytest.raises(ValueError):
+        ProjectExporter(sync_toloka_client, str(tmp_path), max_workers=0)
+
+
+@pytest.mark.skipif(not PYARROW_INSTALLED, reason='pyarrow is not installed')
+def test_export_parquet(sync_toloka_client, backend, tmp_path, yesterday):
+    import pyarrow.parquet
+
+    exporter = ProjectExporter(
+        sync_toloka_client, str(tmp_path), format=ExportFormat.PARQUET, entities=['pools', 'tasks', 'assignments'],
+    )
+    exporter.export('10')
+
+    table = pyarrow.parquet.read_table(str(tmp_path / 'tasks' / 'pool_id=100' / 'part.parquet'))
+    rows = table.to_pylist()
+    assert [row['id'] for row in rows] == ['task-1', 'task-2']
+    assert simplejson.loads(rows[0]['input_values']) == {'url': 'a'}
+    assert table.schema.field('created').type == pyarrow.timestamp('us')
+    assert rows[0]['created'] == yesterday
+
+    table = pyarrow.parquet.read_table(str(tmp_path / 'assignments' / 'pool_id=100' / 'part.parquet'))
+    assert table.schema.field('reward').type == pyarrow.float64()
+    assert table.schema.field('automerged').type == pyarrow.bool_()
+    assert table.to_pylist()[0]['reward'] == 0.01
+    assert table.to_pylist()[0]['status'] == 'ACCEPTED'
+
+    table = pyarrow.parquet.read_table(str(tmp_path / 'pools' / 'part.parquet'))
+    assert table.schema.field('assignment_max_duration_seconds').type == pyarrow.int64()
@@ -0,0 +1,86 @@
+import pytest
+from toloka.client import Assignment, Pool, Project
+from toloka.mirror import SQLiteMirror
+
+from .testutils.backend_mock import BackendSearchMock
+
+
+@pytest.fixture
+def backend(respx_mock, toloka_url):
+    backends = {
+        'tasks': BackendSearchMock([
+            {'pool_id': '100', 'id': 'task-1', 'created': '2020-01-01T01:01:01'},
+            {'pool_id': '100', 'id': 'task-2', 'created': '2020-01-01T01:01:02'},
+        ], limit=2),
+        'assignments': BackendSearchMock([
+            {
+                'pool_id': '100', 'id': 'assignment-1', 'user_id': 'user-1', 'task_suite_id': 'suite-1',
+                'status': 'ACTIVE', 'created': '2020-01-01T01:02:01',
+            },
+            {
+                'pool_id': '100', 'id': 'assignment-2', 'user_id': 'user-2', 'task_suite_id': 'suite-1',
+                'status': 'SUBMITTED', 'created': '2020-01-01T01:02:02', 'submitted': '2020-01-01T01:03:00',
+            },
+        ], limit=2),
+        'user-bonuses': BackendSearchMock([
+            {'id': 'bonus-1', 'user_id': 'user-1', 'amount': '1.5', 'created': '2020-01-01T01:04:00'},
+        ], limit=2),
+    }
+    for path, backend_mock in backends.items():
+        respx_mock.get(f'{toloka_url}/{path}').mock(side_effect=backend_mock)
+    respx_mock.get(f'{toloka_url}/pools/100').respond(
+        json={'id': '100', 'project_id': '10', 'status': 'OPEN', 'created': '2020-01-01T01:00:00'},
+    )
+    respx_mock.get(f'{toloka_url}/projects/10').respond(
+        json={'id': '10', 'status': 'ACTIVE', 'created': '2020-01-01T00:00:00'},
+    )
+    return backends
+
+
+def test_sync_pool(toloka_client, backend, tmp_path):
+    mirror = SQLiteMirror(str(tmp_path / 'mirror.sqlite'), toloka_client, commit_every=1)
+    mirror.sync_pool('100')
+
+    assert mirror.get_project('10').status == Project.ProjectStatus.ACTIVE
+    assert [pool.id for pool in mirror.get_pools(project_id='10', status=Pool.Status.OPEN)] == ['100']
+    assert [task.id for task in mirror.get_tasks(pool_id='100')] == ['task-1', 'task-2']
+    assert [assignment.id for assignment in mirror.get_assignments(pool_id='100')] == ['assignment-1', 'assignment-2']
+    assert [
+        assignment.id for assignment in mirror.get_assignments(pool_id='100', status=Assignment.SUBMITTED)
+    ] == ['assignment-2']
+    assert [assignment.id for assignment in mirror.get_assignments(user_id='user-1')] == ['assignment-1']
+    assert mirror.get_pool('404') is None
+
+    backend['tasks'].storage.append({'pool_id': '100', 'id': 'task-3', 'created': '2020-01-01T01:01:03'})
+    backend['assignments'].storage[0].update({'status': 'SUBMITTED', 'submitted': '2020-01-01T01:03:01'})
+    tasks_requests_count = len(backend['tasks'].responses)
+    mirror.sync_pool('100')
+
+    # The second synchronization continues from the saved checkpoint, so old tasks are not fetched again
+    new_tasks_responses = backend['tasks'].responses[tasks_requests_count:]
+    assert 'task-1' not in {item['id'] for response in new_tasks_responses for item in response['items']}
+    assert [task.id for task in mirror.get_tasks(pool_id='100')] == ['task-1', 'task-2', 'task-3']
+    assert [
+        assignment.id for assignment in mirror.get_assignments(pool_id='100', status='SUBMITTED')
+    ] == ['assignment-1', 'assignment-2']
+    mirror.close()
+
+    # Data is available without requests after reopening the database
+    reopened = SQLiteMirror(str(tmp_path / 'mirror.sqlite'), toloka_client)
+    assert [task.id for task in reopened.get_tasks(pool_id='100')] == ['task-1', 'task-2', 'task-3']
+    assert reopened.connection.execute('SELECT COUNT(*) FROM assignments WHERE user_id = ?', ('user-2',)).fetchone() \
+        == (1,)
+    reopened.close()
+
+
+def test_sync_user_bonuses(toloka_client, backend, tmp_path):
+    mirror = SQLiteMirror(str(tmp_path / 'mirror.sqlite'), toloka_client)
+    mirror.sync_user_bonuses()
+    backend['user-bonuses'].storage.append(
+        {'id': 'bonus-2', 'user_id': 'user-2', 'amount': '2.25', 'created': '2020-01-01T01:04:01'},
+    )
+    mirror.sync_user_bonuses()
+
+    assert [(bonus.id, str(bonus.amount)) for bonus in mirror.get_user_bonuses()] == [('bonus-1', '1.5'), ('bonus-2', '2.25')]
+    assert [bonus.id for bonus in mirror.get_user_bonuses(user_id='user-2')] == ['bonus-2']
+    mirror.close()
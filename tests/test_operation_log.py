@@ -197,3 +197,67 @@ def test_get_operagiton_log(request, respx_mock, toloka_client, toloka_url, obje
     respx_mock.get(f'{toloka_url}/operations/{operation_id}/log').mock(side_effect=get_operation_log)
     result = toloka_client.get_operation_log(operation_id)
     assert log_list == client.unstructure(result)
+
+
+@pytest.mark.parametrize(
+    'object',
+    [
+        'task',
+        'bonus',
+        'tasks_suite',
+    ],
+)
+def test_get_operation_log_items(request, respx_mock, toloka_client, toloka_url, object):
+    log_list = request.getfixturevalue(f'{object}_operation_log_list')
+    operation_id = 'ee60ef13-37a3-666a-9220-266daa4b71a7'
+
+    def get_operation_log(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'get_operation_log_items',
+            'X-Low-Level-Method': 'get_operation_log_items',
+        }
+        check_headers(request, expected_headers)
+
+        return httpx.Response(text=simplejson.dumps(log_list), status_code=200)
+
+    respx_mock.get(f'{toloka_url}/operations/{operation_id}/log').mock(side_effect=get_operation_log)
+    result = list(toloka_client.get_operation_log_items(operation_id))
+    assert all(isinstance(item, client.operation_log.OperationLogItem) for item in result)
+    assert log_list == client.unstructure(result)
+
+
+class InterruptedByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Sends the first bytes of the content and fails like a dropped connection."""
+
+    def __init__(self, content: bytes, sent_bytes: int):
+        self.content = content
+        self.sent_bytes = sent_bytes
+
+    def __iter__(self):
+        yield self.content[:self.sent_bytes]
+        raise httpx.ReadError('Connection reset by peer')
+
+    async def __aiter__(self):
+        yield self.content[:self.sent_bytes]
+        raise httpx.ReadError('Connection reset by peer')
+
+
+def test_get_operation_log_items_retries_interrupted_body(respx_mock, toloka_client, toloka_url, task_operation_log_list):
+    operation_id = 'ee60ef13-37a3-666a-9220-266daa4b71a7'
+    content = simplejson.dumps(task_operation_log_list).encode()
+    # The connection drops after the first item is received
+    sent_bytes = len(simplejson.dumps(task_operation_log_list[:1])) + 1
+    responses = iter([
+        httpx.Response(200, stream=InterruptedByteStream(content, sent_bytes)),
+        httpx.Response(200, content=content),
+    ])
+    respx_mock.get(f'{toloka_url}/operations/{operation_id}/log').mock(side_effect=lambda request: next(responses))
+
+    result = list(toloka_client.get_operation_log_items(operation_id))
+    assert task_operation_log_list == client.unstructure(result)
+
+    # The client is configured with a single retry
+    responses = iter([httpx.Response(200, stream=InterruptedByteStream(content, sent_bytes)) for _ in range(2)])
+    with pytest.raises(httpx.ReadError):
+        list(toloka_client.get_operation_log_items(operation_id))
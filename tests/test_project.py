@@ -198,6 +198,30 @@ def test_get_project(respx_mock, toloka_client, toloka_url, project_map):
     assert project_map == client.unstructure(result)
 
 
+def test_save_project(respx_mock, toloka_client, toloka_url, project_map):
+
+    def update_project(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'save_project',
+            'X-Low-Level-Method': 'update_project',
+        }
+        check_headers(request, expected_headers)
+
+        return httpx.Response(json=simplejson.loads(request.content), status_code=200)
+
+    route = respx_mock.put(f'{toloka_url}/projects/10').mock(side_effect=update_project)
+    respx_mock.get(f'{toloka_url}/projects/10').mock(return_value=httpx.Response(json=project_map, status_code=200))
+    project = toloka_client.get_project('10')
+    assert toloka_client.save_project(project) is project
+    assert not route.called
+
+    project.private_comment = 'updated comment'
+    result = toloka_client.save_project(project)
+    assert route.call_count == 1
+    assert {**project_map, 'private_comment': 'updated comment'} == client.unstructure(result)
+
+
 def test_get_project_returns_internal_server_error(respx_mock, toloka_client, toloka_url):
     body = {
         'code': 'INTERNAL_ERROR',
@@ -211,3 +211,84 @@ def test_delete_user_restriction(respx_mock, toloka_client, toloka_url):
 
     respx_mock.delete(f'{toloka_url}/user-restrictions/user-restriction-i1d').mock(side_effect=deletion)
     toloka_client.delete_user_restriction('user-restriction-i1d')
+
+
+def test_reconcile_user_restrictions(respx_mock, toloka_client, toloka_url):
+    current_restrictions = [
+        {
+            'id': f'restriction-{user_id}',
+            'scope': 'PROJECT',
+            'project_id': '10',
+            'user_id': user_id,
+            'private_comment': comment,
+            'will_expire': '2030-01-01T00:00:00',
+            'created': '2020-01-01T00:00:00',
+        }
+        for user_id, comment in [('user-1', 'Spammer'), ('user-2', 'Spammer'), ('user-3', 'Spammer')]
+    ]
+    # Tolokers may have several restrictions in the same project
+    current_restrictions += [
+        dict(current_restrictions[1], id='restriction-user-2-copy'),
+        dict(current_restrictions[2], id='restriction-user-3-copy'),
+        dict(current_restrictions[0], id='restriction-user-5', user_id='user-5'),
+        dict(current_restrictions[0], id='restriction-user-5-copy', user_id='user-5', private_comment='Bot'),
+    ]
+    requests = []
+
+    def get_user_restrictions(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'reconcile_user_restrictions',
+            'X-Low-Level-Method': 'find_user_restrictions',
+        }
+        check_headers(request, expected_headers)
+        assert request.url.params['scope'] == 'PROJECT'
+        assert request.url.params['project_id'] == '10'
+        return httpx.Response(json={'items': current_restrictions, 'has_more': False}, status_code=200)
+
+    def set_user_restriction(request):
+        requests.append(('put', simplejson.loads(request.content)))
+        return httpx.Response(json=dict(simplejson.loads(request.content), id='new-restriction'), status_code=201)
+
+    def delete_user_restriction(request):
+        requests.append(('delete', request.url.path.split('/')[-1]))
+        return httpx.Response(status_code=204)
+
+    respx_mock.get(f'{toloka_url}/user-restrictions').mock(side_effect=get_user_restrictions)
+    respx_mock.put(f'{toloka_url}/user-restrictions').mock(side_effect=set_user_restriction)
+    respx_mock.delete(url__regex=rf'{toloka_url}/user-restrictions/.*').mock(side_effect=delete_user_restriction)
+
+    def restriction(comment):
+        return client.user_restriction.ProjectUserRestriction(
+            project_id='10', private_comment=comment,
+            will_expire=datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+
+    report = toloka_client.reconcile_user_restrictions(
+        {
+            'user-1': restriction('Spammer'), 'user-2': restriction('Bot'), 'user-4': restriction('Spammer'),
+            'user-5': restriction('Spammer'),
+        },
+        scope='PROJECT',
+        project_id='10',
+        remove_missing=True,
+    )
+    assert sorted(requests, key=str) == sorted([
+        ('put', {
+            'scope': 'PROJECT', 'project_id': '10', 'user_id': 'user-2', 'private_comment': 'Bot',
+            'will_expire': '2030-01-01T00:00:00',
+        }),
+        ('put', {
+            'scope': 'PROJECT', 'project_id': '10', 'user_id': 'user-4', 'private_comment': 'Spammer',
+            'will_expire': '2030-01-01T00:00:00',
+        }),
+        ('delete', 'restriction-user-2'),
+        ('delete', 'restriction-user-2-copy'),
+        ('delete', 'restriction-user-5-copy'),
+        ('delete', 'restriction-user-3'),
+        ('delete', 'restriction-user-3-copy'),
+    ], key=str)
+    assert [result.change.user_id for result in report.applied] == [
+        'user-2', 'user-2', 'user-2', 'user-4', 'user-5', 'user-3', 'user-3',
+    ]
+    assert report.unchanged_user_ids == ['user-1']
@@ -228,3 +228,59 @@ def test_exact_value_in_user_skill(
     respx_mock.get(f'{toloka_url}/user-skills/user-skill-i1d').mock(side_effect=new_user_skills)
     user_skill = toloka_client.get_user_skill('user-skill-i1d')
     assert user_skill.exact_value == value_to_check
+
+
+def test_reconcile_user_skills(respx_mock, toloka_client, toloka_url):
+    current_values = {'user-1': Decimal('10'), 'user-2': Decimal('20'), 'user-3': Decimal('30')}
+    requests = []
+
+    def get_user_skills(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'reconcile_user_skills',
+            'X-Low-Level-Method': 'find_user_skills',
+        }
+        check_headers(request, expected_headers)
+        assert request.url.params['skill_id'] == 'skill-i1d'
+
+        items = [
+            {'id': f'user-skill-{user_id}', 'skill_id': 'skill-i1d', 'user_id': user_id, 'exact_value': value}
+            for user_id, value in current_values.items()
+        ]
+        return httpx.Response(text=simplejson.dumps({'items': items, 'has_more': False}), status_code=200)
+
+    def set_user_skill(request):
+        expected_headers = {
+            'X-Caller-Context': 'client' if isinstance(toloka_client, client.TolokaClient) else 'async_client',
+            'X-Top-Level-Method': 'reconcile_user_skills',
+            'X-Low-Level-Method': 'set_user_skill',
+        }
+        check_headers(request, expected_headers)
+        requests.append(('put', simplejson.loads(request.content, parse_float=Decimal)))
+        return httpx.Response(text=request.content.decode(), status_code=201)
+
+    def delete_user_skill(request):
+        requests.append(('delete', request.url.path.split('/')[-1]))
+        return httpx.Response(status_code=204)
+
+    respx_mock.get(f'{toloka_url}/user-skills').mock(side_effect=get_user_skills)
+    respx_mock.put(f'{toloka_url}/user-skills').mock(side_effect=set_user_skill)
+    respx_mock.delete(url__regex=rf'{toloka_url}/user-skills/.*').mock(side_effect=delete_user_skill)
+
+    report = toloka_client.reconcile_user_skills(
+        'skill-i1d',
+        {'user-1': Decimal('10'), 'user-2': 25, 'user-3': None, 'user-4': Decimal('40'), 'user-5': None},
+    )
+    assert sorted(requests, key=str) == sorted([
+        ('put', {'skill_id': 'skill-i1d', 'user_id': 'user-2', 'value': Decimal('25')}),
+        ('delete', 'user-skill-user-3'),
+        ('put', {'skill_id': 'skill-i1d', 'user_id': 'user-4', 'value': Decimal('40')}),
+    ], key=str)
+    assert [result.change.user_id for result in report.applied] == ['user-2', 'user-3', 'user-4']
+    assert not report.failed
+    assert report.unchanged_user_ids == ['user-1', 'user-5']
+
+    requests.clear()
+    report = toloka_client.reconcile_user_skills('skill-i1d', {'user-1': Decimal('10')}, remove_missing=True)
+    assert sorted(requests) == [('delete', 'user-skill-user-2'), ('delete', 'user-skill-user-3')]
+    assert report.unchanged_user_ids == ['user-1']
@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+import pytest
+import simplejson
+
+from toloka.util._json_stream import JSONArrayStreamParser
+
+
+@pytest.fixture
+def items():
+    return [
+        {'id': '1', 'values': [1, 2, {'nested': 'a]b,c'}]},
+        'string with "quotes" and \\ backslash',
+        12345,
+        Decimal('0.0125'),
+        True,
+        None,
+        [],
+        {},
+    ]
+
+
+def parse_in_chunks(text, chunk_size):
+    parser = JSONArrayStreamParser()
+    result = []
+    for start in range(0, len(text), chunk_size):
+        result.extend(parser.feed(text[start:start + chunk_size]))
+    result.extend(parser.close())
+    return result
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 1000])
+def test_parse_array_in_chunks(items, chunk_size):
+    text = simplejson.dumps(items, indent=2)
+    assert parse_in_chunks(text, chunk_size) == items
+
+
+@pytest.mark.parametrize('text', ['[]', ' [ ] ', '\n[\n]\n'])
+def test_parse_empty_array(text):
+    assert parse_in_chunks(text, 1) == []
+
+
+def test_items_are_returned_as_soon_as_completed():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('[{"a": 1}, {"a"') == [{'a': 1}]
+    assert parser.feed(': 2}, 1') == [{'a': 2}]
+    assert parser.feed('0]') == [10]
+    assert parser.close() == []
+
+
+def test_item_split_across_many_chunks_is_decoded_once():
+    item = {'values': [{'text': f'value "{idx}" \\ [{{'} for idx in range(1000)]}
+    text = simplejson.dumps([item, 1])
+    parser = JSONArrayStreamParser()
+    raw_decode_calls = []
+    raw_decode = parser._decoder.raw_decode
+
+    def counting_raw_decode(buffer, pos):
+        raw_decode_calls.append(pos)
+        return raw_decode(buffer, pos)
+
+    parser._decoder.raw_decode = counting_raw_decode
+    result = []
+    for start in range(0, len(text), 3):
+        result.extend(parser.feed(text[start:start + 3]))
+    result.extend(parser.close())
+    assert result == [item, 1]
+    # The large item is decoded once, the number is decoded when a delimiter is received
+    assert len(raw_decode_calls) <= 3
+
+
+@pytest.mark.parametrize('text', ['', '[', '[1,', '[1', '{"a": 1}', '[1 2]', '[1]]', '[{"a": }]'])
+def test_invalid_array(text):
+    parser = JSONArrayStreamParser()
+    with pytest.raises(simplejson.JSONDecodeError):
+        parser.feed(text)
+        parser.close()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+@pytest.mark.parametrize('has_more_first', [False, True])
+def test_parse_object_items_in_chunks(items, chunk_size, has_more_first):
+    page = {'has_more': True, 'items': items} if has_more_first else {'items': items, 'has_more': True}
+    text = simplejson.dumps(page, indent=2)
+    parser = JSONArrayStreamParser(items_field='items')
+    result = []
+    for start in range(0, len(text), chunk_size):
+        result.extend(parser.feed(text[start:start + chunk_size]))
+    result.extend(parser.close())
+    assert result == items
+    assert parser.fields == {'has_more': True}
+
+
+@pytest.mark.parametrize('text', ['[]', '{"items": [1}', '{"items" [1]}', '{items: []}', '{"items": [1], }'])
+def test_invalid_object(text):
+    parser = JSONArrayStreamParser(items_field='items')
+    with pytest.raises(simplejson.JSONDecodeError):
+        parser.feed(text)
+        parser.close()